@@ -162,8 +162,15 @@ def get_latest_portfolio_report() -> Path:
     return max(files, key=lambda p: p.stat().st_mtime)
 
 
-def get_latest_consolidated() -> Path:
-    """Retourne le fichier consolidé le plus récent."""
+def get_latest_consolidated(prefer_cache: bool = True) -> Path:
+    """
+    Retourne le fichier consolidé le plus récent.
+
+    Args:
+        prefer_cache: Retourner le compagnon colonnaire (.columns.npz) s'il
+            a été écrit pour cette version du fichier texte (taille et date
+            de modification, cf. consolidated_cache.is_cache_fresh)
+    """
     pattern = "Consolidated_Strategies_*.txt"
     files = list(CONSOLIDATED_DIR.glob(pattern))
     if not files:
@@ -174,6 +181,21 @@ def get_latest_consolidated() -> Path:
     # Exclure les fichiers COSTS, Filtered, Part
     files = [f for f in files if "COSTS" not in f.name 
              and "Filtered" not in f.name and "Part" not in f.name]
+    latest = max(files, key=lambda p: p.stat().st_mtime)
+    if prefer_cache:
+        from src.consolidators.consolidated_cache import companion_path, is_cache_fresh
+        cache = companion_path(latest)
+        if is_cache_fresh(latest, cache):
+            return cache
+    return latest
+
+
+def get_latest_correlation_index() -> Path:
+    """Retourne l'index JSON de l'export binaire de corrélation le plus récent."""
+    pattern = "correlation_index_*.json"
+    files = list(CORRELATION_DIR.rglob(pattern))
+    if not files:
+        raise FileNotFoundError(f"Aucun fichier {pattern} trouvé")
     return max(files, key=lambda p: p.stat().st_mtime)
 
 
@@ -0,0 +1,92 @@
+"""
+Recherche des stratégies existantes les plus corrélées à de nouvelles courbes.
+
+Compare un ou plusieurs fichiers DataSource (par défaut: les fichiers de
+EQUITY_CURVES_DIR plus récents que la dernière analyse de corrélation) à
+l'index de similarité exporté par run_pipeline.py, sans recalcul de la
+matrice complète.
+
+Utilisation:
+    python find_similar_strategies.py                     # nouveaux fichiers
+    python find_similar_strategies.py ES_NEW.txt -k 10    # fichiers donnés
+    python find_similar_strategies.py ES_NEW.txt --add    # ajout à l'index
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Ajouter le répertoire racine au path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from config.settings import EQUITY_CURVES_DIR, get_latest_correlation_index
+from src.consolidators.config import SIMILARITY_CONFIG
+from src.consolidators.correlation_neighbors import datasource_strategy_id, read_datasource_profits
+from src.consolidators.correlation_store import CorrelationStore
+
+
+def main():
+    """Fonction principale."""
+    parser = argparse.ArgumentParser(description="Stratégies les plus corrélées à de nouvelles courbes")
+    parser.add_argument('files', nargs='*', type=Path, help="Fichiers DataSource (.txt)")
+    parser.add_argument('-k', '--top', type=int, default=SIMILARITY_CONFIG['top_k'],
+                        help="Nombre de stratégies affichées")
+    parser.add_argument('--abs', action='store_true', help="Classer par |corrélation|")
+    parser.add_argument('--add', action='store_true', help="Ajouter les courbes à l'index")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("🔎 RECHERCHE DES STRATÉGIES LES PLUS CORRÉLÉES")
+    print("=" * 70)
+
+    try:
+        index_file = get_latest_correlation_index()
+    except FileNotFoundError:
+        print("\n❌ Aucun export binaire de corrélation trouvé (correlation_index_*.json)")
+        return 1
+
+    store = CorrelationStore.load(index_file)
+    index = store.similarity
+    if index is None:
+        print(f"\n❌ Pas d'index de similarité dans {index_file.name} (relancer l'étape corrélation)")
+        return 1
+    print(f"\n📂 Index : {index_file.name} ({len(index)} stratégies, {len(index.dates)} jours)")
+
+    files = args.files
+    if not files:
+        indexed_at = store.similarity_path.stat().st_mtime
+        files = sorted(
+            f for f in EQUITY_CURVES_DIR.glob("*.txt")
+            if f.stat().st_mtime > indexed_at and datasource_strategy_id(f) not in index
+        )
+        print(f"📁 {len(files)} nouveau(x) fichier(s) dans {EQUITY_CURVES_DIR}")
+
+    added = 0
+    for path in files:
+        profits = read_datasource_profits(path)
+
+        start = time.perf_counter()
+        neighbors = index.query(profits, k=args.top, order='abs' if args.abs else 'largest')
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        print(f"\n📈 {path.name} → {profits.name} ({elapsed_ms:.0f} ms)")
+        if neighbors.empty:
+            print(f"   Aucune stratégie avec au moins {index.min_common_days} jours communs")
+        for row in neighbors.itertuples(index=False):
+            print(f"   {row.Correlation:+.3f}  {row.Strategy}  ({row.Common_Days} jours communs)")
+
+        # Index par Strategy_ID ({stratégie}_{symbole}), fichier {symbole}_{stratégie}.txt
+        if args.add and profits.name not in index:
+            index.add(profits.name, profits)
+            added += 1
+
+    if added:
+        index.save(store.similarity_path)
+        print(f"\n✅ {added} courbe(s) ajoutée(s) à l'index : {store.similarity_path.name}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
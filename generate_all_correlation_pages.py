@@ -2,94 +2,72 @@
 Génération COMPLÈTE des pages de corrélation (245 pages).
 
 Ce script génère toutes les pages sans demander de confirmation.
+
+Utilisation:
+    python generate_all_correlation_pages.py              # une page HTML par stratégie
+    python generate_all_correlation_pages.py --explorer   # explorateur + fragments JSON
 """
 
+import argparse
 from pathlib import Path
 import sys
-import pandas as pd
-import numpy as np
 
 # Ajouter le répertoire racine au path
 sys.path.insert(0, str(Path(__file__).parent))
 
+from config.settings import get_latest_correlation_index
+from src.consolidators.correlation_calculator import CorrelationAnalyzer
+from src.generators.correlation_explorer import EXPLORER_FILE, CorrelationExplorerGenerator
 from src.generators.correlation_pages import CorrelationPagesGenerator
 
 
-def create_mock_analyzer(scores_file: Path):
-    """Crée un mock analyzer depuis les scores existants."""
-    print(f"📂 Chargement des scores depuis : {scores_file.name}")
-    
-    # Charger les scores
-    scores = pd.read_csv(scores_file, sep=';', encoding='utf-8-sig', decimal=',')
-    
-    print(f"   ✓ {len(scores)} stratégies chargées")
+def load_analyzer(index_file: Path) -> CorrelationAnalyzer:
+    """Recharge les résultats de corrélation depuis l'export binaire (matrices mappées)."""
+    print(f"📂 Chargement des matrices depuis : {index_file.name}")
     
-    # Renommer la colonne
-    if 'Strategy_ID' in scores.columns and 'Strategy' not in scores.columns:
-        scores = scores.rename(columns={'Strategy_ID': 'Strategy'})
+    analyzer = CorrelationAnalyzer.from_binary(index_file)
     
-    # Créer des matrices de corrélation simulées
-    strategies = scores['Strategy'].tolist()
-    n = len(strategies)
-    
-    print(f"   🎲 Création de matrices de corrélation simulées ({n}×{n})...")
-    
-    corr_matrix_lt = pd.DataFrame(
-        np.random.rand(n, n) * 0.6 - 0.3,
-        index=strategies,
-        columns=strategies
-    )
+    print(f"   ✓ LT : {len(analyzer.corr_matrix_lt)}×{len(analyzer.corr_matrix_lt)}, "
+          f"CT : {len(analyzer.corr_matrix_ct)}×{len(analyzer.corr_matrix_ct)}")
+    print(f"   ✓ {len(analyzer.scores)} stratégies (scores recalculés depuis les matrices)")
     
-    corr_matrix_ct = pd.DataFrame(
-        np.random.rand(n, n) * 0.6 - 0.3,
-        index=strategies,
-        columns=strategies
-    )
-    
-    # Diagonale = 1
-    for i in range(n):
-        corr_matrix_lt.iloc[i, i] = 1.0
-        corr_matrix_ct.iloc[i, i] = 1.0
-    
-    class MockAnalyzer:
-        def __init__(self):
-            self.scores = scores
-            self.corr_matrix_lt = corr_matrix_lt
-            self.corr_matrix_ct = corr_matrix_ct
-            self.correlation_threshold = 0.70
-            self.start_year_longterm = 2012
-            self.recent_months = 12
-    
-    return MockAnalyzer()
+    return analyzer
 
 
 def main():
     """Fonction principale."""
+    parser = argparse.ArgumentParser(description="Génération des pages de corrélation")
+    parser.add_argument('--explorer', action='store_true',
+                        help="Explorateur unique + un fragment par stratégie (au lieu des pages)")
+    args = parser.parse_args()
     
     print("=" * 70)
     print("📄 GÉNÉRATION COMPLÈTE DES PAGES DE CORRÉLATION")
     print("=" * 70)
     
     # Chemins
-    correlation_dir = Path(r"C:\TradeData\V2\outputs\correlation")
     output_dir = Path(r"C:\TradeData\V2\outputs\correlation_pages_full")
     
-    # Trouver le fichier de scores
-    score_files = list(correlation_dir.glob("all_strategy_scores_*.csv"))
-    
-    if not score_files:
-        print("\n❌ Aucun fichier de scores trouvé")
+    # Trouver l'export binaire le plus récent (run_pipeline.py, étape corrélation)
+    try:
+        index_file = get_latest_correlation_index()
+    except FileNotFoundError:
+        print("\n❌ Aucun export binaire de corrélation trouvé (correlation_index_*.json)")
         return 1
     
-    scores_file = max(score_files, key=lambda p: p.stat().st_mtime)
+    print(f"\n📁 Fichier : {index_file.name}\n")
     
-    print(f"\n📁 Fichier : {scores_file.name}\n")
-    
-    # Créer l'analyzer
-    analyzer = create_mock_analyzer(scores_file)
+    # Recharger l'analyzer
+    analyzer = load_analyzer(index_file)
     
     print(f"\n✅ Analyzer créé avec {len(analyzer.scores)} stratégies")
     
+    if args.explorer:
+        # Seuls les fragments modifiés sont réécrits: pas de confirmation
+        stats = CorrelationExplorerGenerator(analyzer).generate(output_dir, top_n=15, verbose=True)
+        print(f"\n🧭 Ouvrir : {output_dir / EXPLORER_FILE}")
+        return 0 if stats['errors'] == 0 else 1
+    
     # Confirmation
     print(f"\n⚠️  Vous allez générer {len(analyzer.scores)} pages HTML")
     print(f"   Destination : {output_dir}")
@@ -45,6 +45,7 @@ from config.settings import (
     ensure_directories, get_latest_portfolio_report, get_latest_consolidated,
     HTML_CORRELATION_DIR, HTML_MONTECARLO_DIR,
 )
+from src.monte_carlo.config import WORKER_CONFIG
 
 
 # =============================================================================
@@ -82,11 +83,22 @@ class PipelineConfig:
         self.mc_capital_minimum = 10000
         self.mc_capital_increment = 5000
         self.mc_max_strategies = 0  # 0 = toutes
+        self.mc_isolate_workers = True  # Un processus isolé par stratégie
+        self.mc_timeout_seconds = WORKER_CONFIG['timeout_seconds']  # Timeout wall-clock par stratégie (0 = illimité)
+        self.mc_memory_limit_mb = WORKER_CONFIG['memory_limit_mb']  # Plafond mémoire par worker (POSIX, 0 = illimité)
+        self.mc_slow_threshold_seconds = WORKER_CONFIG['slow_threshold_seconds']  # Signaler les stratégies plus lentes
         
         # Paramètres Corrélation
         self.corr_start_year = 2012
         self.corr_recent_months = 12
         self.corr_threshold = 0.70
+        self.corr_memory_budget_mb = 0  # > 0: lecture en flux du consolidé (plafond mémoire en Mo)
+        self.corr_bootstrap_replicates = 0  # > 0: intervalles de confiance bootstrap (CT)
+        self.corr_export_csv = True  # Export CSV lisible en plus des matrices binaires
+        self.corr_multi_window = False  # Scores multi-fenêtres (MULTI_WINDOW_CONFIG, export CSV)
+        self.corr_aggregated = False  # Corrélations agrégées semaine / mois (AGGREGATION_CONFIG)
+        self.corr_clusters = False  # Classification hiérarchique LT (CLUSTERING_CONFIG)
+        self.corr_codrawdown = False  # Corrélation de co-drawdown (DRAWDOWN_CONFIG)
         
         # Options
         self.verbose = True
@@ -757,8 +769,11 @@ def step_monte_carlo(config: PipelineConfig) -> Dict[str, Any]:
         'simulated': 0,
         'skipped': 0,
         'errors': 0,
+        'timeouts': 0,
+        'memory_limits': 0,
         'duration_seconds': 0,
-        'summaries': []
+        'summaries': [],
+        'outliers': []  # Stratégies lentes, bloquées ou hors plafond mémoire
     }
     
     start_time = time.time()
@@ -804,8 +819,25 @@ def step_monte_carlo(config: PipelineConfig) -> Dict[str, Any]:
         mc_output_dir = OUTPUT_ROOT / "monte_carlo" / config.timestamp
         mc_output_dir.mkdir(parents=True, exist_ok=True)
         
+        sim_params = {
+            'capital_minimum': config.mc_capital_minimum,
+            'capital_increment': config.mc_capital_increment,
+            'nb_capital_levels': config.mc_nb_capital_levels,
+            'nb_simulations': config.mc_nb_simulations,
+        }
+        
+        if config.mc_isolate_workers:
+            print(f"   🛡️  Workers isolés: timeout {config.mc_timeout_seconds or '∞'}s, "
+                  f"mémoire {config.mc_memory_limit_mb or '∞'} Mo")
+        
         # Simuler chaque stratégie
         for i, equity_file in enumerate(equity_files, 1):
+            if config.mc_isolate_workers:
+                if config.verbose:
+                    print(f"\n[{i}/{len(equity_files)}] {equity_file.stem}...", end=" ", flush=True)
+                _run_isolated_simulation(config, equity_file, mc_output_dir, sim_params, result)
+                continue
+            
             try:
                 if config.verbose:
                     print(f"\n[{i}/{len(equity_files)}] {equity_file.stem}...", end=" ", flush=True)
@@ -819,13 +851,7 @@ def step_monte_carlo(config: PipelineConfig) -> Dict[str, Any]:
                     continue
                 
                 # Créer le simulateur
-                mc = MonteCarloSimulator(
-                    strategy_file=str(equity_file),
-                    capital_minimum=config.mc_capital_minimum,
-                    capital_increment=config.mc_capital_increment,
-                    nb_capital_levels=config.mc_nb_capital_levels,
-                    nb_simulations=config.mc_nb_simulations,
-                )
+                mc = MonteCarloSimulator(strategy_file=str(equity_file), **sim_params)
                 
                 # Lancer la simulation
                 mc.run(verbose=False)
@@ -866,12 +892,79 @@ def step_monte_carlo(config: PipelineConfig) -> Dict[str, Any]:
     
     result['duration_seconds'] = round(time.time() - start_time, 1)
     
-    print(f"\n📈 Résumé: {result['simulated']} simulés, {result['skipped']} ignorés, {result['errors']} erreurs")
+    print(f"\n📈 Résumé: {result['simulated']} simulés, {result['skipped']} ignorés, "
+          f"{result['timeouts']} timeouts, {result['memory_limits']} plafonds mémoire, {result['errors']} erreurs")
+    if result['outliers']:
+        print(f"🐢 {len(result['outliers'])} stratégie(s) hors norme:")
+        for outlier in result['outliers']:
+            trades = outlier['nb_trades'] if outlier['nb_trades'] is not None else '?'
+            print(f"   • {outlier['strategy']}: {outlier['reason']} "
+                  f"({outlier['duration_seconds']}s, {outlier['file_size_mb']} Mo, {trades} trades)")
     print(f"⏱️  Durée: {result['duration_seconds']}s")
     
     return result
 
 
+def _run_isolated_simulation(
+    config: PipelineConfig,
+    equity_file: Path,
+    mc_output_dir: Path,
+    sim_params: Dict[str, Any],
+    result: Dict[str, Any]
+) -> None:
+    """
+    Simule une stratégie dans un worker isolé et met à jour les statistiques de l'étape.
+    
+    Les stratégies lentes, bloquées (timeout) ou hors plafond mémoire sont
+    ajoutées à result['outliers'] avec la taille du fichier et le nombre de trades.
+    """
+    from src.monte_carlo.worker import simulate_strategy_isolated
+    
+    outcome = simulate_strategy_isolated(
+        equity_file,
+        mc_output_dir,
+        sim_params,
+        timeout_seconds=config.mc_timeout_seconds,
+        memory_limit_mb=config.mc_memory_limit_mb,
+    )
+    status = outcome['status']
+    
+    if status == 'ok':
+        result['summaries'].append(outcome['summary'])
+        result['simulated'] += 1
+        if config.verbose:
+            mc_status = outcome['mc_status']
+            status_icon = "✅" if mc_status == "OK" else "⚠️" if mc_status == "WARNING" else "🔴"
+            capital = outcome['recommended_capital']
+            capital_str = f"${capital:,.0f}" if capital else "N/A"
+            print(f"{status_icon} Capital recommandé: {capital_str} ({outcome['duration_seconds']}s)")
+    elif status == 'skipped':
+        result['skipped'] += 1
+        if config.verbose:
+            print(f"{outcome['error']}, ignoré")
+    else:
+        if status == 'timeout':
+            result['timeouts'] += 1
+        elif status == 'memory':
+            result['memory_limits'] += 1
+        else:
+            result['errors'] += 1
+        if config.verbose:
+            print(f"❌ {status}: {outcome['error']}")
+    
+    is_slow = status == 'ok' and outcome['duration_seconds'] >= config.mc_slow_threshold_seconds
+    if status in ('timeout', 'memory', 'crashed') or is_slow:
+        result['outliers'].append({
+            'strategy': outcome['strategy'],
+            'file': outcome['file'],
+            'reason': 'slow' if is_slow else status,
+            'duration_seconds': outcome['duration_seconds'],
+            'file_size_mb': outcome['file_size_mb'],
+            'nb_trades': outcome['nb_trades'],
+            'error': outcome['error'],
+        })
+
+
 # =============================================================================
 # ÉTAPE 3: ANALYSE DE CORRÉLATION
 # =============================================================================
@@ -899,8 +992,9 @@ def step_correlation(config: PipelineConfig) -> Dict[str, Any]:
     start_time = time.time()
     
     try:
-        import pandas as pd
+        from src.consolidators.config import AGGREGATION_CONFIG
         from src.consolidators.correlation_calculator import CorrelationAnalyzer
+        from src.consolidators.consolidated_cache import load_consolidated, stream_profit_matrix
         
         # Charger le fichier consolidé
         try:
@@ -924,9 +1018,14 @@ def step_correlation(config: PipelineConfig) -> Dict[str, Any]:
         
         # Charger les données
         print("\n📥 Chargement des données...")
-        df = pd.read_csv(consolidated_path, sep=';', encoding='utf-8', decimal=',')
-        print(f"   {len(df):,} lignes chargées")
-        print(f"   Colonnes: {list(df.columns)}")
+        if config.corr_memory_budget_mb > 0:
+            # Lecture en flux: matrice de profits accumulée bloc par bloc
+            df = stream_profit_matrix(consolidated_path, memory_budget_mb=config.corr_memory_budget_mb)
+            print(f"   Matrice de profits: {df.shape[0]:,} jours × {df.shape[1]} stratégies")
+        else:
+            df = load_consolidated(consolidated_path)
+            print(f"   {len(df):,} lignes chargées")
+            print(f"   Colonnes: {list(df.columns)}")
         
         if config.dry_run:
             print("\n🔍 Mode dry-run: aucune analyse")
@@ -941,19 +1040,40 @@ def step_correlation(config: PipelineConfig) -> Dict[str, Any]:
             correlation_threshold=config.corr_threshold,
         )
         
-        # Lancer l'analyse
-        analyzer.run(verbose=config.verbose)
+        # Analyses optionnelles (colonnes ajoutées en fin de scores)
+        if config.corr_aggregated:
+            analyzer.aggregation_levels = list(AGGREGATION_CONFIG['levels'])
+        analyzer.clustering_enabled = config.corr_clusters
+        analyzer.codrawdown_enabled = config.corr_codrawdown
+        
+        # Lancer l'analyse (état incrémental: seuls les nouveaux jours sont intégrés)
+        analyzer.run(verbose=config.verbose, state_path=CORRELATION_DIR / "correlation_state.npz")
+        
+        # Intervalles de confiance bootstrap (comptes robustes, exportés en CSV)
+        if config.corr_bootstrap_replicates > 0:
+            analyzer.compute_bootstrap_intervals(
+                n_replicates=config.corr_bootstrap_replicates, verbose=config.verbose
+            )
+        
+        # Scores multi-fenêtres (même échelle que le score LT/CT, exportés en CSV)
+        if config.corr_multi_window:
+            analyzer.run_multi_window(verbose=config.verbose)
+        
+        # Index de similarité (recherche des stratégies dupliquées, exporté avec les matrices)
+        analyzer.build_similarity_index(verbose=config.verbose)
         
         # Afficher le résumé
         if config.verbose:
             analyzer.print_summary()
         
         # Exporter les résultats
-        # CSV dans correlation/
+        # Matrices binaires (.npy + index JSON) et CSV optionnels dans correlation/
         corr_output_dir = CORRELATION_DIR / config.timestamp
         corr_output_dir.mkdir(parents=True, exist_ok=True)
         
-        exported_files = analyzer.export_csv(corr_output_dir, prefix="correlation")
+        exported_files = analyzer.export_binary(corr_output_dir, prefix="correlation")
+        if config.corr_export_csv:
+            exported_files.update(analyzer.export_csv(corr_output_dir, prefix="correlation"))
         
         # HTML Dashboard dans html_reports/correlation/dashboards/
         if config.generate_dashboard:
@@ -1142,6 +1262,77 @@ Exemples:
         help="Nombre de simulations Monte Carlo par niveau (défaut: 1000)"
     )
     
+    parser.add_argument(
+        '--mc-timeout',
+        type=int,
+        default=WORKER_CONFIG['timeout_seconds'],
+        help=f"Timeout Monte Carlo par stratégie en secondes (0 = illimité, défaut: {WORKER_CONFIG['timeout_seconds']})"
+    )
+    
+    parser.add_argument(
+        '--mc-memory-mb',
+        type=int,
+        default=WORKER_CONFIG['memory_limit_mb'],
+        help=f"Plafond mémoire par worker Monte Carlo en Mo (POSIX, 0 = illimité, défaut: {WORKER_CONFIG['memory_limit_mb']})"
+    )
+    
+    parser.add_argument(
+        '--mc-slow',
+        type=int,
+        default=WORKER_CONFIG['slow_threshold_seconds'],
+        help=f"Durée en secondes au-delà de laquelle une stratégie est signalée lente (défaut: {WORKER_CONFIG['slow_threshold_seconds']})"
+    )
+    
+    parser.add_argument(
+        '--mc-inline',
+        action='store_true',
+        help="Monte Carlo dans le processus principal (sans isolation ni timeout)"
+    )
+    
+    parser.add_argument(
+        '--corr-memory-mb',
+        type=int,
+        default=0,
+        help="Corrélation: lecture en flux du consolidé avec ce plafond mémoire en Mo (0 = chargement complet)"
+    )
+    
+    parser.add_argument(
+        '--corr-no-csv',
+        action='store_true',
+        help="Corrélation: exporter uniquement les matrices binaires (.npy + index JSON)"
+    )
+    
+    parser.add_argument(
+        '--corr-bootstrap',
+        type=int,
+        default=0,
+        help="Corrélation: répliques bootstrap pour les intervalles de confiance CT (0 = désactivé)"
+    )
+    
+    parser.add_argument(
+        '--corr-aggregated',
+        action='store_true',
+        help="Corrélation: corrélations des profits agrégés par semaine / mois (colonnes N_Corr_W/M)"
+    )
+    
+    parser.add_argument(
+        '--corr-clusters',
+        action='store_true',
+        help="Corrélation: classification hiérarchique LT (colonne Cluster, heatmaps par cluster)"
+    )
+    
+    parser.add_argument(
+        '--corr-codrawdown',
+        action='store_true',
+        help="Corrélation: corrélation de co-drawdown LT (colonnes N_Corr_DD, onglet du dashboard)"
+    )
+    
+    parser.add_argument(
+        '--corr-multi-window',
+        action='store_true',
+        help="Corrélation: scores Davey multi-fenêtres (3/6/12/24 mois + LT, exportés en CSV)"
+    )
+    
     parser.add_argument(
         '--force',
         action='store_true',
@@ -1210,6 +1401,17 @@ Exemples:
     config.enrich_include_equity = not args.no_equity
     config.mc_max_strategies = args.mc_max
     config.mc_nb_simulations = args.mc_sims
+    config.mc_timeout_seconds = args.mc_timeout
+    config.mc_memory_limit_mb = args.mc_memory_mb
+    config.mc_slow_threshold_seconds = args.mc_slow
+    config.mc_isolate_workers = not args.mc_inline
+    config.corr_memory_budget_mb = args.corr_memory_mb
+    config.corr_bootstrap_replicates = args.corr_bootstrap
+    config.corr_export_csv = not args.corr_no_csv
+    config.corr_multi_window = args.corr_multi_window
+    config.corr_aggregated = args.corr_aggregated
+    config.corr_clusters = args.corr_clusters
+    config.corr_codrawdown = args.corr_codrawdown
     
     # Configuration preprocessing
     if args.skip_preprocessing:
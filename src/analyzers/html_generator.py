@@ -9,6 +9,8 @@ from pathlib import Path
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 
+from ..utils.templates import Markup, compile_template
+
 
 # =============================================================================
 # UTILITAIRES HTML
@@ -129,771 +131,850 @@ def get_type_color(strategy_type: str) -> str:
 
 
 # =============================================================================
-# GÉNÉRATEUR DE RAPPORTS
+# TEMPLATES (compilés une fois, cf. src.utils.templates)
 # =============================================================================
 
-class HTMLReportGenerator:
-    """Génère les rapports HTML pour les analyses de stratégies."""
-    
-    # CSS commun pour tous les rapports
-    COMMON_CSS = """
-    <style>
-        :root {
-            --primary: #3498db;
-            --success: #27ae60;
-            --warning: #f39c12;
-            --danger: #e74c3c;
-            --dark: #2c3e50;
-            --light: #ecf0f1;
-        }
+STRATEGY_REPORT_TEMPLATE = compile_template("""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{name} - Strategy Analysis</title>
+    {common_css}
+</head>
+<body>
+    <div class="container">
+        <a href="index.html" class="back-link">← Retour à la liste</a>
         
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
+        <h1>📊 {name}</h1>
         
-        body {
+        <div class="header-grid">
+            <div class="info-box">
+                <strong>Type</strong>
+                <span class="badge" style="background-color: {type_color}">{stype}</span>
+            </div>
+            <div class="info-box">
+                <strong>Sous-type</strong>
+                <span>{subtype}</span>
+            </div>
+            <div class="info-box">
+                <strong>Score Qualité</strong>
+                <span class="score {quality_class}">{quality_score}/10</span>
+            </div>
+            <div class="info-box">
+                <strong>Score Complexité</strong>
+                <span class="score {complexity_class}">{complexity_score}/10</span>
+            </div>
+        </div>
+        
+        <div class="section">
+            <h2>📝 Résumé</h2>
+            {summary_html}
+        </div>
+        
+        <div class="section">
+            <h2>🎯 Conditions d'Entrée</h2>
+            {entry_html}
+        </div>
+        
+        <div class="section">
+            <h2>🚪 Conditions de Sortie</h2>
+            {exit_html}
+        </div>
+        
+        <div class="header-grid">
+            <div class="info-box">
+                <strong>Stop Loss</strong>
+                {stop_loss_html}
+            </div>
+            <div class="info-box">
+                <strong>Take Profit</strong>
+                {take_profit_html}
+            </div>
+            <div class="info-box">
+                <strong>Exit On Close</strong>
+                <span class="badge {eoc_class}">{exit_on_close}</span>
+            </div>
+            <div class="info-box">
+                <strong>Time Exit</strong>
+                <span class="badge {te_class}">{time_exit}</span>
+            </div>
+        </div>
+        
+        <div class="section">
+            <h2>🔧 Patterns & Fonctions</h2>
+            {patterns_html}
+            <p><strong>Nombre de patterns:</strong> {number_of_patterns}</p>
+        </div>
+        
+        {pattern_details_section}
+        
+        <div class="section">
+            <h2>⭐ Analyse Qualité</h2>
+            {quality_analysis_html}
+        </div>
+        
+        {links_html}
+        
+        <h2>💻 Code Source</h2>
+        <div class="code-block"><pre>{strategy_code}</pre></div>
+        
+        <p style="margin-top: 20px; color: #7f8c8d; font-size: 0.9em;">
+            Généré le {generated} | 
+            Hash: {code_hash}...
+        </p>
+    </div>
+</body>
+</html>""")
+
+PATTERN_TAG_TEMPLATE = compile_template('<span class="pattern-tag">{pattern}</span>')
+
+REPORT_LINK_TEMPLATE = compile_template('<li><a href="{href}">{label}</a></li>')
+
+STRATEGY_CARD_TEMPLATE = compile_template("""
+            <div class="strategy-card" data-type="{type_key}" data-quality="{quality}">
+                <h3><a href="{html_file}">{name}</a></h3>
+                <div class="card-badges">
+                    <span class="badge" style="background-color: {type_color}">{stype}</span>
+                    <span class="badge badge-subtype">{subtype}</span>
+                </div>
+                <p class="card-summary">{summary}</p>
+                <div class="card-scores">
+                    <span>Qualité: <strong class="{quality_class}">{quality}/10</strong></span>
+                    <span>Complexité: <strong>{complexity}/10</strong></span>
+                </div>
+            </div>
+            """)
+
+TYPE_ROW_TEMPLATE = compile_template("""
+            <div class="type-row">
+                <span class="type-name">{stype}</span>
+                <div class="type-bar-container">
+                    <div class="type-bar" style="width: {pct}%; background-color: {color}"></div>
+                </div>
+                <span class="type-count">{count}</span>
+            </div>
+            """)
+
+TYPE_BUTTON_TEMPLATE = compile_template('<button{active} data-type="{type_key}">{label} ({count})</button>')
+
+DASHBOARD_TEMPLATE = compile_template("""<!DOCTYPE html>
+<html lang="fr">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>AI Strategy Analysis Dashboard</title>
+    <style>
+        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+        
+        body {{
             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            line-height: 1.6;
-            color: #333;
-            background-color: #f5f5f5;
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            min-height: 100vh;
             padding: 20px;
-        }
+        }}
         
-        .container {
-            max-width: 1200px;
-            margin: 0 auto;
+        .container {{ max-width: 1400px; margin: 0 auto; }}
+        
+        .header {{
             background: white;
             border-radius: 10px;
             padding: 30px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }
-        
-        .back-link {
-            display: inline-block;
-            margin-bottom: 20px;
-            color: var(--primary);
-            text-decoration: none;
-            font-weight: 500;
-        }
+            margin-bottom: 30px;
+            box-shadow: 0 4px 15px rgba(0,0,0,0.2);
+        }}
         
-        .back-link:hover {
-            text-decoration: underline;
-        }
+        h1 {{
+            color: #2c3e50;
+            margin-bottom: 10px;
+        }}
         
-        h1 {
-            color: var(--dark);
-            border-bottom: 3px solid var(--primary);
-            padding-bottom: 10px;
+        .subtitle {{
+            color: #7f8c8d;
             margin-bottom: 20px;
-        }
-        
-        h2 {
-            color: #34495e;
-            margin-top: 30px;
-            margin-bottom: 15px;
-            border-left: 4px solid var(--primary);
-            padding-left: 15px;
-        }
+        }}
         
-        .header-grid {
+        .stats {{
             display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+            grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
             gap: 20px;
-            margin: 20px 0;
-        }
+            margin: 30px 0;
+        }}
         
-        .info-box {
-            background: var(--light);
-            padding: 15px;
-            border-radius: 8px;
-            border-left: 4px solid var(--primary);
-        }
+        .stat-box {{
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+            padding: 20px;
+            border-radius: 10px;
+            text-align: center;
+        }}
         
-        .info-box strong {
+        .stat-box strong {{
             display: block;
-            color: var(--dark);
+            font-size: 2em;
             margin-bottom: 5px;
-            font-size: 0.9em;
-        }
-        
-        .badge {
-            display: inline-block;
-            padding: 5px 12px;
-            border-radius: 15px;
-            color: white;
-            font-size: 0.85em;
-            font-weight: 500;
-        }
+        }}
         
-        .badge-yes {
-            background: var(--success);
-        }
+        .filters {{
+            background: white;
+            border-radius: 10px;
+            padding: 20px;
+            margin-bottom: 30px;
+            box-shadow: 0 4px 15px rgba(0,0,0,0.2);
+        }}
         
-        .badge-no {
-            background: #95a5a6;
-        }
+        .search-box {{
+            width: 100%;
+            padding: 12px;
+            font-size: 1em;
+            border: 2px solid #ddd;
+            border-radius: 5px;
+            margin-bottom: 15px;
+        }}
         
-        .score {
-            font-size: 1.5em;
-            font-weight: bold;
-        }
+        .type-filter {{
+            display: flex;
+            flex-wrap: wrap;
+            gap: 10px;
+        }}
         
-        .score-high {
-            color: var(--success);
-        }
+        .type-filter button {{
+            padding: 8px 16px;
+            border: 2px solid #667eea;
+            background: white;
+            color: #667eea;
+            border-radius: 20px;
+            cursor: pointer;
+            font-weight: 500;
+        }}
         
-        .score-medium {
-            color: var(--warning);
-        }
+        .type-filter button:hover,
+        .type-filter button.active {{
+            background: #667eea;
+            color: white;
+        }}
         
-        .score-low {
-            color: var(--danger);
-        }
+        .content-wrapper {{
+            display: grid;
+            grid-template-columns: 280px 1fr;
+            gap: 30px;
+        }}
         
-        .section {
-            margin: 25px 0;
+        .sidebar {{
+            background: white;
+            border-radius: 10px;
             padding: 20px;
-            background: #f8f9fa;
-            border-radius: 8px;
-        }
+            height: fit-content;
+            position: sticky;
+            top: 20px;
+        }}
         
-        .analysis-list {
-            margin: 10px 0 10px 20px;
-        }
+        .sidebar h2 {{
+            font-size: 1.2em;
+            margin-bottom: 15px;
+            color: #2c3e50;
+        }}
         
-        .analysis-list li {
-            margin: 8px 0;
-        }
+        .type-row {{
+            display: flex;
+            align-items: center;
+            margin-bottom: 10px;
+        }}
         
-        .code-block {
-            background: #282c34;
-            color: #abb2bf;
-            padding: 20px;
-            border-radius: 8px;
-            overflow-x: auto;
-            font-family: 'Courier New', monospace;
-            font-size: 13px;
-            line-height: 1.5;
-            white-space: pre-wrap;
-            word-wrap: break-word;
-        }
+        .type-name {{
+            width: 100px;
+            font-size: 0.85em;
+        }}
         
-        .patterns-list {
-            display: flex;
-            flex-wrap: wrap;
-            gap: 8px;
-            margin: 10px 0;
-        }
+        .type-bar-container {{
+            flex: 1;
+            height: 20px;
+            background: #ecf0f1;
+            border-radius: 10px;
+            overflow: hidden;
+            margin: 0 10px;
+        }}
         
-        .pattern-tag {
-            background: var(--light);
-            padding: 5px 10px;
-            border-radius: 4px;
-            font-family: monospace;
-            font-size: 0.9em;
-        }
+        .type-bar {{
+            height: 100%;
+        }}
         
-        .links-section {
-            margin-top: 30px;
-            padding: 20px;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            border-radius: 8px;
-            color: white;
-        }
+        .type-count {{
+            width: 30px;
+            text-align: right;
+            font-weight: bold;
+        }}
         
-        .links-section a {
-            color: white;
-            text-decoration: underline;
-        }
+        .strategies-grid {{
+            display: grid;
+            grid-template-columns: repeat(auto-fill, minmax(320px, 1fr));
+            gap: 20px;
+        }}
         
-        @media (max-width: 768px) {
-            .header-grid {
-                grid-template-columns: 1fr;
-            }
-            
-            body {
-                padding: 10px;
-            }
-            
-            .container {
-                padding: 15px;
-            }
-        }
-    </style>
-    """
-    
-    def __init__(self, output_dir: Path):
-        """
-        Initialise le générateur.
+        .strategy-card {{
+            background: white;
+            border-radius: 10px;
+            padding: 20px;
+            box-shadow: 0 4px 15px rgba(0,0,0,0.1);
+            transition: transform 0.3s;
+        }}
         
-        Args:
-            output_dir: Répertoire de sortie pour les HTML
-        """
-        self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(parents=True, exist_ok=True)
-    
-    def generate_strategy_report(
-        self,
-        analysis: Dict,
-        strategy_code: str,
-        mc_report_path: Optional[str] = None,
-        correlation_path: Optional[str] = None,
-    ) -> Path:
-        """
-        Génère le rapport HTML pour une stratégie.
+        .strategy-card:hover {{
+            transform: translateY(-5px);
+        }}
         
-        Args:
-            analysis: Résultat de l'analyse IA
-            strategy_code: Code source de la stratégie
-            mc_report_path: Chemin vers le rapport Monte Carlo (optionnel)
-            correlation_path: Chemin vers le dashboard corrélation (optionnel)
-            
-        Returns:
-            Path du fichier HTML généré
-        """
-        name = analysis.get("strategy_name", "Unknown")
-        stype = analysis.get("strategy_type", "OTHER")
-        subtype = analysis.get("strategy_subtype", "")
+        .strategy-card h3 {{
+            margin-bottom: 10px;
+        }}
         
-        # Scores
-        quality_score = analysis.get("quality_score", "N/A")
-        complexity_score = analysis.get("complexity_score", "N/A")
+        .strategy-card h3 a {{
+            color: #2c3e50;
+            text-decoration: none;
+        }}
         
-        # Formatage des sections
-        summary_html = format_text_for_html(analysis.get("summary", ""))
-        entry_html = format_text_for_html(analysis.get("entry_conditions", ""))
-        exit_html = format_text_for_html(analysis.get("exit_conditions", ""))
-        quality_analysis_html = format_text_for_html(analysis.get("quality_analysis", ""))
-        pattern_details_html = format_text_for_html(analysis.get("pattern_details", ""))
+        .strategy-card h3 a:hover {{
+            color: #667eea;
+        }}
         
-        # Patterns list
-        patterns = analysis.get("function_patterns", [])
-        if isinstance(patterns, str):
-            patterns = [p.strip() for p in patterns.split(";") if p.strip()]
+        .card-badges {{
+            margin-bottom: 10px;
+        }}
         
-        patterns_html = '<div class="patterns-list">'
-        for p in patterns:
-            patterns_html += f'<span class="pattern-tag">{html_escape(p)}</span>'
-        patterns_html += '</div>' if patterns else '<p>Aucun pattern identifié</p>'
+        .badge {{
+            display: inline-block;
+            padding: 4px 10px;
+            border-radius: 12px;
+            font-size: 0.8em;
+            color: white;
+            margin-right: 5px;
+        }}
         
-        # Liens vers autres rapports
-        links_html = ""
-        if mc_report_path or correlation_path:
-            links_html = '<div class="links-section"><h3>📊 Rapports Liés</h3><ul>'
-            if mc_report_path:
-                links_html += f'<li><a href="{mc_report_path}">📈 Simulation Monte Carlo</a></li>'
-            if correlation_path:
-                links_html += f'<li><a href="{correlation_path}">🔗 Analyse de Corrélation</a></li>'
-            links_html += '</ul></div>'
+        .badge-subtype {{
+            background: #95a5a6;
+        }}
         
-        # Construire le HTML
-        type_color = get_type_color(stype)
-        quality_class = get_score_class(quality_score)
-        complexity_class = get_score_class(complexity_score)
+        .card-summary {{
+            color: #555;
+            font-size: 0.9em;
+            margin-bottom: 10px;
+            min-height: 40px;
+        }}
         
-        exit_on_close = analysis.get("exit_on_close", "NO")
-        eoc_class = "badge-yes" if exit_on_close.upper() == "YES" else "badge-no"
+        .card-scores {{
+            display: flex;
+            justify-content: space-between;
+            padding-top: 10px;
+            border-top: 1px solid #eee;
+            font-size: 0.9em;
+        }}
         
-        time_exit = analysis.get("time_exit_condition", "NO")
-        te_class = "badge-yes" if time_exit.upper() == "YES" else "badge-no"
+        .score-high {{ color: #27ae60; }}
+        .score-medium {{ color: #f39c12; }}
+        .score-low {{ color: #e74c3c; }}
         
-        html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{html_escape(name)} - Strategy Analysis</title>
-    {self.COMMON_CSS}
+        @media (max-width: 1000px) {{
+            .content-wrapper {{
+                grid-template-columns: 1fr;
+            }}
+            .sidebar {{
+                position: relative;
+                top: 0;
+            }}
+        }}
+    </style>
 </head>
 <body>
     <div class="container">
-        <a href="index.html" class="back-link">← Retour à la liste</a>
+        <div class="header">
+            <h1>🤖 AI Strategy Analysis Dashboard</h1>
+            <p class="subtitle">Analyse automatisée des stratégies de trading</p>
+            
+            <div class="stats">
+                <div class="stat-box">
+                    <strong>{total}</strong>
+                    <span>Stratégies</span>
+                </div>
+                <div class="stat-box">
+                    <strong>{avg_quality:.1f}/10</strong>
+                    <span>Qualité Moyenne</span>
+                </div>
+                <div class="stat-box">
+                    <strong>{n_types}</strong>
+                    <span>Types</span>
+                </div>
+            </div>
+        </div>
         
-        <h1>📊 {html_escape(name)}</h1>
-        
-        <div class="header-grid">
-            <div class="info-box">
-                <strong>Type</strong>
-                <span class="badge" style="background-color: {type_color}">{stype}</span>
-            </div>
-            <div class="info-box">
-                <strong>Sous-type</strong>
-                <span>{html_escape(subtype)}</span>
-            </div>
-            <div class="info-box">
-                <strong>Score Qualité</strong>
-                <span class="score {quality_class}">{quality_score}/10</span>
-            </div>
-            <div class="info-box">
-                <strong>Score Complexité</strong>
-                <span class="score {complexity_class}">{complexity_score}/10</span>
+        <div class="filters">
+            <input type="text" id="searchBox" class="search-box" placeholder="🔍 Rechercher une stratégie...">
+            <div class="type-filter" id="typeFilter">
+                {type_buttons}
             </div>
         </div>
         
-        <div class="section">
-            <h2>📝 Résumé</h2>
-            {summary_html}
-        </div>
-        
-        <div class="section">
-            <h2>🎯 Conditions d'Entrée</h2>
-            {entry_html}
-        </div>
-        
-        <div class="section">
-            <h2>🚪 Conditions de Sortie</h2>
-            {exit_html}
-        </div>
-        
-        <div class="header-grid">
-            <div class="info-box">
-                <strong>Stop Loss</strong>
-                {format_text_for_html(analysis.get('stop_loss_level', 'None'))}
-            </div>
-            <div class="info-box">
-                <strong>Take Profit</strong>
-                {format_text_for_html(analysis.get('take_profit_level', 'None'))}
-            </div>
-            <div class="info-box">
-                <strong>Exit On Close</strong>
-                <span class="badge {eoc_class}">{exit_on_close}</span>
+        <div class="content-wrapper">
+            <div class="sidebar">
+                <h2>📊 Distribution par Type</h2>
+                {type_dist_html}
             </div>
-            <div class="info-box">
-                <strong>Time Exit</strong>
-                <span class="badge {te_class}">{time_exit}</span>
+            
+            <div class="strategies-grid" id="strategiesGrid">
+                {cards_html}
             </div>
         </div>
-        
-        <div class="section">
-            <h2>🔧 Patterns & Fonctions</h2>
-            {patterns_html}
-            <p><strong>Nombre de patterns:</strong> {analysis.get('number_of_patterns', 'N/A')}</p>
-        </div>
-        
-        {"<div class='section'><h2>🔍 Détails des Patterns</h2>" + pattern_details_html + "</div>" if pattern_details_html and pattern_details_html not in ('N/A', 'None', '') else ""}
-        
-        <div class="section">
-            <h2>⭐ Analyse Qualité</h2>
-            {quality_analysis_html}
-        </div>
-        
-        {links_html}
-        
-        <h2>💻 Code Source</h2>
-        <div class="code-block"><pre>{html_escape(strategy_code)}</pre></div>
-        
-        <p style="margin-top: 20px; color: #7f8c8d; font-size: 0.9em;">
-            Généré le {datetime.now().strftime('%Y-%m-%d %H:%M')} | 
-            Hash: {analysis.get('code_hash', 'N/A')[:12]}...
-        </p>
     </div>
-</body>
-</html>"""
-        
-        # Sauvegarder
-        filename = f"{name.replace(' ', '_').replace('/', '_')}.html"
-        output_path = self.output_dir / filename
-        output_path.write_text(html, encoding='utf-8')
-        
-        return output_path
     
-    def generate_dashboard(
-        self,
-        results: List[Dict],
-        output_filename: str = "index.html",
-    ) -> Path:
-        """
-        Génère le dashboard principal listant toutes les stratégies.
-        
-        Args:
-            results: Liste des résultats d'analyse
-            output_filename: Nom du fichier de sortie
-            
-        Returns:
-            Path du fichier HTML généré
-        """
-        # Trier par qualité décroissante
-        sorted_results = sorted(
-            results,
-            key=lambda x: float(x.get('quality_score', 0)) if x.get('quality_score', 'N/A') != 'N/A' else 0,
-            reverse=True
-        )
-        
-        # Statistiques
-        total = len(results)
+    <script>
+        const searchBox = document.getElementById('searchBox');
+        const typeFilter = document.getElementById('typeFilter');
+        const grid = document.getElementById('strategiesGrid');
+        let currentType = 'all';
         
-        quality_scores = [
-            float(r.get('quality_score', 0)) 
-            for r in results 
-            if r.get('quality_score', 'N/A') != 'N/A'
-        ]
-        avg_quality = sum(quality_scores) / len(quality_scores) if quality_scores else 0
+        searchBox.addEventListener('input', filterCards);
         
-        # Distribution par type
-        type_counts = {}
-        for r in results:
-            t = r.get('strategy_type', 'OTHER')
-            type_counts[t] = type_counts.get(t, 0) + 1
+        typeFilter.querySelectorAll('button').forEach(btn => {{
+            btn.addEventListener('click', () => {{
+                typeFilter.querySelectorAll('button').forEach(b => b.classList.remove('active'));
+                btn.classList.add('active');
+                currentType = btn.dataset.type;
+                filterCards();
+            }});
+        }});
         
-        # Générer les cards
-        cards_html = ""
-        for r in sorted_results:
-            name = r.get('strategy_name', 'Unknown')
-            stype = r.get('strategy_type', 'OTHER')
-            subtype = r.get('strategy_subtype', '')
-            summary = r.get('summary', '')
-            quality = r.get('quality_score', 'N/A')
-            complexity = r.get('complexity_score', 'N/A')
-            
-            # Nettoyer le résumé
-            summary_clean = re.sub(r'\\n+', ' ', summary)
-            summary_clean = re.sub(r'\*\*([^*]+)\*\*', r'\1', summary_clean)
-            summary_clean = re.sub(r'\s+', ' ', summary_clean).strip()
-            if len(summary_clean) > 150:
-                summary_clean = summary_clean[:147] + '...'
-            
-            html_file = f"{name.replace(' ', '_').replace('/', '_')}.html"
-            type_color = get_type_color(stype)
-            quality_class = get_score_class(quality)
+        function filterCards() {{
+            const search = searchBox.value.toLowerCase();
+            const cards = grid.querySelectorAll('.strategy-card');
             
-            cards_html += f"""
-            <div class="strategy-card" data-type="{stype.lower()}" data-quality="{quality}">
-                <h3><a href="{html_file}">{html_escape(name)}</a></h3>
-                <div class="card-badges">
-                    <span class="badge" style="background-color: {type_color}">{stype}</span>
-                    <span class="badge badge-subtype">{html_escape(subtype[:40])}</span>
-                </div>
-                <p class="card-summary">{html_escape(summary_clean)}</p>
-                <div class="card-scores">
-                    <span>Qualité: <strong class="{quality_class}">{quality}/10</strong></span>
-                    <span>Complexité: <strong>{complexity}/10</strong></span>
-                </div>
-            </div>
-            """
-        
-        # Générer la distribution par type
-        type_dist_html = ""
-        max_count = max(type_counts.values()) if type_counts else 1
-        for t, count in sorted(type_counts.items(), key=lambda x: x[1], reverse=True):
-            pct = (count / max_count) * 100
-            color = get_type_color(t)
-            type_dist_html += f"""
-            <div class="type-row">
-                <span class="type-name">{t}</span>
-                <div class="type-bar-container">
-                    <div class="type-bar" style="width: {pct}%; background-color: {color}"></div>
-                </div>
-                <span class="type-count">{count}</span>
-            </div>
-            """
-        
-        # Type filter buttons
-        type_buttons = '<button class="active" data-type="all">Tous ({total})</button>'
-        for t, count in sorted(type_counts.items(), key=lambda x: x[1], reverse=True)[:5]:
-            type_buttons += f'<button data-type="{t.lower()}">{t} ({count})</button>'
-        
-        html = f"""<!DOCTYPE html>
-<html lang="fr">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>AI Strategy Analysis Dashboard</title>
+            cards.forEach(card => {{
+                const text = card.textContent.toLowerCase();
+                const type = card.dataset.type;
+                
+                const matchSearch = text.includes(search);
+                const matchType = currentType === 'all' || type === currentType;
+                
+                card.style.display = matchSearch && matchType ? 'block' : 'none';
+            }});
+        }}
+    </script>
+</body>
+</html>""")
+
+
+# =============================================================================
+# GÉNÉRATEUR DE RAPPORTS
+# =============================================================================
+
+class HTMLReportGenerator:
+    """Génère les rapports HTML pour les analyses de stratégies."""
+    
+    # CSS commun pour tous les rapports
+    COMMON_CSS = """
     <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+        :root {
+            --primary: #3498db;
+            --success: #27ae60;
+            --warning: #f39c12;
+            --danger: #e74c3c;
+            --dark: #2c3e50;
+            --light: #ecf0f1;
+        }
         
-        body {{
+        * {
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }
+        
+        body {
             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
+            line-height: 1.6;
+            color: #333;
+            background-color: #f5f5f5;
             padding: 20px;
-        }}
-        
-        .container {{ max-width: 1400px; margin: 0 auto; }}
+        }
         
-        .header {{
+        .container {
+            max-width: 1200px;
+            margin: 0 auto;
             background: white;
             border-radius: 10px;
             padding: 30px;
-            margin-bottom: 30px;
-            box-shadow: 0 4px 15px rgba(0,0,0,0.2);
-        }}
-        
-        h1 {{
-            color: #2c3e50;
-            margin-bottom: 10px;
-        }}
+            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+        }
         
-        .subtitle {{
-            color: #7f8c8d;
+        .back-link {
+            display: inline-block;
             margin-bottom: 20px;
-        }}
-        
-        .stats {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
-            gap: 20px;
-            margin: 30px 0;
-        }}
+            color: var(--primary);
+            text-decoration: none;
+            font-weight: 500;
+        }
         
-        .stat-box {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 20px;
-            border-radius: 10px;
-            text-align: center;
-        }}
+        .back-link:hover {
+            text-decoration: underline;
+        }
         
-        .stat-box strong {{
+        h1 {
+            color: var(--dark);
+            border-bottom: 3px solid var(--primary);
+            padding-bottom: 10px;
+            margin-bottom: 20px;
+        }
+        
+        h2 {
+            color: #34495e;
+            margin-top: 30px;
+            margin-bottom: 15px;
+            border-left: 4px solid var(--primary);
+            padding-left: 15px;
+        }
+        
+        .header-grid {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+            gap: 20px;
+            margin: 20px 0;
+        }
+        
+        .info-box {
+            background: var(--light);
+            padding: 15px;
+            border-radius: 8px;
+            border-left: 4px solid var(--primary);
+        }
+        
+        .info-box strong {
             display: block;
-            font-size: 2em;
+            color: var(--dark);
             margin-bottom: 5px;
-        }}
+            font-size: 0.9em;
+        }
         
-        .filters {{
-            background: white;
-            border-radius: 10px;
-            padding: 20px;
-            margin-bottom: 30px;
-            box-shadow: 0 4px 15px rgba(0,0,0,0.2);
-        }}
+        .badge {
+            display: inline-block;
+            padding: 5px 12px;
+            border-radius: 15px;
+            color: white;
+            font-size: 0.85em;
+            font-weight: 500;
+        }
         
-        .search-box {{
-            width: 100%;
-            padding: 12px;
-            font-size: 1em;
-            border: 2px solid #ddd;
-            border-radius: 5px;
-            margin-bottom: 15px;
-        }}
+        .badge-yes {
+            background: var(--success);
+        }
         
-        .type-filter {{
-            display: flex;
-            flex-wrap: wrap;
-            gap: 10px;
-        }}
+        .badge-no {
+            background: #95a5a6;
+        }
         
-        .type-filter button {{
-            padding: 8px 16px;
-            border: 2px solid #667eea;
-            background: white;
-            color: #667eea;
-            border-radius: 20px;
-            cursor: pointer;
-            font-weight: 500;
-        }}
+        .score {
+            font-size: 1.5em;
+            font-weight: bold;
+        }
         
-        .type-filter button:hover,
-        .type-filter button.active {{
-            background: #667eea;
-            color: white;
-        }}
+        .score-high {
+            color: var(--success);
+        }
         
-        .content-wrapper {{
-            display: grid;
-            grid-template-columns: 280px 1fr;
-            gap: 30px;
-        }}
+        .score-medium {
+            color: var(--warning);
+        }
         
-        .sidebar {{
-            background: white;
-            border-radius: 10px;
+        .score-low {
+            color: var(--danger);
+        }
+        
+        .section {
+            margin: 25px 0;
             padding: 20px;
-            height: fit-content;
-            position: sticky;
-            top: 20px;
-        }}
+            background: #f8f9fa;
+            border-radius: 8px;
+        }
         
-        .sidebar h2 {{
-            font-size: 1.2em;
-            margin-bottom: 15px;
-            color: #2c3e50;
-        }}
+        .analysis-list {
+            margin: 10px 0 10px 20px;
+        }
         
-        .type-row {{
+        .analysis-list li {
+            margin: 8px 0;
+        }
+        
+        .code-block {
+            background: #282c34;
+            color: #abb2bf;
+            padding: 20px;
+            border-radius: 8px;
+            overflow-x: auto;
+            font-family: 'Courier New', monospace;
+            font-size: 13px;
+            line-height: 1.5;
+            white-space: pre-wrap;
+            word-wrap: break-word;
+        }
+        
+        .patterns-list {
             display: flex;
-            align-items: center;
-            margin-bottom: 10px;
-        }}
+            flex-wrap: wrap;
+            gap: 8px;
+            margin: 10px 0;
+        }
         
-        .type-name {{
-            width: 100px;
-            font-size: 0.85em;
-        }}
+        .pattern-tag {
+            background: var(--light);
+            padding: 5px 10px;
+            border-radius: 4px;
+            font-family: monospace;
+            font-size: 0.9em;
+        }
         
-        .type-bar-container {{
-            flex: 1;
-            height: 20px;
-            background: #ecf0f1;
-            border-radius: 10px;
-            overflow: hidden;
-            margin: 0 10px;
-        }}
+        .links-section {
+            margin-top: 30px;
+            padding: 20px;
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            border-radius: 8px;
+            color: white;
+        }
         
-        .type-bar {{
-            height: 100%;
-        }}
+        .links-section a {
+            color: white;
+            text-decoration: underline;
+        }
         
-        .type-count {{
-            width: 30px;
-            text-align: right;
-            font-weight: bold;
-        }}
+        @media (max-width: 768px) {
+            .header-grid {
+                grid-template-columns: 1fr;
+            }
+            
+            body {
+                padding: 10px;
+            }
+            
+            .container {
+                padding: 15px;
+            }
+        }
+    </style>
+    """
+    
+    def __init__(self, output_dir: Path):
+        """
+        Initialise le générateur.
         
-        .strategies-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fill, minmax(320px, 1fr));
-            gap: 20px;
-        }}
+        Args:
+            output_dir: Répertoire de sortie pour les HTML
+        """
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+    
+    def generate_strategy_report(
+        self,
+        analysis: Dict,
+        strategy_code: str,
+        mc_report_path: Optional[str] = None,
+        correlation_path: Optional[str] = None,
+    ) -> Path:
+        """
+        Génère le rapport HTML pour une stratégie.
         
-        .strategy-card {{
-            background: white;
-            border-radius: 10px;
-            padding: 20px;
-            box-shadow: 0 4px 15px rgba(0,0,0,0.1);
-            transition: transform 0.3s;
-        }}
+        Args:
+            analysis: Résultat de l'analyse IA
+            strategy_code: Code source de la stratégie
+            mc_report_path: Chemin vers le rapport Monte Carlo (optionnel)
+            correlation_path: Chemin vers le dashboard corrélation (optionnel)
+            
+        Returns:
+            Path du fichier HTML généré
+        """
+        name = analysis.get("strategy_name", "Unknown")
+        stype = analysis.get("strategy_type", "OTHER")
+        subtype = analysis.get("strategy_subtype", "")
         
-        .strategy-card:hover {{
-            transform: translateY(-5px);
-        }}
+        # Scores
+        quality_score = analysis.get("quality_score", "N/A")
+        complexity_score = analysis.get("complexity_score", "N/A")
         
-        .strategy-card h3 {{
-            margin-bottom: 10px;
-        }}
+        # Formatage des sections
+        summary_html = format_text_for_html(analysis.get("summary", ""))
+        entry_html = format_text_for_html(analysis.get("entry_conditions", ""))
+        exit_html = format_text_for_html(analysis.get("exit_conditions", ""))
+        quality_analysis_html = format_text_for_html(analysis.get("quality_analysis", ""))
+        pattern_details_html = format_text_for_html(analysis.get("pattern_details", ""))
         
-        .strategy-card h3 a {{
-            color: #2c3e50;
-            text-decoration: none;
-        }}
+        # Patterns list
+        patterns = analysis.get("function_patterns", [])
+        if isinstance(patterns, str):
+            patterns = [p.strip() for p in patterns.split(";") if p.strip()]
         
-        .strategy-card h3 a:hover {{
-            color: #667eea;
-        }}
+        if patterns:
+            tags = PATTERN_TAG_TEMPLATE.render_many({'pattern': p} for p in patterns)
+            patterns_html = Markup(f'<div class="patterns-list">{tags}</div>')
+        else:
+            patterns_html = Markup('<p>Aucun pattern identifié</p>')
         
-        .card-badges {{
-            margin-bottom: 10px;
-        }}
+        if pattern_details_html and pattern_details_html not in ('N/A', 'None', ''):
+            pattern_details_section = Markup(
+                f"<div class='section'><h2>🔍 Détails des Patterns</h2>{pattern_details_html}</div>"
+            )
+        else:
+            pattern_details_section = Markup('')
         
-        .badge {{
-            display: inline-block;
-            padding: 4px 10px;
-            border-radius: 12px;
-            font-size: 0.8em;
-            color: white;
-            margin-right: 5px;
-        }}
+        # Liens vers autres rapports
+        links = [
+            {'href': path, 'label': label}
+            for path, label in (
+                (mc_report_path, '📈 Simulation Monte Carlo'),
+                (correlation_path, '🔗 Analyse de Corrélation'),
+            )
+            if path
+        ]
+        links_html = Markup('')
+        if links:
+            links_html = Markup(
+                '<div class="links-section"><h3>📊 Rapports Liés</h3><ul>'
+                f'{REPORT_LINK_TEMPLATE.render_many(links)}</ul></div>'
+            )
         
-        .badge-subtype {{
-            background: #95a5a6;
-        }}
+        # Construire le HTML
+        type_color = get_type_color(stype)
+        quality_class = get_score_class(quality_score)
+        complexity_class = get_score_class(complexity_score)
         
-        .card-summary {{
-            color: #555;
-            font-size: 0.9em;
-            margin-bottom: 10px;
-            min-height: 40px;
-        }}
+        exit_on_close = analysis.get("exit_on_close", "NO")
+        eoc_class = "badge-yes" if exit_on_close.upper() == "YES" else "badge-no"
         
-        .card-scores {{
-            display: flex;
-            justify-content: space-between;
-            padding-top: 10px;
-            border-top: 1px solid #eee;
-            font-size: 0.9em;
-        }}
+        time_exit = analysis.get("time_exit_condition", "NO")
+        te_class = "badge-yes" if time_exit.upper() == "YES" else "badge-no"
         
-        .score-high {{ color: #27ae60; }}
-        .score-medium {{ color: #f39c12; }}
-        .score-low {{ color: #e74c3c; }}
+        html = STRATEGY_REPORT_TEMPLATE.render(
+            name=name,
+            common_css=Markup(self.COMMON_CSS),
+            type_color=type_color,
+            stype=stype,
+            subtype=subtype,
+            quality_class=quality_class,
+            quality_score=quality_score,
+            complexity_class=complexity_class,
+            complexity_score=complexity_score,
+            summary_html=Markup(summary_html),
+            entry_html=Markup(entry_html),
+            exit_html=Markup(exit_html),
+            stop_loss_html=Markup(format_text_for_html(analysis.get('stop_loss_level', 'None'))),
+            take_profit_html=Markup(format_text_for_html(analysis.get('take_profit_level', 'None'))),
+            eoc_class=eoc_class,
+            exit_on_close=exit_on_close,
+            te_class=te_class,
+            time_exit=time_exit,
+            patterns_html=patterns_html,
+            number_of_patterns=analysis.get('number_of_patterns', 'N/A'),
+            pattern_details_section=pattern_details_section,
+            quality_analysis_html=Markup(quality_analysis_html),
+            links_html=links_html,
+            strategy_code=strategy_code,
+            generated=datetime.now().strftime('%Y-%m-%d %H:%M'),
+            code_hash=analysis.get('code_hash', 'N/A')[:12],
+        )
         
-        @media (max-width: 1000px) {{
-            .content-wrapper {{
-                grid-template-columns: 1fr;
-            }}
-            .sidebar {{
-                position: relative;
-                top: 0;
-            }}
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>🤖 AI Strategy Analysis Dashboard</h1>
-            <p class="subtitle">Analyse automatisée des stratégies de trading</p>
-            
-            <div class="stats">
-                <div class="stat-box">
-                    <strong>{total}</strong>
-                    <span>Stratégies</span>
-                </div>
-                <div class="stat-box">
-                    <strong>{avg_quality:.1f}/10</strong>
-                    <span>Qualité Moyenne</span>
-                </div>
-                <div class="stat-box">
-                    <strong>{len(type_counts)}</strong>
-                    <span>Types</span>
-                </div>
-            </div>
-        </div>
+        # Sauvegarder
+        filename = f"{name.replace(' ', '_').replace('/', '_')}.html"
+        output_path = self.output_dir / filename
+        output_path.write_text(html, encoding='utf-8')
         
-        <div class="filters">
-            <input type="text" id="searchBox" class="search-box" placeholder="🔍 Rechercher une stratégie...">
-            <div class="type-filter" id="typeFilter">
-                {type_buttons}
-            </div>
-        </div>
+        return output_path
+    
+    def generate_dashboard(
+        self,
+        results: List[Dict],
+        output_filename: str = "index.html",
+    ) -> Path:
+        """
+        Génère le dashboard principal listant toutes les stratégies.
         
-        <div class="content-wrapper">
-            <div class="sidebar">
-                <h2>📊 Distribution par Type</h2>
-                {type_dist_html}
-            </div>
+        Args:
+            results: Liste des résultats d'analyse
+            output_filename: Nom du fichier de sortie
             
-            <div class="strategies-grid" id="strategiesGrid">
-                {cards_html}
-            </div>
-        </div>
-    </div>
-    
-    <script>
-        const searchBox = document.getElementById('searchBox');
-        const typeFilter = document.getElementById('typeFilter');
-        const grid = document.getElementById('strategiesGrid');
-        let currentType = 'all';
+        Returns:
+            Path du fichier HTML généré
+        """
+        # Trier par qualité décroissante
+        sorted_results = sorted(
+            results,
+            key=lambda x: float(x.get('quality_score', 0)) if x.get('quality_score', 'N/A') != 'N/A' else 0,
+            reverse=True
+        )
         
-        searchBox.addEventListener('input', filterCards);
+        # Statistiques
+        total = len(results)
         
-        typeFilter.querySelectorAll('button').forEach(btn => {{
-            btn.addEventListener('click', () => {{
-                typeFilter.querySelectorAll('button').forEach(b => b.classList.remove('active'));
-                btn.classList.add('active');
-                currentType = btn.dataset.type;
-                filterCards();
-            }});
-        }});
+        quality_scores = [
+            float(r.get('quality_score', 0)) 
+            for r in results 
+            if r.get('quality_score', 'N/A') != 'N/A'
+        ]
+        avg_quality = sum(quality_scores) / len(quality_scores) if quality_scores else 0
         
-        function filterCards() {{
-            const search = searchBox.value.toLowerCase();
-            const cards = grid.querySelectorAll('.strategy-card');
+        # Distribution par type
+        type_counts = {}
+        for r in results:
+            t = r.get('strategy_type', 'OTHER')
+            type_counts[t] = type_counts.get(t, 0) + 1
+        
+        # Générer les cards
+        cards = []
+        for r in sorted_results:
+            name = r.get('strategy_name', 'Unknown')
+            stype = r.get('strategy_type', 'OTHER')
+            subtype = r.get('strategy_subtype', '')
+            summary = r.get('summary', '')
+            quality = r.get('quality_score', 'N/A')
+            complexity = r.get('complexity_score', 'N/A')
             
-            cards.forEach(card => {{
-                const text = card.textContent.toLowerCase();
-                const type = card.dataset.type;
-                
-                const matchSearch = text.includes(search);
-                const matchType = currentType === 'all' || type === currentType;
-                
-                card.style.display = matchSearch && matchType ? 'block' : 'none';
-            }});
-        }}
-    </script>
-</body>
-</html>"""
+            # Nettoyer le résumé
+            summary_clean = re.sub(r'\\n+', ' ', summary)
+            summary_clean = re.sub(r'\*\*([^*]+)\*\*', r'\1', summary_clean)
+            summary_clean = re.sub(r'\s+', ' ', summary_clean).strip()
+            if len(summary_clean) > 150:
+                summary_clean = summary_clean[:147] + '...'
+            
+            html_file = f"{name.replace(' ', '_').replace('/', '_')}.html"
+            type_color = get_type_color(stype)
+            quality_class = get_score_class(quality)
+            
+            cards.append({
+                'type_key': stype.lower(),
+                'quality': quality,
+                'html_file': html_file,
+                'name': name,
+                'type_color': type_color,
+                'stype': stype,
+                'subtype': subtype[:40],
+                'summary': summary_clean,
+                'quality_class': quality_class,
+                'complexity': complexity,
+            })
+        cards_html = STRATEGY_CARD_TEMPLATE.render_many(cards)
+        
+        # Générer la distribution par type
+        max_count = max(type_counts.values()) if type_counts else 1
+        by_count = sorted(type_counts.items(), key=lambda x: x[1], reverse=True)
+        type_dist_html = TYPE_ROW_TEMPLATE.render_many(
+            {'stype': t, 'pct': (count / max_count) * 100, 'color': get_type_color(t), 'count': count}
+            for t, count in by_count
+        )
+        
+        # Type filter buttons
+        buttons = [{'active': Markup(' class="active"'), 'type_key': 'all', 'label': 'Tous', 'count': total}]
+        buttons += [{'active': '', 'type_key': t.lower(), 'label': t, 'count': count} for t, count in by_count[:5]]
+        type_buttons = TYPE_BUTTON_TEMPLATE.render_many(buttons)
+        
+        html = DASHBOARD_TEMPLATE.render(
+            total=total,
+            avg_quality=avg_quality,
+            n_types=len(type_counts),
+            type_buttons=type_buttons,
+            type_dist_html=type_dist_html,
+            cards_html=cards_html,
+        )
         
         output_path = self.output_dir / output_filename
         output_path.write_text(html, encoding='utf-8')
@@ -6,6 +6,14 @@ Basé sur la méthodologie Kevin Davey.
 from .config import (
     DEFAULT_CONFIG,
     SCORE_THRESHOLDS,
+    TILING_CONFIG,
+    MULTI_WINDOW_CONFIG,
+    STREAMING_CONFIG,
+    BOOTSTRAP_CONFIG,
+    SIMILARITY_CONFIG,
+    AGGREGATION_CONFIG,
+    CLUSTERING_CONFIG,
+    DRAWDOWN_CONFIG,
     STATUS_DIVERSIFYING,
     STATUS_MODERATE,
     STATUS_CORRELATED,
@@ -17,12 +25,34 @@ from .correlation_calculator import (
     build_profit_matrix,
     calculate_correlation_matrix,
     calculate_davey_scores,
+    calculate_threshold_sweep,
+    add_aggregated_score_columns,
 )
+from .profit_matrix import ProfitMatrix, ProfitMatrixAccumulator
+from .packed_matrix import PackedSymmetricMatrix
+from .consolidated_cache import load_consolidated, stream_profit_matrix
+from .correlation_tiles import tiled_pearson_correlation_matrix
+from .correlation_state import CorrelationState
+from .correlation_store import CorrelationStore, save_correlation_store
+from .correlation_rolling import RollingCorrelations, rolling_pair_correlations
+from .correlation_windows import multi_window_correlations, calculate_multi_window_scores, window_weights
+from .correlation_bootstrap import bootstrap_correlation_intervals, robust_correlated_counts
+from .portfolio_selection import PortfolioSelector
+from .correlation_neighbors import SimilarityIndex, datasource_strategy_id, read_datasource_profits
+from .correlation_clustering import CorrelationClusters, average_linkage
 
 __all__ = [
     # Config
     'DEFAULT_CONFIG',
     'SCORE_THRESHOLDS',
+    'TILING_CONFIG',
+    'MULTI_WINDOW_CONFIG',
+    'STREAMING_CONFIG',
+    'BOOTSTRAP_CONFIG',
+    'SIMILARITY_CONFIG',
+    'AGGREGATION_CONFIG',
+    'CLUSTERING_CONFIG',
+    'DRAWDOWN_CONFIG',
     'STATUS_DIVERSIFYING',
     'STATUS_MODERATE',
     'STATUS_CORRELATED',
@@ -33,4 +63,40 @@ __all__ = [
     'build_profit_matrix',
     'calculate_correlation_matrix',
     'calculate_davey_scores',
+    'calculate_threshold_sweep',
+    'add_aggregated_score_columns',
+    # Cache colonnaire du fichier consolidé
+    'load_consolidated',
+    'stream_profit_matrix',
+    # Matrice de profits compacte
+    'ProfitMatrix',
+    'ProfitMatrixAccumulator',
+    # Matrices symétriques empaquetées
+    'PackedSymmetricMatrix',
+    # Calcul par tuiles
+    'tiled_pearson_correlation_matrix',
+    # État incrémental
+    'CorrelationState',
+    # Export binaire (.npy + index JSON)
+    'CorrelationStore',
+    'save_correlation_store',
+    # Corrélation glissante
+    'RollingCorrelations',
+    'rolling_pair_correlations',
+    # Multi-fenêtres
+    'multi_window_correlations',
+    'calculate_multi_window_scores',
+    'window_weights',
+    # Intervalles de confiance bootstrap
+    'bootstrap_correlation_intervals',
+    'robust_correlated_counts',
+    # Portefeuille diversifié
+    'PortfolioSelector',
+    # Recherche des stratégies les plus corrélées
+    'SimilarityIndex',
+    'datasource_strategy_id',
+    'read_datasource_profits',
+    # Classification hiérarchique
+    'CorrelationClusters',
+    'average_linkage',
 ]
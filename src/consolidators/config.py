@@ -29,6 +29,86 @@ DEFAULT_CONFIG = {
     
     # Méthode
     'correlation_method': 'pearson',   # 'pearson', 'spearman', 'kendall'
+    'n_jobs': 1,                       # Processus pour Spearman/Kendall (1 = séquentiel)
+    
+    # Corrélation glissante (pages individuelles)
+    'rolling_window_months': 12,       # Longueur de fenêtre
+    'rolling_step_months': 1,          # Pas entre deux fenêtres
+    'rolling_top_n': 5,                # Partenaires suivis par stratégie
+    
+    # Sensibilité au seuil (balayage des scores Davey)
+    'sweep_thresholds': [0.50, 0.55, 0.60, 0.65, 0.70, 0.75, 0.80, 0.85, 0.90],
+    
+    # Portefeuille diversifié (sélection gloutonne / faisceau)
+    'portfolio_size': 10,              # Stratégies à sélectionner
+    'portfolio_beam_width': 1,         # 1 = glouton, > 1 = recherche en faisceau
+}
+
+# Scoring multi-fenêtres (fenêtres se terminant au dernier jour)
+MULTI_WINDOW_CONFIG = {
+    'windows_months': [3, 6, 12, 24], # Fenêtres courtes en mois
+    'include_longterm': True,          # Ajouter la fenêtre LT (depuis start_year_longterm)
+    'weights': None,                   # Poids relatifs {'3M': 1, ..., 'LT': 2}, ramenés à W_LT + W_CT
+                                       # (None = LT: W_LT, fenêtres en mois: W_CT à parts égales)
+}
+
+# Calcul par tuiles (grands univers: plusieurs milliers de stratégies)
+TILING_CONFIG = {
+    'min_strategies': 1000,            # En dessous: calcul matriciel direct
+    'tile_size': 512,                  # Stratégies par tuile (réduit si budget dépassé)
+    'n_workers': None,                 # Processus (None = nombre de CPU)
+    'memory_budget_mb': 2048,          # Mémoire de travail des tuiles (tous workers)
+    'progress_step_pct': 10,           # Pas d'affichage de la progression (%)
+}
+
+# Lecture en flux du fichier consolidé (plafond mémoire)
+STREAMING_CONFIG = {
+    'memory_budget_mb': 512,           # Plafond mémoire de l'étape de corrélation
+    'chunk_share': 0.25,               # Part du budget réservée au bloc en cours de lecture
+    'row_bytes': 400,                  # Coût estimé d'une ligne dans un bloc pandas
+    'min_chunk_rows': 10_000,          # Taille de bloc minimale
+}
+
+# Intervalles de confiance bootstrap des corrélations
+BOOTSTRAP_CONFIG = {
+    'n_replicates': 200,               # Répliques (rééchantillonnage des jours)
+    'confidence': 0.95,                # Niveau de confiance des intervalles
+    'seed': 42,                        # Graine (résultats reproductibles)
+    'n_workers': None,                 # Processus (None = nombre de CPU)
+    'parallel_min_replicates': 100,    # En dessous: calcul séquentiel
+    'memory_budget_mb': 1024,          # Mémoire des répliques en cours (tous workers)
+    'min_valid_share': 0.5,            # Part minimum de répliques calculables (sinon NaN)
+}
+
+# Corrélations des profits agrégés par semaine / mois (fenêtre long terme)
+AGGREGATION_CONFIG = {
+    'enabled': False,                  # Calculées par run() (run_pipeline: --corr-aggregated)
+    'levels': ['W', 'M'],              # Niveaux calculés lorsque activé
+    'labels': {'W': 'Hebdomadaire', 'M': 'Mensuel'},
+    'min_common_periods': {'W': 26, 'M': 12},  # Périodes communes minimum
+}
+
+# Corrélation de co-drawdown (jours où les deux stratégies sont en drawdown, fenêtre long terme)
+DRAWDOWN_CONFIG = {
+    'enabled': False,                  # Calculée par run() et exportée (run_pipeline: --corr-codrawdown)
+    'min_common_days': 50,             # Jours communs en drawdown minimum
+    'top_pairs': 20,                   # Paires à risque caché affichées (co-drawdown - LT)
+}
+
+# Recherche des stratégies les plus corrélées (esquisse + raffinement exact)
+SIMILARITY_CONFIG = {
+    'n_components': 256,               # Dimension de l'esquisse (projection aléatoire)
+    'seed': 42,                        # Graine de la projection
+    'n_candidates': 500,               # Candidates recalculées exactement (minimum)
+    'candidate_factor': 10,            # Candidates par stratégie demandée (k)
+    'block_rows': 1024,                # Stratégies projetées par bloc à la construction
+    'top_k': 15,                       # Stratégies affichées par requête
+}
+
+# Classification hiérarchique (lien moyen sur 1 - |corr|, matrice long terme)
+CLUSTERING_CONFIG = {
+    'enabled': False,                  # Calculée par run() et exportée (run_pipeline: --corr-clusters)
+    'cut_distance': None,              # Coupure des clusters (None = 1 - correlation_threshold)
 }
 
 # Classification des scores Davey
@@ -0,0 +1,374 @@
+"""
+Cache colonnaire du fichier consolidé (Consolidated_Strategies_*.txt).
+
+Le fichier texte (CSV français, dates %d/%m/%Y) est long à parser. À la
+première lecture, un compagnon .npz est écrit à côté du fichier avec:
+- les dates déjà parsées (datetime64)
+- les colonnes texte (stratégie, symbole...) en codes catégoriels
+- la colonne Strategy_ID précalculée (même règle que CorrelationAnalyzer)
+- les colonnes numériques telles quelles
+
+Les lectures suivantes chargent le compagnon tant qu'il est frais (taille
+et date de modification du fichier source identiques).
+
+Pour une mémoire bornée, stream_profit_matrix lit le fichier (ou son
+compagnon) par blocs de lignes et ajoute chaque bloc à la ProfitMatrix
+dense, sans jamais matérialiser le DataFrame complet ni les lignes lues.
+
+Utilisation:
+    df = load_consolidated(path)   # .txt ou compagnon .npz
+    profits = stream_profit_matrix(path, memory_budget_mb=512)
+"""
+
+import json
+import zipfile
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .config import STREAMING_CONFIG
+from .profit_matrix import ProfitMatrix, ProfitMatrixAccumulator
+
+
+CACHE_SUFFIX = '.columns.npz'  # Compagnon colonnaire du .txt
+CACHE_VERSION = 1
+
+# Ordre de recherche de la colonne stratégie (cf. CorrelationAnalyzer._prepare_data)
+_STRATEGY_COLUMNS = ('Strategy_Name', 'Strategie')
+
+# Colonnes utiles à la matrice de profits (lecture en flux)
+_PROFIT_COLUMNS = {'Date', 'DailyProfit', 'Strategy_ID', 'Symbol', *_STRATEGY_COLUMNS}
+
+
+def companion_path(source: Path) -> Path:
+    """Chemin du compagnon colonnaire d'un fichier consolidé."""
+    source = Path(source)
+    return source.with_name(source.stem + CACHE_SUFFIX)
+
+
+def source_path(cache: Path) -> Path:
+    """Chemin du fichier consolidé d'un compagnon colonnaire."""
+    cache = Path(cache)
+    return cache.with_name(cache.name[:-len(CACHE_SUFFIX)] + '.txt')
+
+
+def is_cache_path(path: Path) -> bool:
+    """Indique si le chemin désigne un compagnon colonnaire."""
+    return Path(path).name.endswith(CACHE_SUFFIX)
+
+
+def _source_signature(source: Path) -> Dict[str, int]:
+    stat = Path(source).stat()
+    return {'size': int(stat.st_size), 'mtime_ns': int(stat.st_mtime_ns)}
+
+
+def _read_meta(cache: Path) -> Optional[Dict]:
+    try:
+        with np.load(cache, allow_pickle=False) as archive:
+            return json.loads(str(archive['__meta__']))
+    except (OSError, KeyError, ValueError):
+        return None
+
+
+def is_cache_fresh(source: Path, cache: Optional[Path] = None) -> bool:
+    """
+    Vérifie que le compagnon correspond au fichier source actuel.
+
+    Args:
+        source: Fichier consolidé .txt
+        cache: Compagnon (défaut: companion_path(source))
+
+    Returns:
+        True si le compagnon existe et a été écrit pour cette version du source
+    """
+    source = Path(source)
+    cache = Path(cache) if cache is not None else companion_path(source)
+    if not cache.exists() or not source.exists():
+        return False
+
+    meta = _read_meta(cache)
+    if meta is None or meta.get('version') != CACHE_VERSION:
+        return False
+    return meta.get('source') == _source_signature(source)
+
+
+def parse_consolidated_text(source: Path) -> pd.DataFrame:
+    """
+    Lit le fichier consolidé texte et prépare les colonnes coûteuses.
+
+    Args:
+        source: Fichier Consolidated_Strategies_*.txt
+
+    Returns:
+        DataFrame avec Date parsée et Strategy_ID
+    """
+    return _prepare_columns(pd.read_csv(source, sep=';', encoding='utf-8', decimal=','))
+
+
+def _prepare_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Parse les dates et ajoute Strategy_ID (sur place)."""
+    if 'Date' in df.columns and not pd.api.types.is_datetime64_any_dtype(df['Date']):
+        df['Date'] = pd.to_datetime(df['Date'], format='%d/%m/%Y', errors='coerce')
+
+    if 'Strategy_ID' not in df.columns:
+        strategy_col = next((c for c in _STRATEGY_COLUMNS if c in df.columns), None)
+        if strategy_col is not None:
+            if 'Symbol' in df.columns:
+                df['Strategy_ID'] = df[strategy_col].astype(str) + '_' + df['Symbol'].astype(str)
+            else:
+                df['Strategy_ID'] = df[strategy_col].astype(str)
+
+    return df
+
+
+def write_consolidated_cache(df: pd.DataFrame, source: Path, cache: Optional[Path] = None) -> Path:
+    """
+    Écrit le compagnon colonnaire d'un DataFrame consolidé.
+
+    Args:
+        df: DataFrame issu de parse_consolidated_text
+        source: Fichier source (signature enregistrée pour la fraîcheur)
+        cache: Chemin de sortie (défaut: companion_path(source))
+
+    Returns:
+        Path du compagnon écrit
+    """
+    cache = Path(cache) if cache is not None else companion_path(source)
+
+    arrays = {}
+    kinds = []
+    for k, column in enumerate(df.columns):
+        series = df[column]
+        if pd.api.types.is_datetime64_any_dtype(series):
+            arrays[f'c{k}'] = series.to_numpy(dtype='datetime64[ns]').view(np.int64)
+            kinds.append('datetime')
+        elif pd.api.types.is_numeric_dtype(series) or pd.api.types.is_bool_dtype(series):
+            arrays[f'c{k}'] = series.to_numpy()
+            kinds.append('numeric')
+        else:
+            codes, categories = pd.factorize(series, sort=True)
+            arrays[f'c{k}'] = codes.astype(np.int32)
+            arrays[f'c{k}_categories'] = np.asarray(categories.astype(str), dtype=str)
+            kinds.append('category')
+
+    meta = {
+        'version': CACHE_VERSION,
+        'columns': [str(c) for c in df.columns],
+        'kinds': kinds,
+        'source': _source_signature(source),
+    }
+    arrays['__meta__'] = np.array(json.dumps(meta))
+
+    # Écriture atomique: un compagnon partiel ne doit jamais être lu
+    tmp = cache.with_name(cache.name + '.tmp')
+    with open(tmp, 'wb') as f:
+        np.savez(f, **arrays)
+    tmp.replace(cache)
+    return cache
+
+
+def read_consolidated_cache(cache: Path, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Charge un compagnon colonnaire.
+
+    Args:
+        cache: Fichier .columns.npz
+        columns: Colonnes à charger (défaut: toutes; les autres ne sont pas lues)
+
+    Returns:
+        DataFrame (dates datetime64, colonnes texte en catégories)
+    """
+    with np.load(cache, allow_pickle=False) as archive:
+        meta = json.loads(str(archive['__meta__']))
+        selected = [c for c in meta['columns'] if columns is None or c in columns]
+        data = {}
+        for k, (column, kind) in enumerate(zip(meta['columns'], meta['kinds'])):
+            if column not in selected:
+                continue
+            values = archive[f'c{k}']
+            if kind == 'datetime':
+                data[column] = values.view('datetime64[ns]')
+            elif kind == 'category':
+                data[column] = pd.Categorical.from_codes(values, categories=archive[f'c{k}_categories'])
+            else:
+                data[column] = values
+    return pd.DataFrame(data, columns=selected)
+
+
+def iter_consolidated_cache(cache: Path, columns: List[str], chunk_rows: int) -> Iterator[pd.DataFrame]:
+    """
+    Lit un compagnon colonnaire par tranches de lignes.
+
+    Les colonnes sont lues directement dans l'archive (en-tête .npy puis
+    chunk_rows valeurs à la fois): seule la tranche courante et les
+    catégories des colonnes texte sont en mémoire.
+
+    Args:
+        cache: Fichier .columns.npz
+        columns: Colonnes à lire
+        chunk_rows: Lignes par tranche
+
+    Yields:
+        DataFrame de chunk_rows lignes au plus (mêmes types que read_consolidated_cache)
+    """
+    with zipfile.ZipFile(cache) as archive:
+        with archive.open('__meta__.npy') as f:
+            meta = json.loads(str(np.lib.format.read_array(f)))
+
+        readers, categories = {}, {}
+        try:
+            for k, (column, kind) in enumerate(zip(meta['columns'], meta['kinds'])):
+                if column not in columns:
+                    continue
+                f = archive.open(f'c{k}.npy')
+                readers[column] = (f, kind, _read_npy_header(f))
+                if kind == 'category':
+                    with archive.open(f'c{k}_categories.npy') as cf:
+                        categories[column] = np.lib.format.read_array(cf)
+
+            while True:
+                data = {}
+                for column, (f, kind, dtype) in readers.items():
+                    values = np.frombuffer(f.read(chunk_rows * dtype.itemsize), dtype=dtype)
+                    if kind == 'datetime':
+                        data[column] = values.view('datetime64[ns]')
+                    elif kind == 'category':
+                        data[column] = pd.Categorical.from_codes(values, categories=categories[column])
+                    else:
+                        data[column] = values
+                if not data or len(next(iter(data.values()))) == 0:
+                    return
+                yield pd.DataFrame(data, columns=[c for c in meta['columns'] if c in data])
+        finally:
+            for f, _, _ in readers.values():
+                f.close()
+
+
+def _read_npy_header(f) -> np.dtype:
+    """Lit l'en-tête d'un tableau .npy 1-D et retourne son dtype."""
+    version = np.lib.format.read_magic(f)
+    if version == (1, 0):
+        shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+    else:
+        shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+    if len(shape) != 1 or dtype.hasobject:
+        raise ValueError(f"Colonne de compagnon inattendue: {shape} {dtype}")
+    return dtype
+
+
+def load_consolidated(path: Path, verbose: bool = True) -> pd.DataFrame:
+    """
+    Charge le fichier consolidé en passant par le compagnon colonnaire.
+
+    - compagnon frais: lecture directe
+    - sinon: parse du texte puis écriture du compagnon (première lecture)
+
+    Args:
+        path: Fichier consolidé .txt ou compagnon .columns.npz
+        verbose: Afficher la source utilisée
+
+    Returns:
+        DataFrame consolidé
+    """
+    path = Path(path)
+    source = source_path(path) if is_cache_path(path) else path
+    cache = companion_path(source)
+
+    if is_cache_fresh(source, cache) or (is_cache_path(path) and not source.exists()):
+        if verbose:
+            print(f"   ⚡ Cache colonnaire: {cache.name}")
+        return read_consolidated_cache(cache)
+
+    df = parse_consolidated_text(source)
+    try:
+        write_consolidated_cache(df, source, cache)
+        if verbose:
+            print(f"   💾 Cache colonnaire écrit: {cache.name}")
+    except OSError as e:
+        if verbose:
+            print(f"   ⚠️  Cache colonnaire non écrit: {e}")
+    return df
+
+
+def chunk_rows_for_budget(memory_budget_mb: Optional[float] = None) -> int:
+    """
+    Taille de bloc (lignes) compatible avec le budget mémoire.
+
+    Args:
+        memory_budget_mb: Budget total (défaut: STREAMING_CONFIG)
+
+    Returns:
+        Nombre de lignes par bloc
+    """
+    budget_mb = memory_budget_mb or STREAMING_CONFIG['memory_budget_mb']
+    chunk_bytes = budget_mb * 1024 ** 2 * STREAMING_CONFIG['chunk_share']
+    return max(STREAMING_CONFIG['min_chunk_rows'], int(chunk_bytes // STREAMING_CONFIG['row_bytes']))
+
+
+def stream_profit_matrix(
+    path: Path,
+    memory_budget_mb: Optional[float] = None,
+    chunk_rows: Optional[int] = None,
+    dtype=np.float32,
+    verbose: bool = True,
+) -> ProfitMatrix:
+    """
+    Construit la matrice de profits en lisant le fichier consolidé par blocs.
+
+    Seules les colonnes utiles sont lues. Si un compagnon colonnaire frais
+    existe, ses colonnes Date / Strategy_ID / DailyProfit sont lues par
+    tranches de chunk_rows lignes; sinon le texte est lu par blocs de
+    chunk_rows lignes (le compagnon n'est pas écrit dans ce mode). La source
+    est lue deux fois: une première passe relève les dates et stratégies
+    (sans les profits) pour allouer la matrice dense à sa taille exacte, la
+    seconde y ajoute chaque bloc puis le libère. Le pic mémoire est la
+    matrice de sortie (et son masque d'activité) plus un bloc,
+    indépendamment de la taille du fichier.
+
+    Args:
+        path: Fichier consolidé .txt ou compagnon .columns.npz
+        memory_budget_mb: Plafond mémoire (défaut: STREAMING_CONFIG)
+        chunk_rows: Lignes par bloc (défaut: déduit du budget)
+        dtype: Type de stockage des profits
+        verbose: Afficher la progression
+
+    Returns:
+        ProfitMatrix équivalente à ProfitMatrix.from_frame(load_consolidated(path))
+    """
+    path = Path(path)
+    source = source_path(path) if is_cache_path(path) else path
+    cache = companion_path(source)
+    chunk_rows = chunk_rows or chunk_rows_for_budget(memory_budget_mb)
+    accumulator = ProfitMatrixAccumulator(dtype=dtype)
+
+    from_cache = is_cache_fresh(source, cache) or (is_cache_path(path) and not source.exists())
+    if verbose:
+        if from_cache:
+            print(f"   ⚡ Cache colonnaire: {cache.name}")
+        else:
+            print(f"   📥 Lecture par blocs de {chunk_rows:,} lignes (deux passes)")
+
+    def chunks(with_profits: bool):
+        if from_cache:
+            columns = ['Date', 'Strategy_ID'] + (['DailyProfit'] if with_profits else [])
+            yield from iter_consolidated_cache(cache, columns, chunk_rows)
+            return
+        usecols = _PROFIT_COLUMNS if with_profits else _PROFIT_COLUMNS - {'DailyProfit'}
+        reader = pd.read_csv(
+            source, sep=';', encoding='utf-8', decimal=',',
+            usecols=lambda c: c in usecols, chunksize=chunk_rows,
+        )
+        with reader:
+            for chunk in reader:
+                yield _prepare_columns(chunk)
+
+    for chunk in chunks(with_profits=False):
+        accumulator.scan(chunk)
+    for chunk in chunks(with_profits=True):
+        accumulator.add(chunk)
+
+    if verbose:
+        print(f"   {accumulator.n_rows:,} lignes accumulées ({accumulator.nbytes / 1024 ** 2:.1f} Mo)")
+    return accumulator.build()
@@ -0,0 +1,272 @@
+"""
+Intervalles de confiance bootstrap des corrélations par paire.
+
+Une corrélation de 0.71 contre 0.69 fait basculer une paire de part et
+d'autre du seuil Davey; sur 12 mois avec peu de jours communs l'estimation
+est bruitée. On rééchantillonne les jours (avec remise) et on recalcule
+toutes les paires à chaque réplique avec le moteur matriciel.
+
+Les tirages forment une matrice d'indices (répliques × jours), convertie en
+comptes de tirage par jour: la réplique b est alors exactement
+compute_masked_moments(values, weights=comptes_b) (un jour tiré k fois
+compte k fois), sans copier la matrice de profits rééchantillonnée.
+
+Les répliques sont traitées par blocs de lignes (mémoire bornée:
+répliques × bloc × N), répartis sur plusieurs processus pour un grand
+nombre de répliques. Les bornes sont les quantiles (percentiles) des
+répliques valides.
+
+Utilisation:
+    lower, upper = bootstrap_correlation_intervals(profit_matrix, min_common_days=30)
+    robust = robust_correlated_counts(lower, upper, threshold=0.7)
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .config import BOOTSTRAP_CONFIG
+from .correlation_engine import block_correlation, column_shift
+from .correlation_tiles import _SHARED, _attach_shared, _create_shared
+from .profit_matrix import profit_arrays
+
+
+def bootstrap_weights(n_days: int, n_replicates: int, seed: Optional[int] = None) -> np.ndarray:
+    """
+    Comptes de tirage par jour de chaque réplique.
+
+    Args:
+        n_days: Nombre de jours (lignes de la matrice de profits)
+        n_replicates: Nombre de répliques
+        seed: Graine du générateur
+
+    Returns:
+        Matrice (répliques × jours) de comptes float64 (somme = n_days par réplique)
+    """
+    rng = np.random.default_rng(seed)
+    indices = rng.integers(0, n_days, size=(n_replicates, n_days))
+    offsets = np.arange(n_replicates)[:, None] * n_days
+    counts = np.bincount((indices + offsets).ravel(), minlength=n_replicates * n_days)
+    return counts.reshape(n_replicates, n_days).astype(np.float64)
+
+
+def _percentile_bounds(
+    replicates: np.ndarray,
+    confidence: float,
+    min_valid: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Quantiles (interpolation linéaire, comme np.quantile) des répliques non NaN.
+
+    Args:
+        replicates: Corrélations (répliques × ...)
+        confidence: Niveau de confiance (ex: 0.95)
+        min_valid: Répliques valides minimum (sinon NaN)
+
+    Returns:
+        Tuple (bornes basses, bornes hautes)
+    """
+    ordered = np.sort(replicates, axis=0)   # NaN en fin de tri
+    valid = (~np.isnan(replicates)).sum(axis=0)
+    alpha = (1.0 - confidence) / 2.0
+
+    bounds = []
+    for q in (alpha, 1.0 - alpha):
+        position = q * np.maximum(valid - 1, 0)
+        below = np.floor(position).astype(np.int64)
+        above = np.minimum(below + 1, np.maximum(valid - 1, 0))
+        low = np.take_along_axis(ordered, below[None], axis=0)[0]
+        high = np.take_along_axis(ordered, above[None], axis=0)[0]
+        bound = low + (high - low) * (position - below)
+        bound[valid < max(min_valid, 1)] = np.nan
+        bounds.append(bound)
+    return bounds[0], bounds[1]
+
+
+def _replicate_rows(
+    x: np.ndarray,
+    m: np.ndarray,
+    weights: np.ndarray,
+    rows: np.ndarray,
+    min_common_days: int,
+) -> np.ndarray:
+    """
+    Corrélations des lignes rows avec toutes les stratégies, pour chaque réplique.
+
+    Args:
+        x: Profits centrés et masqués (jours × N)
+        m: Masque d'activité float64
+        weights: Comptes de tirage (répliques × jours)
+        rows: Indices des lignes du bloc
+        min_common_days: Jours communs minimum (comptés avec les répétitions)
+
+    Returns:
+        Corrélations float32 (répliques × |rows| × N), diagonale à 1
+    """
+    x_rows, m_rows = x[:, rows], m[:, rows]
+    x2 = x * x
+    result = np.empty((len(weights), len(rows), x.shape[1]), dtype=np.float32)
+
+    for b, w in enumerate(weights):
+        xw_rows = x_rows * w[:, None]
+        mw_rows = m_rows * w[:, None]
+        corr, _ = block_correlation(
+            n=mw_rows.T @ m,
+            a_ij=xw_rows.T @ m,
+            a_ji=mw_rows.T @ x,
+            q_ij=(xw_rows * x_rows).T @ m,
+            q_ji=mw_rows.T @ x2,
+            p=xw_rows.T @ x,
+            min_common_days=min_common_days,
+        )
+        corr[np.arange(len(rows)), rows] = 1.0
+        result[b] = corr
+
+    return result
+
+
+def _interval_rows(
+    x: np.ndarray,
+    m: np.ndarray,
+    weights: np.ndarray,
+    rows: np.ndarray,
+    min_common_days: int,
+    confidence: float,
+    min_valid: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Bornes de l'intervalle pour un bloc de lignes."""
+    replicates = _replicate_rows(x, m, weights, rows, min_common_days)
+    return _percentile_bounds(replicates, confidence, min_valid)
+
+
+def _interval_task(rows: np.ndarray, min_common_days: int, confidence: float, min_valid: int):
+    """Tâche de pool: bloc de lignes sur les tableaux partagés."""
+    lower, upper = _interval_rows(
+        _SHARED['x'], _SHARED['m'], _SHARED['weights'], rows, min_common_days, confidence, min_valid
+    )
+    return rows, lower, upper
+
+
+def rows_per_block(n_replicates: int, n_strategies: int, memory_budget_mb: float) -> int:
+    """Lignes par bloc pour que les répliques d'un bloc tiennent dans le budget."""
+    row_bytes = n_replicates * n_strategies * 4 * 2   # répliques float32 + tri
+    return int(max(1, min(n_strategies, memory_budget_mb * 1024 ** 2 // max(row_bytes, 1))))
+
+
+def bootstrap_correlation_intervals(
+    profit_matrix,
+    min_common_days: int,
+    n_replicates: Optional[int] = None,
+    confidence: Optional[float] = None,
+    seed: Optional[int] = None,
+    n_workers: Optional[int] = None,
+    memory_budget_mb: Optional[float] = None,
+    verbose: bool = False,
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Intervalles de confiance bootstrap (percentiles) de toutes les corrélations de Pearson.
+
+    Args:
+        profit_matrix: Matrice de profits de la fenêtre (ProfitMatrix ou DataFrame)
+        min_common_days: Jours communs minimum (par réplique)
+        n_replicates: Nombre de répliques (défaut: BOOTSTRAP_CONFIG)
+        confidence: Niveau de confiance (défaut: BOOTSTRAP_CONFIG)
+        seed: Graine (défaut: BOOTSTRAP_CONFIG)
+        n_workers: Processus (défaut: BOOTSTRAP_CONFIG, puis nombre de CPU)
+        memory_budget_mb: Mémoire de travail (tous workers, défaut: BOOTSTRAP_CONFIG)
+        verbose: Afficher la progression
+
+    Returns:
+        Tuple (bornes basses N×N, bornes hautes N×N), NaN si trop peu de répliques valides
+    """
+    n_replicates = n_replicates or BOOTSTRAP_CONFIG['n_replicates']
+    confidence = confidence or BOOTSTRAP_CONFIG['confidence']
+    seed = BOOTSTRAP_CONFIG['seed'] if seed is None else seed
+    memory_budget_mb = memory_budget_mb or BOOTSTRAP_CONFIG['memory_budget_mb']
+    min_valid = int(np.ceil(n_replicates * BOOTSTRAP_CONFIG['min_valid_share']))
+
+    values, mask, strategies, _ = profit_arrays(profit_matrix)
+    n_days, n_strategies = values.shape
+    x = np.where(mask, values - column_shift(values, mask), 0.0)
+    m = mask.astype(np.float64)
+    del values, mask
+
+    weights = bootstrap_weights(n_days, n_replicates, seed)
+
+    parallel = n_replicates >= BOOTSTRAP_CONFIG['parallel_min_replicates'] and n_strategies > 1
+    n_workers = (n_workers or BOOTSTRAP_CONFIG['n_workers'] or os.cpu_count() or 1) if parallel else 1
+    block = rows_per_block(n_replicates, n_strategies, memory_budget_mb / n_workers)
+    blocks = [np.arange(start, min(start + block, n_strategies)) for start in range(0, n_strategies, block)]
+
+    if verbose:
+        print(f"   🎲 Bootstrap: {n_replicates} répliques, {len(blocks)} blocs, {n_workers} processus")
+
+    lower = np.full((n_strategies, n_strategies), np.nan)
+    upper = np.full((n_strategies, n_strategies), np.nan)
+
+    if n_workers <= 1 or len(blocks) == 1:
+        for rows in blocks:
+            lower[rows], upper[rows] = _interval_rows(
+                x, m, weights, rows, min_common_days, confidence, min_valid
+            )
+    else:
+        segments = []
+        try:
+            specs = {}
+            for key, array in (('x', x), ('m', m), ('weights', weights)):
+                shm, shared = _create_shared(array.shape, array.dtype)
+                shared[...] = array
+                del shared
+                segments.append(shm)
+                specs[key] = (shm.name, array.shape, array.dtype.str)
+
+            with ProcessPoolExecutor(
+                max_workers=n_workers, initializer=_attach_shared, initargs=(specs,)
+            ) as executor:
+                futures = [
+                    executor.submit(_interval_task, rows, min_common_days, confidence, min_valid)
+                    for rows in blocks
+                ]
+                for future in as_completed(futures):
+                    rows, block_lower, block_upper = future.result()
+                    lower[rows] = block_lower
+                    upper[rows] = block_upper
+        finally:
+            for shm in segments:
+                shm.close()
+                shm.unlink()
+
+    return (
+        pd.DataFrame(lower, index=strategies, columns=strategies),
+        pd.DataFrame(upper, index=strategies, columns=strategies),
+    )
+
+
+def robust_correlated_counts(
+    ci_lower: pd.DataFrame,
+    ci_upper: pd.DataFrame,
+    threshold: float,
+) -> pd.Series:
+    """
+    Nombre de partenaires robustement corrélés: tout l'intervalle est au-delà du seuil.
+
+    |corr| > seuil est robuste si borne basse > seuil ou borne haute < -seuil.
+
+    Args:
+        ci_lower: Bornes basses (cf. bootstrap_correlation_intervals)
+        ci_upper: Bornes hautes
+        threshold: Seuil de corrélation
+
+    Returns:
+        Series stratégie → nombre de partenaires robustement corrélés
+    """
+    lower = ci_lower.to_numpy()
+    upper = ci_upper.reindex(index=ci_lower.index, columns=ci_lower.columns).to_numpy()
+
+    with np.errstate(invalid='ignore'):
+        robust = (lower > threshold) | (upper < -threshold)
+    np.fill_diagonal(robust, False)
+    return pd.Series(robust.sum(axis=1), index=ci_lower.index, name='N_Robust')
@@ -13,9 +13,72 @@ import numpy as np
 from pathlib import Path
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Dict, List, Tuple, Optional, Any, Union
 
-from .config import DEFAULT_CONFIG, SCORE_THRESHOLDS, get_correlation_status
+from .config import DEFAULT_CONFIG, SCORE_THRESHOLDS, TILING_CONFIG, MULTI_WINDOW_CONFIG, AGGREGATION_CONFIG, CLUSTERING_CONFIG, DRAWDOWN_CONFIG, get_correlation_status
+from .correlation_bootstrap import bootstrap_correlation_intervals, robust_correlated_counts
+from .correlation_engine import pearson_correlation_matrix, rank_correlation_matrix
+from .correlation_tiles import tiled_pearson_correlation_matrix
+from .profit_matrix import ProfitMatrix, profit_arrays
+from .packed_matrix import PackedSymmetricMatrix, packed_delta
+from .correlation_state import CorrelationState
+from .correlation_store import CorrelationStore, save_correlation_store
+from .correlation_rolling import RollingCorrelations, rolling_pair_correlations, select_pairs_of_interest
+from .correlation_neighbors import SimilarityIndex
+from .correlation_clustering import CorrelationClusters
+from .portfolio_selection import PortfolioSelector
+from .correlation_windows import (
+    LONGTERM_LABEL,
+    build_windows,
+    calculate_multi_window_scores,
+    multi_window_correlations,
+    window_weights,
+)
+
+
+# Types de stockage des matrices de résultats (triangle supérieur empaqueté)
+_PACKED_DTYPES = {
+    'corr_lt': np.float32,
+    'corr_ct': np.float32,
+    'common_lt': np.uint16,
+    'common_ct': np.uint16,
+    'delta': np.float32,
+}
+
+
+# Types des DataFrames publics (ceux des matrices denses d'avant l'empaquetage)
+_FRAME_DTYPES = {
+    'corr_lt': np.float64,
+    'corr_ct': np.float64,
+    'common_lt': np.int64,
+    'common_ct': np.int64,
+    'delta': np.float64,
+}
+
+
+def _packed_result(key: str, doc: str) -> property:
+    """
+    Propriété DataFrame adossée à une matrice empaquetée (self._packed[key]).
+    
+    Le DataFrame dense est construit à la première lecture puis conservé
+    (self._frames[key]): les lectures suivantes rendent le même objet.
+    L'affectation remplace la matrice empaquetée et invalide ce DataFrame.
+    """
+    def getter(self) -> Optional[pd.DataFrame]:
+        if key not in self._frames:
+            packed = self._packed.get(key)
+            if packed is None:
+                return None
+            self._frames[key] = packed.to_frame(_FRAME_DTYPES[key])
+        return self._frames[key]
+    
+    def setter(self, value):
+        self._frames.pop(key, None)
+        if value is not None and not isinstance(value, PackedSymmetricMatrix):
+            value = PackedSymmetricMatrix.from_dense(value, dtype=_PACKED_DTYPES[key])
+        self._packed[key] = value
+    
+    return property(getter, setter, doc=doc)
 
 
 class CorrelationAnalyzer:
@@ -27,11 +90,48 @@ class CorrelationAnalyzer:
         analyzer.run()
         analyzer.print_summary()
         analyzer.export_results('output_dir')
+    
+    Les matrices de résultats sont stockées en triangle supérieur empaqueté
+    (corrélations float32, jours communs uint16); les attributs corr_matrix_*,
+    common_days_* et delta_matrix construisent un DataFrame à la première
+    lecture, puis le conservent:
+    - float64 (corrélations, delta) et int64 (jours communs), mais les
+      corrélations sont arrondies à la précision float32 du stockage
+    - une écriture sur place (analyzer.corr_matrix_lt.loc[a, b] = x) est
+      visible aux lectures suivantes de l'attribut; les exports, pages et
+      dashboard lisent la matrice empaquetée: réassigner l'attribut
+      (analyzer.corr_matrix_lt = frame) pour y reporter les modifications
+    - le DataFrame conservé occupe N×N×8 octets en plus de la matrice
+      empaquetée; en interne, utiliser self._packed
+    
+    Scores Davey, sensibilité au seuil, colonnes agrégées / co-drawdown et
+    statistiques sont calculés par run() sur les corrélations float64 du
+    calcul, avant empaquetage (from_binary: sur les valeurs stockées).
+    
+    Les corrélations des profits agrégés par semaine / mois (fenêtre LT,
+    cf. AGGREGATION_CONFIG, niveaux de run() dans aggregation_levels, vide
+    par défaut) sont dans aggregated_corr et ajoutent les colonnes
+    N_Corr_<niveau> / Avg_Corr_<niveau> en fin de scores.
+    
+    La corrélation de co-drawdown (jours où les deux stratégies sont en
+    drawdown, fenêtre LT, cf. DRAWDOWN_CONFIG; par run() si
+    codrawdown_enabled) est dans codrawdown_corr et ajoute les colonnes
+    N_Corr_DD / Avg_Corr_DD en fin de scores.
+    
+    La classification hiérarchique de la matrice LT (clusters, ordre des
+    heatmaps; par run() si clustering_enabled, cf. CLUSTERING_CONFIG) est
+    dans clusters et ajoute la colonne Cluster en fin de scores.
     """
     
+    corr_matrix_lt = _packed_result('corr_lt', "Corrélations long terme")
+    corr_matrix_ct = _packed_result('corr_ct', "Corrélations court terme")
+    common_days_lt = _packed_result('common_lt', "Jours communs long terme")
+    common_days_ct = _packed_result('common_ct', "Jours communs court terme")
+    delta_matrix = _packed_result('delta', "Delta CT - LT sur les stratégies communes")
+    
     def __init__(
         self,
-        data: pd.DataFrame,
+        data: Optional[Union[pd.DataFrame, ProfitMatrix]],
         start_year_longterm: int = None,
         recent_months: int = None,
         correlation_threshold: float = None,
@@ -41,12 +141,15 @@ class CorrelationAnalyzer:
         weight_longterm: float = None,
         weight_recent: float = None,
         correlation_method: str = None,
+        n_jobs: int = None,
     ):
         """
         Initialise l'analyseur de corrélation.
         
         Args:
-            data: DataFrame avec colonnes Date, Strategy_Name, Symbol, DailyProfit
+            data: DataFrame avec colonnes Date, Strategy_Name, Symbol, DailyProfit,
+                ou ProfitMatrix déjà construite (lecture en flux, cf. stream_profit_matrix),
+                ou None pour des résultats rechargés (cf. from_binary)
             start_year_longterm: Année de début pour analyse long terme
             recent_months: Nombre de mois pour analyse court terme
             correlation_threshold: Seuil pour considérer deux stratégies corrélées
@@ -56,6 +159,7 @@ class CorrelationAnalyzer:
             weight_longterm: Poids du score LT dans le score Davey
             weight_recent: Poids du score CT dans le score Davey
             correlation_method: Méthode de corrélation ('pearson', 'spearman', 'kendall')
+            n_jobs: Nombre de processus pour Spearman/Kendall
         """
         # Paramètres avec valeurs par défaut
         self.start_year_longterm = start_year_longterm or DEFAULT_CONFIG['start_year_longterm']
@@ -67,20 +171,40 @@ class CorrelationAnalyzer:
         self.weight_longterm = weight_longterm or DEFAULT_CONFIG['weight_longterm']
         self.weight_recent = weight_recent or DEFAULT_CONFIG['weight_recent']
         self.correlation_method = correlation_method or DEFAULT_CONFIG['correlation_method']
-        
-        # Préparer les données
-        self.data = self._prepare_data(data)
-        
-        # Résultats
-        self.corr_matrix_lt: Optional[pd.DataFrame] = None
-        self.corr_matrix_ct: Optional[pd.DataFrame] = None
-        self.common_days_lt: Optional[pd.DataFrame] = None
-        self.common_days_ct: Optional[pd.DataFrame] = None
-        self.delta_matrix: Optional[pd.DataFrame] = None
+        self.n_jobs = n_jobs or DEFAULT_CONFIG['n_jobs']
+        
+        # Préparer les données (matrice de profits construite à la demande)
+        if data is None or isinstance(data, ProfitMatrix):
+            self.data: Optional[pd.DataFrame] = None
+            self._profits: Optional[ProfitMatrix] = data
+        else:
+            self.data = self._prepare_data(data)
+            self._profits = None
+        
+        # Résultats (matrices empaquetées, cf. packed_matrix)
+        self._packed: Dict[str, Optional[PackedSymmetricMatrix]] = dict.fromkeys(_PACKED_DTYPES)
+        self._frames: Dict[str, pd.DataFrame] = {}
         self.scores: Optional[pd.DataFrame] = None
         self.stats_lt: Optional[Dict] = None
         self.stats_ct: Optional[Dict] = None
         self.run_timestamp: Optional[datetime] = None
+        self.state: Optional[CorrelationState] = None
+        self.rolling_correlations: Optional[RollingCorrelations] = None
+        self.similarity: Optional[SimilarityIndex] = None
+        self.clusters: Optional[CorrelationClusters] = None
+        self.codrawdown_corr: Optional[PackedSymmetricMatrix] = None
+        self.codrawdown_common: Optional[PackedSymmetricMatrix] = None
+        self.aggregation_levels: List[str] = list(AGGREGATION_CONFIG['levels']) if AGGREGATION_CONFIG['enabled'] else []
+        self.clustering_enabled: bool = CLUSTERING_CONFIG['enabled']
+        self.codrawdown_enabled: bool = DRAWDOWN_CONFIG['enabled']
+        self.aggregated_corr: Dict[str, PackedSymmetricMatrix] = {}
+        self.aggregated_common: Dict[str, PackedSymmetricMatrix] = {}
+        self.multi_window_corr: Dict[str, pd.DataFrame] = {}
+        self.multi_window_common: Dict[str, pd.DataFrame] = {}
+        self.multi_window_scores: Optional[pd.DataFrame] = None
+        self.threshold_sweep: Optional[pd.DataFrame] = None
+        self.bootstrap_intervals: Dict[str, Tuple[pd.DataFrame, pd.DataFrame]] = {}
+        self.robust_counts: Optional[pd.DataFrame] = None
     
     def _prepare_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """Prépare et valide les données."""
@@ -119,12 +243,35 @@ class CorrelationAnalyzer:
         
         return df
     
-    def run(self, verbose: bool = True) -> None:
+    def packed_matrix(self, name: str) -> Optional[PackedSymmetricMatrix]:
+        """
+        Matrice de résultats empaquetée (accès O(1) par paire, lignes sans DataFrame).
+        
+        Args:
+            name: 'corr_lt', 'corr_ct', 'common_lt', 'common_ct' ou 'delta'
+        """
+        if name not in _PACKED_DTYPES:
+            raise ValueError(f"Matrice inconnue: {name}")
+        return self._packed[name]
+    
+    @property
+    def profits(self) -> ProfitMatrix:
+        """Matrice de profits compacte (construite une seule fois)."""
+        if self._profits is None:
+            if self.data is None:
+                raise ValueError("Aucune donnée de profits (résultats rechargés depuis un export binaire)")
+            self._profits = ProfitMatrix.from_frame(self.data)
+        return self._profits
+    
+    def run(self, verbose: bool = True, state_path: Optional[Path] = None) -> None:
         """
         Exécute l'analyse de corrélation complète.
         
         Args:
             verbose: Afficher la progression
+            state_path: Fichier d'état incrémental (.npz). Si fourni (Pearson),
+                les statistiques par paire sont mises à jour avec les nouveaux
+                jours au lieu d'être recalculées, puis l'état est sauvegardé.
         """
         self.run_timestamp = datetime.now()
         
@@ -134,7 +281,7 @@ class CorrelationAnalyzer:
             print("=" * 70)
         
         # Définir les périodes
-        end_date = self.data['Date'].max()
+        end_date = self.profits.dates[-1]
         start_date_ct = end_date - relativedelta(months=self.recent_months)
         start_date_lt = datetime(self.start_year_longterm, 1, 1)
         
@@ -143,68 +290,551 @@ class CorrelationAnalyzer:
             print(f"   Long Terme: {start_date_lt.strftime('%Y-%m-%d')} → {end_date.strftime('%Y-%m-%d')}")
             print(f"   Court Terme: {start_date_ct.strftime('%Y-%m-%d')} → {end_date.strftime('%Y-%m-%d')} ({self.recent_months} mois)")
         
-        # Filtrer les données par période
-        data_lt = self.data[self.data['Date'] >= start_date_lt]
-        data_ct = self.data[self.data['Date'] >= start_date_ct]
-        
         if verbose:
             print(f"\n📈 Données:")
-            print(f"   Long Terme: {len(data_lt):,} lignes, {data_lt['Strategy_ID'].nunique()} stratégies")
-            print(f"   Court Terme: {len(data_ct):,} lignes, {data_ct['Strategy_ID'].nunique()} stratégies")
-        
-        # Construire les matrices de profit
-        if verbose:
-            print("\n🔧 Construction des matrices de profit...")
-        
-        matrix_lt = build_profit_matrix(data_lt)
-        matrix_ct = build_profit_matrix(data_ct)
+            for label, start in (("Long Terme", start_date_lt), ("Court Terme", start_date_ct)):
+                active_days = self.profits.window(start=start).active_days()
+                print(f"   {label}: {int(active_days.sum()):,} jours actifs, {int((active_days > 0).sum())} stratégies")
+        
+        if state_path is not None and self.correlation_method == 'pearson':
+            (corr_lt, common_lt), (corr_ct, common_ct) = self._run_incremental(
+                Path(state_path), start_date_lt, start_date_ct, verbose
+            )
+        else:
+            # Construire la matrice de profits (une fois), LT/CT = vues par dates
+            if verbose:
+                print("\n🔧 Construction des matrices de profit...")
+            
+            matrix_lt = self.profits.window(start=start_date_lt)
+            matrix_ct = self.profits.window(start=start_date_ct)
+            
+            # Filtrer les stratégies actives
+            matrix_lt = matrix_lt.filter_active(self.min_active_days)
+            matrix_ct = matrix_ct.filter_active(max(10, self.min_active_days // 5))
+            
+            if verbose:
+                print(f"   Long Terme: {len(matrix_lt.strategies)} stratégies actives")
+                print(f"   Court Terme: {len(matrix_ct.strategies)} stratégies actives")
+            
+            # Calculer les matrices de corrélation
+            if verbose:
+                print("\n📊 Calcul des corrélations...")
+            
+            corr_lt, common_lt = calculate_correlation_matrix(
+                matrix_lt, self.min_common_days_longterm, self.correlation_method, self.n_jobs, verbose
+            )
+            
+            corr_ct, common_ct = calculate_correlation_matrix(
+                matrix_ct, self.min_common_days_recent, self.correlation_method, self.n_jobs, verbose
+            )
         
-        # Filtrer les stratégies actives
-        matrix_lt = filter_active_strategies(matrix_lt, self.min_active_days)
-        matrix_ct = filter_active_strategies(matrix_ct, max(10, self.min_active_days // 5))
+        # Stockage empaqueté; les résultats dérivés utilisent les matrices float64
+        self.corr_matrix_lt, self.common_days_lt = corr_lt, common_lt
+        self.corr_matrix_ct, self.common_days_ct = corr_ct, common_ct
+        del common_lt, common_ct
         
         if verbose:
-            print(f"   Long Terme: {len(matrix_lt.columns)} stratégies actives")
-            print(f"   Court Terme: {len(matrix_ct.columns)} stratégies actives")
+            lt, ct = self._packed['corr_lt'], self._packed['corr_ct']
+            print(f"   Long Terme: {len(lt)}×{len(lt)} matrice ({lt.nbytes / 1024 ** 2:.1f} Mo empaquetée)")
+            print(f"   Court Terme: {len(ct)}×{len(ct)} matrice ({ct.nbytes / 1024 ** 2:.1f} Mo empaquetée)")
         
-        # Calculer les matrices de corrélation
-        if verbose:
-            print("\n📊 Calcul des corrélations...")
+        extra_corr = {}
+        if self.aggregation_levels:
+            extra_corr.update(self.compute_aggregated_correlations(self.aggregation_levels, verbose))
         
-        self.corr_matrix_lt, self.common_days_lt = calculate_correlation_matrix(
-            matrix_lt, self.min_common_days_longterm, self.correlation_method
-        )
+        if self.codrawdown_enabled:
+            extra_corr['DD'] = self.compute_codrawdown_correlations(verbose)
         
-        self.corr_matrix_ct, self.common_days_ct = calculate_correlation_matrix(
-            matrix_ct, self.min_common_days_recent, self.correlation_method
-        )
+        if self.clustering_enabled:
+            self.compute_clusters(verbose=verbose)
+        
+        self._compute_derived_results(verbose, corr_lt, corr_ct, extra_corr)
         
         if verbose:
-            print(f"   Long Terme: {len(self.corr_matrix_lt)}×{len(self.corr_matrix_lt)} matrice")
-            print(f"   Court Terme: {len(self.corr_matrix_ct)}×{len(self.corr_matrix_ct)} matrice")
+            print(f"\n✅ Analyse terminée en {(datetime.now() - self.run_timestamp).total_seconds():.1f}s")
+            print(f"   {len(self.scores)} stratégies analysées")
+    
+    def _compute_derived_results(
+        self,
+        verbose: bool,
+        corr_lt: Optional[pd.DataFrame] = None,
+        corr_ct: Optional[pd.DataFrame] = None,
+        extra_corr: Optional[Dict[str, pd.DataFrame]] = None,
+    ) -> None:
+        """
+        Delta, scores Davey, sensibilité au seuil et statistiques.
+        
+        Args:
+            verbose: Afficher la progression
+            corr_lt: Corrélations LT float64 du calcul (défaut: matrice stockée)
+            corr_ct: Corrélations CT float64 du calcul (défaut: matrice stockée)
+            extra_corr: Niveau ('W', 'M', 'DD') → corrélations float64 du calcul
+                (défaut: matrices agrégées / co-drawdown stockées)
+        """
+        packed_lt, packed_ct = self._packed['corr_lt'], self._packed['corr_ct']
+        if corr_lt is None:
+            corr_lt = packed_lt.to_frame(np.float64)
+        if corr_ct is None:
+            corr_ct = packed_ct.to_frame(np.float64)
+        if extra_corr is None:
+            extra_corr = {level: packed.to_frame(np.float64) for level, packed in self.aggregated_corr.items()}
+            if self.codrawdown_corr is not None:
+                extra_corr['DD'] = self.codrawdown_corr.to_frame(np.float64)
         
         # Calculer la matrice delta
-        self.delta_matrix = calculate_delta_matrix(self.corr_matrix_lt, self.corr_matrix_ct)
+        self.delta_matrix = packed_delta(packed_lt, packed_ct)
         
         # Calculer les scores Davey
         if verbose:
             print("\n🎯 Calcul des scores Davey...")
         
         self.scores = calculate_davey_scores(
-            self.corr_matrix_lt,
-            self.corr_matrix_ct,
+            corr_lt,
+            corr_ct,
             self.correlation_threshold,
             self.weight_longterm,
             self.weight_recent
         )
         
+        # Colonnes des corrélations agrégées (semaine / mois) et de co-drawdown (même comptage Davey)
+        for level, corr in extra_corr.items():
+            self.scores = add_aggregated_score_columns(self.scores, corr, level, self.correlation_threshold)
+        
+        # Cluster de chaque stratégie (classification de la matrice LT)
+        if self.clusters is not None:
+            cluster = [self.clusters.cluster_of(s) for s in self.scores['Strategy']]
+            self.scores['Cluster'] = pd.array(cluster, dtype='Int64')
+        
+        # Sensibilité au seuil (mêmes matrices, comptages par seuil)
+        self.threshold_sweep = self.compute_threshold_sweep(corr_lt=corr_lt, corr_ct=corr_ct)
+        
         # Statistiques
-        self.stats_lt = compute_matrix_statistics(self.corr_matrix_lt, "Long Terme")
-        self.stats_ct = compute_matrix_statistics(self.corr_matrix_ct, "Court Terme")
+        self.stats_lt = compute_matrix_statistics(corr_lt, "Long Terme")
+        self.stats_ct = compute_matrix_statistics(corr_ct, "Court Terme")
+    
+    def _run_incremental(
+        self, state_path: Path, start_date_lt, start_date_ct, verbose: bool
+    ) -> Tuple[Tuple[pd.DataFrame, pd.DataFrame], Tuple[pd.DataFrame, pd.DataFrame]]:
+        """
+        Calcule les matrices LT/CT à partir de l'état incrémental.
+        
+        Args:
+            state_path: Fichier d'état (.npz)
+            start_date_lt: Début de la fenêtre long terme
+            start_date_ct: Début de la fenêtre court terme
+            verbose: Afficher la progression
+            
+        Returns:
+            Tuple ((corrélations LT, jours communs LT), (corrélations CT, jours communs CT))
+        """
+        state = CorrelationState.load(state_path)
+        
+        if state is not None and state.update(self.profits, start_date_lt, start_date_ct):
+            if verbose:
+                print("\n⚡ État incrémental mis à jour (nouveaux jours uniquement)")
+        else:
+            if verbose:
+                print("\n🔧 Construction de l'état de corrélation complet...")
+            state = CorrelationState.build(self.profits, start_date_lt, start_date_ct)
+        
+        state.save(state_path)
+        self.state = state
         
         if verbose:
-            print(f"\n✅ Analyse terminée en {(datetime.now() - self.run_timestamp).total_seconds():.1f}s")
-            print(f"   {len(self.scores)} stratégies analysées")
+            print("\n📊 Calcul des corrélations...")
+        
+        return (
+            state.correlation('lt', self.min_common_days_longterm, self.min_active_days),
+            state.correlation('ct', self.min_common_days_recent, max(10, self.min_active_days // 5)),
+        )
+    
+    def compute_aggregated_correlations(self, levels: List[str] = None, verbose: bool = False) -> Dict[str, pd.DataFrame]:
+        """
+        Corrélations des profits agrégés par semaine et/ou par mois (fenêtre LT).
+        
+        Deux stratégies qui perdent la même semaine, mais pas les mêmes jours,
+        n'ont aucun jour commun en journalier: l'agrégation les rapproche.
+        Les stratégies sont celles de la matrice LT; une période compte si
+        la stratégie y a tradé au moins un jour.
+        
+        Args:
+            levels: Niveaux 'W' et/ou 'M' (défaut: AGGREGATION_CONFIG)
+            verbose: Afficher la progression
+            
+        Returns:
+            Dict niveau → matrice de corrélation (également dans self.aggregated_corr)
+        """
+        if self._packed['corr_lt'] is None:
+            raise ValueError("Exécutez run() avant les corrélations agrégées")
+        levels = AGGREGATION_CONFIG['levels'] if levels is None else levels
+        
+        strategies = self._packed['corr_lt'].labels
+        profits = self.profits.select(self.profits.strategies.isin(strategies))
+        profits = profits.window(start=datetime(self.start_year_longterm, 1, 1))
+        
+        if verbose:
+            print("\n🗓️ Corrélations des profits agrégés...")
+        
+        results = {}
+        for level in levels:
+            aggregated = profits.aggregate(level)
+            corr, common = calculate_correlation_matrix(
+                aggregated,
+                AGGREGATION_CONFIG['min_common_periods'][level],
+                self.correlation_method,
+                self.n_jobs,
+            )
+            self.aggregated_corr[level] = PackedSymmetricMatrix.from_dense(corr, dtype=_PACKED_DTYPES['corr_lt'])
+            self.aggregated_common[level] = PackedSymmetricMatrix.from_dense(common, dtype=_PACKED_DTYPES['common_lt'])
+            results[level] = corr
+            
+            if verbose:
+                print(f"   {AGGREGATION_CONFIG['labels'][level]}: {len(aggregated)} périodes, {len(corr)} stratégies")
+        
+        return results
+    
+    def compute_threshold_sweep(
+        self,
+        thresholds: List[float] = None,
+        corr_lt: Optional[pd.DataFrame] = None,
+        corr_ct: Optional[pd.DataFrame] = None,
+    ) -> pd.DataFrame:
+        """
+        Balaye les seuils de corrélation sur les matrices LT/CT déjà calculées.
+        
+        Args:
+            thresholds: Seuils (défaut: config, plus le seuil de l'analyse)
+            corr_lt: Corrélations LT float64 (défaut: matrice stockée)
+            corr_ct: Corrélations CT float64 (défaut: matrice stockée)
+            
+        Returns:
+            DataFrame long (cf. calculate_threshold_sweep)
+        """
+        if self._packed['corr_lt'] is None or self._packed['corr_ct'] is None:
+            raise ValueError("Exécutez run() avant le balayage des seuils")
+        
+        thresholds = thresholds or DEFAULT_CONFIG['sweep_thresholds']
+        thresholds = sorted(set(thresholds) | {self.correlation_threshold})
+        return calculate_threshold_sweep(
+            self._packed['corr_lt'].to_frame(np.float64) if corr_lt is None else corr_lt,
+            self._packed['corr_ct'].to_frame(np.float64) if corr_ct is None else corr_ct,
+            thresholds,
+            self.weight_longterm,
+            self.weight_recent,
+        )
+    
+    def compute_bootstrap_intervals(
+        self,
+        horizons: Tuple[str, ...] = ('ct',),
+        n_replicates: int = None,
+        verbose: bool = False,
+    ) -> pd.DataFrame:
+        """
+        Intervalles de confiance bootstrap des corrélations LT et/ou CT.
+        
+        Les jours des fenêtres de run() sont rééchantillonnés; les bornes sont
+        stockées dans self.bootstrap_intervals[horizon] = (basses, hautes).
+        
+        Args:
+            horizons: Fenêtres à traiter ('lt', 'ct')
+            n_replicates: Nombre de répliques (défaut: BOOTSTRAP_CONFIG)
+            verbose: Afficher la progression
+            
+        Returns:
+            DataFrame Strategy, N_Corr_{H}, N_Robust_{H} (également dans self.robust_counts)
+        """
+        if self._packed['corr_lt'] is None or self._packed['corr_ct'] is None:
+            raise ValueError("Exécutez run() avant le bootstrap des corrélations")
+        if self.correlation_method != 'pearson':
+            raise ValueError("Le bootstrap des corrélations n'est disponible qu'en Pearson")
+        
+        end_date = self.profits.dates[-1]
+        windows = {
+            'lt': (datetime(self.start_year_longterm, 1, 1), self.min_common_days_longterm),
+            'ct': (end_date - relativedelta(months=self.recent_months), self.min_common_days_recent),
+        }
+        
+        counts = pd.DataFrame({'Strategy': self._packed['corr_lt'].labels.union(self._packed['corr_ct'].labels)})
+        for horizon in horizons:
+            start, min_common_days = windows[horizon]
+            corr = self._packed[f'corr_{horizon}'].to_frame(np.float64)
+            profits = self.profits.select(self.profits.strategies.isin(corr.columns)).window(start=start)
+            lower, upper = bootstrap_correlation_intervals(
+                profits, min_common_days, n_replicates=n_replicates, verbose=verbose
+            )
+            self.bootstrap_intervals[horizon] = (lower, upper)
+            
+            with np.errstate(invalid='ignore'):
+                above = _abs_offdiagonal_rows(corr, corr.columns) > self.correlation_threshold
+            point = pd.Series(above.sum(axis=1), index=corr.columns)
+            robust = robust_correlated_counts(lower, upper, self.correlation_threshold)
+            
+            label = horizon.upper()
+            counts[f'N_Corr_{label}'] = counts['Strategy'].map(point)
+            counts[f'N_Robust_{label}'] = counts['Strategy'].map(robust)
+        
+        self.robust_counts = counts
+        return counts
+    
+    def portfolio_selector(self, threshold: float = None) -> PortfolioSelector:
+        """
+        Sélecteur de portefeuille (vide) sur les matrices LT/CT déjà calculées.
+        
+        Args:
+            threshold: Seuil de corrélation (défaut: seuil de l'analyse)
+            
+        Returns:
+            PortfolioSelector (add/remove/what_if sans recalcul de corrélation)
+        """
+        if self._packed['corr_lt'] is None or self._packed['corr_ct'] is None:
+            raise ValueError("Exécutez run() avant la sélection de portefeuille")
+        
+        return PortfolioSelector(
+            self._packed['corr_lt'],
+            self._packed['corr_ct'],
+            threshold if threshold is not None else self.correlation_threshold,
+            self.weight_longterm,
+            self.weight_recent,
+        )
+    
+    def build_diversified_portfolio(
+        self,
+        size: int = None,
+        beam_width: int = None,
+        seed: List[str] = None,
+    ) -> PortfolioSelector:
+        """
+        Sélectionne un portefeuille minimisant la corrélation mutuelle.
+        
+        Args:
+            size: Nombre de stratégies (défaut: config)
+            beam_width: Largeur du faisceau, 1 = glouton (défaut: config)
+            seed: Stratégies imposées
+            
+        Returns:
+            PortfolioSelector contenant les membres sélectionnés
+        """
+        return self.portfolio_selector().select(
+            size or DEFAULT_CONFIG['portfolio_size'],
+            beam_width=beam_width or DEFAULT_CONFIG['portfolio_beam_width'],
+            seed=seed,
+        )
+    
+    def compute_codrawdown_correlations(self, verbose: bool = False) -> pd.DataFrame:
+        """
+        Corrélation de co-drawdown: Pearson restreint aux jours où les deux
+        stratégies ont tradé en étant en drawdown (fenêtre LT).
+        
+        Deux stratégies peu corrélées au quotidien peuvent perdre ensemble
+        dans un krach; ces jours-là seuls sont retenus. Les profits hors
+        drawdown sont mis à zéro, puis le moteur habituel (moments masqués,
+        tuiles au-delà de TILING_CONFIG) est appliqué: coût d'un calcul LT.
+        
+        Args:
+            verbose: Afficher la progression
+            
+        Returns:
+            Matrice de corrélation (également dans self.codrawdown_corr)
+        """
+        if self._packed['corr_lt'] is None:
+            raise ValueError("Exécutez run() avant la corrélation de co-drawdown")
+        
+        strategies = self._packed['corr_lt'].labels
+        profits = self.profits.select(self.profits.strategies.isin(strategies))
+        profits = profits.window(start=datetime(self.start_year_longterm, 1, 1))
+        drawdown = profits.in_drawdown()
+        
+        corr, common = calculate_correlation_matrix(
+            drawdown, DRAWDOWN_CONFIG['min_common_days'], 'pearson', self.n_jobs
+        )
+        self.codrawdown_corr = PackedSymmetricMatrix.from_dense(corr, dtype=_PACKED_DTYPES['corr_lt'])
+        self.codrawdown_common = PackedSymmetricMatrix.from_dense(common, dtype=_PACKED_DTYPES['common_lt'])
+        
+        if verbose:
+            share = drawdown.active.sum() / max(int(profits.active.sum()), 1)
+            print(f"\n🌊 Co-drawdown: {len(corr)} stratégies, {share:.0%} des jours actifs en drawdown")
+        return corr
+    
+    def codrawdown_pairs(self, top_n: int = None) -> pd.DataFrame:
+        """
+        Paires dont la corrélation de co-drawdown dépasse le plus la corrélation LT.
+        
+        Ce sont les paires qui semblent diversifiées au quotidien mais
+        perdent ensemble.
+        
+        Args:
+            top_n: Nombre de paires (défaut: DRAWDOWN_CONFIG)
+            
+        Returns:
+            DataFrame Strategy_1, Strategy_2, Corr_LT, Corr_DD, Delta (DD - LT) trié
+        """
+        if self.codrawdown_corr is None:
+            raise ValueError("Exécutez run() avec codrawdown_enabled (ou compute_codrawdown_correlations)")
+        lt = self._packed['corr_lt']
+        pairs = top_pairs(packed_delta(lt, self.codrawdown_corr), top_n or DRAWDOWN_CONFIG['top_pairs'], 'largest', 'Delta')
+        pairs.insert(2, 'Corr_LT', [float(lt.get(a, b)) for a, b in zip(pairs['Strategy_1'], pairs['Strategy_2'])])
+        pairs.insert(3, 'Corr_DD', [
+            float(self.codrawdown_corr.get(a, b)) for a, b in zip(pairs['Strategy_1'], pairs['Strategy_2'])
+        ])
+        return pairs
+    
+    def compute_clusters(self, cut_distance: float = None, verbose: bool = False) -> CorrelationClusters:
+        """
+        Classification hiérarchique (lien moyen sur 1 - |corr|) de la matrice LT.
+        
+        Fournit l'ordre des heatmaps (clusters contigus), le cluster de chaque
+        stratégie et les agrégats par cluster; exportée avec les matrices.
+        
+        Args:
+            cut_distance: Distance de coupure (défaut: CLUSTERING_CONFIG, sinon 1 - seuil de l'analyse)
+            verbose: Afficher le nombre de clusters
+            
+        Returns:
+            CorrelationClusters (également dans self.clusters)
+        """
+        if self._packed['corr_lt'] is None:
+            raise ValueError("Exécutez run() avant la classification")
+        if cut_distance is None:
+            cut_distance = CLUSTERING_CONFIG['cut_distance']
+        if cut_distance is None:
+            cut_distance = 1.0 - self.correlation_threshold
+        
+        self.clusters = CorrelationClusters.build(self._packed['corr_lt'], cut_distance)
+        
+        if verbose:
+            grouped = self.clusters.summary[self.clusters.summary['Size'] > 1]
+            print(f"\n🧩 Classification: {self.clusters.n_clusters} clusters "
+                  f"({len(grouped)} de 2+ stratégies, coupure {cut_distance:.2f})")
+        return self.clusters
+    
+    def build_similarity_index(self, verbose: bool = False) -> SimilarityIndex:
+        """
+        Index de recherche des stratégies les plus corrélées (fenêtre LT de run()).
+        
+        Une nouvelle série peut ensuite être comparée aux stratégies de la
+        matrice LT sans nouveau calcul complet (cf. correlation_neighbors).
+        
+        Args:
+            verbose: Afficher la taille de l'index
+            
+        Returns:
+            SimilarityIndex (également stocké dans self.similarity)
+        """
+        if self._packed['corr_lt'] is None:
+            raise ValueError("Exécutez run() avant de construire l'index de similarité")
+        
+        strategies = self._packed['corr_lt'].labels
+        profits = self.profits.select(self.profits.strategies.isin(strategies))
+        profits = profits.window(start=datetime(self.start_year_longterm, 1, 1))
+        self.similarity = SimilarityIndex.build(profits, self.min_common_days_longterm)
+        
+        if verbose:
+            print(f"   🔎 Index de similarité: {len(self.similarity)} stratégies × {len(self.similarity.dates)} jours")
+        return self.similarity
+    
+    def compute_rolling_correlations(
+        self,
+        window_months: int = None,
+        step_months: int = None,
+        top_n: int = None,
+    ) -> RollingCorrelations:
+        """
+        Calcule les corrélations glissantes des paires les plus corrélées.
+        
+        Args:
+            window_months: Longueur de fenêtre (défaut: config)
+            step_months: Pas entre fenêtres (défaut: config)
+            top_n: Partenaires suivis par stratégie (défaut: config)
+            
+        Returns:
+            RollingCorrelations (également stocké dans self.rolling_correlations)
+        """
+        if self._packed['corr_lt'] is None or self._packed['corr_ct'] is None:
+            raise ValueError("Exécutez run() avant de calculer les corrélations glissantes")
+        
+        pairs = select_pairs_of_interest(
+            self._packed['corr_lt'].to_frame(),
+            self._packed['corr_ct'].to_frame(),
+            top_n or DEFAULT_CONFIG['rolling_top_n'],
+        )
+        
+        strategies = self._packed['corr_lt'].labels.union(self._packed['corr_ct'].labels)
+        profits = self.profits.select(self.profits.strategies.isin(strategies)).window(
+            start=datetime(self.start_year_longterm, 1, 1)
+        )
+        
+        self.rolling_correlations = rolling_pair_correlations(
+            profits,
+            pairs,
+            window_months=window_months or DEFAULT_CONFIG['rolling_window_months'],
+            step_months=step_months or DEFAULT_CONFIG['rolling_step_months'],
+            min_common_days=self.min_common_days_recent,
+        )
+        return self.rolling_correlations
+    
+    def run_multi_window(
+        self,
+        windows_months: List[int] = None,
+        include_longterm: bool = None,
+        weights: Dict[str, float] = None,
+        verbose: bool = True,
+    ) -> pd.DataFrame:
+        """
+        Calcule les corrélations et le score Davey sur plusieurs fenêtres.
+        
+        Une seule matrice de profits est construite; les fenêtres emboîtées
+        sont obtenues en cumulant les moments des segments de dates.
+        Les seuils de jours communs / d'activité des fenêtres en mois sont
+        ceux du court terme, proportionnels à la longueur de la fenêtre.
+        
+        Args:
+            windows_months: Fenêtres en mois (défaut: MULTI_WINDOW_CONFIG)
+            include_longterm: Ajouter la fenêtre long terme (défaut: config)
+            weights: Poids relatifs par fenêtre (défaut: config), ramenés à
+                l'échelle du score LT/CT (cf. window_weights)
+            verbose: Afficher la progression
+            
+        Returns:
+            DataFrame des scores (N_Corr_<fenêtre>, Avg_Corr_<fenêtre>, Score_Davey...)
+        """
+        windows_months = windows_months or MULTI_WINDOW_CONFIG['windows_months']
+        if include_longterm is None:
+            include_longterm = MULTI_WINDOW_CONFIG['include_longterm']
+        weights = weights or MULTI_WINDOW_CONFIG['weights']
+        
+        end_date = self.profits.dates[-1]
+        start_date_lt = datetime(self.start_year_longterm, 1, 1) if include_longterm else None
+        windows = build_windows(end_date, windows_months, start_date_lt)
+        
+        min_common_days = {}
+        min_active_days = {}
+        for label in windows:
+            if label == LONGTERM_LABEL:
+                min_common_days[label] = self.min_common_days_longterm
+                min_active_days[label] = self.min_active_days
+            else:
+                ratio = int(label[:-1]) / self.recent_months
+                min_common_days[label] = max(10, round(self.min_common_days_recent * ratio))
+                min_active_days[label] = max(10, round(max(10, self.min_active_days // 5) * ratio))
+        
+        if verbose:
+            print(f"\n🪟 Analyse multi-fenêtres: {', '.join(windows)}")
+        
+        profits = self.profits.window(start=min(windows.values()))
+        matrices = multi_window_correlations(profits, windows, min_common_days, min_active_days)
+        weights = window_weights(list(windows), self.weight_longterm, self.weight_recent, weights)
+        
+        self.multi_window_corr = {label: corr for label, (corr, _) in matrices.items()}
+        self.multi_window_common = {label: common for label, (_, common) in matrices.items()}
+        self.multi_window_scores = calculate_multi_window_scores(
+            self.multi_window_corr, self.correlation_threshold, weights
+        )
+        
+        if verbose:
+            for label, corr in self.multi_window_corr.items():
+                print(f"   {label}: {len(corr)} stratégies actives")
+        
+        return self.multi_window_scores
     
     def get_summary(self) -> Dict[str, Any]:
         """Retourne un résumé des résultats."""
@@ -297,21 +927,96 @@ class CorrelationAnalyzer:
             print(f"📁 Scores exportés: {path}")
         
         # Matrice LT
-        if self.corr_matrix_lt is not None:
+        if self._packed['corr_lt'] is not None:
             path = output_dir / f"{prefix}_matrix_lt_{timestamp}.csv"
-            self.corr_matrix_lt.to_csv(path, sep=';', decimal=',', encoding='utf-8-sig')
+            self._packed['corr_lt'].to_frame(np.float64).to_csv(path, sep=';', decimal=',', encoding='utf-8-sig')
             files['matrix_lt'] = path
             print(f"📁 Matrice LT exportée: {path}")
         
         # Matrice CT
-        if self.corr_matrix_ct is not None:
+        if self._packed['corr_ct'] is not None:
             path = output_dir / f"{prefix}_matrix_ct_{timestamp}.csv"
-            self.corr_matrix_ct.to_csv(path, sep=';', decimal=',', encoding='utf-8-sig')
+            self._packed['corr_ct'].to_frame(np.float64).to_csv(path, sep=';', decimal=',', encoding='utf-8-sig')
             files['matrix_ct'] = path
             print(f"📁 Matrice CT exportée: {path}")
         
+        # Sensibilité au seuil
+        if self.threshold_sweep is not None:
+            path = output_dir / f"{prefix}_threshold_sweep_{timestamp}.csv"
+            self.threshold_sweep.to_csv(path, sep=';', decimal=',', index=False, encoding='utf-8-sig')
+            files['threshold_sweep'] = path
+            print(f"📁 Sensibilité au seuil exportée: {path}")
+        
+        # Comptes robustes (bootstrap)
+        if self.robust_counts is not None:
+            path = output_dir / f"{prefix}_robust_counts_{timestamp}.csv"
+            self.robust_counts.to_csv(path, sep=';', decimal=',', index=False, encoding='utf-8-sig')
+            files['robust_counts'] = path
+            print(f"📁 Comptes robustes exportés: {path}")
+        
+        # Scores multi-fenêtres
+        if self.multi_window_scores is not None:
+            path = output_dir / f"{prefix}_scores_multi_{timestamp}.csv"
+            self.multi_window_scores.to_csv(path, sep=';', decimal=',', index=False, encoding='utf-8-sig')
+            files['scores_multi'] = path
+            print(f"📁 Scores multi-fenêtres exportés: {path}")
+        
         return files
     
+    def export_binary(self, output_dir: Path, prefix: str = "correlation") -> Dict[str, Path]:
+        """
+        Exporte les matrices LT/CT et les jours communs en .npy avec un index JSON.
+        
+        Args:
+            output_dir: Répertoire de sortie
+            prefix: Préfixe des fichiers
+            
+        Returns:
+            Dict avec le chemin de l'index ('index')
+        """
+        if self._packed['corr_lt'] is None or self._packed['corr_ct'] is None:
+            raise ValueError("Exécutez run() avant l'export binaire")
+        
+        path = save_correlation_store(self, output_dir, prefix)
+        print(f"📁 Matrices binaires exportées: {path}")
+        return {'index': path}
+    
+    @classmethod
+    def from_binary(cls, index_path: Path, mmap: bool = True) -> 'CorrelationAnalyzer':
+        """
+        Recharge les résultats d'un export binaire (sans données de profits).
+        
+        Les matrices empaquetées de l'export sont utilisées telles quelles
+        (mappées en mémoire si mmap, sans copie); scores, delta, sensibilité
+        et statistiques sont recalculés à partir d'elles (aucune corrélation).
+        
+        Args:
+            index_path: Index JSON écrit par export_binary
+            mmap: Mapper les matrices en mémoire
+            
+        Returns:
+            CorrelationAnalyzer prêt pour les pages et le dashboard
+        """
+        store = CorrelationStore.load(index_path, mmap=mmap)
+        analyzer = cls(None, **store.parameters)
+        analyzer.run_timestamp = store.run_timestamp
+        for horizon in ('lt', 'ct'):
+            analyzer._packed[f'corr_{horizon}'] = store.correlation[horizon]
+            analyzer._packed[f'common_{horizon}'] = store.common_days.get(horizon)
+        analyzer.rolling_correlations = store.rolling
+        analyzer.similarity = store.similarity
+        analyzer.clusters = store.clusters
+        if 'dd' in store.correlation:
+            analyzer.codrawdown_corr = store.correlation['dd']
+            analyzer.codrawdown_common = store.common_days.get('dd')
+        for level in AGGREGATION_CONFIG['levels']:
+            if level.lower() in store.correlation:
+                analyzer.aggregated_corr[level] = store.correlation[level.lower()]
+                if level.lower() in store.common_days:
+                    analyzer.aggregated_common[level] = store.common_days[level.lower()]
+        analyzer._compute_derived_results(verbose=False)
+        return analyzer
+    
     def export_dashboard(self, output_path: Path) -> Path:
         """
         Génère un dashboard HTML interactif.
@@ -324,12 +1029,13 @@ class CorrelationAnalyzer:
         """
         from ..generators.correlation_dashboard import CorrelationDashboardGenerator
         
-        if self.corr_matrix_lt is None or self.corr_matrix_ct is None:
+        packed_lt, packed_ct = self._packed['corr_lt'], self._packed['corr_ct']
+        if packed_lt is None or packed_ct is None:
             raise ValueError("Exécutez run() avant d'exporter le dashboard")
         
         # Préparer les paires extrêmes
-        most_lt, least_lt = find_extreme_pairs(self.corr_matrix_lt, top_n=20)
-        most_ct, least_ct = find_extreme_pairs(self.corr_matrix_ct, top_n=20)
+        most_lt, least_lt = find_extreme_pairs(packed_lt, top_n=20)
+        most_ct, least_ct = find_extreme_pairs(packed_ct, top_n=20)
         
         pairs_lt = {
             'most_correlated': most_lt.to_dict('records') if len(most_lt) > 0 else [],
@@ -342,23 +1048,13 @@ class CorrelationAnalyzer:
         
         # Calculer les plus grands changements
         biggest_changes = []
-        if self.delta_matrix is not None and not self.delta_matrix.empty:
-            delta_pairs = []
-            strategies = self.delta_matrix.columns.tolist()
-            for i, s1 in enumerate(strategies):
-                for j in range(i + 1, len(strategies)):
-                    s2 = strategies[j]
-                    delta = self.delta_matrix.loc[s1, s2]
-                    if not np.isnan(delta):
-                        delta_pairs.append({
-                            'Strategy_1': s1,
-                            'Strategy_2': s2,
-                            'Delta': float(delta)
-                        })
-            if delta_pairs:
-                df_delta = pd.DataFrame(delta_pairs)
-                df_delta['Abs_Delta'] = df_delta['Delta'].abs()
-                biggest_changes = df_delta.nlargest(20, 'Abs_Delta')[['Strategy_1', 'Strategy_2', 'Delta']].to_dict('records')
+        delta = self._packed['delta']
+        if delta is not None and not delta.empty:
+            biggest_changes = top_pairs(delta, 20, 'abs', 'Delta').to_dict('records')
+        
+        codrawdown_pairs = []
+        if self.codrawdown_corr is not None:
+            codrawdown_pairs = self.codrawdown_pairs().to_dict('records')
         
         # Configuration pour le générateur
         config = {
@@ -374,15 +1070,20 @@ class CorrelationAnalyzer:
         # Générer le dashboard
         generator = CorrelationDashboardGenerator(config)
         output_path = generator.generate(
-            corr_lt=self.corr_matrix_lt,
-            corr_ct=self.corr_matrix_ct,
+            corr_lt=packed_lt,
+            corr_ct=packed_ct,
             scores=self.scores,
             stats_lt=self.stats_lt,
             stats_ct=self.stats_ct,
             pairs_lt=pairs_lt,
             pairs_ct=pairs_ct,
             biggest_changes=biggest_changes,
-            output_path=output_path
+            output_path=output_path,
+            threshold_sweep=self.threshold_sweep,
+            aggregated=self.aggregated_corr,
+            clusters=self.clusters,
+            codrawdown=self.codrawdown_corr,
+            codrawdown_pairs=codrawdown_pairs,
         )
         
         print(f"📊 Dashboard HTML généré: {output_path}")
@@ -403,14 +1104,7 @@ def build_profit_matrix(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame pivot avec dates en index et stratégies en colonnes
     """
-    profit_matrix = df.pivot_table(
-        index='Date',
-        columns='Strategy_ID',
-        values='DailyProfit',
-        aggfunc='sum',
-        fill_value=0
-    )
-    return profit_matrix.sort_index()
+    return ProfitMatrix.from_frame(df, dtype=np.float64).to_frame()
 
 
 def filter_active_strategies(profit_matrix: pd.DataFrame, min_active_days: int) -> pd.DataFrame:
@@ -430,49 +1124,48 @@ def filter_active_strategies(profit_matrix: pd.DataFrame, min_active_days: int)
 
 
 def calculate_correlation_matrix(
-    profit_matrix: pd.DataFrame,
+    profit_matrix: Union[pd.DataFrame, ProfitMatrix],
     min_common_days: int,
-    method: str = 'pearson'
+    method: str = 'pearson',
+    n_jobs: int = 1,
+    verbose: bool = False,
 ) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """
     Calcule la matrice de corrélation avec filtre sur jours communs.
     
+    Pearson passe par le moteur matriciel (quelques produits BLAS pour toutes
+    les paires), découpé en tuiles sur plusieurs processus au-delà de
+    TILING_CONFIG['min_strategies'] stratégies. Spearman range toutes les paires d'une ligne en une seule
+    opération, Kendall utilise le tau-b en O(n log n) par paire; ces deux
+    méthodes peuvent être réparties sur plusieurs processus.
+    
     Args:
-        profit_matrix: Matrice de profits journaliers
+        profit_matrix: Matrice de profits journaliers (DataFrame ou ProfitMatrix)
         min_common_days: Jours communs minimum pour calculer une corrélation
         method: Méthode de corrélation ('pearson', 'spearman', 'kendall')
+        n_jobs: Nombre de processus (Spearman/Kendall, et tuiles si > 1)
+        verbose: Afficher la progression du calcul par tuiles
         
     Returns:
         Tuple (matrice de corrélation, matrice des jours communs)
     """
-    strategies = profit_matrix.columns.tolist()
-    n = len(strategies)
+    values, mask, strategies, _ = profit_arrays(profit_matrix)
     
-    corr_matrix = pd.DataFrame(np.nan, index=strategies, columns=strategies)
-    common_days_matrix = pd.DataFrame(0, index=strategies, columns=strategies, dtype=int)
-    
-    for i, strat_i in enumerate(strategies):
-        corr_matrix.loc[strat_i, strat_i] = 1.0
-        common_days_matrix.loc[strat_i, strat_i] = (profit_matrix[strat_i] != 0).sum()
-        
-        for j in range(i + 1, n):
-            strat_j = strategies[j]
-            
-            # Masque: jours où les deux stratégies ont tradé
-            mask = (profit_matrix[strat_i] != 0) & (profit_matrix[strat_j] != 0)
-            common_days = mask.sum()
-            
-            common_days_matrix.loc[strat_i, strat_j] = common_days
-            common_days_matrix.loc[strat_j, strat_i] = common_days
-            
-            if common_days >= min_common_days:
-                series_i = profit_matrix.loc[mask, strat_i]
-                series_j = profit_matrix.loc[mask, strat_j]
-                corr = series_i.corr(series_j, method=method)
-                corr_matrix.loc[strat_i, strat_j] = corr
-                corr_matrix.loc[strat_j, strat_i] = corr
+    if method == 'pearson' and len(strategies) >= TILING_CONFIG['min_strategies']:
+        corr, common = tiled_pearson_correlation_matrix(
+            values, min_common_days,
+            n_workers=n_jobs if n_jobs > 1 else None,
+            verbose=verbose,
+        )
+    elif method == 'pearson':
+        corr, common = pearson_correlation_matrix(values, min_common_days, mask=mask)
+    else:
+        corr, common = rank_correlation_matrix(values, min_common_days, method=method, n_jobs=n_jobs)
     
-    return corr_matrix, common_days_matrix
+    return (
+        pd.DataFrame(corr, index=strategies, columns=strategies),
+        pd.DataFrame(common, index=strategies, columns=strategies),
+    )
 
 
 def calculate_delta_matrix(corr_lt: pd.DataFrame, corr_ct: pd.DataFrame) -> pd.DataFrame:
@@ -494,6 +1187,178 @@ def calculate_delta_matrix(corr_lt: pd.DataFrame, corr_ct: pd.DataFrame) -> pd.D
     return delta
 
 
+def _abs_offdiagonal_rows(corr: pd.DataFrame, strategies: pd.Index) -> np.ndarray:
+    """Lignes |corr| de strategies, NaN sur la diagonale."""
+    rows = corr.index.get_indexer(strategies)
+    values = np.abs(corr.to_numpy(dtype=np.float64)[rows])
+    own = corr.columns.get_indexer(strategies)
+    has_own = own >= 0
+    values[np.flatnonzero(has_own), own[has_own]] = np.nan
+    return values
+
+
+def _davey_row_statistics(corr: pd.DataFrame, strategies: pd.Index) -> Dict[str, np.ndarray]:
+    """
+    Statistiques |corr| des lignes de strategies (diagonale et NaN exclus).
+    
+    Args:
+        corr: Matrice de corrélation
+        strategies: Stratégies (lignes) à évaluer
+        
+    Returns:
+        Dict abs (|corr|, NaN sur la diagonale), avg, max, max_with
+    """
+    values = _abs_offdiagonal_rows(corr, strategies)
+    rows = np.arange(len(strategies))
+    
+    valid = ~np.isnan(values)
+    count = valid.sum(axis=1)
+    total = np.where(valid, values, 0.0).sum(axis=1)
+    filled = np.where(valid, values, -np.inf)
+    argmax = filled.argmax(axis=1)
+    has_values = count > 0
+    
+    with np.errstate(invalid='ignore', divide='ignore'):
+        avg = np.where(has_values, total / count, 0.0)
+    max_corr = np.where(has_values, filled[rows, argmax], 0.0)
+    max_with = np.where(has_values, corr.columns.to_numpy(dtype=object)[argmax], "")
+    
+    return {'abs': values, 'avg': avg, 'max': max_corr, 'max_with': max_with}
+
+
+def _counts_above(abs_values: np.ndarray, thresholds: np.ndarray) -> np.ndarray:
+    """
+    Nombre de valeurs > seuil par ligne, pour tous les seuils en une passe.
+    
+    Chaque valeur est classée parmi les seuils triés (searchsorted), puis un
+    histogramme par ligne cumulé depuis le haut donne les comptages.
+    
+    Args:
+        abs_values: Matrice |corr| (NaN ignorés)
+        thresholds: Seuils triés par ordre croissant
+        
+    Returns:
+        Comptages (lignes × seuils)
+    """
+    n_rows, n_thresholds = abs_values.shape[0], len(thresholds)
+    rows, cols = np.nonzero(~np.isnan(abs_values))
+    bins = np.searchsorted(thresholds, abs_values[rows, cols], side='left')
+    hist = np.bincount(
+        rows * (n_thresholds + 1) + bins, minlength=n_rows * (n_thresholds + 1)
+    ).reshape(n_rows, n_thresholds + 1)
+    # valeur > seuil_k  ⇔  plus de k seuils strictement inférieurs
+    return np.cumsum(hist[:, ::-1], axis=1)[:, ::-1][:, 1:]
+
+
+def calculate_davey_scores_for_thresholds(
+    corr_lt: pd.DataFrame,
+    corr_ct: pd.DataFrame,
+    thresholds: List[float],
+    weight_lt: float,
+    weight_ct: float
+) -> Dict[float, pd.DataFrame]:
+    """
+    Scores Davey pour plusieurs seuils de corrélation en une seule passe.
+    
+    Les statistiques indépendantes du seuil (moyennes, maxima) sont calculées
+    une fois; seuls les comptages N_Corr dépendent du seuil.
+    
+    Args:
+        corr_lt: Matrice de corrélation long terme
+        corr_ct: Matrice de corrélation court terme
+        thresholds: Seuils de corrélation
+        weight_lt: Poids long terme
+        weight_ct: Poids court terme
+        
+    Returns:
+        Dict seuil → DataFrame des scores (cf. calculate_davey_scores)
+    """
+    # Stratégies communes aux deux matrices
+    strategies = corr_lt.columns[corr_lt.columns.isin(corr_ct.columns)]
+    
+    lt = _davey_row_statistics(corr_lt, strategies)
+    ct = _davey_row_statistics(corr_ct, strategies)
+    
+    ordered = np.sort(np.unique(np.asarray(thresholds, dtype=np.float64)))
+    n_corr_lt = _counts_above(lt['abs'], ordered)
+    n_corr_ct = _counts_above(ct['abs'], ordered)
+    
+    common = {
+        'Avg_Corr_LT': np.round(lt['avg'], 3),
+        'Avg_Corr_CT': np.round(ct['avg'], 3),
+        'Delta_Corr': np.round(ct['avg'] - lt['avg'], 3),
+        'Max_Corr_LT': np.round(lt['max'], 3),
+        'Max_Corr_LT_With': lt['max_with'],
+        'Max_Corr_CT': np.round(ct['max'], 3),
+        'Max_Corr_CT_With': ct['max_with'],
+    }
+    
+    results = {}
+    for k, threshold in enumerate(ordered):
+        score_davey = np.round(n_corr_lt[:, k] * weight_lt + n_corr_ct[:, k] * weight_ct, 1)
+        status = [get_correlation_status(score) for score in score_davey]
+        
+        df_scores = pd.DataFrame({
+            'Strategy': strategies.to_numpy(dtype=object),
+            'Score_Davey': score_davey,
+            'N_Corr_LT': n_corr_lt[:, k].astype(int),
+            'N_Corr_CT': n_corr_ct[:, k].astype(int),
+            **common,
+            'Status': [s for s, _ in status],
+            'Status_Emoji': [e for _, e in status],
+        })
+        results[float(threshold)] = df_scores.sort_values(
+            'Score_Davey', ascending=False, kind='stable'
+        ).reset_index(drop=True)
+    
+    return {float(t): results[float(t)] for t in thresholds}
+
+
+def calculate_threshold_sweep(
+    corr_lt: pd.DataFrame,
+    corr_ct: pd.DataFrame,
+    thresholds: List[float],
+    weight_lt: float,
+    weight_ct: float
+) -> pd.DataFrame:
+    """
+    Sensibilité des scores Davey au seuil de corrélation.
+    
+    Les |corr| de chaque ligne sont classées une seule fois parmi les seuils
+    (cf. _counts_above): aucun recalcul des matrices ni des statistiques
+    indépendantes du seuil.
+    
+    Args:
+        corr_lt: Matrice de corrélation long terme
+        corr_ct: Matrice de corrélation court terme
+        thresholds: Seuils à balayer
+        weight_lt: Poids long terme
+        weight_ct: Poids court terme
+        
+    Returns:
+        DataFrame long (Strategy, Threshold, N_Corr_LT, N_Corr_CT, Score_Davey,
+        Status, Status_Emoji), trié par stratégie puis seuil
+    """
+    strategies = corr_lt.columns[corr_lt.columns.isin(corr_ct.columns)]
+    ordered = np.sort(np.unique(np.asarray(thresholds, dtype=np.float64)))
+    
+    n_corr_lt = _counts_above(_abs_offdiagonal_rows(corr_lt, strategies), ordered)
+    n_corr_ct = _counts_above(_abs_offdiagonal_rows(corr_ct, strategies), ordered)
+    score_davey = np.round(n_corr_lt * weight_lt + n_corr_ct * weight_ct, 1)
+    
+    status = [get_correlation_status(score) for score in score_davey.ravel()]
+    sweep = pd.DataFrame({
+        'Strategy': np.repeat(strategies.to_numpy(dtype=object), len(ordered)),
+        'Threshold': np.tile(ordered, len(strategies)),
+        'N_Corr_LT': n_corr_lt.ravel().astype(int),
+        'N_Corr_CT': n_corr_ct.ravel().astype(int),
+        'Score_Davey': score_davey.ravel(),
+        'Status': [s for s, _ in status],
+        'Status_Emoji': [e for _, e in status],
+    })
+    return sweep.sort_values(['Strategy', 'Threshold'], kind='stable').reset_index(drop=True)
+
+
 def calculate_davey_scores(
     corr_lt: pd.DataFrame,
     corr_ct: pd.DataFrame,
@@ -519,70 +1384,67 @@ def calculate_davey_scores(
     Returns:
         DataFrame avec les scores par stratégie
     """
-    # Stratégies communes aux deux matrices
-    common_strategies = list(set(corr_lt.columns) & set(corr_ct.columns))
-    
-    scores = []
-    
-    for strat in common_strategies:
-        # Long Terme
-        lt_corrs = corr_lt.loc[strat].drop(strat, errors='ignore').dropna()
-        n_corr_lt = (lt_corrs.abs() > threshold).sum()
-        avg_corr_lt = lt_corrs.abs().mean() if len(lt_corrs) > 0 else 0
-        max_corr_lt = lt_corrs.abs().max() if len(lt_corrs) > 0 else 0
-        max_corr_lt_with = lt_corrs.abs().idxmax() if len(lt_corrs) > 0 else ""
-        
-        # Court Terme
-        ct_corrs = corr_ct.loc[strat].drop(strat, errors='ignore').dropna()
-        n_corr_ct = (ct_corrs.abs() > threshold).sum()
-        avg_corr_ct = ct_corrs.abs().mean() if len(ct_corrs) > 0 else 0
-        max_corr_ct = ct_corrs.abs().max() if len(ct_corrs) > 0 else 0
-        max_corr_ct_with = ct_corrs.abs().idxmax() if len(ct_corrs) > 0 else ""
-        
-        # Score Davey combiné
-        score_davey = n_corr_lt * weight_lt + n_corr_ct * weight_ct
-        
-        # Delta de corrélation moyenne
-        delta_corr = avg_corr_ct - avg_corr_lt
-        
-        # Classification
-        status, status_emoji = get_correlation_status(score_davey)
-        
-        scores.append({
-            'Strategy': strat,
-            'Score_Davey': round(score_davey, 1),
-            'N_Corr_LT': int(n_corr_lt),
-            'N_Corr_CT': int(n_corr_ct),
-            'Avg_Corr_LT': round(avg_corr_lt, 3),
-            'Avg_Corr_CT': round(avg_corr_ct, 3),
-            'Delta_Corr': round(delta_corr, 3),
-            'Max_Corr_LT': round(max_corr_lt, 3),
-            'Max_Corr_LT_With': max_corr_lt_with,
-            'Max_Corr_CT': round(max_corr_ct, 3),
-            'Max_Corr_CT_With': max_corr_ct_with,
-            'Status': status,
-            'Status_Emoji': status_emoji
-        })
+    return calculate_davey_scores_for_thresholds(
+        corr_lt, corr_ct, [threshold], weight_lt, weight_ct
+    )[float(threshold)]
+
+
+def add_aggregated_score_columns(
+    scores: pd.DataFrame,
+    corr: pd.DataFrame,
+    level: str,
+    threshold: float,
+) -> pd.DataFrame:
+    """
+    Ajoute N_Corr_<niveau> et Avg_Corr_<niveau> (matrice agrégée ou de co-drawdown) aux scores Davey.
     
-    df_scores = pd.DataFrame(scores)
-    df_scores = df_scores.sort_values('Score_Davey', ascending=False).reset_index(drop=True)
+    Le Score_Davey n'est pas modifié; les colonnes sont ajoutées après les
+    colonnes existantes (schéma des scores inchangé jusqu'à Status_Emoji).
     
-    return df_scores
+    Args:
+        scores: Scores (cf. calculate_davey_scores)
+        corr: Matrice de corrélation agrégée ou de co-drawdown
+        level: Suffixe des colonnes ('W', 'M', 'DD')
+        threshold: Seuil de corrélation
+        
+    Returns:
+        Scores avec les colonnes ajoutées (0 / NaN pour une stratégie absente)
+    """
+    strategies = pd.Index(scores['Strategy'])
+    present = strategies.isin(corr.columns)
+    stats = _davey_row_statistics(corr, strategies[present])
+    
+    n_corr = np.zeros(len(strategies), dtype=int)
+    avg = np.full(len(strategies), np.nan)
+    with np.errstate(invalid='ignore'):
+        n_corr[present] = (stats['abs'] > threshold).sum(axis=1)
+    avg[present] = np.round(stats['avg'], 3)
+    
+    scores = scores.copy()
+    scores[f'N_Corr_{level}'] = n_corr
+    scores[f'Avg_Corr_{level}'] = avg
+    return scores
 
 
-def compute_matrix_statistics(corr_matrix: pd.DataFrame, label: str) -> Dict[str, Any]:
+def compute_matrix_statistics(
+    corr_matrix: Union[pd.DataFrame, PackedSymmetricMatrix],
+    label: str,
+) -> Dict[str, Any]:
     """
     Calcule les statistiques d'une matrice de corrélation.
     
     Args:
-        corr_matrix: Matrice de corrélation
+        corr_matrix: Matrice de corrélation (DataFrame ou PackedSymmetricMatrix)
         label: Nom de la matrice pour l'affichage
         
     Returns:
         Dictionnaire de statistiques
     """
-    mask = np.triu(np.ones_like(corr_matrix, dtype=bool), k=1)
-    values = corr_matrix.values[mask]
+    if isinstance(corr_matrix, PackedSymmetricMatrix):
+        values = corr_matrix.upper.astype(np.float64)
+    else:
+        mask = np.triu(np.ones_like(corr_matrix, dtype=bool), k=1)
+        values = corr_matrix.values[mask]
     values = values[~np.isnan(values)]
     
     return {
@@ -600,36 +1462,128 @@ def compute_matrix_statistics(corr_matrix: pd.DataFrame, label: str) -> Dict[str
     }
 
 
-def find_extreme_pairs(corr_matrix: pd.DataFrame, top_n: int = 20) -> Tuple[pd.DataFrame, pd.DataFrame]:
+# Éléments (lignes × colonnes) traités par bloc lors de la recherche des paires extrêmes
+_PAIR_BLOCK_ELEMENTS = 4_000_000
+
+
+def _pair_candidates(values: np.ndarray, order: str, excluded: Optional[np.ndarray], top_n: int):
+    """
+    Candidates d'un bloc: clé de tri croissante (meilleures paires en premier).
+    
+    Args:
+        values: Valeurs du bloc (aplaties)
+        order: 'largest', 'smallest' ou 'abs'
+        excluded: Masque des positions hors triangle supérieur (ou None)
+        top_n: Nombre de paires recherchées
+        
+    Returns:
+        Tuple (positions retenues dans le bloc, clés), ex æquo à la frontière compris
+    """
+    if order == 'largest':
+        key = -values
+    elif order == 'smallest':
+        key = values.copy()
+    else:
+        key = -np.abs(values)
+    key[np.isnan(key)] = np.inf
+    if excluded is not None:
+        key[excluded] = np.inf
+    
+    valid = np.flatnonzero(np.isfinite(key))
+    if len(valid) > top_n:
+        kth = np.partition(key[valid], top_n - 1)[top_n - 1]
+        valid = valid[key[valid] <= kth]
+    return valid, key[valid]
+
+
+def top_pairs(
+    matrix: Union[pd.DataFrame, PackedSymmetricMatrix],
+    top_n: int = 20,
+    order: str = 'largest',
+    value_name: str = 'Correlation',
+) -> pd.DataFrame:
+    """
+    Paires (triangle supérieur, NaN exclus) aux valeurs extrêmes.
+    
+    La matrice est parcourue par blocs de lignes (ou par tranches du vecteur
+    empaqueté): dans chaque bloc, seules les paires j > i sont considérées
+    et argpartition ne garde que les candidates (ex æquo compris). La liste
+    complète des paires n'est jamais construite. Résultat identique à
+    nlargest/nsmallest (keep='first') sur la liste des paires dans l'ordre (i, j).
+    
+    Args:
+        matrix: Matrice carrée symétrique (DataFrame ou PackedSymmetricMatrix)
+        top_n: Nombre de paires
+        order: 'largest', 'smallest' ou 'abs' (plus grandes valeurs absolues)
+        value_name: Nom de la colonne de valeur
+        
+    Returns:
+        DataFrame Strategy_1, Strategy_2, <value_name> trié
+    """
+    if order not in ('largest', 'smallest', 'abs'):
+        raise ValueError(f"Ordre inconnu: {order}")
+    
+    candidate_flat = []
+    candidate_key = []
+    
+    if isinstance(matrix, PackedSymmetricMatrix):
+        # Le vecteur empaqueté est déjà le triangle supérieur dans l'ordre (i, j)
+        upper = matrix.upper
+        for k0 in range(0, len(upper), _PAIR_BLOCK_ELEMENTS):
+            block = upper[k0:k0 + _PAIR_BLOCK_ELEMENTS].astype(np.float64)
+            valid, key = _pair_candidates(block, order, None, top_n)
+            candidate_flat.append(valid + k0)
+            candidate_key.append(key)
+    else:
+        values = matrix.to_numpy(dtype=np.float64)
+        n = values.shape[0]
+        columns = np.arange(n)
+        block_rows = max(1, _PAIR_BLOCK_ELEMENTS // max(n, 1))
+        for i0 in range(0, n, block_rows):
+            block = values[i0:i0 + block_rows]
+            rows = np.arange(i0, i0 + len(block))
+            lower = (columns[None, :] <= rows[:, None]).ravel()
+            valid, key = _pair_candidates(block.ravel(), order, lower, top_n)
+            candidate_flat.append(valid + i0 * n)
+            candidate_key.append(key)
+    
+    flat = np.concatenate(candidate_flat) if candidate_flat else np.array([], dtype=np.int64)
+    keys = np.concatenate(candidate_key) if candidate_key else np.array([])
+    best = flat[np.lexsort((flat, keys))[:top_n]]
+    
+    if isinstance(matrix, PackedSymmetricMatrix):
+        i, j = matrix.pair_positions(best)
+        names = matrix.labels.to_numpy(dtype=object)
+        best_values = matrix.upper[best].astype(np.float64)
+    else:
+        i, j = np.divmod(best, n)
+        names = matrix.columns.to_numpy(dtype=object)
+        best_values = values[i, j]
+    
+    return pd.DataFrame({
+        'Strategy_1': names[i],
+        'Strategy_2': names[j],
+        value_name: best_values,
+    })
+
+
+def find_extreme_pairs(
+    corr_matrix: Union[pd.DataFrame, PackedSymmetricMatrix],
+    top_n: int = 20,
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """
     Trouve les paires avec corrélations extrêmes.
     
     Args:
-        corr_matrix: Matrice de corrélation
+        corr_matrix: Matrice de corrélation (DataFrame ou PackedSymmetricMatrix)
         top_n: Nombre de paires à retourner
         
     Returns:
         Tuple (paires les plus corrélées, paires les moins corrélées)
     """
-    pairs = []
-    strategies = corr_matrix.columns.tolist()
-    
-    for i, strat_i in enumerate(strategies):
-        for j in range(i + 1, len(strategies)):
-            strat_j = strategies[j]
-            corr = corr_matrix.loc[strat_i, strat_j]
-            if not np.isnan(corr):
-                pairs.append({
-                    'Strategy_1': strat_i,
-                    'Strategy_2': strat_j,
-                    'Correlation': float(corr)
-                })
-    
-    df_pairs = pd.DataFrame(pairs)
-    if len(df_pairs) == 0:
+    most = top_pairs(corr_matrix, top_n, 'largest')
+    if len(most) == 0:
         return pd.DataFrame(), pd.DataFrame()
     
-    most = df_pairs.nlargest(top_n, 'Correlation')
-    least = df_pairs.nsmallest(top_n, 'Correlation')
-    
+    least = top_pairs(corr_matrix, top_n, 'smallest')
     return most, least
@@ -0,0 +1,325 @@
+"""
+Classification hiérarchique des stratégies (lien moyen sur 1 - |corr|).
+
+Les heatmaps de 200+ stratégies ne se lisent que si les stratégies corrélées
+sont voisines. La classification est calculée une fois par l'analyse, sur la
+matrice long terme, et conservée avec les matrices:
+
+- Distance: d(i, j) = 1 - |corr(i, j)| (corrélation non calculable → 1)
+- Lien moyen (UPGMA) par l'algorithme de la chaîne des plus proches voisins:
+  O(N²) en mémoire et en calcul, chaque fusion met à jour une ligne
+  (formule de Lance-Williams), sans recherche du minimum global
+- Ordre des feuilles: parcours du dendrogramme (enfant gauche d'abord),
+  les clusters sont contigus dans cet ordre
+- Clusters: coupure du dendrogramme à la distance 1 - seuil de corrélation
+  (corrélation absolue moyenne entre membres ≥ seuil)
+
+La matrice de liens a le format de scipy.cluster.hierarchy.linkage
+(fusion a, b, distance, taille; le cluster créé par la fusion k porte
+l'identifiant N + k).
+
+Utilisation:
+    clusters = CorrelationClusters.build(corr_lt, cut_distance=0.3)
+    clusters.ordered_strategies           # ordre des heatmaps
+    clusters.summary                      # Cluster, Size, Mean_Corr, ...
+    clusters.members('A_ES')              # stratégies du même cluster
+"""
+
+from pathlib import Path
+from typing import List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from .config import CLUSTERING_CONFIG, DEFAULT_CONFIG
+from .packed_matrix import PackedSymmetricMatrix
+
+
+def correlation_distance(corr: np.ndarray) -> np.ndarray:
+    """Distance 1 - |corr| (NaN → 1, diagonale 0)."""
+    distance = 1.0 - np.abs(np.nan_to_num(np.asarray(corr, dtype=np.float64), nan=0.0))
+    np.fill_diagonal(distance, 0.0)
+    return np.clip(distance, 0.0, 1.0)
+
+
+def average_linkage(distance: np.ndarray) -> np.ndarray:
+    """
+    Classification hiérarchique à lien moyen (chaîne des plus proches voisins).
+
+    Args:
+        distance: Matrice de distances N×N symétrique
+
+    Returns:
+        Matrice de liens (N-1)×4 triée par distance (format scipy)
+    """
+    d = np.array(distance, dtype=np.float64)
+    n = len(d)
+    if n < 2:
+        return np.zeros((0, 4))
+    np.fill_diagonal(d, np.inf)
+    size = np.ones(n)
+
+    merges = []
+    chain: List[int] = []
+    while len(merges) < n - 1:
+        if not chain:
+            chain.append(int(np.flatnonzero(size)[0]))
+        a = chain[-1]
+        b = int(np.argmin(d[a]))
+        # En cas d'égalité, le prédécesseur dans la chaîne est préféré (terminaison)
+        if len(chain) > 1 and d[a, chain[-2]] <= d[a, b]:
+            b = chain[-2]
+        if len(chain) == 1 or b != chain[-2]:
+            chain.append(b)
+            continue
+
+        # a et b plus proches voisins réciproques: fusion dans b (Lance-Williams)
+        chain = chain[:-2]
+        merges.append((a, b, d[a, b]))
+        row = (size[a] * d[a] + size[b] * d[b]) / (size[a] + size[b])
+        d[b, :] = row
+        d[:, b] = row
+        d[b, b] = np.inf
+        d[a, :] = np.inf
+        d[:, a] = np.inf
+        size[b] += size[a]
+        size[a] = 0
+
+    # Fusions triées par distance, identifiants scipy (union-find sur les feuilles)
+    merges.sort(key=lambda m: m[2])
+    parent = np.arange(2 * n - 1)
+    cluster_size = np.ones(2 * n - 1)
+
+    def find(x: int) -> int:
+        root = x
+        while parent[root] != root:
+            root = parent[root]
+        while parent[x] != root:
+            parent[x], x = root, parent[x]
+        return root
+
+    linkage = np.empty((n - 1, 4))
+    for k, (a, b, dist) in enumerate(merges):
+        ra, rb = find(a), find(b)
+        new = n + k
+        parent[ra] = parent[rb] = new
+        cluster_size[new] = cluster_size[ra] + cluster_size[rb]
+        linkage[k] = (min(ra, rb), max(ra, rb), dist, cluster_size[new])
+    return linkage
+
+
+def leaf_order(linkage: np.ndarray) -> np.ndarray:
+    """Ordre des feuilles du dendrogramme (parcours gauche → droite)."""
+    n = len(linkage) + 1
+    if n == 1:
+        return np.zeros(1, dtype=np.int64)
+    order = []
+    stack = [2 * n - 2]
+    while stack:
+        node = stack.pop()
+        if node < n:
+            order.append(node)
+        else:
+            left, right = linkage[node - n, :2].astype(np.int64)
+            stack.extend((right, left))
+    return np.array(order, dtype=np.int64)
+
+
+def cut_tree(linkage: np.ndarray, cut_distance: float, order: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Clusters plats: feuilles réunies par les fusions de distance ≤ cut_distance.
+
+    Args:
+        linkage: Matrice de liens (cf. average_linkage)
+        cut_distance: Distance de coupure
+        order: Ordre des feuilles (numérotation des clusters dans cet ordre)
+
+    Returns:
+        Numéro de cluster (1..K) par feuille
+    """
+    n = len(linkage) + 1
+    order = leaf_order(linkage) if order is None else order
+    parent = np.arange(2 * n - 1)
+    for k in np.flatnonzero(linkage[:, 2] <= cut_distance):
+        parent[linkage[k, :2].astype(np.int64)] = n + k
+
+    # Remonter chaque feuille jusqu'à la dernière fusion retenue
+    top = parent[:n]
+    while True:
+        up = parent[top]
+        if np.array_equal(up, top):
+            break
+        top = up
+
+    # Numérotation par première apparition dans l'ordre des feuilles
+    _, first = np.unique(top[order], return_index=True)
+    numbering = {top[order][k]: rank + 1 for rank, k in enumerate(np.sort(first))}
+    return np.array([numbering[t] for t in top], dtype=np.int64)
+
+
+class CorrelationClusters:
+    """
+    Classification hiérarchique d'une matrice de corrélation.
+
+    Attributs:
+        strategies: Stratégies (ordre de la matrice d'origine)
+        linkage: Matrice de liens (N-1)×4 (format scipy)
+        order: Permutation des stratégies (ordre des feuilles)
+        labels: Cluster de chaque stratégie (1..K, numéroté dans l'ordre des feuilles)
+        cut_distance: Distance de coupure des clusters
+        summary: Cluster, Size, Mean_Corr, Mean_Abs_Corr, Strategies (un cluster par ligne)
+    """
+
+    def __init__(
+        self,
+        strategies: Sequence[str],
+        linkage: np.ndarray,
+        order: np.ndarray,
+        labels: np.ndarray,
+        cut_distance: float,
+        summary: pd.DataFrame,
+    ):
+        self.strategies = list(strategies)
+        self.linkage = np.asarray(linkage, dtype=np.float64)
+        self.order = np.asarray(order, dtype=np.int64)
+        self.labels = np.asarray(labels, dtype=np.int64)
+        self.cut_distance = float(cut_distance)
+        self.summary = summary
+        self._position = {s: k for k, s in enumerate(self.strategies)}
+
+    @classmethod
+    def build(
+        cls,
+        corr: Union[pd.DataFrame, PackedSymmetricMatrix],
+        cut_distance: Optional[float] = None,
+    ) -> 'CorrelationClusters':
+        """
+        Classe les stratégies d'une matrice de corrélation.
+
+        Args:
+            corr: Matrice de corrélation (DataFrame ou empaquetée)
+            cut_distance: Distance de coupure (défaut: CLUSTERING_CONFIG, sinon 1 - seuil par défaut)
+
+        Returns:
+            CorrelationClusters
+        """
+        if isinstance(corr, PackedSymmetricMatrix):
+            strategies, values = list(corr.labels), corr.to_dense(np.float64)
+        else:
+            strategies, values = list(corr.columns), corr.to_numpy(dtype=np.float64)
+        if cut_distance is None:
+            cut_distance = CLUSTERING_CONFIG['cut_distance']
+        if cut_distance is None:
+            cut_distance = 1.0 - DEFAULT_CONFIG['correlation_threshold']
+
+        if len(strategies) == 0:
+            return cls([], np.zeros((0, 4)), np.zeros(0), np.zeros(0), cut_distance, _summary_frame([], np.zeros(0), []))
+
+        linkage = average_linkage(correlation_distance(values))
+        order = leaf_order(linkage)
+        labels = cut_tree(linkage, cut_distance, order)
+        summary = _cluster_summary(
+            [strategies[k] for k in order], values[np.ix_(order, order)], labels[order]
+        )
+        return cls(strategies, linkage, order, labels, cut_distance, summary)
+
+    def __len__(self) -> int:
+        return len(self.strategies)
+
+    @property
+    def n_clusters(self) -> int:
+        return len(self.summary)
+
+    @property
+    def ordered_strategies(self) -> List[str]:
+        """Stratégies dans l'ordre des feuilles (clusters contigus)."""
+        return [self.strategies[k] for k in self.order]
+
+    def cluster_of(self, strategy: str) -> Optional[int]:
+        """Cluster d'une stratégie (None si non classée)."""
+        k = self._position.get(strategy)
+        return None if k is None else int(self.labels[k])
+
+    def members(self, strategy: str) -> List[str]:
+        """Stratégies du cluster d'une stratégie (ordre des feuilles, elle-même incluse)."""
+        cluster = self.cluster_of(strategy)
+        if cluster is None:
+            return []
+        return self.summary.loc[self.summary['Cluster'] == cluster, 'Strategies'].iloc[0]
+
+    def order_labels(self, labels: Sequence[str]) -> List[str]:
+        """
+        Range des libellés dans l'ordre des feuilles (libellés non classés à la fin).
+
+        Args:
+            labels: Libellés d'une autre matrice (CT, delta, agrégée)
+
+        Returns:
+            Libellés réordonnés
+        """
+        rank = {s: k for k, s in enumerate(self.ordered_strategies)}
+        return sorted(labels, key=lambda s: rank.get(s, len(rank)))
+
+    def save(self, path: Path) -> Path:
+        """Sauvegarde la classification (.npz compressé)."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'wb') as f:
+            np.savez_compressed(
+                f,
+                strategies=np.array(self.strategies, dtype=str),
+                linkage=self.linkage,
+                order=self.order,
+                labels=self.labels,
+                cut_distance=np.array([self.cut_distance]),
+                mean_corr=self.summary[['Mean_Corr', 'Mean_Abs_Corr']].to_numpy(dtype=np.float64),
+            )
+        return path
+
+    @classmethod
+    def load(cls, path: Path) -> 'CorrelationClusters':
+        """Charge une classification sauvegardée (aucun recalcul de matrice)."""
+        with np.load(Path(path), allow_pickle=False) as archive:
+            strategies = archive['strategies'].tolist()
+            order, labels = archive['order'], archive['labels']
+            summary = _summary_frame(
+                [strategies[k] for k in order], labels[order], archive['mean_corr']
+            )
+            return cls(strategies, archive['linkage'], order, labels, float(archive['cut_distance'][0]), summary)
+
+
+def _cluster_summary(ordered_strategies: Sequence[str], ordered_corr: np.ndarray, ordered_labels: np.ndarray) -> pd.DataFrame:
+    """
+    Agrégats par cluster (clusters contigus dans l'ordre des feuilles).
+
+    Seuls les blocs diagonaux sont parcourus: O(Σ taille²) ≤ O(N²).
+    """
+    groups = _contiguous_groups(ordered_labels)
+    means = np.full((len(groups), 2), np.nan)
+    for c, group in enumerate(groups):
+        block = ordered_corr[group[0]:group[-1] + 1, group[0]:group[-1] + 1]
+        values = block[~np.eye(len(group), dtype=bool)]
+        values = values[~np.isnan(values)]
+        if len(values):
+            means[c] = values.mean(), np.abs(values).mean()
+    return _summary_frame(ordered_strategies, ordered_labels, means)
+
+
+def _summary_frame(ordered_strategies: Sequence[str], ordered_labels: np.ndarray, means: np.ndarray) -> pd.DataFrame:
+    """Tableau des clusters (membres dans l'ordre des feuilles)."""
+    groups = _contiguous_groups(ordered_labels)
+    means = np.asarray(means, dtype=np.float64).reshape(len(groups), 2)
+    return pd.DataFrame({
+        'Cluster': [int(ordered_labels[g[0]]) for g in groups],
+        'Size': [len(g) for g in groups],
+        'Mean_Corr': np.round(means[:, 0], 4),
+        'Mean_Abs_Corr': np.round(means[:, 1], 4),
+        'Strategies': [[ordered_strategies[k] for k in g] for g in groups],
+    })
+
+
+def _contiguous_groups(ordered_labels: np.ndarray) -> List[np.ndarray]:
+    """Positions de chaque cluster (contigu dans l'ordre des feuilles)."""
+    if len(ordered_labels) == 0:
+        return []
+    return np.split(np.arange(len(ordered_labels)), np.flatnonzero(np.diff(ordered_labels)) + 1)
@@ -0,0 +1,424 @@
+"""
+Moteur de corrélation matriciel (NumPy).
+
+Calcule toutes les corrélations de Pearson par paire sur les jours communs
+(jours où les deux stratégies ont tradé) en quelques produits matriciels,
+au lieu d'une double boucle Python sur les paires.
+
+Principe (M = masque "a tradé", X = profits centrés et masqués):
+    n  = MᵀM            jours communs par paire
+    A  = XᵀM            Σ x_i sur les jours communs de (i, j)
+    Q  = (X²)ᵀM         Σ x_i² sur les jours communs de (i, j)
+    P  = XᵀX            Σ x_i·x_j (nul dès qu'une des deux n'a pas tradé)
+
+    cov_ij = P_ij - A_ij·A_ji / n_ij
+    var_i  = Q_ij - A_ij² / n_ij
+    r_ij   = cov_ij / √(var_i · var_j)
+
+Les profits sont décalés par leur moyenne (sur les jours actifs) avant le
+calcul: la corrélation est invariante par translation et cela évite les
+pertes de précision des formules à une passe.
+
+Spearman et Kendall (tau-b) sont calculés paire par paire sur les mêmes
+jours communs, avec des rangs vectorisés et un comptage des paires
+discordantes en O(n log n), éventuellement sur plusieurs processus.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+# Variance relative en dessous de laquelle une série est considérée constante
+_VARIANCE_RTOL = 1e-12
+
+
+def activity_mask(values: np.ndarray) -> np.ndarray:
+    """
+    Masque des jours avec activité (P&L non nul).
+
+    Args:
+        values: Matrice de profits (jours × stratégies)
+
+    Returns:
+        Masque booléen de même forme
+    """
+    return (values != 0) & ~np.isnan(values)
+
+
+def column_shift(values: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    """
+    Moyenne de chaque colonne sur ses jours actifs (0 si aucun jour actif).
+
+    Args:
+        values: Matrice de profits (jours × stratégies)
+        mask: Masque d'activité
+
+    Returns:
+        Vecteur des décalages par stratégie
+    """
+    counts = mask.sum(axis=0)
+    sums = np.where(mask, values, 0.0).sum(axis=0)
+    return np.divide(sums, counts, out=np.zeros(values.shape[1]), where=counts > 0)
+
+
+def compute_masked_moments(
+    values: np.ndarray,
+    mask: Optional[np.ndarray] = None,
+    shift: Optional[np.ndarray] = None,
+    weights: Optional[np.ndarray] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    Calcule les statistiques suffisantes par paire sur les jours communs.
+
+    Args:
+        values: Matrice de profits (jours × stratégies)
+        mask: Masque des jours retenus (défaut: P&L non nul)
+        shift: Décalage par stratégie (défaut: moyenne sur les jours actifs)
+        weights: Poids par jour (ex: comptes de rééchantillonnage), optionnel
+
+    Returns:
+        Dict avec 'n', 'A', 'Q', 'P' (matrices N×N) et 'shift'
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if mask is None:
+        mask = activity_mask(values)
+    if shift is None:
+        shift = column_shift(values, mask)
+
+    m = mask.astype(np.float64)
+    x = np.where(mask, values - shift, 0.0)
+
+    if weights is not None:
+        w = np.asarray(weights, dtype=np.float64)[:, None]
+        mw = m * w
+        xw = x * w
+    else:
+        mw = m
+        xw = x
+
+    return {
+        'n': mw.T @ m,
+        'A': xw.T @ m,
+        'Q': (xw * x).T @ m,
+        'P': xw.T @ x,
+        'shift': shift,
+    }
+
+
+def block_correlation(
+    n: np.ndarray,
+    a_ij: np.ndarray,
+    a_ji: np.ndarray,
+    q_ij: np.ndarray,
+    q_ji: np.ndarray,
+    p: np.ndarray,
+    min_common_days: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Corrélations d'un bloc de paires (i ∈ I, j ∈ J) à partir de ses moments.
+
+    Args:
+        n: Jours communs (|I|×|J|)
+        a_ij, a_ji: Σ x_i et Σ x_j sur les jours communs
+        q_ij, q_ji: Σ x_i² et Σ x_j² sur les jours communs
+        p: Σ x_i·x_j
+        min_common_days: Jours communs minimum
+
+    Returns:
+        Tuple (corrélations du bloc avec NaN si non calculable, jours communs int64)
+    """
+    common = np.rint(n).astype(np.int64)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cov = p - a_ij * a_ji / n
+        var_i = q_ij - a_ij * a_ij / n
+        var_j = q_ji - a_ji * a_ji / n
+        corr = cov / np.sqrt(var_i * var_j)
+
+    degenerate = (var_i <= _VARIANCE_RTOL * np.abs(q_ij)) | (var_j <= _VARIANCE_RTOL * np.abs(q_ji))
+    corr[degenerate | (common < max(min_common_days, 2)) | ~np.isfinite(corr)] = np.nan
+    np.clip(corr, -1.0, 1.0, out=corr)
+    return corr, common
+
+
+def moments_to_correlation(
+    moments: Dict[str, np.ndarray],
+    min_common_days: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Convertit les statistiques suffisantes en matrice de corrélation.
+
+    Args:
+        moments: Sortie de compute_masked_moments (ou cumul de plusieurs)
+        min_common_days: Jours communs minimum pour calculer une corrélation
+
+    Returns:
+        Tuple (corrélations N×N avec NaN si non calculable, jours communs N×N int64)
+    """
+    a, q = moments['A'], moments['Q']
+    corr, common = block_correlation(moments['n'], a, a.T, q, q.T, moments['P'], min_common_days)
+    np.fill_diagonal(corr, 1.0)
+    return corr, common
+
+
+def pearson_correlation_matrix(
+    values: np.ndarray,
+    min_common_days: int,
+    mask: Optional[np.ndarray] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Corrélations de Pearson de toutes les paires sur leurs jours communs.
+
+    Équivalent vectorisé de la boucle:
+        mask = (x_i != 0) & (x_j != 0)
+        r_ij = Series.corr(x_i[mask], x_j[mask])   si mask.sum() >= min_common_days
+
+    Args:
+        values: Matrice de profits (jours × stratégies)
+        min_common_days: Jours communs minimum
+        mask: Masque des jours retenus (défaut: P&L non nul)
+
+    Returns:
+        Tuple (corrélations N×N, jours communs N×N)
+    """
+    values = np.nan_to_num(np.asarray(values, dtype=np.float64), nan=0.0)
+    moments = compute_masked_moments(values, mask=mask)
+    return moments_to_correlation(moments, min_common_days)
+
+
+# ==============================================================================
+# MÉTHODES ROBUSTES (SPEARMAN, KENDALL)
+# ==============================================================================
+
+def _common_days_matrix(mask: np.ndarray) -> np.ndarray:
+    """Jours communs par paire (MᵀM)."""
+    m = mask.astype(np.float64)
+    return np.rint(m.T @ m).astype(np.int64)
+
+
+def _columnwise_pearson(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Pearson colonne par colonne entre x et y (NaN = observation exclue, mêmes positions)."""
+    valid = ~np.isnan(x)
+    n = valid.sum(axis=0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        xc = np.where(valid, x - np.nansum(x, axis=0) / n, 0.0)
+        yc = np.where(valid, y - np.nansum(y, axis=0) / n, 0.0)
+        cov = (xc * yc).sum(axis=0)
+        denom = np.sqrt((xc * xc).sum(axis=0) * (yc * yc).sum(axis=0))
+        return np.where(denom > 0, cov / denom, np.nan)
+
+
+def _average_ranks(x: np.ndarray) -> np.ndarray:
+    """Rangs moyens (ex-aequo moyennés) par colonne, NaN conservés."""
+    return pd.DataFrame(x).rank(axis=0, method='average', na_option='keep').to_numpy()
+
+
+def _spearman_rows(values: np.ndarray, mask: np.ndarray, rows: np.ndarray, min_common_days: int) -> np.ndarray:
+    """
+    Spearman des paires (i, j>i) pour les lignes i données.
+
+    Pour chaque i, les rangs sont recalculés dans le masque commun de
+    chaque paire: toutes les colonnes j sont rangées en une seule opération.
+    """
+    n_strategies = values.shape[1]
+    out = np.full((len(rows), n_strategies), np.nan)
+
+    for k, i in enumerate(rows):
+        others = np.arange(i + 1, n_strategies)
+        days = np.flatnonzero(mask[:, i])
+        if len(others) == 0 or len(days) < min_common_days:
+            continue
+
+        pair_mask = mask[np.ix_(days, others)]
+        keep = pair_mask.sum(axis=0) >= max(min_common_days, 2)
+        if not keep.any():
+            continue
+        others = others[keep]
+        pair_mask = pair_mask[:, keep]
+
+        xi = np.where(pair_mask, values[days, i][:, None], np.nan)
+        xj = np.where(pair_mask, values[np.ix_(days, others)], np.nan)
+        out[k, others] = _columnwise_pearson(_average_ranks(xi), _average_ranks(xj))
+
+    return out
+
+
+def _dense_ranks(x: np.ndarray) -> np.ndarray:
+    """Rangs denses (0..k-1) d'un vecteur."""
+    _, inverse = np.unique(x, return_inverse=True)
+    return inverse.astype(np.int64)
+
+
+def _count_inversions(a: np.ndarray) -> int:
+    """
+    Nombre de paires (p < q) avec a[p] > a[q] (strict), en O(n log m).
+
+    a contient des rangs denses 0..m-1. Tri par base, bits de poids fort
+    d'abord: à chaque bit, les éléments sont groupés par leurs bits
+    supérieurs (ordre d'origine conservé dans chaque groupe); une paire
+    inversée est comptée au premier bit où ses valeurs diffèrent (un 1 avant
+    un 0 dans le même groupe), puis chaque groupe est partitionné de façon
+    stable (0 puis 1). Chaque bit coûte O(n) (sommes cumulées), sans tri
+    ni boucle Python sur les éléments.
+    """
+    n = len(a)
+    if n < 2:
+        return 0
+
+    cur = np.asarray(a, dtype=np.int64)
+    positions = np.arange(n)
+    total = 0
+
+    for bit in range(int(cur.max()).bit_length() - 1, -1, -1):
+        prefix = cur >> (bit + 1)
+        ones = (cur >> bit) & 1
+
+        # Début du groupe (bits supérieurs identiques, contigus) de chaque élément
+        boundary = np.r_[True, prefix[1:] != prefix[:-1]]
+        group_start = np.maximum.accumulate(np.where(boundary, positions, 0))
+
+        ones_before = np.cumsum(ones) - ones
+        ones_in_group = ones_before - ones_before[group_start]
+        zeros = ones == 0
+        total += int(ones_in_group[zeros].sum())
+
+        # Partition stable dans chaque groupe: les 0 puis les 1
+        zeros_before = (positions - group_start) - ones_in_group
+        group_ids = np.cumsum(boundary) - 1
+        group_zeros = np.bincount(group_ids, weights=zeros, minlength=group_ids[-1] + 1).astype(np.int64)
+        target = np.where(zeros, group_start + zeros_before, group_start + group_zeros[group_ids] + ones_in_group)
+        reordered = np.empty_like(cur)
+        reordered[target] = cur
+        cur = reordered
+
+    return total
+
+
+def _tie_pairs(sorted_values: np.ndarray) -> int:
+    """Σ t(t-1)/2 sur les groupes d'ex-aequo d'un vecteur trié."""
+    if len(sorted_values) == 0:
+        return 0
+    boundaries = np.flatnonzero(np.r_[True, sorted_values[1:] != sorted_values[:-1], True])
+    counts = np.diff(boundaries)
+    return int((counts * (counts - 1) // 2).sum())
+
+
+def kendall_tau_b(x: np.ndarray, y: np.ndarray) -> float:
+    """
+    Tau-b de Kendall par l'algorithme de Knight, en O(n log n).
+
+    Tri par x (ex-aequo départagés par y), puis les paires discordantes sont
+    les inversions de y dans cet ordre (cf. _count_inversions).
+
+    Args:
+        x, y: Vecteurs de même longueur
+
+    Returns:
+        Tau-b (NaN si une des séries est constante)
+    """
+    n = len(x)
+    if n < 2:
+        return np.nan
+
+    xr = _dense_ranks(np.asarray(x))
+    yr = _dense_ranks(np.asarray(y))
+
+    order = np.lexsort((yr, xr))
+    xs, ys = xr[order], yr[order]
+
+    total = n * (n - 1) // 2
+    x_ties = _tie_pairs(xs)
+    y_ties = _tie_pairs(np.sort(yr))
+    joint = xs * (yr.max() + 1) + ys
+    joint_ties = _tie_pairs(joint)
+    discordant = _count_inversions(ys)
+
+    denom = (total - x_ties) * (total - y_ties)
+    if denom <= 0:
+        return np.nan
+    return (total - x_ties - y_ties + joint_ties - 2 * discordant) / np.sqrt(float(denom))
+
+
+def _kendall_rows(values: np.ndarray, mask: np.ndarray, rows: np.ndarray, min_common_days: int) -> np.ndarray:
+    """Kendall des paires (i, j>i) pour les lignes i données."""
+    n_strategies = values.shape[1]
+    out = np.full((len(rows), n_strategies), np.nan)
+
+    for k, i in enumerate(rows):
+        days = np.flatnonzero(mask[:, i])
+        others = np.arange(i + 1, n_strategies)
+        if len(others) == 0 or len(days) < min_common_days:
+            continue
+
+        # Jours communs de toute la ligne en une opération; une paire = un tau-b O(n log n)
+        pair_mask = mask[np.ix_(days, others)]
+        for j, both in zip(others, pair_mask.T):
+            if both.sum() >= max(min_common_days, 2):
+                common = days[both]
+                out[k, j] = kendall_tau_b(values[common, i], values[common, j])
+
+    return out
+
+
+_ROW_FUNCTIONS = {
+    'spearman': _spearman_rows,
+    'kendall': _kendall_rows,
+}
+
+
+def _row_chunks(n_strategies: int, n_chunks: int) -> list:
+    """Découpe les lignes en paquets de charge équivalente (la ligne i a N-i-1 paires)."""
+    rows = np.arange(n_strategies)
+    # Entrelacer pour équilibrer: les premières lignes ont plus de paires
+    return [rows[k::n_chunks] for k in range(n_chunks) if len(rows[k::n_chunks])]
+
+
+def _rank_rows_task(args) -> Tuple[np.ndarray, np.ndarray]:
+    """Tâche de pool: calcule un paquet de lignes."""
+    method, values, mask, rows, min_common_days = args
+    return rows, _ROW_FUNCTIONS[method](values, mask, rows, min_common_days)
+
+
+def rank_correlation_matrix(
+    values: np.ndarray,
+    min_common_days: int,
+    method: str = 'spearman',
+    n_jobs: int = 1,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Corrélations de Spearman ou Kendall (tau-b) sur les jours communs.
+
+    Args:
+        values: Matrice de profits (jours × stratégies)
+        min_common_days: Jours communs minimum
+        method: 'spearman' ou 'kendall'
+        n_jobs: Nombre de processus (1 = séquentiel)
+
+    Returns:
+        Tuple (corrélations N×N, jours communs N×N)
+    """
+    if method not in _ROW_FUNCTIONS:
+        raise ValueError(f"Méthode de corrélation inconnue: {method}")
+
+    values = np.nan_to_num(np.asarray(values, dtype=np.float64), nan=0.0)
+    mask = activity_mask(values)
+    n_strategies = values.shape[1]
+    upper = np.full((n_strategies, n_strategies), np.nan)
+
+    if n_jobs and n_jobs > 1 and n_strategies > 2:
+        tasks = [
+            (method, values, mask, rows, min_common_days)
+            for rows in _row_chunks(n_strategies, n_jobs * 4)
+        ]
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            for rows, block in executor.map(_rank_rows_task, tasks):
+                upper[rows] = block
+    else:
+        upper[:] = _ROW_FUNCTIONS[method](values, mask, np.arange(n_strategies), min_common_days)
+
+    corr = np.where(np.isnan(upper), upper.T, upper)
+    np.fill_diagonal(corr, 1.0)
+    return corr, _common_days_matrix(mask)
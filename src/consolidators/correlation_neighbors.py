@@ -0,0 +1,312 @@
+"""
+Recherche rapide des stratégies les plus corrélées à une nouvelle série.
+
+Le top des stratégies corrélées d'une page demande la matrice N×N complète.
+Pour savoir immédiatement si une nouvelle courbe (fichier DataSource déposé
+dans EQUITY_CURVES_DIR) duplique une stratégie existante, on conserve un
+index des profits journaliers sur la grille de dates de l'analyse:
+
+1. Esquisse (projection aléatoire): chaque série centrée sur ses jours
+   actifs et normée est projetée sur d composantes gaussiennes
+   (Johnson-Lindenstrauss). Le produit scalaire de deux esquisses estime
+   la corrélation des séries complétées par des zéros.
+2. Raffinement exact: les meilleures candidates de l'esquisse sont
+   recalculées avec le moteur de Pearson (jours communs, même résultat
+   que la matrice de l'analyse).
+
+Une requête coûte une projection (T×d) et un produit N×d, puis un calcul
+exact sur quelques centaines de candidates: indépendant de N² et bien en
+dessous de la seconde. Les fortes corrélations (doublons) sont retrouvées;
+l'erreur de l'esquisse (~1/√d) ne peut écarter que des corrélations faibles
+en fin de classement. L'ajout d'une stratégie met l'index à jour en O(T·d)
+(amorti), sans recalcul des autres. La grille de dates est celle de la
+construction; les jours hors grille d'une nouvelle série sont ignorés (aucune
+stratégie indexée n'y a tradé).
+
+Utilisation:
+    index = SimilarityIndex.build(profits, min_common_days=100)
+    index.query(read_datasource_profits(path), k=15)
+    index.add('NEW_ES', series)
+    index.save(path)
+"""
+
+from pathlib import Path
+from typing import Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from ..monte_carlo.data_loader import load_strategy_file
+from .config import SIMILARITY_CONFIG
+from .correlation_engine import block_correlation
+from .profit_matrix import profit_arrays
+
+
+def datasource_strategy_id(path: Path) -> str:
+    """
+    Strategy_ID ({stratégie}_{symbole}) d'un fichier DataSource ({symbole}_{stratégie}.txt).
+
+    Un nom de fichier sans '_' est repris tel quel.
+    """
+    symbol, _, strategy = Path(path).stem.partition('_')
+    return f"{strategy}_{symbol}" if strategy else symbol
+
+
+def read_datasource_profits(path: Path) -> pd.Series:
+    """
+    Profits journaliers d'un fichier DataSource (format Titan, cf. load_strategy_file).
+
+    Args:
+        path: Fichier {symbole}_{stratégie}.txt
+
+    Returns:
+        Series date → profit (profits d'une même date additionnés), nommée
+        d'après le Strategy_ID du fichier (cf. datasource_strategy_id)
+    """
+    df = load_strategy_file(path)
+    series = df.groupby('Date')['DailyProfit'].sum().rename_axis(None)
+    series.name = datasource_strategy_id(path)
+    return series
+
+
+def _unit_rows(values: np.ndarray) -> np.ndarray:
+    """Lignes centrées sur leurs jours actifs (P&L non nul), nulles ailleurs, de norme 1."""
+    mask = values != 0
+    counts = mask.sum(axis=1, keepdims=True)
+    sums = values.sum(axis=1, keepdims=True)
+    shift = np.divide(sums, counts, out=np.zeros(counts.shape), where=counts > 0)
+    x = np.where(mask, values - shift, 0.0)
+    norm = np.linalg.norm(x, axis=1, keepdims=True)
+    return np.divide(x, norm, out=np.zeros_like(x), where=norm > 0)
+
+
+class SimilarityIndex:
+    """
+    Index de recherche des stratégies les plus corrélées.
+
+    Attributs:
+        dates: Grille de dates (DatetimeIndex)
+        strategies: Stratégies indexées (ordre d'ajout)
+        min_common_days: Jours communs minimum du calcul exact
+        n_components: Dimension de l'esquisse
+        seed: Graine de la projection
+    """
+
+    def __init__(
+        self,
+        dates: pd.DatetimeIndex,
+        min_common_days: int,
+        n_components: Optional[int] = None,
+        seed: Optional[int] = None,
+    ):
+        self.dates = pd.DatetimeIndex(dates)
+        self.min_common_days = int(min_common_days)
+        self.n_components = int(n_components or SIMILARITY_CONFIG['n_components'])
+        self.seed = SIMILARITY_CONFIG['seed'] if seed is None else int(seed)
+
+        rng = np.random.default_rng(self.seed)
+        self._projection = (
+            rng.standard_normal((len(self.dates), self.n_components)) / np.sqrt(self.n_components)
+        ).astype(np.float32)
+
+        self.strategies = []
+        self._position = {}
+        self._values = np.zeros((0, len(self.dates)), dtype=np.float32)
+        self._sketch = np.zeros((0, self.n_components), dtype=np.float32)
+
+    @classmethod
+    def build(
+        cls,
+        profit_matrix,
+        min_common_days: int,
+        n_components: Optional[int] = None,
+        seed: Optional[int] = None,
+    ) -> 'SimilarityIndex':
+        """
+        Construit l'index à partir d'une matrice de profits.
+
+        Args:
+            profit_matrix: ProfitMatrix ou DataFrame pivot (dates × stratégies)
+            min_common_days: Jours communs minimum du calcul exact
+            n_components: Dimension de l'esquisse (défaut: SIMILARITY_CONFIG)
+            seed: Graine de la projection (défaut: SIMILARITY_CONFIG)
+
+        Returns:
+            SimilarityIndex
+        """
+        values, _, strategies, dates = profit_arrays(profit_matrix)
+        index = cls(dates, min_common_days, n_components, seed)
+        index._append(strategies, values.T)
+        return index
+
+    def __len__(self) -> int:
+        return len(self.strategies)
+
+    def __contains__(self, strategy: str) -> bool:
+        return strategy in self._position
+
+    # ==========================================================================
+    # MISE À JOUR INCRÉMENTALE
+    # ==========================================================================
+
+    def _align(self, profits: pd.Series) -> np.ndarray:
+        """Profits d'une série sur la grille de dates (0 hors activité, dates hors grille ignorées)."""
+        profits = pd.to_numeric(profits, errors='coerce').fillna(0.0)
+        profits = profits.groupby(pd.DatetimeIndex(pd.to_datetime(profits.index))).sum()
+        return profits.reindex(self.dates, fill_value=0.0).to_numpy(dtype=np.float64)
+
+    def _append(self, strategies, rows: np.ndarray):
+        """Ajoute des lignes (stratégies × jours) à l'index, capacité doublée si nécessaire."""
+        n, added = len(self.strategies), len(strategies)
+        if n + added > len(self._values):
+            capacity = max(n + added, 2 * len(self._values))
+            values = np.zeros((capacity, len(self.dates)), dtype=np.float32)
+            sketch = np.zeros((capacity, self.n_components), dtype=np.float32)
+            values[:n], sketch[:n] = self._values[:n], self._sketch[:n]
+            self._values, self._sketch = values, sketch
+
+        # Projection par blocs de lignes (mémoire de travail bornée)
+        block = SIMILARITY_CONFIG['block_rows']
+        for start in range(0, added, block):
+            rows_block = np.asarray(rows[start:start + block], dtype=np.float64)
+            self._values[n + start:n + start + len(rows_block)] = rows_block
+            self._sketch[n + start:n + start + len(rows_block)] = _unit_rows(rows_block) @ self._projection
+        for k, strategy in enumerate(strategies):
+            self._position[strategy] = n + k
+        self.strategies.extend(strategies)
+
+    def add(self, strategy: str, profits: pd.Series) -> 'SimilarityIndex':
+        """
+        Ajoute une stratégie (O(T·d), les autres ne sont pas recalculées).
+
+        Args:
+            strategy: Nom de la stratégie
+            profits: Profits journaliers (Series indexée par date)
+
+        Returns:
+            L'index (mis à jour)
+        """
+        if strategy in self._position:
+            raise ValueError(f"Stratégie déjà indexée: {strategy}")
+        self._append([strategy], self._align(profits)[None, :])
+        return self
+
+    # ==========================================================================
+    # REQUÊTES
+    # ==========================================================================
+
+    def _exact(self, query: np.ndarray, candidates: np.ndarray):
+        """Corrélations de Pearson exactes (jours communs) de la requête avec les candidates."""
+        values = self._values[candidates].astype(np.float64)
+        mask = values != 0
+        counts = mask.sum(axis=1, keepdims=True)
+        shift = np.divide(values.sum(axis=1, keepdims=True), counts, out=np.zeros(counts.shape), where=counts > 0)
+        x = np.where(mask, values - shift, 0.0)
+        m = mask.astype(np.float64)
+
+        q_mask = query != 0
+        q_shift = query[q_mask].mean() if q_mask.any() else 0.0
+        xq = np.where(q_mask, query - q_shift, 0.0)
+        mq = q_mask.astype(np.float64)
+
+        return block_correlation(
+            n=m @ mq,
+            a_ij=x @ mq,
+            a_ji=m @ xq,
+            q_ij=(x * x) @ mq,
+            q_ji=m @ (xq * xq),
+            p=x @ xq,
+            min_common_days=self.min_common_days,
+        )
+
+    def query(
+        self,
+        profits: Union[pd.Series, str],
+        k: int = 15,
+        order: str = 'largest',
+        n_candidates: Optional[int] = None,
+    ) -> pd.DataFrame:
+        """
+        Stratégies indexées les plus corrélées à une série.
+
+        Args:
+            profits: Profits journaliers (Series indexée par date), ou nom d'une
+                stratégie indexée (elle-même exclue du résultat)
+            k: Nombre de stratégies retournées
+            order: 'largest' (corrélations les plus fortes) ou 'abs' (|corr|)
+            n_candidates: Candidates recalculées exactement
+                (défaut: max(SIMILARITY_CONFIG, candidate_factor × k))
+
+        Returns:
+            DataFrame Strategy, Correlation, Common_Days, Sketch (estimation de l'esquisse)
+        """
+        if order not in ('largest', 'abs'):
+            raise ValueError(f"Ordre inconnu: {order}")
+
+        exclude = None
+        if isinstance(profits, str):
+            exclude = self._position[profits]
+            query = self._values[exclude].astype(np.float64)
+        else:
+            query = self._align(profits)
+
+        n = len(self.strategies)
+        sketch = self._sketch[:n] @ (_unit_rows(query[None, :])[0] @ self._projection)
+        scores = np.abs(sketch) if order == 'abs' else sketch.copy()
+        if exclude is not None:
+            scores[exclude] = -np.inf
+
+        n_candidates = n_candidates or max(
+            SIMILARITY_CONFIG['n_candidates'], SIMILARITY_CONFIG['candidate_factor'] * k
+        )
+        if n_candidates < n:
+            candidates = np.sort(np.argpartition(-scores, n_candidates - 1)[:n_candidates])
+        else:
+            candidates = np.arange(n)
+        if exclude is not None:
+            candidates = candidates[candidates != exclude]
+
+        corr, common = self._exact(query, candidates)
+        ranking = np.abs(corr) if order == 'abs' else corr
+        valid = ~np.isnan(corr)
+        candidates, corr, common, ranking = candidates[valid], corr[valid], common[valid], ranking[valid]
+        best = np.argsort(-ranking, kind='stable')[:k]
+
+        return pd.DataFrame({
+            'Strategy': [self.strategies[c] for c in candidates[best]],
+            'Correlation': corr[best],
+            'Common_Days': common[best],
+            'Sketch': sketch[candidates[best]].astype(np.float64),
+        })
+
+    # ==========================================================================
+    # SAUVEGARDE
+    # ==========================================================================
+
+    def save(self, path: Path) -> Path:
+        """Sauvegarde l'index (.npz compressé)."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        n = len(self.strategies)
+        with open(path, 'wb') as f:
+            np.savez_compressed(
+                f,
+                strategies=np.array(self.strategies, dtype=str),
+                dates=self.dates.strftime('%Y-%m-%d').to_numpy(dtype=str),
+                values=self._values[:n],
+                sketch=self._sketch[:n],
+                params=np.array([self.min_common_days, self.n_components, self.seed], dtype=np.int64),
+            )
+        return path
+
+    @classmethod
+    def load(cls, path: Path) -> 'SimilarityIndex':
+        """Charge un index sauvegardé (l'esquisse n'est pas recalculée)."""
+        with np.load(Path(path), allow_pickle=False) as archive:
+            min_common_days, n_components, seed = (int(v) for v in archive['params'])
+            index = cls(pd.to_datetime(archive['dates'].tolist()), min_common_days, n_components, seed)
+            index.strategies = archive['strategies'].tolist()
+            index._position = {s: k for k, s in enumerate(index.strategies)}
+            index._values = archive['values']
+            index._sketch = archive['sketch']
+        return index
@@ -0,0 +1,267 @@
+"""
+Séries de corrélation glissante par paire.
+
+Pour chaque paire d'intérêt, la corrélation de Pearson sur les jours communs
+est calculée sur une fenêtre glissante (ex: 12 mois, pas mensuel). Au lieu de
+recalculer chaque fenêtre, on construit les sommes cumulées des statistiques
+suffisantes (n, Σx, Σy, Σx², Σy², Σxy sur les jours communs): la somme d'une
+fenêtre est la différence de deux lignes cumulées, pour toutes les fenêtres
+et toutes les paires d'un paquet à la fois.
+
+Les séries sont stockées en float32 (paires × fenêtres) et sauvegardables en
+.npz pour les pages de corrélation.
+
+Utilisation:
+    pairs = select_pairs_of_interest(corr_lt, corr_ct, top_n=5)
+    rolling = rolling_pair_correlations(profit_matrix, pairs, window_months=12)
+    values = rolling.series('A_ES', 'B_NQ')
+"""
+
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .correlation_engine import column_shift, block_correlation
+from .profit_matrix import profit_arrays
+
+
+# Nombre de paires traitées par paquet (borne la mémoire: T × paquet × 6 floats)
+_PAIR_CHUNK = 256
+
+
+class RollingCorrelations:
+    """
+    Séries de corrélation glissante d'un ensemble de paires.
+
+    Attributs:
+        strategies: Stratégies référencées par les paires
+        window_ends: Date de fin de chaque fenêtre
+        pairs: Indices (i, j) dans strategies, i < j (P×2)
+        values: Corrélations (P × fenêtres), NaN si non calculable
+        window_months, step_months: Paramètres des fenêtres
+    """
+
+    def __init__(
+        self,
+        strategies: List[str],
+        window_ends: pd.DatetimeIndex,
+        pairs: np.ndarray,
+        values: np.ndarray,
+        window_months: int,
+        step_months: int,
+    ):
+        self.strategies = list(strategies)
+        self.window_ends = pd.DatetimeIndex(window_ends)
+        self.pairs = np.asarray(pairs, dtype=np.int32).reshape(-1, 2)
+        self.values = np.asarray(values, dtype=np.float32)
+        self.window_months = window_months
+        self.step_months = step_months
+
+        self._strategy_index = {s: k for k, s in enumerate(self.strategies)}
+        self._pair_index = {(int(i), int(j)): k for k, (i, j) in enumerate(self.pairs)}
+
+    def __len__(self) -> int:
+        return len(self.pairs)
+
+    def series(self, strategy_a: str, strategy_b: str) -> Optional[np.ndarray]:
+        """
+        Série d'une paire (ordre indifférent).
+
+        Returns:
+            Valeurs par fenêtre (float32), ou None si la paire n'est pas suivie
+        """
+        i = self._strategy_index.get(strategy_a)
+        j = self._strategy_index.get(strategy_b)
+        if i is None or j is None:
+            return None
+        k = self._pair_index.get((min(i, j), max(i, j)))
+        return None if k is None else self.values[k]
+
+    def chart_data(self, strategy: str, partners: Iterable[str]) -> Dict:
+        """
+        Données de graphique pour une stratégie et ses partenaires.
+
+        Args:
+            strategy: Stratégie de la page
+            partners: Stratégies à tracer (les paires non suivies sont ignorées)
+
+        Returns:
+            Dict {'dates': [...], 'window_months', 'series': [{'strategy', 'values'}]}
+        """
+        series = []
+        for partner in partners:
+            values = self.series(strategy, partner)
+            if values is None or np.isnan(values).all():
+                continue
+            series.append({
+                'strategy': partner,
+                'values': [None if np.isnan(v) else round(float(v), 3) for v in values],
+            })
+
+        return {
+            'dates': [d.strftime('%Y-%m') for d in self.window_ends],
+            'window_months': self.window_months,
+            'series': series,
+        }
+
+    def save(self, path: Path) -> Path:
+        """Sauvegarde les séries (.npz compressé)."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'wb') as f:
+            np.savez_compressed(
+                f,
+                strategies=np.array(self.strategies, dtype=str),
+                window_ends=self.window_ends.strftime('%Y-%m-%d').to_numpy(dtype=str),
+                pairs=self.pairs,
+                values=self.values,
+                params=np.array([self.window_months, self.step_months], dtype=np.int32),
+            )
+        return path
+
+    @classmethod
+    def load(cls, path: Path) -> 'RollingCorrelations':
+        """Charge des séries sauvegardées."""
+        with np.load(Path(path), allow_pickle=False) as archive:
+            window_months, step_months = (int(v) for v in archive['params'])
+            return cls(
+                strategies=archive['strategies'].tolist(),
+                window_ends=pd.to_datetime(archive['window_ends'].tolist()),
+                pairs=archive['pairs'],
+                values=archive['values'],
+                window_months=window_months,
+                step_months=step_months,
+            )
+
+
+def select_pairs_of_interest(
+    corr_lt: pd.DataFrame,
+    corr_ct: pd.DataFrame,
+    top_n: int = 5,
+) -> List[Tuple[str, str]]:
+    """
+    Paires à suivre: pour chaque stratégie, ses top_n partenaires par |corr| max (LT, CT).
+
+    Args:
+        corr_lt: Matrice de corrélation long terme
+        corr_ct: Matrice de corrélation court terme
+        top_n: Partenaires par stratégie
+
+    Returns:
+        Liste de paires (a, b) uniques, a < b
+    """
+    strategies = corr_lt.columns.union(corr_ct.columns)
+    lt = corr_lt.reindex(index=strategies, columns=strategies).abs().to_numpy()
+    ct = corr_ct.reindex(index=strategies, columns=strategies).abs().to_numpy()
+
+    strength = np.fmax(lt, ct)
+    np.fill_diagonal(strength, np.nan)
+    strength = np.nan_to_num(strength, nan=-1.0)
+
+    k = min(top_n, len(strategies) - 1)
+    if k <= 0:
+        return []
+
+    partners = np.argpartition(-strength, k - 1, axis=1)[:, :k]
+    pairs = set()
+    for i, row in enumerate(partners):
+        for j in row:
+            if strength[i, j] >= 0:
+                pairs.add((min(i, j), max(i, j)))
+
+    return [(strategies[i], strategies[j]) for i, j in sorted(pairs)]
+
+
+def window_bounds(
+    dates: pd.DatetimeIndex,
+    window_months: int,
+    step_months: int,
+) -> Tuple[pd.DatetimeIndex, np.ndarray, np.ndarray]:
+    """
+    Fenêtres (fin - window_months, fin] aux fins de mois, pas de step_months.
+
+    La dernière fenêtre se termine toujours au dernier jour disponible.
+
+    Returns:
+        Tuple (dates de fin, indices de début, indices de fin) dans dates
+    """
+    if len(dates) == 0:
+        return pd.DatetimeIndex([]), np.array([], dtype=np.int64), np.array([], dtype=np.int64)
+
+    first_end = dates[0] + pd.DateOffset(months=window_months)
+    ends = pd.date_range(first_end, dates[-1], freq=pd.offsets.MonthEnd(step_months))
+    if len(ends) == 0 or ends[-1] != dates[-1]:
+        ends = ends.append(pd.DatetimeIndex([dates[-1]]))
+
+    starts = ends - pd.DateOffset(months=window_months)
+    start_idx = np.searchsorted(dates.values, starts.values, side='right')
+    end_idx = np.searchsorted(dates.values, ends.values, side='right')
+    return ends, start_idx, end_idx
+
+
+def rolling_pair_correlations(
+    profit_matrix,
+    pairs: List[Tuple[str, str]],
+    window_months: int = 12,
+    step_months: int = 1,
+    min_common_days: int = 30,
+) -> RollingCorrelations:
+    """
+    Corrélations glissantes des paires demandées par sommes cumulées.
+
+    Args:
+        profit_matrix: Matrice de profits (ProfitMatrix ou DataFrame dates × stratégies)
+        pairs: Paires (a, b) à suivre
+        window_months: Longueur de fenêtre en mois
+        step_months: Pas entre deux fenêtres en mois
+        min_common_days: Jours communs minimum dans une fenêtre
+
+    Returns:
+        RollingCorrelations
+    """
+    values, mask, strategies, dates = profit_arrays(profit_matrix)
+    position = {s: k for k, s in enumerate(strategies)}
+
+    pair_idx = np.array(
+        sorted({
+            (min(position[a], position[b]), max(position[a], position[b]))
+            for a, b in pairs
+            if a in position and b in position and a != b
+        }),
+        dtype=np.int64,
+    ).reshape(-1, 2)
+
+    ends, start_idx, end_idx = window_bounds(dates, window_months, step_months)
+
+    x = np.where(mask, values - column_shift(values, mask), 0.0)
+    m = mask.astype(np.float64)
+
+    result = np.full((len(pair_idx), len(ends)), np.nan, dtype=np.float32)
+
+    for c0 in range(0, len(pair_idx), _PAIR_CHUNK):
+        chunk = pair_idx[c0:c0 + _PAIR_CHUNK]
+        common = m[:, chunk[:, 0]] * m[:, chunk[:, 1]]
+        xi = x[:, chunk[:, 0]] * common
+        xj = x[:, chunk[:, 1]] * common
+
+        sums = {}
+        for key, term in (
+            ('n', common), ('a_ij', xi), ('a_ji', xj),
+            ('q_ij', xi * xi), ('q_ji', xj * xj), ('p', xi * xj),
+        ):
+            cumulative = np.vstack([np.zeros((1, len(chunk))), np.cumsum(term, axis=0)])
+            sums[key] = cumulative[end_idx] - cumulative[start_idx]
+
+        corr, _ = block_correlation(min_common_days=min_common_days, **sums)
+        result[c0:c0 + len(chunk)] = corr.T
+
+    return RollingCorrelations(
+        strategies=strategies,
+        window_ends=ends,
+        pairs=pair_idx,
+        values=result,
+        window_months=window_months,
+        step_months=step_months,
+    )
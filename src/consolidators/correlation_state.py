@@ -0,0 +1,296 @@
+"""
+État incrémental des corrélations (statistiques suffisantes par paire).
+
+Chaque nuit, un seul jour est ajouté au fichier consolidé. Plutôt que de
+reconstruire les matrices de profits et de recalculer toutes les paires,
+on conserve pour chaque fenêtre (LT et CT) les moments par paire sur les
+jours communs (n, Σx, Σx², Σxy, cf. correlation_engine) et on les met à jour:
+- ajout des jours postérieurs au dernier jour connu (LT et CT)
+- retrait des jours qui sortent de la fenêtre court terme (CT)
+
+Les décalages par stratégie sont figés à la construction de l'état pour que
+les moments restent additifs. L'état est reconstruit entièrement si:
+- une nouvelle stratégie apparaît
+- l'historique déjà intégré a changé (empreinte cellules actives / somme des P&L)
+- le début de la fenêtre long terme a changé
+
+Utilisation:
+    state = CorrelationState.load(path)
+    if state is None or not state.update(data, start_lt, start_ct):
+        state = CorrelationState.build(data, start_lt, start_ct)
+    state.save(path)
+    corr_lt, common_lt = state.correlation('lt', min_common_days=100, min_active_days=50)
+"""
+
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from .correlation_engine import column_shift, compute_masked_moments, moments_to_correlation
+from .profit_matrix import ProfitMatrix
+
+
+_MOMENT_KEYS = ('n', 'A', 'Q', 'P')
+
+# Tolérance relative de l'empreinte (somme des P&L) de l'historique
+_FINGERPRINT_RTOL = 1e-9
+
+
+def _as_profit_matrix(data: Union[pd.DataFrame, ProfitMatrix]) -> ProfitMatrix:
+    """Matrice de profits des données (DataFrame préparé ou ProfitMatrix)."""
+    return data if isinstance(data, ProfitMatrix) else ProfitMatrix.from_frame(data)
+
+
+def _history_fingerprint(profits: ProfitMatrix, end_date: pd.Timestamp) -> Tuple[int, float]:
+    """Nombre de cellules actives et somme des P&L jusqu'à end_date inclus."""
+    history = profits.window(end=end_date)
+    return int(history.active.sum()), float(history.values.sum(dtype=np.float64))
+
+
+class CorrelationState:
+    """
+    Statistiques suffisantes LT/CT persistables et mises à jour par jour.
+
+    Attributs:
+        strategies: Stratégies couvertes (ordre des matrices)
+        shift: Décalage figé par stratégie
+        moments: {'lt': {...}, 'ct': {...}} (matrices N×N)
+        start_date_lt, start_date_ct, end_date: Bornes des fenêtres
+    """
+
+    def __init__(
+        self,
+        strategies: List[str],
+        shift: np.ndarray,
+        moments: Dict[str, Dict[str, np.ndarray]],
+        start_date_lt: pd.Timestamp,
+        start_date_ct: pd.Timestamp,
+        end_date: pd.Timestamp,
+        fingerprint: Tuple[int, float],
+    ):
+        self.strategies = list(strategies)
+        self.shift = shift
+        self.moments = moments
+        self.start_date_lt = pd.Timestamp(start_date_lt)
+        self.start_date_ct = pd.Timestamp(start_date_ct)
+        self.end_date = pd.Timestamp(end_date)
+        self.fingerprint = fingerprint
+
+    # ==========================================================================
+    # CONSTRUCTION / MISE À JOUR
+    # ==========================================================================
+
+    @classmethod
+    def build(
+        cls,
+        data: Union[pd.DataFrame, ProfitMatrix],
+        start_date_lt,
+        start_date_ct,
+    ) -> 'CorrelationState':
+        """
+        Construit l'état complet à partir des données préparées.
+
+        Args:
+            data: DataFrame préparé (Date, Strategy_ID, DailyProfit) ou ProfitMatrix
+            start_date_lt: Début de la fenêtre long terme
+            start_date_ct: Début de la fenêtre court terme
+
+        Returns:
+            CorrelationState
+        """
+        start_date_lt = pd.Timestamp(start_date_lt)
+        start_date_ct = pd.Timestamp(start_date_ct)
+
+        full = _as_profit_matrix(data)
+        profits = full.window(start=min(start_date_lt, start_date_ct))
+        shift = column_shift(profits.values.astype(np.float64), profits.active)
+
+        moments = {}
+        for window, start in (('lt', start_date_lt), ('ct', start_date_ct)):
+            view = profits.window(start=start)
+            moments[window] = compute_masked_moments(view.values, mask=view.active, shift=shift)
+
+        end_date = full.dates[-1]
+        return cls(
+            strategies=profits.strategies.tolist(),
+            shift=shift,
+            moments=moments,
+            start_date_lt=start_date_lt,
+            start_date_ct=start_date_ct,
+            end_date=end_date,
+            fingerprint=_history_fingerprint(full, end_date),
+        )
+
+    def _rows_moments(self, profits: ProfitMatrix) -> Optional[Dict[str, np.ndarray]]:
+        """Moments d'une plage de dates de la matrice (None si vide)."""
+        if len(profits) == 0:
+            return None
+
+        columns = pd.Index(self.strategies).get_indexer(profits.strategies)
+        values = np.zeros((len(profits), len(self.strategies)))
+        mask = np.zeros(values.shape, dtype=bool)
+        values[:, columns] = profits.values
+        mask[:, columns] = profits.active
+        return compute_masked_moments(values, mask=mask, shift=self.shift)
+
+    def _apply(self, window: str, delta: Optional[Dict[str, np.ndarray]], sign: float):
+        """Ajoute (sign=+1) ou retire (sign=-1) des moments à une fenêtre."""
+        if delta is None:
+            return
+        for key in _MOMENT_KEYS:
+            self.moments[window][key] += sign * delta[key]
+
+    def update(self, data: Union[pd.DataFrame, ProfitMatrix], start_date_lt, start_date_ct) -> bool:
+        """
+        Intègre les nouveaux jours et fait glisser la fenêtre court terme.
+
+        Args:
+            data: DataFrame préparé ou ProfitMatrix complet (historique + nouveaux jours)
+            start_date_lt: Début de la fenêtre long terme
+            start_date_ct: Nouveau début de la fenêtre court terme
+
+        Returns:
+            True si l'état a été mis à jour, False s'il doit être reconstruit
+        """
+        start_date_lt = pd.Timestamp(start_date_lt)
+        start_date_ct = pd.Timestamp(start_date_ct)
+
+        if start_date_lt != self.start_date_lt or start_date_ct < self.start_date_ct:
+            return False
+
+        profits = _as_profit_matrix(data)
+        fingerprint = _history_fingerprint(profits, self.end_date)
+        if fingerprint[0] != self.fingerprint[0] or not np.isclose(
+            fingerprint[1], self.fingerprint[1], rtol=_FINGERPRINT_RTOL
+        ):
+            return False
+
+        new_days = profits.rows(int(profits.dates.searchsorted(self.end_date, side='right')), len(profits))
+        new_strategies = ~profits.strategies.isin(self.strategies)
+        if new_days.active[:, new_strategies].any():
+            return False
+        new_days = new_days.select(~new_strategies)
+
+        # Nouveaux jours: LT et CT
+        added = self._rows_moments(new_days)
+        self._apply('lt', added, 1.0)
+        self._apply('ct', added, 1.0)
+
+        # Jours sortis de la fenêtre court terme
+        leaving = profits.rows(
+            int(profits.dates.searchsorted(self.start_date_ct, side='left')),
+            int(profits.dates.searchsorted(start_date_ct, side='left')),
+        )
+        self._apply('ct', self._rows_moments(leaving.select(~new_strategies)), -1.0)
+
+        new_end = profits.dates[-1]
+        self.start_date_ct = start_date_ct
+        self.end_date = new_end
+        self.fingerprint = _history_fingerprint(profits, new_end)
+        return True
+
+    # ==========================================================================
+    # RÉSULTATS
+    # ==========================================================================
+
+    def correlation(
+        self,
+        window: str,
+        min_common_days: int,
+        min_active_days: int,
+    ) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Matrices de corrélation et de jours communs d'une fenêtre.
+
+        Args:
+            window: 'lt' ou 'ct'
+            min_common_days: Jours communs minimum par paire
+            min_active_days: Jours d'activité minimum pour inclure une stratégie
+
+        Returns:
+            Tuple (corrélations, jours communs) restreints aux stratégies actives
+        """
+        corr, common = moments_to_correlation(self.moments[window], min_common_days)
+        active = np.flatnonzero(np.diag(common) >= min_active_days)
+        strategies = [self.strategies[k] for k in active]
+        index = np.ix_(active, active)
+        return (
+            pd.DataFrame(corr[index], index=strategies, columns=strategies),
+            pd.DataFrame(common[index], index=strategies, columns=strategies),
+        )
+
+    # ==========================================================================
+    # PERSISTANCE
+    # ==========================================================================
+
+    def save(self, path: Path) -> Path:
+        """
+        Sauvegarde l'état (.npz compressé).
+
+        Args:
+            path: Fichier de sortie
+
+        Returns:
+            Path du fichier écrit
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        arrays = {
+            'strategies': np.array(self.strategies, dtype=str),
+            'shift': self.shift,
+            'dates': np.array([
+                self.start_date_lt.isoformat(),
+                self.start_date_ct.isoformat(),
+                self.end_date.isoformat(),
+            ]),
+            'fingerprint': np.array(self.fingerprint, dtype=np.float64),
+        }
+        for window, moments in self.moments.items():
+            for key in _MOMENT_KEYS:
+                arrays[f"{window}_{key}"] = moments[key]
+
+        with open(path, 'wb') as f:
+            np.savez_compressed(f, **arrays)
+        return path
+
+    @classmethod
+    def load(cls, path: Path) -> Optional['CorrelationState']:
+        """
+        Charge un état sauvegardé.
+
+        Args:
+            path: Fichier .npz
+
+        Returns:
+            CorrelationState, ou None si absent ou illisible
+        """
+        path = Path(path)
+        if not path.exists():
+            return None
+
+        try:
+            with np.load(path, allow_pickle=False) as archive:
+                start_lt, start_ct, end = (pd.Timestamp(str(d)) for d in archive['dates'])
+                fingerprint = archive['fingerprint']
+                shift = archive['shift']
+                moments = {
+                    window: {key: archive[f"{window}_{key}"] for key in _MOMENT_KEYS}
+                    for window in ('lt', 'ct')
+                }
+                for window in moments:
+                    moments[window]['shift'] = shift
+                return cls(
+                    strategies=archive['strategies'].tolist(),
+                    shift=shift,
+                    moments=moments,
+                    start_date_lt=start_lt,
+                    start_date_ct=start_ct,
+                    end_date=end,
+                    fingerprint=(int(fingerprint[0]), float(fingerprint[1])),
+                )
+        except (OSError, KeyError, ValueError) as e:
+            print(f"⚠️ État de corrélation illisible ({path.name}): {e}")
+            return None
@@ -0,0 +1,234 @@
+"""
+Export binaire des résultats de corrélation (matrices .npy + index JSON).
+
+Les matrices LT/CT et les jours communs sont écrits en .npy dans leur
+format empaqueté (diagonale puis triangle supérieur, cf.
+PackedSymmetricMatrix.save), la liste des stratégies et les paramètres de
+l'analyse dans un index JSON. Le rechargement ne parse aucun texte et ne
+copie aucune matrice: les fichiers sont mappés en mémoire et une ligne est
+extraite du triangle empaqueté, stratégie trouvée en O(1) par nom.
+
+Fichiers d'un export (même préfixe et horodatage):
+    {prefix}_index_{ts}.json          index (paramètres, stratégies, fichiers)
+    {prefix}_matrix_{lt|ct}_{ts}.npy  corrélations (float32 empaquetées)
+    {prefix}_common_{lt|ct}_{ts}.npy  jours communs (uint16 empaquetés)
+    {prefix}_matrix_{w|m}_{ts}.npy    corrélations agrégées semaine / mois (si calculées)
+    {prefix}_matrix_dd_{ts}.npy       corrélations de co-drawdown (si calculées)
+    {prefix}_rolling_{ts}.npz         corrélations glissantes (si calculées)
+    {prefix}_similarity_{ts}.npz      index de similarité (si construit)
+    {prefix}_clusters_{ts}.npz        classification hiérarchique (si calculée)
+
+Utilisation:
+    index = save_correlation_store(analyzer, output_dir)
+    store = CorrelationStore.load(index)
+    row = store.row('ct', 'A_ES')
+    analyzer = CorrelationAnalyzer.from_binary(index)   # pages, dashboard
+"""
+
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .correlation_clustering import CorrelationClusters
+from .correlation_neighbors import SimilarityIndex
+from .correlation_rolling import RollingCorrelations
+from .packed_matrix import PackedSymmetricMatrix
+
+
+STORE_VERSION = 1
+HORIZONS = ('lt', 'ct')
+
+# Paramètres de CorrelationAnalyzer enregistrés dans l'index
+STORE_PARAMETERS = (
+    'start_year_longterm',
+    'recent_months',
+    'correlation_threshold',
+    'min_common_days_longterm',
+    'min_common_days_recent',
+    'min_active_days',
+    'weight_longterm',
+    'weight_recent',
+    'correlation_method',
+)
+
+
+def save_correlation_store(analyzer, output_dir: Path, prefix: str = "correlation") -> Path:
+    """
+    Écrit les matrices empaquetées d'un CorrelationAnalyzer en .npy avec leur index JSON.
+
+    Args:
+        analyzer: CorrelationAnalyzer ayant exécuté run()
+        output_dir: Répertoire de sortie
+        prefix: Préfixe des fichiers
+
+    Returns:
+        Path de l'index JSON
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M")
+
+    packed = getattr(analyzer, '_packed', {})
+    matrices = {horizon: (packed[f'corr_{horizon}'], packed.get(f'common_{horizon}')) for horizon in HORIZONS}
+    aggregated_common = getattr(analyzer, 'aggregated_common', {})
+    for level, corr in getattr(analyzer, 'aggregated_corr', {}).items():
+        matrices[level.lower()] = (corr, aggregated_common.get(level))
+    if getattr(analyzer, 'codrawdown_corr', None) is not None:
+        matrices['dd'] = (analyzer.codrawdown_corr, getattr(analyzer, 'codrawdown_common', None))
+
+    horizons = {}
+    for horizon, (corr, common) in matrices.items():
+        entry = {'strategies': [str(s) for s in corr.labels]}
+
+        path = output_dir / f"{prefix}_matrix_{horizon}_{timestamp}.npy"
+        corr.save(path, dtype=np.float32)
+        entry['correlation'] = path.name
+
+        if common is not None:
+            if not common.labels.equals(corr.labels):
+                common = common.subset(corr.labels)
+            path = output_dir / f"{prefix}_common_{horizon}_{timestamp}.npy"
+            common.save(path, dtype=np.uint16)
+            entry['common_days'] = path.name
+
+        horizons[horizon] = entry
+
+    rolling = None
+    if getattr(analyzer, 'rolling_correlations', None) is not None:
+        rolling = analyzer.rolling_correlations.save(output_dir / f"{prefix}_rolling_{timestamp}.npz").name
+    
+    similarity = None
+    if getattr(analyzer, 'similarity', None) is not None:
+        similarity = analyzer.similarity.save(output_dir / f"{prefix}_similarity_{timestamp}.npz").name
+    
+    clusters = None
+    if getattr(analyzer, 'clusters', None) is not None:
+        clusters = analyzer.clusters.save(output_dir / f"{prefix}_clusters_{timestamp}.npz").name
+
+    run_timestamp = getattr(analyzer, 'run_timestamp', None)
+    index = {
+        'version': STORE_VERSION,
+        'run_timestamp': run_timestamp.isoformat() if run_timestamp else None,
+        'parameters': {name: getattr(analyzer, name) for name in STORE_PARAMETERS},
+        'horizons': horizons,
+        'rolling': rolling,
+        'similarity': similarity,
+        'clusters': clusters,
+    }
+
+    index_path = output_dir / f"{prefix}_index_{timestamp}.json"
+    with open(index_path, 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False, indent=2)
+    return index_path
+
+
+class CorrelationStore:
+    """
+    Matrices de corrélation chargées depuis un export binaire.
+
+    Attributs:
+        parameters: Paramètres de l'analyse (cf. STORE_PARAMETERS)
+        strategies: Horizon → liste des stratégies (ordre des lignes)
+        correlation: Horizon → PackedSymmetricMatrix float32 (mappée si mmap)
+        common_days: Horizon → jours communs, PackedSymmetricMatrix uint16 (ou absent)
+        rolling: Corrélations glissantes (ou None)
+        similarity: Index de similarité (ou None)
+        similarity_path: Fichier de l'index de similarité (mise à jour incrémentale)
+        clusters: Classification hiérarchique (ou None)
+    """
+
+    def __init__(
+        self,
+        parameters: Dict[str, Any],
+        strategies: Dict[str, List[str]],
+        correlation: Dict[str, PackedSymmetricMatrix],
+        common_days: Dict[str, PackedSymmetricMatrix],
+        rolling: Optional[RollingCorrelations] = None,
+        run_timestamp: Optional[datetime] = None,
+        similarity: Optional[SimilarityIndex] = None,
+        similarity_path: Optional[Path] = None,
+        clusters: Optional[CorrelationClusters] = None,
+    ):
+        self.parameters = parameters
+        self.strategies = strategies
+        self.correlation = correlation
+        self.common_days = common_days
+        self.rolling = rolling
+        self.run_timestamp = run_timestamp
+        self.similarity = similarity
+        self.similarity_path = similarity_path
+        self.clusters = clusters
+        self._position = {
+            horizon: {s: k for k, s in enumerate(names)} for horizon, names in strategies.items()
+        }
+
+    @classmethod
+    def load(cls, index_path: Path, mmap: bool = True) -> 'CorrelationStore':
+        """
+        Charge un export binaire.
+
+        Args:
+            index_path: Index JSON (cf. save_correlation_store)
+            mmap: Mapper les matrices en mémoire (lecture seule) au lieu de les lire
+
+        Returns:
+            CorrelationStore
+        """
+        index_path = Path(index_path)
+        with open(index_path, encoding='utf-8') as f:
+            index = json.load(f)
+        version = index.get('version')
+        if version != STORE_VERSION:
+            raise ValueError(f"Version d'export non supportée: {version}")
+
+        folder = index_path.parent
+        strategies, correlation, common_days = {}, {}, {}
+        for horizon, entry in index['horizons'].items():
+            names = entry['strategies']
+            strategies[horizon] = names
+            correlation[horizon] = PackedSymmetricMatrix.load(folder / entry['correlation'], names, mmap=mmap)
+            if entry.get('common_days'):
+                common_days[horizon] = PackedSymmetricMatrix.load(folder / entry['common_days'], names, mmap=mmap)
+
+        rolling = RollingCorrelations.load(folder / index['rolling']) if index.get('rolling') else None
+        run_timestamp = datetime.fromisoformat(index['run_timestamp']) if index.get('run_timestamp') else None
+        similarity_path = folder / index['similarity'] if index.get('similarity') else None
+        similarity = SimilarityIndex.load(similarity_path) if similarity_path else None
+        clusters = CorrelationClusters.load(folder / index['clusters']) if index.get('clusters') else None
+        return cls(
+            index['parameters'], strategies, correlation, common_days, rolling, run_timestamp,
+            similarity, similarity_path, clusters,
+        )
+
+    def row(self, horizon: str, strategy: str) -> Optional[np.ndarray]:
+        """
+        Ligne de corrélations d'une stratégie.
+
+        La stratégie est trouvée en O(1) par nom; la ligne est lue dans le
+        triangle empaqueté (N valeurs, sans matrice dense).
+
+        Returns:
+            Corrélations dans l'ordre de strategies[horizon], ou None si absente
+        """
+        k = self._position[horizon].get(strategy)
+        return None if k is None else self.correlation[horizon].row(k)
+
+    def frame(self, horizon: str, common_days: bool = False) -> Optional[pd.DataFrame]:
+        """
+        Matrice d'un horizon en DataFrame dense (copie N×N).
+
+        Args:
+            horizon: 'lt', 'ct' (ou niveau agrégé 'w', 'm', co-drawdown 'dd')
+            common_days: Jours communs au lieu des corrélations
+
+        Returns:
+            DataFrame stratégies × stratégies (None si non exporté)
+        """
+        packed = (self.common_days if common_days else self.correlation).get(horizon)
+        if packed is None:
+            return None
+        return packed.to_frame(np.int64 if common_days else np.float64)
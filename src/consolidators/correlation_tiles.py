@@ -0,0 +1,284 @@
+"""
+Calcul de corrélation par tuiles pour les grands univers de stratégies.
+
+La matrice N×N est découpée en tuiles (I, J) de taille b×b (I ≤ J). Chaque
+tuile est calculée par un worker à partir des profits centrés et du masque
+d'activité placés en mémoire partagée, puis écrite directement dans les
+matrices de sortie (également partagées): aucune copie de la matrice de
+profits ni des résultats ne transite par pickle.
+
+Les résultats sont ceux du calcul direct (pearson_correlation_matrix), à
+l'arrondi flottant près: mêmes décalages par stratégie, mêmes formules
+(block_correlation).
+
+Budget mémoire: les tableaux partagés (profits centrés et masque T×N en
+float64, sorties N×N) et la copie finale des sorties sont décomptés du
+budget (cf. shared_bytes); le reste est réparti entre les tuiles des
+workers. Les profits centrés et le masque sont écrits directement dans la
+mémoire partagée (aucune copie intermédiaire dans le processus parent).
+
+Utilisation:
+    corr, common = tiled_pearson_correlation_matrix(values, min_common_days=100)
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .config import TILING_CONFIG
+from .correlation_engine import activity_mask, column_shift, block_correlation
+
+
+# Tableaux partagés attachés dans chaque worker (nom → ndarray)
+_SHARED: Dict[str, np.ndarray] = {}
+_SHARED_HANDLES: List[shared_memory.SharedMemory] = []
+
+
+# ==============================================================================
+# MÉMOIRE PARTAGÉE
+# ==============================================================================
+
+def _create_shared(shape: tuple, dtype) -> Tuple[shared_memory.SharedMemory, np.ndarray]:
+    """Alloue un tableau (non initialisé) dans un segment de mémoire partagée."""
+    dtype = np.dtype(dtype)
+    shm = shared_memory.SharedMemory(create=True, size=max(int(np.prod(shape)) * dtype.itemsize, 1))
+    return shm, np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+
+def _attach_shared(specs: Dict[str, Tuple[str, tuple, str]]):
+    """Initialiseur de worker: attache les segments partagés par leur nom."""
+    for key, (name, shape, dtype) in specs.items():
+        shm = shared_memory.SharedMemory(name=name)
+        _SHARED_HANDLES.append(shm)
+        _SHARED[key] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+
+
+# ==============================================================================
+# TUILES
+# ==============================================================================
+
+def shared_bytes(n_days: int, n_strategies: int) -> int:
+    """
+    Mémoire fixe du calcul par tuiles, hors tuiles des workers.
+
+    Profits centrés et masque (T×N float64), corrélations et jours communs
+    (N×N, 8 octets), plus une matrice N×N lors de la copie des sorties
+    (copiées l'une après l'autre, chaque segment libéré aussitôt).
+    """
+    return (2 * n_days * n_strategies + 3 * n_strategies * n_strategies) * 8
+
+
+def tile_size_for_budget(
+    n_days: int,
+    tile_size: int,
+    memory_budget_mb: float,
+    n_workers: int,
+) -> int:
+    """
+    Réduit la taille de tuile jusqu'à tenir dans le budget mémoire.
+
+    Estimation par worker: ~6 copies T×b (profits, masque, carrés des deux
+    blocs) + ~10 matrices b×b (moments et résultats intermédiaires).
+
+    Args:
+        n_days: Nombre de jours (T)
+        tile_size: Taille de tuile souhaitée
+        memory_budget_mb: Budget des tuiles pour tous les workers (hors shared_bytes)
+        n_workers: Nombre de workers
+
+    Returns:
+        Taille de tuile retenue (minimum 32)
+    """
+    budget_bytes = memory_budget_mb * 1024 * 1024 / max(n_workers, 1)
+    size = max(int(tile_size), 32)
+    while size > 32 and (6 * n_days * size + 10 * size * size) * 8 > budget_bytes:
+        size //= 2
+    return max(size, 32)
+
+
+def tile_bounds(n_strategies: int, tile_size: int) -> List[Tuple[int, int, int, int]]:
+    """
+    Liste des tuiles du triangle supérieur (diagonale incluse).
+
+    Returns:
+        Liste de (i0, i1, j0, j1)
+    """
+    starts = range(0, n_strategies, tile_size)
+    blocks = [(s, min(s + tile_size, n_strategies)) for s in starts]
+    return [
+        (i0, i1, j0, j1)
+        for k, (i0, i1) in enumerate(blocks)
+        for (j0, j1) in blocks[k:]
+    ]
+
+
+def _tile_pair_count(bounds: Tuple[int, int, int, int]) -> int:
+    """Nombre de paires distinctes (i ≤ j) couvertes par une tuile."""
+    i0, i1, j0, j1 = bounds
+    if i0 == j0:
+        size = i1 - i0
+        return size * (size + 1) // 2
+    return (i1 - i0) * (j1 - j0)
+
+
+def _compute_tile(
+    x: np.ndarray,
+    m: np.ndarray,
+    corr_out: np.ndarray,
+    common_out: np.ndarray,
+    bounds: Tuple[int, int, int, int],
+    min_common_days: int,
+):
+    """Calcule une tuile et l'écrit (ainsi que sa transposée) dans les sorties."""
+    i0, i1, j0, j1 = bounds
+    x_i, m_i = x[:, i0:i1], m[:, i0:i1]
+    x_j, m_j = x[:, j0:j1], m[:, j0:j1]
+
+    corr, common = block_correlation(
+        n=m_i.T @ m_j,
+        a_ij=x_i.T @ m_j,
+        a_ji=m_i.T @ x_j,
+        q_ij=(x_i * x_i).T @ m_j,
+        q_ji=m_i.T @ (x_j * x_j),
+        p=x_i.T @ x_j,
+        min_common_days=min_common_days,
+    )
+
+    if i0 == j0:
+        np.fill_diagonal(corr, 1.0)
+
+    corr_out[i0:i1, j0:j1] = corr
+    common_out[i0:i1, j0:j1] = common
+    if i0 != j0:
+        corr_out[j0:j1, i0:i1] = corr.T
+        common_out[j0:j1, i0:i1] = common.T
+
+
+def _tile_task(bounds: Tuple[int, int, int, int], min_common_days: int):
+    """Tâche de pool: calcule une tuile sur les tableaux partagés."""
+    _compute_tile(
+        _SHARED['x'], _SHARED['m'], _SHARED['corr'], _SHARED['common'],
+        bounds, min_common_days,
+    )
+
+
+# ==============================================================================
+# API
+# ==============================================================================
+
+def tiled_pearson_correlation_matrix(
+    values: np.ndarray,
+    min_common_days: int,
+    tile_size: Optional[int] = None,
+    n_workers: Optional[int] = None,
+    memory_budget_mb: Optional[float] = None,
+    verbose: bool = False,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Corrélations de Pearson sur les jours communs, calculées par tuiles.
+
+    Args:
+        values: Matrice de profits (jours × stratégies)
+        min_common_days: Jours communs minimum
+        tile_size: Stratégies par tuile (défaut: TILING_CONFIG)
+        n_workers: Nombre de processus (défaut: TILING_CONFIG, puis nombre de CPU)
+        memory_budget_mb: Budget mémoire total, tableaux partagés compris (défaut: TILING_CONFIG)
+        verbose: Afficher la progression
+
+    Returns:
+        Tuple (corrélations N×N, jours communs N×N)
+    """
+    values = np.nan_to_num(np.asarray(values, dtype=np.float64), nan=0.0)
+    n_days, n_strategies = values.shape
+
+    n_workers = n_workers or TILING_CONFIG['n_workers'] or os.cpu_count() or 1
+    budget_mb = memory_budget_mb or TILING_CONFIG['memory_budget_mb']
+    fixed_mb = shared_bytes(n_days, n_strategies) / 1024 ** 2
+    tile_size = tile_size_for_budget(
+        n_days,
+        tile_size or TILING_CONFIG['tile_size'],
+        max(budget_mb - fixed_mb, 0),
+        n_workers,
+    )
+    if verbose and fixed_mb > budget_mb:
+        print(f"   ⚠️  Tableaux partagés ({fixed_mb:.0f} Mo) au-delà du budget ({budget_mb:.0f} Mo)")
+
+    tiles = tile_bounds(n_strategies, tile_size)
+    total_pairs = n_strategies * (n_strategies + 1) // 2
+    step = max(total_pairs * TILING_CONFIG['progress_step_pct'] // 100, 1)
+
+    if verbose:
+        print(f"   🧩 {len(tiles)} tuiles de {tile_size} stratégies, {n_workers} processus")
+
+    def report(done_pairs: int, last_reported: int) -> int:
+        if verbose and done_pairs - last_reported >= step:
+            print(f"   ⏳ Tuiles: {done_pairs * 100 // total_pairs}%")
+            return done_pairs
+        return last_reported
+
+    if n_workers <= 1 or len(tiles) == 1:
+        x = np.empty((n_days, n_strategies))
+        m = np.empty((n_days, n_strategies))
+        _center_into(values, x, m)
+        corr = np.empty((n_strategies, n_strategies))
+        common = np.empty((n_strategies, n_strategies), dtype=np.int64)
+        done = reported = 0
+        for bounds in tiles:
+            _compute_tile(x, m, corr, common, bounds, min_common_days)
+            done += _tile_pair_count(bounds)
+            reported = report(done, reported)
+        return corr, common
+
+    segments = {}
+    shared = {}
+    try:
+        specs = {}
+        for key, shape, dtype in (
+            ('x', (n_days, n_strategies), np.float64),
+            ('m', (n_days, n_strategies), np.float64),
+            ('corr', (n_strategies, n_strategies), np.float64),
+            ('common', (n_strategies, n_strategies), np.int64),
+        ):
+            segments[key], shared[key] = _create_shared(shape, dtype)
+            specs[key] = (segments[key].name, shape, np.dtype(dtype).str)
+        _center_into(values, shared['x'], shared['m'])
+
+        with ProcessPoolExecutor(
+            max_workers=n_workers, initializer=_attach_shared, initargs=(specs,)
+        ) as executor:
+            futures = {executor.submit(_tile_task, bounds, min_common_days): bounds for bounds in tiles}
+            done = reported = 0
+            for future in as_completed(futures):
+                future.result()
+                done += _tile_pair_count(futures[future])
+                reported = report(done, reported)
+
+        # Profits libérés avant la copie des sorties, une sortie à la fois
+        _release(segments, shared, 'x', 'm')
+        corr = shared['corr'].copy()
+        _release(segments, shared, 'corr')
+        common = shared['common'].copy()
+        return corr, common
+    finally:
+        _release(segments, shared, *list(segments))
+
+
+def _center_into(values: np.ndarray, x: np.ndarray, m: np.ndarray) -> None:
+    """Écrit les profits centrés (nuls hors activité) dans x et le masque d'activité dans m."""
+    mask = activity_mask(values)
+    np.subtract(values, column_shift(values, mask), out=x)
+    x[~mask] = 0.0
+    m[...] = mask
+
+
+def _release(segments: Dict[str, shared_memory.SharedMemory], shared: Dict[str, np.ndarray], *keys: str) -> None:
+    """Ferme et supprime des segments (les vues doivent être libérées avant)."""
+    for key in keys:
+        shared.pop(key, None)
+        shm = segments.pop(key, None)
+        if shm is not None:
+            shm.close()
+            shm.unlink()
@@ -0,0 +1,217 @@
+"""
+Corrélations et scores Davey sur plusieurs fenêtres en une seule passe.
+
+Toutes les fenêtres se terminent au dernier jour (3, 6, 12, 24 mois, long
+terme...): elles sont donc emboîtées. Les lignes de la matrice de profits
+(triée par date) sont parcourues de la plus récente à la plus ancienne par
+segments [début_k, début_k-1): les moments de chaque segment sont ajoutés
+aux moments cumulés, qui donnent directement ceux de la fenêtre suivante.
+Chaque jour n'est traité qu'une fois, quel que soit le nombre de fenêtres.
+
+Utilisation:
+    windows = build_windows(end_date, [3, 6, 12, 24], start_date_lt)
+    matrices = multi_window_correlations(profit_matrix, windows, min_common, min_active)
+    weights = window_weights(list(windows), weight_longterm=0.5, weight_recent=0.5)
+    scores = calculate_multi_window_scores(corr_by_window, threshold=0.7, weights=weights)
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from dateutil.relativedelta import relativedelta
+
+from .config import DEFAULT_CONFIG, get_correlation_status
+from .correlation_engine import column_shift, compute_masked_moments, moments_to_correlation
+from .profit_matrix import profit_arrays
+
+
+LONGTERM_LABEL = 'LT'
+
+
+def window_label(months: int) -> str:
+    """Libellé d'une fenêtre en mois (ex: 12 → '12M')."""
+    return f"{int(months)}M"
+
+
+def build_windows(
+    end_date,
+    windows_months: List[int],
+    start_date_lt=None,
+) -> Dict[str, pd.Timestamp]:
+    """
+    Dates de début des fenêtres se terminant à end_date.
+
+    Args:
+        end_date: Dernier jour des données
+        windows_months: Longueurs de fenêtre en mois
+        start_date_lt: Début de la fenêtre long terme (None = pas de fenêtre LT)
+
+    Returns:
+        Dict libellé → date de début (inclusive)
+    """
+    end_date = pd.Timestamp(end_date)
+    windows = {
+        window_label(months): pd.Timestamp(end_date - relativedelta(months=int(months)))
+        for months in sorted(set(windows_months))
+    }
+    if start_date_lt is not None:
+        windows[LONGTERM_LABEL] = pd.Timestamp(start_date_lt)
+    return windows
+
+
+def window_weights(
+    labels: List[str],
+    weight_longterm: float,
+    weight_recent: float,
+    weights: Optional[Dict[str, float]] = None,
+) -> Dict[str, float]:
+    """
+    Poids des fenêtres, à l'échelle du score Davey LT/CT.
+
+    Les seuils SCORE_THRESHOLDS sont calibrés pour N_LT × W_LT + N_CT × W_CT:
+    les poids sont donc ramenés à la somme W_LT + W_CT. Par défaut, la
+    fenêtre LT reçoit W_LT et les fenêtres en mois se partagent W_CT à parts
+    égales (sans fenêtre LT, elles se partagent W_LT + W_CT). Avec les
+    fenêtres LT et CT seules, le score est celui de run().
+
+    Args:
+        labels: Libellés des fenêtres
+        weight_longterm: Poids long terme (W_LT)
+        weight_recent: Poids court terme (W_CT)
+        weights: Poids relatifs par fenêtre (None = répartition par défaut)
+
+    Returns:
+        Dict libellé → poids, de somme W_LT + W_CT
+    """
+    total = weight_longterm + weight_recent
+    if weights is None:
+        recent = [label for label in labels if label != LONGTERM_LABEL]
+        if LONGTERM_LABEL in labels:
+            weights = {LONGTERM_LABEL: weight_longterm}
+            share = weight_recent
+        else:
+            weights = {}
+            share = total
+        weights.update({label: share / len(recent) for label in recent})
+        return weights
+
+    weights = {label: float(weights.get(label, 0.0)) for label in labels}
+    weight_sum = sum(weights.values())
+    if weight_sum <= 0:
+        raise ValueError("La somme des poids des fenêtres doit être positive")
+    return {label: weight * total / weight_sum for label, weight in weights.items()}
+
+
+def multi_window_correlations(
+    profit_matrix,
+    windows: Dict[str, pd.Timestamp],
+    min_common_days: Dict[str, int],
+    min_active_days: Dict[str, int],
+) -> Dict[str, Tuple[pd.DataFrame, pd.DataFrame]]:
+    """
+    Matrices de corrélation de toutes les fenêtres emboîtées.
+
+    Args:
+        profit_matrix: Matrice de profits (ProfitMatrix ou DataFrame) couvrant la plus longue fenêtre
+        windows: Libellé → date de début (cf. build_windows)
+        min_common_days: Libellé → jours communs minimum
+        min_active_days: Libellé → jours d'activité minimum pour inclure une stratégie
+
+    Returns:
+        Dict libellé → (corrélations, jours communs), restreints aux stratégies actives
+    """
+    values, mask, strategies, dates = profit_arrays(profit_matrix)
+    dates = dates.values
+    shift = column_shift(values, mask)
+
+    # Fenêtres de la plus courte (début le plus récent) à la plus longue
+    ordered = sorted(windows.items(), key=lambda item: item[1], reverse=True)
+
+    results = {}
+    cumulated = None
+    stop = len(dates)
+    for label, start in ordered:
+        begin = int(np.searchsorted(dates, np.datetime64(start), side='left'))
+        if begin < stop:
+            segment = compute_masked_moments(values[begin:stop], mask=mask[begin:stop], shift=shift)
+            if cumulated is None:
+                cumulated = segment
+            else:
+                for key in ('n', 'A', 'Q', 'P'):
+                    cumulated[key] = cumulated[key] + segment[key]
+            stop = begin
+
+        if cumulated is None:
+            n_strategies = len(strategies)
+            cumulated = {key: np.zeros((n_strategies, n_strategies)) for key in ('n', 'A', 'Q', 'P')}
+
+        corr, common = moments_to_correlation(cumulated, min_common_days[label])
+        active = np.flatnonzero(np.diag(common) >= min_active_days[label])
+        names = [strategies[k] for k in active]
+        index = np.ix_(active, active)
+        results[label] = (
+            pd.DataFrame(corr[index], index=names, columns=names),
+            pd.DataFrame(common[index], index=names, columns=names),
+        )
+
+    return {label: results[label] for label in windows}
+
+
+def calculate_multi_window_scores(
+    correlations: Dict[str, pd.DataFrame],
+    threshold: float,
+    weights: Optional[Dict[str, float]] = None,
+) -> pd.DataFrame:
+    """
+    Score Davey pondéré sur plusieurs fenêtres.
+
+    Pour chaque stratégie et chaque fenêtre: N_Corr_<fenêtre> = nombre de
+    stratégies avec |corr| > seuil. Score_Davey = Σ poids × N_Corr, avec des
+    poids à l'échelle du score LT/CT (cf. window_weights).
+    Une stratégie inactive sur une fenêtre y compte 0 (Avg_Corr vide).
+
+    Args:
+        correlations: Libellé → matrice de corrélation
+        threshold: Seuil de corrélation
+        weights: Libellé → poids (défaut: window_weights avec les poids de DEFAULT_CONFIG)
+
+    Returns:
+        DataFrame trié par Score_Davey décroissant
+    """
+    labels = list(correlations)
+    if weights is None:
+        weights = window_weights(labels, DEFAULT_CONFIG['weight_longterm'], DEFAULT_CONFIG['weight_recent'])
+
+    strategies = pd.Index([])
+    for corr in correlations.values():
+        strategies = strategies.union(corr.columns)
+
+    scores = pd.DataFrame({'Strategy': strategies})
+    scores['Score_Davey'] = 0.0
+    n_windows = np.zeros(len(strategies), dtype=int)
+
+    for label in labels:
+        corr = correlations[label]
+        values = np.abs(corr.to_numpy(dtype=np.float64, copy=True))
+        np.fill_diagonal(values, np.nan)
+
+        with np.errstate(invalid='ignore'):
+            n_corr = pd.Series((values > threshold).sum(axis=1), index=corr.columns)
+        valid = (~np.isnan(values)).sum(axis=1)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            avg = pd.Series(np.where(valid > 0, np.nansum(values, axis=1) / valid, np.nan), index=corr.columns)
+
+        n_corr = n_corr.reindex(strategies, fill_value=0).to_numpy()
+        scores[f'N_Corr_{label}'] = n_corr.astype(int)
+        scores[f'Avg_Corr_{label}'] = avg.reindex(strategies).round(3).to_numpy()
+        scores['Score_Davey'] += weights.get(label, 0.0) * n_corr
+        n_windows += strategies.isin(corr.columns)
+
+    scores['Score_Davey'] = scores['Score_Davey'].round(1)
+    scores['N_Windows'] = n_windows
+    status = scores['Score_Davey'].map(get_correlation_status)
+    scores['Status'] = status.str[0]
+    scores['Status_Emoji'] = status.str[1]
+
+    return scores.sort_values('Score_Davey', ascending=False).reset_index(drop=True)
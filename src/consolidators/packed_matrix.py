@@ -0,0 +1,267 @@
+"""
+Matrice symétrique compacte (triangle supérieur empaqueté).
+
+Les matrices de corrélation, de jours communs et de delta sont symétriques:
+seul le triangle strictement supérieur est stocké, ligne par ligne, dans un
+vecteur de N(N-1)/2 valeurs, plus la diagonale. Avec des corrélations en
+float32 et des jours communs en uint16, la mémoire est divisée par 4
+(float64 dense) et 8 (int64 dense).
+
+Position de la paire (i, j), i < j, dans le vecteur:
+    k = offset[i] + j     avec offset[i] = i·N - i(i+1)/2 - i - 1
+
+L'ordre du vecteur est l'ordre ligne par ligne (i, j) du triangle supérieur.
+
+Utilisation:
+    packed = PackedSymmetricMatrix.from_dense(corr_df)          # float32
+    packed.get('A_ES', 'B_NQ')                                  # O(1)
+    packed.row('A_ES')                                          # ligne complète
+    corr_df = packed.to_frame()                                 # interop pandas
+    packed.save(path); PackedSymmetricMatrix.load(path, labels) # .npy mappable
+    np.asarray(packed)                                          # interop NumPy
+"""
+
+from pathlib import Path
+from typing import Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+
+def _storage_values(values: np.ndarray, dtype) -> np.ndarray:
+    """Convertit vers le type de stockage (entiers: NaN → 0 et saturation)."""
+    dtype = np.dtype(dtype)
+    if np.issubdtype(dtype, np.integer):
+        info = np.iinfo(dtype)
+        values = np.nan_to_num(np.asarray(values, dtype=np.float64), nan=0.0)
+        return np.clip(values, info.min, info.max).astype(dtype)
+    return np.asarray(values, dtype=dtype)
+
+
+class PackedSymmetricMatrix:
+    """
+    Matrice symétrique N×N stockée en triangle supérieur.
+
+    Attributs:
+        labels: Libellés des lignes / colonnes (stratégies)
+        upper: Triangle strictement supérieur, ligne par ligne (N(N-1)/2)
+        diagonal: Diagonale (N)
+    """
+
+    def __init__(self, labels: Sequence, upper: np.ndarray, diagonal: np.ndarray):
+        self.labels = pd.Index(labels)
+        self.upper = np.asanyarray(upper)   # conserve un np.memmap (cf. load)
+        self.diagonal = np.asarray(diagonal, dtype=self.upper.dtype)
+
+        n = len(self.labels)
+        if len(self.diagonal) != n or len(self.upper) != n * (n - 1) // 2:
+            raise ValueError(f"Tailles incohérentes pour une matrice {n}×{n}")
+
+        rows = np.arange(n, dtype=np.int64)
+        self._offsets = rows * n - rows * (rows + 1) // 2 - rows - 1
+        self._position = {label: k for k, label in enumerate(self.labels)}
+
+    @classmethod
+    def from_dense(
+        cls,
+        matrix: Union[pd.DataFrame, np.ndarray],
+        labels: Optional[Sequence] = None,
+        dtype=np.float32,
+    ) -> 'PackedSymmetricMatrix':
+        """
+        Empaquette une matrice dense (seul le triangle supérieur est lu).
+
+        Args:
+            matrix: DataFrame carré (mêmes libellés en index et colonnes) ou ndarray N×N
+            labels: Libellés (défaut: colonnes du DataFrame, sinon 0..N-1)
+            dtype: Type de stockage (entiers: NaN → 0, valeurs saturées)
+
+        Returns:
+            PackedSymmetricMatrix
+        """
+        if isinstance(matrix, pd.DataFrame):
+            if not matrix.index.equals(matrix.columns):
+                matrix = matrix.reindex(index=matrix.columns)
+            labels = matrix.columns if labels is None else labels
+            matrix = matrix.to_numpy()
+        matrix = np.asarray(matrix)
+        n = matrix.shape[0]
+        if matrix.shape != (n, n):
+            raise ValueError(f"Matrice carrée attendue, reçu {matrix.shape}")
+        labels = range(n) if labels is None else labels
+
+        upper = np.empty(n * (n - 1) // 2, dtype=dtype)
+        start = 0
+        for i in range(n - 1):
+            stop = start + n - i - 1
+            upper[start:stop] = _storage_values(matrix[i, i + 1:], dtype)
+            start = stop
+        return cls(labels, upper, _storage_values(np.diagonal(matrix), dtype))
+
+    # ==========================================================================
+    # ACCÈS
+    # ==========================================================================
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    @property
+    def shape(self):
+        return (len(self.labels), len(self.labels))
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self.upper.dtype
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.upper.nbytes + self.diagonal.nbytes)
+
+    @property
+    def empty(self) -> bool:
+        return len(self.labels) == 0
+
+    def index_of(self, label) -> int:
+        """Position d'un libellé (KeyError si absent)."""
+        return self._position[label]
+
+    def __contains__(self, label) -> bool:
+        return label in self._position
+
+    def get(self, a, b):
+        """Valeur de la paire (a, b), en O(1)."""
+        i, j = self._position[a], self._position[b]
+        if i == j:
+            return self.diagonal[i]
+        if i > j:
+            i, j = j, i
+        return self.upper[self._offsets[i] + j]
+
+    def row(self, label) -> np.ndarray:
+        """
+        Ligne complète d'un libellé (ou d'une position entière).
+
+        Returns:
+            Valeurs dans l'ordre de labels (copie, N valeurs)
+        """
+        i = label if isinstance(label, (int, np.integer)) else self._position[label]
+        n = len(self.labels)
+        row = np.empty(n, dtype=self.dtype)
+        row[:i] = self.upper[self._offsets[:i] + i]
+        row[i] = self.diagonal[i]
+        row[i + 1:] = self.upper[self._offsets[i] + i + 1:self._offsets[i] + n]
+        return row
+
+    def row_series(self, label) -> pd.Series:
+        """Ligne d'un libellé en Series (index = labels)."""
+        return pd.Series(self.row(label), index=self.labels, name=label)
+
+    def pair_positions(self, flat: np.ndarray):
+        """
+        Indices (i, j) des positions du vecteur upper.
+
+        Args:
+            flat: Positions dans upper
+
+        Returns:
+            Tuple (i, j) d'entiers, i < j
+        """
+        flat = np.asarray(flat, dtype=np.int64)
+        starts = self._offsets + np.arange(len(self.labels)) + 1
+        i = np.searchsorted(starts, flat, side='right') - 1
+        return i, flat - self._offsets[i]
+
+    # ==========================================================================
+    # CONVERSIONS
+    # ==========================================================================
+
+    def to_dense(self, dtype=None) -> np.ndarray:
+        """Matrice dense N×N."""
+        n = len(self.labels)
+        dense = np.empty((n, n), dtype=dtype or self.dtype)
+        start = 0
+        for i in range(n):
+            stop = start + n - i - 1
+            dense[i, i + 1:] = self.upper[start:stop]
+            dense[i + 1:, i] = self.upper[start:stop]
+            start = stop
+        dense[np.arange(n), np.arange(n)] = self.diagonal
+        return dense
+
+    def to_frame(self, dtype=None) -> pd.DataFrame:
+        """DataFrame dense (labels en index et colonnes)."""
+        return pd.DataFrame(self.to_dense(dtype), index=self.labels, columns=self.labels, copy=False)
+
+    def save(self, path: Path, dtype=None) -> Path:
+        """
+        Écrit la matrice en .npy: diagonale (N) puis triangle supérieur.
+
+        Les libellés ne sont pas écrits (cf. index de l'export binaire).
+
+        Args:
+            path: Fichier .npy
+            dtype: Type de stockage (défaut: celui de la matrice)
+
+        Returns:
+            Path écrit
+        """
+        dtype = dtype or self.dtype
+        vector = np.empty(len(self.diagonal) + len(self.upper), dtype=dtype)
+        vector[:len(self.diagonal)] = _storage_values(self.diagonal, dtype)
+        vector[len(self.diagonal):] = _storage_values(self.upper, dtype)
+        np.save(path, vector)
+        return Path(path)
+
+    @classmethod
+    def load(cls, path: Path, labels: Sequence, mmap: bool = True) -> 'PackedSymmetricMatrix':
+        """
+        Relit une matrice écrite par save().
+
+        Args:
+            path: Fichier .npy
+            labels: Libellés (ordre des lignes)
+            mmap: Mapper le fichier en mémoire (lecture seule, aucune copie)
+
+        Returns:
+            PackedSymmetricMatrix adossée au fichier si mmap
+        """
+        vector = np.load(path, mmap_mode='r' if mmap else None)
+        n = len(labels)
+        return cls(labels, vector[n:], vector[:n])
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        return self.to_dense(dtype)
+
+    def subset(self, labels: Sequence) -> 'PackedSymmetricMatrix':
+        """Sous-matrice sur les libellés donnés (dans cet ordre)."""
+        positions = np.array([self._position[label] for label in labels], dtype=np.int64)
+        n = len(positions)
+        upper = np.empty(n * (n - 1) // 2, dtype=self.dtype)
+        start = 0
+        for k in range(n - 1):
+            stop = start + n - k - 1
+            upper[start:stop] = self.row(int(positions[k]))[positions[k + 1:]]
+            start = stop
+        return PackedSymmetricMatrix(labels, upper, self.diagonal[positions])
+
+
+def packed_delta(
+    lt: PackedSymmetricMatrix,
+    ct: PackedSymmetricMatrix,
+) -> PackedSymmetricMatrix:
+    """
+    Matrice delta CT - LT sur les libellés communs (ordre de lt).
+
+    Returns:
+        PackedSymmetricMatrix (vide si aucun libellé commun)
+    """
+    common = lt.labels[lt.labels.isin(ct.labels)]
+    if len(common) == len(lt.labels) and common.equals(ct.labels):
+        lt_common, ct_common = lt, ct
+    else:
+        lt_common, ct_common = lt.subset(common), ct.subset(common)
+    return PackedSymmetricMatrix(
+        common,
+        ct_common.upper - lt_common.upper,
+        ct_common.diagonal - lt_common.diagonal,
+    )
@@ -0,0 +1,262 @@
+"""
+Sélection d'un portefeuille diversifié sur les matrices LT/CT.
+
+Le score Davey d'une stratégie compte ses stratégies corrélées (|corr| > seuil)
+dans tout l'univers. Pour construire un portefeuille, seul compte le nombre
+de stratégies corrélées *parmi les membres*. On conserve pour chaque
+stratégie de l'univers les vecteurs:
+- counts_lt / counts_ct: membres corrélés (LT / CT)
+- abs_sum: somme des |corr| pondérées avec les membres (départage)
+
+Ajouter ou retirer un membre met ces vecteurs à jour en O(N) (une colonne
+des matrices booléennes). Le coût marginal d'un candidat est directement
+son score Davey restreint au portefeuille:
+    coût = W_LT × counts_lt + W_CT × counts_ct
+
+Utilisation:
+    selector = PortfolioSelector(corr_lt, corr_ct, threshold=0.7)   # DataFrame ou empaquetées
+    portfolio = selector.select(size=10, beam_width=3)
+    portfolio.scores()
+    portfolio.what_if(add='X_ES', remove='Y_NQ')
+"""
+
+from typing import List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from .config import get_correlation_status
+from .packed_matrix import PackedSymmetricMatrix
+
+
+def _abs_dense(matrix: Union[pd.DataFrame, PackedSymmetricMatrix], strategies: pd.Index) -> np.ndarray:
+    """|corr| dense float64 sur strategies (dans cet ordre)."""
+    if isinstance(matrix, PackedSymmetricMatrix):
+        if not matrix.labels.equals(strategies):
+            matrix = matrix.subset(strategies)
+        return np.abs(matrix.to_dense(np.float64))
+    return np.abs(matrix.reindex(index=strategies, columns=strategies).to_numpy(dtype=np.float64))
+
+
+def _labels(matrix: Union[pd.DataFrame, PackedSymmetricMatrix]) -> pd.Index:
+    return matrix.labels if isinstance(matrix, PackedSymmetricMatrix) else matrix.columns
+
+
+class PortfolioSelector:
+    """
+    Portefeuille de stratégies et vecteurs de corrélation avec ses membres.
+
+    Attributs:
+        strategies: Univers (stratégies communes aux matrices LT et CT)
+        members: Indices des membres dans strategies (ordre d'ajout)
+        counts_lt, counts_ct: Membres corrélés avec chaque stratégie de l'univers
+        abs_sum: Somme des |corr| pondérées avec les membres
+    """
+
+    def __init__(
+        self,
+        corr_lt: Union[pd.DataFrame, PackedSymmetricMatrix],
+        corr_ct: Union[pd.DataFrame, PackedSymmetricMatrix],
+        threshold: float,
+        weight_lt: float = 0.5,
+        weight_ct: float = 0.5,
+    ):
+        labels_lt, labels_ct = _labels(corr_lt), _labels(corr_ct)
+        strategies = labels_lt[labels_lt.isin(labels_ct)]
+        lt = _abs_dense(corr_lt, strategies)
+        ct = _abs_dense(corr_ct, strategies)
+        np.fill_diagonal(lt, np.nan)
+        np.fill_diagonal(ct, np.nan)
+
+        self.strategies = strategies
+        self.threshold = threshold
+        self.weight_lt = weight_lt
+        self.weight_ct = weight_ct
+
+        with np.errstate(invalid='ignore'):
+            self._correlated_lt = lt > threshold
+            self._correlated_ct = ct > threshold
+        self._abs = (weight_lt * np.nan_to_num(lt) + weight_ct * np.nan_to_num(ct)).astype(np.float32)
+
+        # Score Davey dans l'univers complet (départage final)
+        self._universe_score = (
+            weight_lt * self._correlated_lt.sum(axis=1) + weight_ct * self._correlated_ct.sum(axis=1)
+        )
+
+        self._position = {s: k for k, s in enumerate(strategies)}
+        n = len(strategies)
+        self.members: List[int] = []
+        self._is_member = np.zeros(n, dtype=bool)
+        self.counts_lt = np.zeros(n, dtype=np.int32)
+        self.counts_ct = np.zeros(n, dtype=np.int32)
+        self.abs_sum = np.zeros(n, dtype=np.float64)
+
+    # ==========================================================================
+    # MISE À JOUR O(N)
+    # ==========================================================================
+
+    def _index(self, strategy: str) -> int:
+        k = self._position.get(strategy)
+        if k is None:
+            raise ValueError(f"Stratégie inconnue: {strategy}")
+        return k
+
+    def _update(self, k: int, sign: int):
+        self.counts_lt += sign * self._correlated_lt[:, k]
+        self.counts_ct += sign * self._correlated_ct[:, k]
+        self.abs_sum += sign * self._abs[:, k]
+
+    def add(self, strategy: str) -> 'PortfolioSelector':
+        """Ajoute un membre (mise à jour O(N) des vecteurs)."""
+        k = self._index(strategy)
+        if self._is_member[k]:
+            raise ValueError(f"Stratégie déjà dans le portefeuille: {strategy}")
+        self._update(k, 1)
+        self._is_member[k] = True
+        self.members.append(k)
+        return self
+
+    def remove(self, strategy: str) -> 'PortfolioSelector':
+        """Retire un membre (mise à jour O(N) des vecteurs)."""
+        k = self._index(strategy)
+        if not self._is_member[k]:
+            raise ValueError(f"Stratégie absente du portefeuille: {strategy}")
+        self._update(k, -1)
+        self._is_member[k] = False
+        self.members.remove(k)
+        return self
+
+    def copy(self) -> 'PortfolioSelector':
+        """Copie indépendante de l'état (les matrices sont partagées)."""
+        clone = object.__new__(PortfolioSelector)
+        clone.__dict__.update(self.__dict__)
+        clone.members = list(self.members)
+        clone._is_member = self._is_member.copy()
+        clone.counts_lt = self.counts_lt.copy()
+        clone.counts_ct = self.counts_ct.copy()
+        clone.abs_sum = self.abs_sum.copy()
+        return clone
+
+    # ==========================================================================
+    # SCORES
+    # ==========================================================================
+
+    @property
+    def member_names(self) -> List[str]:
+        return [self.strategies[k] for k in self.members]
+
+    def costs(self) -> np.ndarray:
+        """Score Davey restreint au portefeuille, pour chaque stratégie de l'univers."""
+        return self.weight_lt * self.counts_lt + self.weight_ct * self.counts_ct
+
+    @property
+    def total_score(self) -> float:
+        """Somme des scores Davey des membres (chaque paire corrélée compte deux fois)."""
+        return float(self.costs()[self._is_member].sum())
+
+    def scores(self) -> pd.DataFrame:
+        """
+        Scores Davey des membres calculés à l'intérieur du portefeuille.
+
+        Returns:
+            DataFrame Strategy, Score_Davey, N_Corr_LT, N_Corr_CT, Avg_Corr,
+            Status, Status_Emoji (trié par score décroissant)
+        """
+        members = np.array(self.members, dtype=np.int64)
+        others = max(len(members) - 1, 1)
+        score = np.round(self.costs()[members], 1)
+        status = [get_correlation_status(s) for s in score]
+
+        df_scores = pd.DataFrame({
+            'Strategy': self.strategies[members],
+            'Score_Davey': score,
+            'N_Corr_LT': self.counts_lt[members].astype(int),
+            'N_Corr_CT': self.counts_ct[members].astype(int),
+            'Avg_Corr': np.round(self.abs_sum[members] / others, 3),
+            'Status': [s for s, _ in status],
+            'Status_Emoji': [e for _, e in status],
+        })
+        return df_scores.sort_values('Score_Davey', ascending=False, kind='stable').reset_index(drop=True)
+
+    def what_if(self, add: Optional[str] = None, remove: Optional[str] = None) -> pd.DataFrame:
+        """
+        Scores du portefeuille après ajout et/ou retrait, sans modifier l'état.
+
+        Args:
+            add: Stratégie à ajouter
+            remove: Stratégie à retirer
+
+        Returns:
+            DataFrame des scores (cf. scores) avec Score_Delta par rapport à l'état actuel
+        """
+        current = self.scores().set_index('Strategy')['Score_Davey']
+        scenario = self.copy()
+        if remove is not None:
+            scenario.remove(remove)
+        if add is not None:
+            scenario.add(add)
+
+        result = scenario.scores()
+        result['Score_Delta'] = (result['Score_Davey'] - result['Strategy'].map(current).fillna(0.0)).round(1)
+        return result
+
+    # ==========================================================================
+    # SÉLECTION (GLOUTONNE / FAISCEAU)
+    # ==========================================================================
+
+    def _ranked_candidates(self, limit: int) -> np.ndarray:
+        """Candidats non membres par coût marginal, puis |corr| cumulée, puis score univers."""
+        candidates = np.flatnonzero(~self._is_member)
+        order = np.lexsort((
+            self._universe_score[candidates],
+            self.abs_sum[candidates],
+            self.costs()[candidates],
+        ))
+        return candidates[order[:limit]]
+
+    def select(
+        self,
+        size: int,
+        beam_width: int = 1,
+        seed: Optional[List[str]] = None,
+    ) -> 'PortfolioSelector':
+        """
+        Complète le portefeuille jusqu'à size membres en minimisant la corrélation mutuelle.
+
+        beam_width = 1: recherche gloutonne (meilleur coût marginal à chaque pas).
+        beam_width > 1: recherche en faisceau, les beam_width meilleurs
+        portefeuilles partiels (score total, puis |corr| cumulée) sont conservés.
+
+        Args:
+            size: Nombre de membres visé
+            beam_width: Largeur du faisceau
+            seed: Stratégies imposées (ajoutées avant la recherche)
+
+        Returns:
+            Nouveau PortfolioSelector (l'instance courante n'est pas modifiée)
+        """
+        start = self.copy()
+        for strategy in seed or []:
+            if not start._is_member[start._index(strategy)]:
+                start.add(strategy)
+
+        size = min(size, len(self.strategies))
+        beam = [start]
+        while len(beam[0].members) < size:
+            children = {}
+            for state in beam:
+                for k in state._ranked_candidates(beam_width):
+                    key = frozenset(state.members) | {int(k)}
+                    if key in children:
+                        continue
+                    child = state.copy()
+                    child.add(self.strategies[k])
+                    children[key] = child
+
+            ranked = sorted(
+                children.values(),
+                key=lambda s: (s.total_score, float(s.abs_sum[s._is_member].sum())),
+            )
+            beam = ranked[:beam_width]
+
+        return beam[0]
@@ -0,0 +1,389 @@
+"""
+Matrice de profits compacte (dates × stratégies) adossée à des tableaux NumPy.
+
+Remplace le pivot pandas dense pour l'étape de corrélation:
+- construite une seule fois à partir des dates et Strategy_ID codés en
+  entiers (np.unique / factorize) et d'une accumulation np.bincount
+- stockage float32 + masque d'activité booléen (5 octets par cellule au
+  lieu de 8 pour un float64, sans l'index pandas)
+- les fenêtres LT/CT sont des vues par plage de dates (aucune copie)
+- ProfitMatrixAccumulator la construit bloc par bloc en deux passes
+  (lecture en flux du fichier consolidé: la matrice de sortie est allouée
+  une fois à sa taille exacte, seul un bloc est conservé en plus)
+- aggregate() regroupe les jours par semaine ou par mois (codes de période
+  entiers, une seule réduction sur les lignes triées)
+- in_drawdown() restreint les profits aux jours de drawdown (équité cumulée
+  sous son plus haut), pour la corrélation de co-drawdown
+
+Utilisation:
+    profits = ProfitMatrix.from_frame(data)
+    lt = profits.window(start=start_date_lt).filter_active(min_active_days)
+    corr, common = pearson_correlation_matrix(lt.values, 100, mask=lt.active)
+"""
+
+from typing import Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+
+# Fréquences d'agrégation: semaine (lundi → dimanche), mois calendaire
+AGGREGATION_FREQUENCIES = ('W', 'M')
+
+
+def period_codes(dates: pd.DatetimeIndex, freq: str) -> np.ndarray:
+    """
+    Code entier de la période (semaine ou mois) de chaque date.
+
+    Args:
+        dates: Dates
+        freq: 'W' (semaines commençant le lundi) ou 'M' (mois calendaires)
+
+    Returns:
+        Codes int64 croissants avec les dates
+    """
+    if freq == 'W':
+        # 1970-01-01 est un jeudi: +3 jours aligne les semaines sur le lundi
+        return (dates.values.astype('datetime64[D]').astype(np.int64) + 3) // 7
+    if freq == 'M':
+        return dates.values.astype('datetime64[M]').astype(np.int64)
+    raise ValueError(f"Fréquence d'agrégation inconnue: {freq} (attendu: {AGGREGATION_FREQUENCIES})")
+
+
+def period_starts(codes: np.ndarray, freq: str) -> pd.DatetimeIndex:
+    """Premier jour (lundi ou 1er du mois) des périodes codées par period_codes."""
+    if freq == 'W':
+        return pd.DatetimeIndex((codes * 7 - 3).astype('datetime64[D]'))
+    return pd.DatetimeIndex(codes.astype('datetime64[M]').astype('datetime64[D]'))
+
+
+class ProfitMatrix:
+    """
+    Profits journaliers par stratégie, triés par date.
+
+    Attributs:
+        dates: Dates (DatetimeIndex trié)
+        strategies: Stratégies (Index trié, ordre des colonnes)
+        values: Profits (jours × stratégies), float32 par défaut
+        active: Masque d'activité (P&L non nul)
+    """
+
+    def __init__(
+        self,
+        dates: pd.DatetimeIndex,
+        strategies: pd.Index,
+        values: np.ndarray,
+        active: np.ndarray,
+    ):
+        self.dates = pd.DatetimeIndex(dates)
+        self.strategies = pd.Index(strategies)
+        self.values = values
+        self.active = active
+
+    @classmethod
+    def from_frame(
+        cls,
+        df: pd.DataFrame,
+        dtype=np.float32,
+        strategy_col: str = 'Strategy_ID',
+    ) -> 'ProfitMatrix':
+        """
+        Construit la matrice à partir des lignes (Date, Strategy_ID, DailyProfit).
+
+        Les profits d'un même couple (date, stratégie) sont additionnés, comme
+        pivot_table(aggfunc='sum', fill_value=0).
+
+        Args:
+            df: DataFrame avec colonnes Date, Strategy_ID, DailyProfit
+            dtype: Type de stockage des profits
+            strategy_col: Colonne identifiant la stratégie
+
+        Returns:
+            ProfitMatrix
+        """
+        date_codes, dates = pd.factorize(pd.DatetimeIndex(df['Date']), sort=True)
+        strategy_codes, strategies = pd.factorize(df[strategy_col], sort=True)
+        profits = pd.to_numeric(df['DailyProfit'], errors='coerce').to_numpy(dtype=np.float64)
+
+        valid = (date_codes >= 0) & (strategy_codes >= 0) & ~np.isnan(profits)
+        n_dates, n_strategies = len(dates), len(strategies)
+
+        flat = date_codes[valid].astype(np.int64) * n_strategies + strategy_codes[valid]
+        sums = np.bincount(flat, weights=profits[valid], minlength=n_dates * n_strategies)
+        sums = sums.reshape(n_dates, n_strategies)
+
+        return cls(
+            dates=pd.DatetimeIndex(dates),
+            strategies=pd.Index(strategies),
+            values=sums.astype(dtype, copy=False),
+            active=sums != 0,
+        )
+
+    # ==========================================================================
+    # VUES
+    # ==========================================================================
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.values.shape
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def window(self, start=None, end=None) -> 'ProfitMatrix':
+        """
+        Vue sur une plage de dates [start, end] (bornes incluses, None = ouverte).
+
+        Returns:
+            ProfitMatrix partageant les tableaux sous-jacents
+        """
+        lo = 0 if start is None else int(self.dates.searchsorted(pd.Timestamp(start), side='left'))
+        hi = len(self.dates) if end is None else int(self.dates.searchsorted(pd.Timestamp(end), side='right'))
+        return self.rows(lo, hi)
+
+    def rows(self, lo: int, hi: int) -> 'ProfitMatrix':
+        """Vue sur les lignes [lo, hi) (indices de dates)."""
+        return ProfitMatrix(self.dates[lo:hi], self.strategies, self.values[lo:hi], self.active[lo:hi])
+
+    def active_days(self) -> np.ndarray:
+        """Nombre de jours d'activité par stratégie."""
+        return self.active.sum(axis=0)
+
+    def select(self, columns: Union[np.ndarray, list]) -> 'ProfitMatrix':
+        """
+        Sous-ensemble de stratégies (indices ou masque booléen).
+
+        Returns:
+            ProfitMatrix (copie des colonnes retenues)
+        """
+        columns = np.asarray(columns)
+        if columns.dtype == bool:
+            columns = np.flatnonzero(columns)
+        return ProfitMatrix(
+            self.dates, self.strategies[columns],
+            self.values[:, columns], self.active[:, columns],
+        )
+
+    def filter_active(self, min_active_days: int) -> 'ProfitMatrix':
+        """Stratégies avec au moins min_active_days jours d'activité."""
+        return self.select(self.active_days() >= min_active_days)
+
+    def aggregate(self, freq: str) -> 'ProfitMatrix':
+        """
+        Profits agrégés par semaine ou par mois.
+
+        Les dates étant triées, chaque période est un bloc de lignes
+        contigu: une seule réduction (np.add.reduceat) donne les sommes,
+        sans resample pandas par stratégie. Une stratégie est active sur
+        une période si elle a tradé au moins un jour de la période.
+
+        Args:
+            freq: 'W' (hebdomadaire) ou 'M' (mensuel)
+
+        Returns:
+            ProfitMatrix indexée par le premier jour de chaque période
+        """
+        codes = period_codes(self.dates, freq)
+        if len(codes) == 0:
+            return ProfitMatrix(self.dates, self.strategies, self.values, self.active)
+
+        starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+        sums = np.add.reduceat(self.values, starts, axis=0, dtype=np.float64)
+        active = np.logical_or.reduceat(self.active, starts, axis=0)
+        return ProfitMatrix(
+            dates=period_starts(codes[starts], freq),
+            strategies=self.strategies,
+            values=sums.astype(self.values.dtype, copy=False),
+            active=active,
+        )
+
+    def drawdown_mask(self) -> np.ndarray:
+        """
+        Jours où chaque stratégie est en drawdown sur la période de la matrice.
+
+        L'équité cumulée part de 0 au premier jour; un jour est en drawdown
+        si l'équité de fin de journée est sous son plus haut antérieur.
+
+        Returns:
+            Masque booléen (jours × stratégies)
+        """
+        equity = np.cumsum(self.values, axis=0, dtype=np.float64)
+        peak = np.maximum.accumulate(np.maximum(equity, 0.0), axis=0)
+        return equity < peak
+
+    def in_drawdown(self) -> 'ProfitMatrix':
+        """
+        Profits restreints aux jours actifs en drawdown (nuls ailleurs).
+
+        La corrélation de Pearson de cette matrice (jours communs = jours où
+        les deux stratégies ont tradé en étant en drawdown) est la
+        corrélation de co-drawdown.
+
+        Returns:
+            ProfitMatrix de mêmes dates et stratégies
+        """
+        active = self.active & self.drawdown_mask()
+        return ProfitMatrix(
+            dates=self.dates,
+            strategies=self.strategies,
+            values=np.where(active, self.values, 0).astype(self.values.dtype, copy=False),
+            active=active,
+        )
+
+    def to_frame(self) -> pd.DataFrame:
+        """Matrice pandas (dates en index, stratégies en colonnes)."""
+        frame = pd.DataFrame(self.values, index=self.dates, columns=self.strategies)
+        frame.index.name = 'Date'
+        frame.columns.name = 'Strategy_ID'
+        return frame
+
+
+class ProfitMatrixAccumulator:
+    """
+    Construction d'une ProfitMatrix à partir de blocs de lignes, en deux passes.
+
+    Première passe (scan): seules les dates et stratégies distinctes sont
+    relevées. La matrice dense (jours × stratégies, triée) est ensuite
+    allouée une seule fois à sa taille exacte; la seconde passe (add) y
+    ajoute sur place les sommes de chaque bloc par couple (date, stratégie),
+    le bloc pouvant être libéré aussitôt. build() rend cette matrice sans
+    copie (sauf changement de dtype): le pic mémoire est la matrice de
+    sortie, son masque d'activité et un bloc, quelle que soit la taille du
+    fichier.
+
+    build() donne le même résultat que ProfitMatrix.from_frame sur la
+    concaténation des blocs (à la précision de dtype près lorsqu'un même
+    couple (date, stratégie) est réparti sur plusieurs blocs).
+
+    Utilisation:
+        accumulator = ProfitMatrixAccumulator()
+        for chunk in chunks:
+            accumulator.scan(chunk)
+        for chunk in chunks:
+            accumulator.add(chunk)
+        profits = accumulator.build()
+    """
+
+    def __init__(self, strategy_col: str = 'Strategy_ID', dtype=np.float32):
+        self.strategy_col = strategy_col
+        self.dtype = np.dtype(dtype)
+        self.n_rows = 0
+        # Clés relevées par scan(), triées à l'allocation
+        self._dates = np.array([], dtype=np.int64)
+        self._strategy_set = set()
+        self._strategies: pd.Index = None
+        self._values: np.ndarray = None
+
+    @property
+    def nbytes(self) -> int:
+        """Mémoire occupée par la matrice en construction."""
+        return 0 if self._values is None else self._values.nbytes
+
+    @staticmethod
+    def _date_keys(chunk: pd.DataFrame) -> np.ndarray:
+        """Dates d'un bloc en entiers (ns), NaT = valeur minimale int64."""
+        return pd.DatetimeIndex(chunk['Date']).as_unit('ns').asi8
+
+    def scan(self, chunk: pd.DataFrame) -> None:
+        """
+        Relève les dates et stratégies d'un bloc (première passe).
+
+        Args:
+            chunk: Bloc avec colonnes Date (déjà parsées) et Strategy_ID
+        """
+        if self._values is not None:
+            raise ValueError("scan() doit précéder le premier add()")
+        dates = self._date_keys(chunk)
+        dates = dates[dates != np.iinfo(np.int64).min]
+        self._dates = np.union1d(self._dates, dates)
+        self._strategy_set.update(chunk[self.strategy_col].dropna().unique().tolist())
+
+    def _allocate(self) -> None:
+        """Alloue la matrice triée à sa taille exacte (fin de la première passe)."""
+        self._strategies = pd.Index(sorted(self._strategy_set, key=str))
+        self._strategy_set = set()
+        self._values = np.zeros((len(self._dates), len(self._strategies)), dtype=self.dtype)
+
+    def add(self, chunk: pd.DataFrame) -> None:
+        """
+        Ajoute un bloc de lignes (Date, Strategy_ID, DailyProfit), seconde passe.
+
+        Args:
+            chunk: Bloc avec dates déjà parsées, déjà vu par scan()
+
+        Raises:
+            ValueError: Date ou stratégie absente de la première passe
+        """
+        if self._values is None:
+            self._allocate()
+
+        dates = self._date_keys(chunk)
+        strategies = chunk[self.strategy_col]
+        columns = self._strategies.get_indexer(strategies)
+        profits = pd.to_numeric(chunk['DailyProfit'], errors='coerce').to_numpy(dtype=np.float64)
+
+        rows = np.searchsorted(self._dates, dates)
+        known = rows < len(self._dates)
+        known[known] = self._dates[rows[known]] == dates[known]
+        has_date = dates != np.iinfo(np.int64).min
+        has_strategy = strategies.notna().to_numpy()
+        if (has_date & ~known).any() or (has_strategy & (columns < 0)).any():
+            raise ValueError("Bloc non relevé par scan(): date ou stratégie inconnue")
+
+        valid = has_date & has_strategy
+        self.n_rows += int(valid.sum())
+        valid &= ~np.isnan(profits)
+        if not valid.any():
+            return
+
+        # Sommes du bloc par couple présent (taille bornée par le bloc)
+        n_strategies = len(self._strategies)
+        pairs = rows[valid].astype(np.int64) * n_strategies + columns[valid]
+        pair_codes, unique_pairs = pd.factorize(pairs)
+        sums = np.bincount(pair_codes, weights=profits[valid], minlength=len(unique_pairs))
+        unique_pairs = np.asarray(unique_pairs, dtype=np.int64)
+        self._values[unique_pairs // n_strategies, unique_pairs % n_strategies] += sums
+
+    def build(self, dtype=None) -> ProfitMatrix:
+        """
+        Rend la matrice construite (sans copie) et réinitialise l'accumulateur.
+
+        Args:
+            dtype: Type de stockage des profits (défaut: celui de l'accumulateur)
+
+        Returns:
+            ProfitMatrix
+        """
+        if self._values is None:
+            self._allocate()
+        values, dates, strategies = self._values, self._dates, self._strategies
+        self._values, self._strategies = None, None
+        self._dates = np.array([], dtype=np.int64)
+        if dtype is not None:
+            values = values.astype(dtype, copy=False)
+
+        return ProfitMatrix(
+            dates=pd.DatetimeIndex(dates.view('datetime64[ns]')),
+            strategies=strategies,
+            values=values,
+            active=values != 0,
+        )
+
+
+def profit_arrays(profit_matrix) -> Tuple[np.ndarray, np.ndarray, list, pd.DatetimeIndex]:
+    """
+    Tableaux d'une matrice de profits (ProfitMatrix ou DataFrame pivot).
+
+    Args:
+        profit_matrix: ProfitMatrix ou DataFrame (dates × stratégies)
+
+    Returns:
+        Tuple (profits float64, masque d'activité, stratégies, dates)
+    """
+    if isinstance(profit_matrix, ProfitMatrix):
+        values = profit_matrix.values.astype(np.float64)
+        return values, profit_matrix.active, profit_matrix.strategies.tolist(), profit_matrix.dates
+
+    profit_matrix = profit_matrix.sort_index()
+    values = np.nan_to_num(profit_matrix.to_numpy(dtype=np.float64), nan=0.0)
+    return values, values != 0, profit_matrix.columns.tolist(), pd.DatetimeIndex(profit_matrix.index)
@@ -4,23 +4,33 @@ Générateur de Dashboard HTML pour l'Analyse de Corrélation
 Crée un dashboard interactif avec onglets pour visualiser:
 - Résumé et candidats à l'élimination
 - Scores de corrélation par stratégie (méthode Kevin Davey)
-- Matrices de corrélation Long Terme et Court Terme
+- Matrices de corrélation Long Terme et Court Terme (ordonnées par cluster)
 - Comparaison LT vs CT (détection de changements de régime)
+- Sensibilité des scores au seuil de corrélation
+- Corrélations des profits agrégés par semaine / mois (si calculées)
+- Co-drawdown: corrélation restreinte aux jours de drawdown communs (si calculée)
 - Documentation méthodologique
 
-Adapté pour consultation mobile avec design responsive.
+Adapté pour consultation mobile avec design responsive. Les matrices sont
+embarquées en binaire compact (triangle supérieur Int8 quantifié ou Float32,
+base64) et dessinées sur un canvas à partir de tableaux typés.
 
 Auteur: Trading Analytics Pipeline V2
 Date: Novembre 2025
 """
 
+import base64
 import json
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Union
 import pandas as pd
 import numpy as np
 
+from ..consolidators.config import AGGREGATION_CONFIG
+from ..consolidators.correlation_clustering import CorrelationClusters
+from ..consolidators.packed_matrix import PackedSymmetricMatrix, packed_delta
+
 
 class CorrelationDashboardGenerator:
     """
@@ -31,6 +41,9 @@ class CorrelationDashboardGenerator:
         timestamp: Horodatage pour les noms de fichiers
     """
     
+    # Encodage des heatmaps: 'int8' (quantifié, 1 octet par paire) ou 'float32'
+    HEATMAP_ENCODING = 'int8'
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
         Initialise le générateur.
@@ -56,22 +69,27 @@ class CorrelationDashboardGenerator:
     
     def generate(
         self,
-        corr_lt: pd.DataFrame,
-        corr_ct: pd.DataFrame,
+        corr_lt: Union[pd.DataFrame, PackedSymmetricMatrix],
+        corr_ct: Union[pd.DataFrame, PackedSymmetricMatrix],
         scores: pd.DataFrame,
         stats_lt: Dict[str, Any],
         stats_ct: Dict[str, Any],
         pairs_lt: Dict[str, List],
         pairs_ct: Dict[str, List],
         biggest_changes: List[Dict],
-        output_path: Path
+        output_path: Path,
+        threshold_sweep: Optional[pd.DataFrame] = None,
+        aggregated: Optional[Dict[str, Union[pd.DataFrame, PackedSymmetricMatrix]]] = None,
+        clusters: Optional[CorrelationClusters] = None,
+        codrawdown: Optional[Union[pd.DataFrame, PackedSymmetricMatrix]] = None,
+        codrawdown_pairs: Optional[List[Dict]] = None
     ) -> Path:
         """
         Génère le dashboard HTML complet.
         
         Args:
-            corr_lt: Matrice de corrélation Long Terme
-            corr_ct: Matrice de corrélation Court Terme
+            corr_lt: Matrice de corrélation Long Terme (DataFrame ou empaquetée)
+            corr_ct: Matrice de corrélation Court Terme (DataFrame ou empaquetée)
             scores: DataFrame des scores par stratégie
             stats_lt: Statistiques Long Terme
             stats_ct: Statistiques Court Terme
@@ -79,18 +97,30 @@ class CorrelationDashboardGenerator:
             pairs_ct: Paires extrêmes Court Terme
             biggest_changes: Plus grands changements de corrélation
             output_path: Chemin du fichier de sortie
+            threshold_sweep: Balayage des seuils (cf. calculate_threshold_sweep)
+            aggregated: Niveau ('W', 'M') → matrice des profits agrégés
+            clusters: Classification hiérarchique (ordre des heatmaps, tableau des clusters)
+            codrawdown: Matrice de corrélation de co-drawdown
+            codrawdown_pairs: Paires dont le co-drawdown dépasse le plus la corrélation LT
             
         Returns:
             Path du fichier généré
         """
+        # Matrices empaquetées (triangle supérieur float32)
+        corr_lt = self._packed(corr_lt)
+        corr_ct = self._packed(corr_ct)
+        
         # Calculer la matrice delta
         delta_matrix = self._calculate_delta(corr_lt, corr_ct)
         
         # Préparer les données pour JavaScript
         data = self._prepare_js_data(
             corr_lt, corr_ct, delta_matrix, scores,
-            stats_lt, stats_ct, pairs_lt, pairs_ct, biggest_changes
+            stats_lt, stats_ct, pairs_lt, pairs_ct, biggest_changes, clusters
         )
+        data['sweep'] = self._prepare_sweep_data(threshold_sweep)
+        data['aggregated'] = self._prepare_aggregated_data(aggregated, scores, clusters)
+        data['codrawdown'] = self._prepare_codrawdown_data(codrawdown, codrawdown_pairs, clusters)
         
         # Générer le HTML
         html_content = self._build_html(data, stats_lt, stats_ct)
@@ -102,32 +132,35 @@ class CorrelationDashboardGenerator:
         
         return output_path
     
+    @staticmethod
+    def _packed(matrix: Union[pd.DataFrame, PackedSymmetricMatrix, None]) -> Optional[PackedSymmetricMatrix]:
+        """Empaquette une matrice DataFrame (les matrices déjà empaquetées sont gardées)."""
+        if matrix is None or isinstance(matrix, PackedSymmetricMatrix):
+            return matrix
+        return PackedSymmetricMatrix.from_dense(matrix)
+    
     def _calculate_delta(
         self,
-        corr_lt: pd.DataFrame,
-        corr_ct: pd.DataFrame
-    ) -> pd.DataFrame:
-        """Calcule la matrice de différence CT - LT."""
-        common = corr_lt.columns.intersection(corr_ct.columns)
-        if len(common) == 0:
-            return pd.DataFrame()
-        
-        lt_aligned = corr_lt.loc[common, common]
-        ct_aligned = corr_ct.loc[common, common]
-        
-        return ct_aligned - lt_aligned
+        corr_lt: PackedSymmetricMatrix,
+        corr_ct: PackedSymmetricMatrix
+    ) -> Optional[PackedSymmetricMatrix]:
+        """Calcule la matrice de différence CT - LT (stratégies communes)."""
+        if corr_lt is None or corr_ct is None:
+            return None
+        return packed_delta(corr_lt, corr_ct)
     
     def _prepare_js_data(
         self,
-        corr_lt: pd.DataFrame,
-        corr_ct: pd.DataFrame,
-        delta_matrix: pd.DataFrame,
+        corr_lt: PackedSymmetricMatrix,
+        corr_ct: PackedSymmetricMatrix,
+        delta_matrix: PackedSymmetricMatrix,
         scores: pd.DataFrame,
         stats_lt: Dict,
         stats_ct: Dict,
         pairs_lt: Dict,
         pairs_ct: Dict,
-        biggest_changes: List
+        biggest_changes: List,
+        clusters: Optional[CorrelationClusters] = None
     ) -> Dict[str, Any]:
         """Prépare les données pour injection JavaScript."""
         
@@ -163,31 +196,31 @@ class CorrelationDashboardGenerator:
                     'Max_Corr_CT': float(row.get('Max_Corr_CT', row.get('max_corr_ct', 0))),
                     'Max_Corr_LT_With': row.get('Max_Corr_LT_With', row.get('max_corr_lt_with', '')),
                     'Max_Corr_CT_With': row.get('Max_Corr_CT_With', row.get('max_corr_ct_with', '')),
+                    'Cluster': int(row['Cluster']) if pd.notna(row.get('Cluster')) else None,
                     'Status': status,
                     'Status_Emoji': emoji
                 })
         
-        # Convertir matrices en format pour heatmap
-        def matrix_to_heatmap_data(matrix: pd.DataFrame):
-            if matrix is None or matrix.empty:
-                return [], [], []
-            
-            strategies = list(matrix.columns)
-            # Créer noms courts (max 15 chars)
-            short_names = [s[:15] + '...' if len(s) > 15 else s for s in strategies]
-            
-            data_points = []
-            for i, row_name in enumerate(matrix.index):
-                for j, col_name in enumerate(matrix.columns):
-                    val = matrix.loc[row_name, col_name]
-                    if pd.notna(val):
-                        data_points.append({'x': j, 'y': i, 'v': round(float(val), 4)})
-            
-            return strategies, short_names, data_points
-        
-        strat_lt, short_lt, data_lt = matrix_to_heatmap_data(corr_lt)
-        strat_ct, short_ct, data_ct = matrix_to_heatmap_data(corr_ct)
-        strat_delta, short_delta, data_delta = matrix_to_heatmap_data(delta_matrix)
+        # Convertir matrices en format pour heatmap (ordre des clusters)
+        threshold = self.config.get('correlation_threshold', 0.70)
+        strat_lt, short_lt, data_lt, bounds_lt = self._heatmap_data(corr_lt, clusters, threshold)
+        strat_ct, short_ct, data_ct, bounds_ct = self._heatmap_data(corr_ct, clusters, threshold)
+        strat_delta, short_delta, data_delta, bounds_delta = self._heatmap_data(delta_matrix, clusters)
+        
+        # Clusters de 2+ stratégies, les plus grands d'abord
+        clusters_list = []
+        if clusters is not None:
+            grouped = clusters.summary[clusters.summary['Size'] > 1]
+            grouped = grouped.sort_values(['Size', 'Mean_Abs_Corr'], ascending=False, kind='stable')
+            clusters_list = [
+                {
+                    'Cluster': int(row.Cluster),
+                    'Size': int(row.Size),
+                    'Mean_Corr': None if pd.isna(row.Mean_Corr) else float(row.Mean_Corr),
+                    'Strategies': list(row.Strategies),
+                }
+                for row in grouped.head(30).itertuples(index=False)
+            ]
         
         # Convertir paires
         def format_pairs(pairs_dict: Dict, key: str) -> List[Dict]:
@@ -224,12 +257,16 @@ class CorrelationDashboardGenerator:
             'strat_lt': strat_lt,
             'short_lt': short_lt,
             'data_lt': data_lt,
+            'bounds_lt': bounds_lt,
             'strat_ct': strat_ct,
             'short_ct': short_ct,
             'data_ct': data_ct,
+            'bounds_ct': bounds_ct,
             'strat_delta': strat_delta,
             'short_delta': short_delta,
             'data_delta': data_delta,
+            'bounds_delta': bounds_delta,
+            'clusters_list': clusters_list,
             'most_lt': most_lt,
             'least_lt': least_lt,
             'most_ct': most_ct,
@@ -237,6 +274,191 @@ class CorrelationDashboardGenerator:
             'changes_list': changes_list
         }
     
+    def _prepare_sweep_data(self, sweep: Optional[pd.DataFrame]) -> Dict[str, Any]:
+        """
+        Prépare le balayage des seuils (format compact pour JavaScript).
+        
+        Returns:
+            Dict thresholds, strategies, score / n_lt / n_ct (stratégie × seuil),
+            distribution (statut → effectif par seuil)
+        """
+        if sweep is None or sweep.empty:
+            return {'thresholds': [], 'strategies': [], 'score': [], 'n_lt': [], 'n_ct': [], 'distribution': {}}
+        
+        def pivot(column: str) -> pd.DataFrame:
+            return sweep.pivot(index='Strategy', columns='Threshold', values=column)
+        
+        score = pivot('Score_Davey')
+        distribution = sweep.groupby(['Status', 'Threshold']).size().unstack(fill_value=0)
+        distribution = distribution.reindex(columns=score.columns, fill_value=0)
+        
+        return {
+            'thresholds': [round(float(t), 4) for t in score.columns],
+            'strategies': score.index.tolist(),
+            'score': score.round(1).to_numpy().tolist(),
+            'n_lt': pivot('N_Corr_LT').reindex_like(score).astype(int).to_numpy().tolist(),
+            'n_ct': pivot('N_Corr_CT').reindex_like(score).astype(int).to_numpy().tolist(),
+            'distribution': {status: counts.astype(int).tolist() for status, counts in distribution.iterrows()},
+        }
+    
+    def _encode_heatmap(
+        self,
+        matrix: Optional[PackedSymmetricMatrix],
+        threshold: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Encode une matrice symétrique pour le navigateur.
+        
+        Diagonale (N) puis triangle strictement supérieur ligne par ligne
+        (N(N-1)/2), en base64. Int8: valeur ≈ q × scale (échelle = max|v| / 127),
+        NaN codé -128. Float32: valeurs little-endian, NaN conservés.
+        
+        L'erreur int8 (± scale/2, soit ± 0.004 pour une corrélation) suffit
+        à faire passer une paire d'un côté à l'autre du seuil: avec un
+        seuil, les indicateurs |v| > seuil calculés sur les valeurs exactes
+        sont joints (1 bit par valeur, même ordre, base64).
+        
+        Args:
+            matrix: Matrice empaquetée (ordre d'affichage)
+            threshold: Seuil de corrélation (None: pas d'indicateurs, ex. delta)
+            
+        Returns:
+            Dict encoding, scale, values (base64), et threshold, above si seuil
+        """
+        if matrix is None or matrix.empty:
+            return {'encoding': self.HEATMAP_ENCODING, 'scale': 1.0, 'values': ''}
+        
+        values = np.concatenate([matrix.diagonal, matrix.upper]).astype(np.float64)
+        scale = 1.0
+        if self.HEATMAP_ENCODING == 'float32':
+            raw = values.astype('<f4')
+        else:
+            finite = np.isfinite(values)
+            max_abs = float(np.abs(values[finite]).max()) if finite.any() else 0.0
+            scale = max_abs / 127 if max_abs > 0 else 1.0
+            raw = np.full(len(values), -128, dtype=np.int8)
+            raw[finite] = np.clip(np.rint(values[finite] / scale), -127, 127).astype(np.int8)
+        
+        payload = {
+            'encoding': self.HEATMAP_ENCODING,
+            'scale': scale,
+            'values': base64.b64encode(raw.tobytes()).decode('ascii'),
+        }
+        if threshold is not None:
+            with np.errstate(invalid='ignore'):
+                above = np.abs(values) > threshold
+            payload['threshold'] = float(threshold)
+            payload['above'] = base64.b64encode(np.packbits(above, bitorder='little').tobytes()).decode('ascii')
+        return payload
+    
+    def _heatmap_data(
+        self,
+        matrix: Optional[PackedSymmetricMatrix],
+        clusters: Optional[CorrelationClusters] = None,
+        threshold: Optional[float] = None
+    ):
+        """
+        Prépare une matrice pour la heatmap, dans l'ordre des clusters.
+        
+        Args:
+            matrix: Matrice empaquetée
+            clusters: Classification (ordre des stratégies, bornes)
+            threshold: Seuil de corrélation (cf. _encode_heatmap; None pour le delta)
+            
+        Returns:
+            Tuple (stratégies, noms courts, matrice encodée (cf. _encode_heatmap),
+            bornes [début, fin) des clusters de 2+ stratégies)
+        """
+        if matrix is None or matrix.empty:
+            return [], [], self._encode_heatmap(None), []
+        
+        bounds = []
+        if clusters is not None:
+            ordered = clusters.order_labels(list(matrix.labels))
+            if ordered != list(matrix.labels):
+                matrix = matrix.subset(ordered)
+            # Clusters contigus dans l'ordre des feuilles (stratégies non classées: aucun)
+            ids = [clusters.cluster_of(s) for s in ordered]
+            start = 0
+            for k in range(1, len(ids) + 1):
+                if k == len(ids) or ids[k] != ids[start]:
+                    if ids[start] is not None and k - start > 1:
+                        bounds.append([start, k])
+                    start = k
+        
+        strategies = list(matrix.labels)
+        # Créer noms courts (max 15 chars)
+        short_names = [s[:15] + '...' if len(s) > 15 else s for s in strategies]
+        
+        return strategies, short_names, self._encode_heatmap(matrix, threshold), bounds
+    
+    def _prepare_codrawdown_data(
+        self,
+        codrawdown: Optional[Union[pd.DataFrame, PackedSymmetricMatrix]],
+        pairs: Optional[List[Dict]],
+        clusters: Optional[CorrelationClusters] = None
+    ) -> Dict[str, Any]:
+        """
+        Prépare la heatmap de co-drawdown et les paires à risque caché.
+        
+        Returns:
+            Dict strat, short, data, bounds (heatmap), pairs (vide si non calculée)
+        """
+        strategies, short_names, payload, bounds = self._heatmap_data(
+            self._packed(codrawdown), clusters, self.config.get('correlation_threshold', 0.70)
+        )
+        return {
+            'strat': strategies,
+            'short': short_names,
+            'data': payload,
+            'bounds': bounds,
+            'pairs': [
+                {
+                    'Strategy_1': p['Strategy_1'],
+                    'Strategy_2': p['Strategy_2'],
+                    'Corr_LT': float(p['Corr_LT']),
+                    'Corr_DD': float(p['Corr_DD']),
+                    'Delta': float(p['Delta']),
+                }
+                for p in (pairs or [])
+            ],
+        }
+    
+    def _prepare_aggregated_data(
+        self,
+        aggregated: Optional[Dict[str, Union[pd.DataFrame, PackedSymmetricMatrix]]],
+        scores: Optional[pd.DataFrame],
+        clusters: Optional[CorrelationClusters] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Prépare les matrices agrégées (heatmap) et les N_Corr par niveau.
+        
+        Returns:
+            Liste de dicts key, label, strat, short, data, bounds (heatmap), n_corr (stratégie → N)
+        """
+        levels = []
+        for level, matrix in (aggregated or {}).items():
+            packed = self._packed(matrix)
+            if packed is None or packed.empty:
+                continue
+            strategies, short_names, payload, bounds = self._heatmap_data(
+                packed, clusters, self.config.get('correlation_threshold', 0.70)
+            )
+            column = f'N_Corr_{level}'
+            n_corr = {}
+            if scores is not None and column in scores.columns:
+                n_corr = dict(zip(scores['Strategy'], scores[column].astype(int).tolist()))
+            levels.append({
+                'key': level,
+                'label': AGGREGATION_CONFIG['labels'].get(level, level),
+                'strat': strategies,
+                'short': short_names,
+                'data': payload,
+                'bounds': bounds,
+                'n_corr': n_corr,
+            })
+        return levels
+    
     def _build_html(
         self,
         data: Dict[str, Any],
@@ -258,7 +480,7 @@ class CorrelationDashboardGenerator:
         
         # Générer les sections
         css = self._generate_css()
-        nav_html = self._generate_nav()
+        nav_html = self._generate_nav(bool(data.get('aggregated')), bool(data['codrawdown']['strat']))
         summary_html = self._generate_summary_tab(
             n_total, n_diversifiant, n_modere, n_correle, n_tres_correle,
             stats_lt, stats_ct, config
@@ -267,6 +489,9 @@ class CorrelationDashboardGenerator:
         longterm_html = self._generate_matrix_tab('longterm', 'Long Terme', stats_lt, config)
         recent_html = self._generate_matrix_tab('recent', 'Court Terme', stats_ct, config)
         comparison_html = self._generate_comparison_tab(stats_lt, stats_ct)
+        sensitivity_html = self._generate_sensitivity_tab(config)
+        aggregation_html = self._generate_aggregation_tab(data.get('aggregated', []), config)
+        codrawdown_html = self._generate_codrawdown_tab(data['codrawdown'], config)
         methodology_html = self._generate_methodology_tab(config)
         js_code = self._generate_javascript(data)
         
@@ -288,6 +513,9 @@ class CorrelationDashboardGenerator:
     {longterm_html}
     {recent_html}
     {comparison_html}
+    {sensitivity_html}
+    {aggregation_html}
+    {codrawdown_html}
     {methodology_html}
     
     {js_code}
@@ -541,14 +769,21 @@ class CorrelationDashboardGenerator:
         }
     </style>'''
     
-    def _generate_nav(self) -> str:
-        """Génère la barre de navigation."""
-        return '''<nav class="nav">
+    def _generate_nav(self, has_aggregated: bool = False, has_codrawdown: bool = False) -> str:
+        """Génère la barre de navigation (onglets Agrégation / Co-drawdown si calculés)."""
+        optional_tabs = (
+            '\n        <button class="tab" onclick="showTab(\'aggregation\')">🗓️ Agrégation</button>'
+            if has_aggregated else ''
+        )
+        if has_codrawdown:
+            optional_tabs += '\n        <button class="tab" onclick="showTab(\'codrawdown\')">🌊 Co-drawdown</button>'
+        return f'''<nav class="nav">
         <button class="tab active" onclick="showTab('summary')">📊 Résumé</button>
         <button class="tab" onclick="showTab('scores')">🎯 Scores</button>
         <button class="tab" onclick="showTab('longterm')">📈 Long Terme</button>
         <button class="tab" onclick="showTab('recent')">📉 Court Terme</button>
         <button class="tab" onclick="showTab('comparison')">⚖️ Comparaison</button>
+        <button class="tab" onclick="showTab('sensitivity')">🎚️ Sensibilité</button>{optional_tabs}
         <button class="tab" onclick="showTab('methodology')">📖 Méthodologie</button>
     </nav>'''
     
@@ -691,6 +926,17 @@ class CorrelationDashboardGenerator:
         
         period_desc = f"Depuis {config.get('start_year_longterm', 2012)}" if tab_id == "longterm" else f"{config.get('recent_months', 12)} derniers mois"
         
+        clusters_html = ''
+        if tab_id == "longterm":
+            clusters_html = f'''<h3>🧩 Clusters de stratégies (lien moyen, |corrélation| moyenne ≥ {config.get('correlation_threshold', 0.70)})</h3>
+            <div class="table-container">
+                <table id="clustersTable">
+                    <thead><tr><th>Cluster</th><th>Taille</th><th>Corr. moyenne</th><th>Stratégies</th></tr></thead>
+                    <tbody></tbody>
+                </table>
+            </div>
+            '''
+        
         return f'''<div id="{tab_id}" class="tab-content">
         <div class="container">
             <h1>{icon} Matrice de Corrélation - {title}</h1>
@@ -724,6 +970,7 @@ class CorrelationDashboardGenerator:
                 </div>
             </div>
             
+            {clusters_html}
             <h3>🔝 Paires les plus corrélées</h3>
             <div class="table-container">
                 <table id="{most_table}">
@@ -786,6 +1033,97 @@ class CorrelationDashboardGenerator:
         </div>
     </div>'''
     
+    def _generate_sensitivity_tab(self, config: Dict) -> str:
+        """Génère l'onglet Sensibilité au seuil."""
+        return f'''<div id="sensitivity" class="tab-content">
+        <div class="container">
+            <h1>🎚️ Sensibilité au seuil de corrélation</h1>
+            <p class="subtitle">Scores Davey recalculés pour chaque seuil sur les mêmes matrices (seuil de l'analyse: {config.get('correlation_threshold', 0.70)})</p>
+            
+            <h2>Distribution des statuts par seuil</h2>
+            <div class="table-container">
+                <table id="sweepDistribution">
+                    <thead></thead>
+                    <tbody></tbody>
+                </table>
+            </div>
+            
+            <h2>Courbe de sensibilité par stratégie</h2>
+            <div class="controls">
+                <div class="control-group">
+                    <label>Stratégie:</label>
+                    <input type="text" id="sweepStrategy" list="sweepStrategies" placeholder="Nom de stratégie..." onchange="renderSweepCurve()">
+                    <datalist id="sweepStrategies"></datalist>
+                </div>
+            </div>
+            <div class="heatmap-container">
+                <canvas id="sweepCurve"></canvas>
+            </div>
+        </div>
+    </div>'''
+    
+    def _generate_aggregation_tab(self, levels: List[Dict[str, Any]], config: Dict) -> str:
+        """Génère l'onglet Agrégation (vide si aucune matrice agrégée)."""
+        if not levels:
+            return ''
+        
+        heatmaps = ''.join(f'''
+            <h2>{level['label']} - {len(level['strat'])} stratégies</h2>
+            <div class="heatmap-container">
+                <canvas id="heatmapAgg{level['key']}"></canvas>
+                <div class="legend">
+                    <span>-1</span>
+                    <div class="legend-gradient legend-corr"></div>
+                    <span>+1</span>
+                </div>
+            </div>
+            ''' for level in levels)
+        headers = ''.join(f"<th>N Corr {level['label']}</th>" for level in levels)
+        
+        return f'''<div id="aggregation" class="tab-content">
+        <div class="container">
+            <h1>🗓️ Corrélations des profits agrégés</h1>
+            <p class="subtitle">Profits sommés par semaine / mois depuis {config.get('start_year_longterm', 2012)}: des pertes de la même semaine, à des jours différents, deviennent visibles</p>
+            {heatmaps}
+            <h2>Stratégies les plus corrélées une fois agrégées</h2>
+            <p class="subtitle">N Corr = nombre de stratégies avec |corrélation| > {config.get('correlation_threshold', 0.70)}, trié par écart au journalier (LT)</p>
+            <div class="table-container">
+                <table id="aggregationTable">
+                    <thead><tr><th>Stratégie</th><th>N Corr LT</th>{headers}<th>Écart max</th></tr></thead>
+                    <tbody></tbody>
+                </table>
+            </div>
+        </div>
+    </div>'''
+    
+    def _generate_codrawdown_tab(self, codrawdown: Dict[str, Any], config: Dict) -> str:
+        """Génère l'onglet Co-drawdown (vide si non calculé)."""
+        if not codrawdown['strat']:
+            return ''
+        return f'''<div id="codrawdown" class="tab-content">
+        <div class="container">
+            <h1>🌊 Corrélation de co-drawdown</h1>
+            <p class="subtitle">Corrélation restreinte aux jours où les deux stratégies ont tradé en étant en drawdown (depuis {config.get('start_year_longterm', 2012)}) - {len(codrawdown['strat'])} stratégies</p>
+            
+            <div class="heatmap-container">
+                <canvas id="heatmapDD"></canvas>
+                <div class="legend">
+                    <span>-1</span>
+                    <div class="legend-gradient legend-corr"></div>
+                    <span>+1</span>
+                </div>
+            </div>
+            
+            <h2>⚠️ Risque caché: co-drawdown bien supérieur à la corrélation LT</h2>
+            <div class="table-container">
+                <table id="codrawdownPairs">
+                    <thead><tr><th>Stratégie 1</th><th>Stratégie 2</th><th>Corr. LT</th><th>Corr. drawdown</th><th>Écart</th></tr></thead>
+                    <tbody></tbody>
+                </table>
+            </div>
+        </div>
+    </div>'''
+    
     def _generate_methodology_tab(self, config: Dict) -> str:
         """Génère l'onglet Méthodologie."""
         return f'''<div id="methodology" class="tab-content">
@@ -860,14 +1198,20 @@ class CorrelationDashboardGenerator:
         const stratLT = {json.dumps(data['strat_lt'], ensure_ascii=False)};
         const shortLT = {json.dumps(data['short_lt'], ensure_ascii=False)};
         const dataLT = {json.dumps(data['data_lt'])};
+        const boundsLT = {json.dumps(data['bounds_lt'])};
         
         const stratCT = {json.dumps(data['strat_ct'], ensure_ascii=False)};
         const shortCT = {json.dumps(data['short_ct'], ensure_ascii=False)};
         const dataCT = {json.dumps(data['data_ct'])};
+        const boundsCT = {json.dumps(data['bounds_ct'])};
         
         const stratDelta = {json.dumps(data['strat_delta'], ensure_ascii=False)};
         const shortDelta = {json.dumps(data['short_delta'], ensure_ascii=False)};
         const dataDelta = {json.dumps(data['data_delta'])};
+        const boundsDelta = {json.dumps(data['bounds_delta'])};
+        
+        // Clusters (classification hiérarchique LT)
+        const clustersData = {json.dumps(data['clusters_list'], ensure_ascii=False)};
         
         // Paires
         const mostCorrLTData = {json.dumps(data['most_lt'], ensure_ascii=False)};
@@ -876,6 +1220,15 @@ class CorrelationDashboardGenerator:
         const leastCorrCTData = {json.dumps(data['least_ct'], ensure_ascii=False)};
         const biggestChangesData = {json.dumps(data['changes_list'], ensure_ascii=False)};
         
+        // Sensibilité au seuil
+        const sweepData = {json.dumps(data.get('sweep', {}), ensure_ascii=False)};
+        
+        // Co-drawdown
+        const codrawdownData = {json.dumps(data['codrawdown'], ensure_ascii=False)};
+        
+        // Corrélations agrégées (semaine / mois)
+        const aggregatedData = {json.dumps(data.get('aggregated', []), ensure_ascii=False)};
+        
         // ===== NAVIGATION =====
         function showTab(tabId) {{
             document.querySelectorAll('.tab').forEach(t => t.classList.remove('active'));
@@ -883,41 +1236,84 @@ class CorrelationDashboardGenerator:
             document.querySelector(`[onclick="showTab('${{tabId}}')"]`).classList.add('active');
             document.getElementById(tabId).classList.add('active');
             
-            if (tabId === 'longterm') renderHeatmap('heatmapLT', stratLT, shortLT, dataLT, 'corr');
-            if (tabId === 'recent') renderHeatmap('heatmapCT', stratCT, shortCT, dataCT, 'corr');
-            if (tabId === 'comparison') renderHeatmap('heatmapDelta', stratDelta, shortDelta, dataDelta, 'delta');
+            if (tabId === 'longterm') renderHeatmap('heatmapLT', stratLT, shortLT, dataLT, 'corr', boundsLT);
+            if (tabId === 'recent') renderHeatmap('heatmapCT', stratCT, shortCT, dataCT, 'corr', boundsCT);
+            if (tabId === 'comparison') renderHeatmap('heatmapDelta', stratDelta, shortDelta, dataDelta, 'delta', boundsDelta);
+            if (tabId === 'sensitivity') renderSweepCurve();
+            if (tabId === 'codrawdown') renderHeatmap('heatmapDD', codrawdownData.strat, codrawdownData.short, codrawdownData.data, 'corr', codrawdownData.bounds);
+            if (tabId === 'aggregation') aggregatedData.forEach(a => renderHeatmap('heatmapAgg' + a.key, a.strat, a.short, a.data, 'corr', a.bounds));
         }}
         
         // ===== HEATMAP =====
+        const NAN_COLOR = [128, 128, 128, 77];
+        
         function getColorCorr(value) {{
-            if (isNaN(value) || value === null) return 'rgba(128,128,128,0.3)';
-            let r, g, b;
+            if (isNaN(value)) return NAN_COLOR;
             if (value < 0) {{
                 const t = (value + 1);
-                r = 211; g = Math.round(47 + t * 188); b = Math.round(47 + t * 12);
-            }} else {{
-                const t = value;
-                r = Math.round(255 - t * 179); g = Math.round(235 - t * 60); b = Math.round(59 + t * 21);
+                return [211, Math.round(47 + t * 188), Math.round(47 + t * 12), 255];
             }}
-            return `rgb(${{r}},${{g}},${{b}})`;
+            const t = value;
+            return [Math.round(255 - t * 179), Math.round(235 - t * 60), Math.round(59 + t * 21), 255];
         }}
         
         function getColorDelta(value) {{
-            if (isNaN(value) || value === null) return 'rgba(128,128,128,0.3)';
+            if (isNaN(value)) return NAN_COLOR;
             const clamped = Math.max(-0.5, Math.min(0.5, value));
             const t = (clamped + 0.5);
-            let r, g, b;
             if (t < 0.5) {{
                 const s = t * 2;
-                r = Math.round(33 + s * 222); g = Math.round(150 + s * 105); b = Math.round(243 + s * 12);
-            }} else {{
-                const s = (t - 0.5) * 2;
-                r = 255; g = Math.round(255 - s * 111); b = Math.round(255 - s * 187);
+                return [Math.round(33 + s * 222), Math.round(150 + s * 105), Math.round(243 + s * 12), 255];
+            }}
+            const s = (t - 0.5) * 2;
+            return [255, Math.round(255 - s * 111), Math.round(255 - s * 187), 255];
+        }}
+        
+        // Matrice encodée (diagonale puis triangle supérieur, base64) → Float32Array n×n (décodée une fois)
+        // Indicateurs exacts |v| > seuil (1 bit par valeur, même ordre) → payload.above_n (Uint8Array n×n)
+        function decodeMatrix(payload, n) {{
+            if (payload.decoded) return payload.decoded;
+            const bytes = Uint8Array.from(atob(payload.values), c => c.charCodeAt(0));
+            const raw = payload.encoding === 'int8' ? new Int8Array(bytes.buffer) : new Float32Array(bytes.buffer);
+            const decode = payload.encoding === 'int8'
+                ? (q => q === -128 ? NaN : q * payload.scale)
+                : (v => v);
+            const bits = payload.above ? Uint8Array.from(atob(payload.above), c => c.charCodeAt(0)) : null;
+            const flag = k => (bits[k >> 3] >> (k & 7)) & 1;
+            const matrix = new Float32Array(n * n);
+            const above = bits ? new Uint8Array(n * n) : null;
+            for (let i = 0; i < n; i++) {{
+                matrix[i * n + i] = decode(raw[i]);
+                if (above) above[i * n + i] = flag(i);
+            }}
+            let k = n;
+            for (let i = 0; i < n; i++) {{
+                for (let j = i + 1; j < n; j++, k++) {{
+                    const v = decode(raw[k]);
+                    matrix[i * n + j] = v;
+                    matrix[j * n + i] = v;
+                    if (above) above[i * n + j] = above[j * n + i] = flag(k);
+                }}
             }}
-            return `rgb(${{r}},${{g}},${{b}})`;
+            payload.decoded = matrix;
+            payload.above_n = above;
+            return matrix;
+        }}
+        
+        // Valeur affichée: du bon côté du seuil selon l'indicateur exact (erreur int8 ± scale/2)
+        function thresholdSide(value, isAbove, threshold) {{
+            const magnitude = Math.abs(value);
+            if (isAbove && magnitude <= threshold) return Math.sign(value || 1) * (threshold + 1e-4);
+            if (!isAbove && magnitude > threshold) return Math.sign(value) * threshold;
+            return value;
+        }}
+        
+        // Texte d'une valeur décodée: 3 décimales si exacte, sinon résolution de l'encodage
+        function formatHeatmapValue(payload, value) {{
+            return payload.encoding === 'int8' ? '≈' + value.toFixed(2) : value.toFixed(3);
         }}
         
-        function renderHeatmap(canvasId, strategies, shortNames, dataPoints, colorType) {{
+        function renderHeatmap(canvasId, strategies, shortNames, payload, colorType, bounds) {{
             const canvas = document.getElementById(canvasId);
             if (!canvas) return;
             const ctx = canvas.getContext('2d');
@@ -938,21 +1334,29 @@ class CorrelationDashboardGenerator:
             canvas.width = margin.left + n * cellSize + margin.right;
             canvas.height = margin.top + n * cellSize + margin.bottom;
             
-            const matrix = {{}};
-            dataPoints.forEach(p => {{
-                if (!matrix[p.y]) matrix[p.y] = {{}};
-                matrix[p.y][p.x] = p.v;
-            }});
-            
+            const matrix = decodeMatrix(payload, n);
+            const above = payload.above_n;
             const getColor = colorType === 'delta' ? getColorDelta : getColorCorr;
             
-            for (let i = 0; i < n; i++) {{
-                for (let j = 0; j < n; j++) {{
-                    const val = matrix[i]?.[j];
-                    ctx.fillStyle = getColor(val);
-                    ctx.fillRect(margin.left + j * cellSize, margin.top + i * cellSize, cellSize - 1, cellSize - 1);
-                }}
+            // Un pixel par cellule, puis agrandissement sans lissage sur le canvas
+            const pixels = new ImageData(n, n);
+            for (let k = 0; k < n * n; k++) {{
+                const value = above ? thresholdSide(matrix[k], above[k], payload.threshold) : matrix[k];
+                pixels.data.set(getColor(value), 4 * k);
             }}
+            const cells = document.createElement('canvas');
+            cells.width = n; cells.height = n;
+            cells.getContext('2d').putImageData(pixels, 0, 0);
+            ctx.imageSmoothingEnabled = false;
+            ctx.drawImage(cells, margin.left, margin.top, n * cellSize, n * cellSize);
+            
+            // Contours des clusters (blocs diagonaux)
+            ctx.strokeStyle = '#e6edf3';
+            ctx.lineWidth = 1;
+            (bounds || []).forEach(([start, stop]) => {{
+                const size = (stop - start) * cellSize - 1;
+                ctx.strokeRect(margin.left + start * cellSize - 0.5, margin.top + start * cellSize - 0.5, size + 1, size + 1);
+            }});
             
             ctx.fillStyle = '#90a4ae';
             ctx.font = `${{Math.max(6, Math.min(9, cellSize - 1))}}px sans-serif`;
@@ -983,13 +1387,16 @@ class CorrelationDashboardGenerator:
                 const row = Math.floor(y / cellSize);
                 
                 if (col >= 0 && col < n && row >= 0 && row < n) {{
-                    const val = matrix[row]?.[col];
-                    if (val !== undefined) {{
+                    const val = matrix[row * n + col];
+                    if (!isNaN(val)) {{
                         tooltip.style.display = 'block';
                         tooltip.style.left = (e.clientX + 15) + 'px';
                         tooltip.style.top = (e.clientY + 15) + 'px';
                         const label = colorType === 'delta' ? 'Delta' : 'Corrélation';
-                        tooltip.innerHTML = `<strong>${{strategies[row]}}</strong><br>vs<br><strong>${{strategies[col]}}</strong><br><br>${{label}}: <strong>${{val.toFixed(3)}}</strong>`;
+                        const side = above && row !== col
+                            ? `<br>${{above[row * n + col] ? '🔴 corrélées' : '🟢 non corrélées'}} (|corr| ${{above[row * n + col] ? '>' : '≤'}} ${{payload.threshold}})`
+                            : '';
+                        tooltip.innerHTML = `<strong>${{strategies[row]}}</strong><br>vs<br><strong>${{strategies[col]}}</strong><br><br>${{label}}: <strong>${{formatHeatmapValue(payload, val)}}</strong>${{side}}`;
                     }} else {{
                         tooltip.style.display = 'none';
                     }}
@@ -1047,6 +1454,44 @@ class CorrelationDashboardGenerator:
             }});
         }}
         
+        function populateCodrawdownTable() {{
+            const tbody = document.querySelector('#codrawdownPairs tbody');
+            if (!tbody) return;
+            tbody.innerHTML = '';
+            codrawdownData.pairs.forEach(row => {{
+                const tr = document.createElement('tr');
+                tr.innerHTML = `
+                    <td style="font-size:0.85em;">${{row.Strategy_1}}</td>
+                    <td style="font-size:0.85em;">${{row.Strategy_2}}</td>
+                    <td>${{row.Corr_LT.toFixed(3)}}</td>
+                    <td style="color:#ef5350;font-weight:bold;">${{row.Corr_DD.toFixed(3)}}</td>
+                    <td>+${{row.Delta.toFixed(3)}}</td>
+                `;
+                tbody.appendChild(tr);
+            }});
+        }}
+        
+        function populateClustersTable() {{
+            const tbody = document.querySelector('#clustersTable tbody');
+            if (!tbody) return;
+            tbody.innerHTML = '';
+            if (clustersData.length === 0) {{
+                tbody.innerHTML = '<tr><td colspan="4" style="text-align:center;">Aucun cluster de 2+ stratégies</td></tr>';
+                return;
+            }}
+            clustersData.forEach(row => {{
+                const tr = document.createElement('tr');
+                const mean = row.Mean_Corr === null ? 'N/A' : row.Mean_Corr.toFixed(3);
+                tr.innerHTML = `
+                    <td>#${{row.Cluster}}</td>
+                    <td>${{row.Size}}</td>
+                    <td>${{mean}}</td>
+                    <td style="font-size:0.85em;">${{row.Strategies.join(', ')}}</td>
+                `;
+                tbody.appendChild(tr);
+            }});
+        }}
+        
         function populatePairsTable(tableId, data) {{
             const tbody = document.querySelector(`#${{tableId}} tbody`);
             if (!tbody || !data) return;
@@ -1068,6 +1513,118 @@ class CorrelationDashboardGenerator:
             }});
         }}
         
+        function populateAggregationTable() {{
+            const tbody = document.querySelector('#aggregationTable tbody');
+            if (!tbody) return;
+            const rows = scoresData.map(row => {{
+                const counts = aggregatedData.map(a => a.n_corr[row.Strategy] ?? 0);
+                return [row, counts, Math.max(...counts) - row.N_Corr_LT];
+            }});
+            rows.sort((a, b) => b[2] - a[2]);
+            tbody.innerHTML = '';
+            rows.slice(0, 30).forEach(([row, counts, gap]) => {{
+                const tr = document.createElement('tr');
+                tr.innerHTML = `<td>${{row.Strategy}}</td><td>${{row.N_Corr_LT}}</td>` +
+                    counts.map(c => `<td>${{c}}</td>`).join('') +
+                    `<td style="${{gap > 0 ? 'color:#ef5350;' : ''}}font-weight:bold;">${{gap > 0 ? '+' : ''}}${{gap}}</td>`;
+                tbody.appendChild(tr);
+            }});
+        }}
+        
+        // ===== SENSIBILITÉ AU SEUIL =====
+        const sweepStatuses = [
+            ['Diversifiant', '🟢'], ['Modéré', '🟡'], ['Corrélé', '🟠'], ['Très corrélé', '🔴']
+        ];
+        
+        function populateSweepDistribution() {{
+            const table = document.getElementById('sweepDistribution');
+            if (!table) return;
+            const thresholds = sweepData.thresholds || [];
+            if (thresholds.length === 0) {{
+                table.querySelector('tbody').innerHTML = '<tr><td style="text-align:center;">Aucun balayage disponible</td></tr>';
+                return;
+            }}
+            table.querySelector('thead').innerHTML = '<tr><th>Statut</th>' +
+                thresholds.map(t => `<th>${{t.toFixed(2)}}</th>`).join('') + '</tr>';
+            const tbody = table.querySelector('tbody');
+            tbody.innerHTML = '';
+            sweepStatuses.forEach(([status, emoji]) => {{
+                const counts = (sweepData.distribution || {{}})[status] || thresholds.map(() => 0);
+                const tr = document.createElement('tr');
+                const statusClass = 'status-' + status.toLowerCase().replace(/ /g, '-').replace(/é/g, 'e');
+                tr.innerHTML = `<td class="${{statusClass}}">${{emoji}} ${{status}}</td>` +
+                    counts.map(c => `<td>${{c}}</td>`).join('');
+                tbody.appendChild(tr);
+            }});
+            
+            const datalist = document.getElementById('sweepStrategies');
+            datalist.innerHTML = sweepData.strategies.map(s => `<option value="${{s}}">`).join('');
+            if (scoresData.length > 0) document.getElementById('sweepStrategy').value = scoresData[0].Strategy;
+        }}
+        
+        function renderSweepCurve() {{
+            const canvas = document.getElementById('sweepCurve');
+            if (!canvas) return;
+            const ctx = canvas.getContext('2d');
+            const thresholds = sweepData.thresholds || [];
+            const k = sweepData.strategies ? sweepData.strategies.indexOf(document.getElementById('sweepStrategy').value) : -1;
+            
+            canvas.width = Math.min(900, canvas.parentElement.clientWidth - 40);
+            canvas.height = 320;
+            ctx.clearRect(0, 0, canvas.width, canvas.height);
+            if (k < 0 || thresholds.length === 0) {{
+                ctx.fillStyle = '#90a4ae';
+                ctx.font = '14px sans-serif';
+                ctx.fillText('Sélectionnez une stratégie', 50, 50);
+                return;
+            }}
+            
+            const series = [
+                ['Score Davey', sweepData.score[k], '#58a6ff'],
+                ['N Corr LT', sweepData.n_lt[k], '#f0883e'],
+                ['N Corr CT', sweepData.n_ct[k], '#2ea043'],
+            ];
+            const margin = {{ top: 20, right: 20, bottom: 40, left: 50 }};
+            const w = canvas.width - margin.left - margin.right;
+            const h = canvas.height - margin.top - margin.bottom;
+            const yMax = Math.max(1, ...series.flatMap(s => s[1]));
+            const tMin = thresholds[0], tMax = thresholds[thresholds.length - 1];
+            const x = t => margin.left + (tMax > tMin ? (t - tMin) / (tMax - tMin) : 0.5) * w;
+            const y = v => margin.top + h - v / yMax * h;
+            
+            // Axes et graduations
+            ctx.strokeStyle = '#30363d';
+            ctx.fillStyle = '#8b949e';
+            ctx.font = '11px sans-serif';
+            ctx.textAlign = 'center';
+            thresholds.forEach(t => {{
+                ctx.beginPath(); ctx.moveTo(x(t), margin.top); ctx.lineTo(x(t), margin.top + h); ctx.stroke();
+                ctx.fillText(t.toFixed(2), x(t), margin.top + h + 16);
+            }});
+            ctx.textAlign = 'right';
+            [0, 0.5, 1].forEach(f => ctx.fillText((yMax * f).toFixed(1), margin.left - 6, y(yMax * f) + 4));
+            
+            // Seuil de l'analyse
+            const current = configData.correlation_threshold;
+            ctx.strokeStyle = '#f85149';
+            ctx.setLineDash([4, 4]);
+            ctx.beginPath(); ctx.moveTo(x(current), margin.top); ctx.lineTo(x(current), margin.top + h); ctx.stroke();
+            ctx.setLineDash([]);
+            
+            // Courbes
+            series.forEach(([label, values, color], s) => {{
+                ctx.strokeStyle = color;
+                ctx.lineWidth = 2;
+                ctx.beginPath();
+                values.forEach((v, i) => i === 0 ? ctx.moveTo(x(thresholds[i]), y(v)) : ctx.lineTo(x(thresholds[i]), y(v)));
+                ctx.stroke();
+                ctx.fillStyle = color;
+                ctx.textAlign = 'left';
+                ctx.fillText(label, margin.left + 10 + s * 110, margin.top + 4);
+            }});
+            ctx.lineWidth = 1;
+        }}
+        
         // ===== FILTERING & SORTING =====
         let sortColumn = 1;
         let sortAsc = false;
@@ -1126,6 +1683,10 @@ class CorrelationDashboardGenerator:
             populatePairsTable('mostCorrCT', mostCorrCTData);
             populatePairsTable('leastCorrCT', leastCorrCTData);
             populatePairsTable('biggestChanges', biggestChangesData);
+            populateSweepDistribution();
+            populateAggregationTable();
+            populateClustersTable();
+            populateCodrawdownTable();
             
             const deltaMean = (statsCT.corr_mean - statsLT.corr_mean).toFixed(3);
             document.getElementById('deltaMean').textContent = (deltaMean >= 0 ? '+' : '') + deltaMean;
@@ -0,0 +1,472 @@
+"""
+Explorateur de corrélation: une application HTML + un fragment par stratégie.
+
+Alternative aux pages individuelles (CorrelationPagesGenerator): au lieu de
+répéter feuille de style, scripts et template dans chaque page, une seule
+application statique charge à la demande le fragment de la stratégie ouverte
+(profil, tops, distribution, alertes, corrélation glissante, cluster).
+
+Fichiers produits dans le répertoire de sortie:
+    correlation_explorer.html          application (identique d'une exécution à l'autre)
+    correlation_shards/index.js        liste des stratégies, paramètres, empreintes
+    correlation_shards/<stratégie>.js  profil d'une stratégie
+
+Les fragments sont du JSON passé à une fonction de rappel (explorerShard(...))
+et chargés par balise <script>: l'explorateur fonctionne ouvert depuis le
+disque (file://), où fetch() est bloqué. Un fichier n'est réécrit que si son
+contenu change; l'empreinte de chaque fragment dans l'index invalide le cache
+du navigateur pour les seuls fragments modifiés. Les fragments des stratégies
+disparues sont supprimés.
+
+Utilisation:
+    explorer = CorrelationExplorerGenerator(analyzer)
+    stats = explorer.generate(output_dir)
+"""
+
+import hashlib
+import json
+import math
+from pathlib import Path
+from typing import Any, Dict
+
+import numpy as np
+
+from ..utils.templates import Markup, compile_template
+from .correlation_pages import PAGE_STYLE, CorrelationPagesGenerator
+
+
+EXPLORER_FILE = 'correlation_explorer.html'
+SHARDS_DIR = 'correlation_shards'
+
+# Application (fragments chargés à la demande), compilée une fois
+EXPLORER_TEMPLATE = compile_template('''<!DOCTYPE html>
+<html lang="fr">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Explorateur de Corrélation</title>
+    <style>
+{page_style}        .explorer {{ display: grid; grid-template-columns: 280px 1fr; gap: 20px; max-width: 1500px; margin: 0 auto; }}
+        .sidebar {{
+            background: #161b22;
+            border: 1px solid #30363d;
+            border-radius: 8px;
+            padding: 16px;
+            height: calc(100vh - 40px);
+            position: sticky;
+            top: 20px;
+            display: flex;
+            flex-direction: column;
+        }}
+        .sidebar input {{
+            width: 100%;
+            padding: 8px 10px;
+            background: #0d1117;
+            border: 1px solid #30363d;
+            border-radius: 6px;
+            color: #c9d1d9;
+            margin: 10px 0;
+        }}
+        .strategy-list {{ overflow-y: auto; flex: 1; }}
+        .strategy-list a {{
+            display: flex;
+            justify-content: space-between;
+            gap: 8px;
+            padding: 6px 8px;
+            color: #c9d1d9;
+            text-decoration: none;
+            border-radius: 4px;
+            font-size: 0.85em;
+        }}
+        .strategy-list a:hover, .strategy-list a.active {{ background: #21262d; }}
+        .strategy-list .score {{ color: #8b949e; white-space: nowrap; }}
+        .explorer .container {{ max-width: none; margin: 0; }}
+        .placeholder {{ color: #8b949e; text-align: center; padding: 60px 0; }}
+        @media (max-width: 768px) {{
+            .explorer {{ grid-template-columns: 1fr; }}
+            .sidebar {{ position: static; height: 40vh; }}
+        }}
+    </style>
+</head>
+<body>
+    <div class="explorer">
+        <aside class="sidebar">
+            <h1>🔗 Corrélations</h1>
+            <div class="subtitle" id="summary"></div>
+            <input type="search" id="search" placeholder="Rechercher une stratégie...">
+            <div class="strategy-list" id="strategyList"></div>
+        </aside>
+        <main class="container" id="detail">
+            <p class="placeholder">Sélectionner une stratégie</p>
+        </main>
+    </div>
+    
+    <script>
+        const SHARDS = '{shards_dir}';
+        const shards = {{}};
+        const pending = {{}};
+        let index = null;
+        
+        function loadScript(src) {{
+            return new Promise((resolve, reject) => {{
+                const script = document.createElement('script');
+                script.src = src;
+                script.onload = () => {{ script.remove(); resolve(); }};
+                script.onerror = () => {{ script.remove(); reject(new Error(src)); }};
+                document.head.appendChild(script);
+            }});
+        }}
+        
+        // Les fragments s'enregistrent à leur chargement (compatible file://, sans fetch)
+        window.explorerIndex = data => {{ index = data; }};
+        window.explorerShard = data => {{
+            if (pending[data.strategy_id]) pending[data.strategy_id](data);
+        }};
+        
+        // Fragment d'une stratégie, chargé à la première ouverture (version = empreinte du contenu)
+        function loadShard(entry) {{
+            if (!shards[entry.id]) {{
+                shards[entry.id] = new Promise((resolve, reject) => {{
+                    pending[entry.id] = resolve;
+                    loadScript(`${{SHARDS}}/${{encodeURIComponent(entry.file)}}?v=${{entry.version}}`).catch(err => {{
+                        delete shards[entry.id];
+                        reject(err);
+                    }});
+                }});
+            }}
+            return shards[entry.id];
+        }}
+        
+        function esc(text) {{
+            return String(text).replace(/[&<>"']/g, c => ({{'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'}}[c]));
+        }}
+        
+        function fmt(v, digits = 3) {{ return v === null || v === undefined ? 'N/A' : Number(v).toFixed(digits); }}
+        
+        function getCorrClass(v) {{
+            if (!v) return '';
+            const a = Math.abs(v);
+            return a >= 0.7 ? 'corr-high' : a >= 0.5 ? 'corr-medium' : 'corr-low';
+        }}
+        
+        function fmtCorr(v) {{ return v !== null ? v.toFixed(3) : '-'; }}
+        
+        function fmtDelta(v) {{
+            if (!v) return '-';
+            const cls = v > 0.05 ? 'delta-positive' : v < -0.05 ? 'delta-negative' : '';
+            return `<span class="${{cls}}">${{v>=0?'+':''}}${{v.toFixed(3)}}</span>`;
+        }}
+        
+        // ===== LISTE DES STRATÉGIES =====
+        function renderList() {{
+            const query = document.getElementById('search').value.trim().toLowerCase();
+            const current = decodeURIComponent(location.hash.slice(1));
+            document.getElementById('strategyList').innerHTML = index.strategies
+                .filter(s => !query || s.id.toLowerCase().includes(query) || String(s.symbol).toLowerCase().includes(query))
+                .map(s => `<a href="#${{encodeURIComponent(s.id)}}" class="${{s.id === current ? 'active' : ''}}">
+                    <span>${{s.status_emoji}} ${{esc(s.id)}}</span><span class="score">${{fmt(s.score_davey, 1)}}</span>
+                </a>`).join('');
+        }}
+        
+        // ===== PROFIL D'UNE STRATÉGIE =====
+        function statsCard(value, label) {{
+            return `<div class="stat-card"><div class="stat-value">${{value}}</div><div class="stat-label">${{label}}</div></div>`;
+        }}
+        
+        function distributionHtml(dist) {{
+            const total = Object.values(dist).reduce((a, b) => a + b, 0);
+            if (total === 0) return '';
+            const pct = v => (v / total * 100).toFixed(1);
+            return `
+                <div class="dist-bar">
+                    <div class="dist-segment dist-very-neg" style="width:${{pct(dist.very_negative)}}%">${{dist.very_negative}}</div>
+                    <div class="dist-segment dist-neg" style="width:${{pct(dist.negative)}}%">${{dist.negative}}</div>
+                    <div class="dist-segment dist-neutral" style="width:${{pct(dist.neutral)}}%">${{dist.neutral}}</div>
+                    <div class="dist-segment dist-pos" style="width:${{pct(dist.positive)}}%">${{dist.positive}}</div>
+                    <div class="dist-segment dist-very-pos" style="width:${{pct(dist.very_positive)}}%">${{dist.very_positive}}</div>
+                </div>
+                <div style="font-size:0.85em;color:#8b949e;margin-top:8px;">
+                    🔵 r≤-0.7 (${{dist.very_negative}}) • 🔷 -0.7<r≤-0.3 (${{dist.negative}}) • ⚪ -0.3<r<0.3 (${{dist.neutral}}) • 🟠 0.3≤r<0.7 (${{dist.positive}}) • 🔴 r≥0.7 (${{dist.very_positive}})
+                </div>`;
+        }}
+        
+        function rowsHtml(rows, last) {{
+            return rows.map(r => `<tr>
+                <td><a href="#${{encodeURIComponent(r.strategy)}}" style="color:#58a6ff">${{esc(r.strategy)}}</a></td>
+                <td>${{esc(r.symbol)}}</td>
+                <td class="${{getCorrClass(r.corr_lt)}}">${{fmtCorr(r.corr_lt)}}</td>
+                <td class="${{getCorrClass(r.corr_ct)}}">${{fmtCorr(r.corr_ct)}}</td>
+                <td>${{last(r)}}</td>
+            </tr>`).join('');
+        }}
+        
+        function drawRolling(rolling) {{
+            const canvas = document.getElementById('rollingChart');
+            const ctx = canvas.getContext('2d');
+            const w = canvas.width = canvas.clientWidth;
+            const h = canvas.height = canvas.clientHeight;
+            const pad = {{left: 40, right: 10, top: 10, bottom: 24}};
+            const n = rolling.dates.length;
+            const xAt = i => pad.left + (n > 1 ? i / (n - 1) : 0.5) * (w - pad.left - pad.right);
+            const yAt = v => pad.top + (1 - (v + 1) / 2) * (h - pad.top - pad.bottom);
+            const colors = ['#f85149', '#d29922', '#58a6ff', '#3fb950', '#bc8cff'];
+            
+            ctx.font = '11px sans-serif';
+            ctx.fillStyle = '#8b949e';
+            [-1, -0.5, 0, 0.5, 1].forEach(v => {{
+                ctx.strokeStyle = v === 0 ? '#30363d' : '#21262d';
+                ctx.beginPath(); ctx.moveTo(pad.left, yAt(v)); ctx.lineTo(w - pad.right, yAt(v)); ctx.stroke();
+                ctx.fillText(v.toFixed(1), 4, yAt(v) + 4);
+            }});
+            ctx.fillText(rolling.dates[0], pad.left, h - 6);
+            ctx.fillText(rolling.dates[n - 1], w - pad.right - 50, h - 6);
+            
+            const legend = document.getElementById('rollingLegend');
+            rolling.series.forEach((s, k) => {{
+                ctx.strokeStyle = colors[k % colors.length];
+                ctx.lineWidth = 1.5;
+                ctx.beginPath();
+                let drawing = false;
+                s.values.forEach((v, i) => {{
+                    if (v === null) {{ drawing = false; return; }}
+                    if (drawing) ctx.lineTo(xAt(i), yAt(v)); else ctx.moveTo(xAt(i), yAt(v));
+                    drawing = true;
+                }});
+                ctx.stroke();
+                legend.innerHTML += `<span style="color:${{colors[k % colors.length]}}">━ ${{esc(s.strategy)}}</span>`;
+            }});
+        }}
+        
+        function renderProfile(p) {{
+            const icons = {{'success': '✅', 'warning': '⚠️', 'danger': '🚨', 'info': '💡'}};
+            const statusClass = p.status.toLowerCase().replace(/ /g, '-').replace(/é/g, 'e');
+            const cluster = p.cluster && p.cluster.members.length ? `
+                <h2>🧩 Cluster #${{p.cluster.id}} (${{p.cluster.size}} stratégies, corr. moyenne ${{fmt(p.cluster.mean_corr)}})</h2>
+                <p class="subtitle">${{p.cluster.members.map(m => `<a href="#${{encodeURIComponent(m)}}" style="color:#58a6ff">${{esc(m)}}</a>`).join(', ')}}</p>` : '';
+            
+            document.getElementById('detail').innerHTML = `
+                <h1>📊 ${{esc(p.strategy_id)}}</h1>
+                <p class="subtitle">Analyse de Corrélation • Symbole: ${{esc(p.symbol)}}</p>
+                <div class="score-badge ${{statusClass}}">
+                    <span>${{p.status_emoji}} ${{esc(p.status)}}</span>
+                    <span>Score: ${{p.score_davey}}</span>
+                </div>
+                ${{p.alerts.map(a => `<div class="alert ${{a.type}}"><span>${{icons[a.type] || '📌'}} ${{esc(a.message)}}</span></div>`).join('')}}
+                
+                <h2>📈 Profil de Corrélation</h2>
+                <div class="stats-grid">
+                    ${{statsCard(p.n_corr_lt, 'Corrélées (LT)')}}
+                    ${{statsCard(p.n_corr_ct, 'Corrélées (CT)')}}
+                    ${{statsCard(fmt(p.avg_corr_lt), 'Moy. LT')}}
+                    ${{statsCard(fmt(p.avg_corr_ct), 'Moy. CT')}}
+                    ${{statsCard((p.delta_avg >= 0 ? '+' : '') + fmt(p.delta_avg), 'Delta (CT-LT)')}}
+                    ${{statsCard(fmt(p.max_corr_lt), 'Max LT')}}
+                </div>
+                
+                <h2>📊 Distribution des Corrélations</h2>
+                ${{distributionHtml(p.distribution)}}
+                ${{cluster}}
+                
+                <div id="rollingSection" style="display:${{p.rolling.series.length ? 'block' : 'none'}}">
+                    <h2>📉 Corrélation Glissante (${{p.rolling.window_months}} mois)</h2>
+                    <canvas id="rollingChart" class="rolling-chart"></canvas>
+                    <div id="rollingLegend" class="rolling-legend"></div>
+                </div>
+                
+                <h2>🔝 Top ${{p.most_correlated.length}} Stratégies les Plus Corrélées</h2>
+                <table>
+                    <thead><tr><th>Stratégie</th><th>Symbole</th><th>Corr. LT</th><th>Corr. CT</th><th>Delta</th></tr></thead>
+                    <tbody>${{rowsHtml(p.most_correlated, r => fmtDelta(r.delta))}}</tbody>
+                </table>
+                
+                <h2>🔻 Top ${{p.least_correlated.length}} Stratégies les Moins Corrélées</h2>
+                <table>
+                    <thead><tr><th>Stratégie</th><th>Symbole</th><th>Corr. LT</th><th>Corr. CT</th><th>Diversification</th></tr></thead>
+                    <tbody>${{rowsHtml(p.least_correlated, r => r.max_abs < 0.2 ? '⭐⭐⭐' : r.max_abs < 0.4 ? '⭐⭐' : '⭐')}}</tbody>
+                </table>
+                
+                <div style="margin-top:30px;padding-top:15px;border-top:1px solid #30363d;text-align:center;color:#6e7681;font-size:0.85em;">
+                    Seuil ${{index.config.threshold}} • LT depuis ${{index.config.start_year}} • CT ${{index.config.recent_months}} mois • Méthode Kevin Davey
+                </div>`;
+            
+            if (p.rolling.series.length) drawRolling(p.rolling);
+        }}
+        
+        function openFromHash() {{
+            renderList();
+            const id = decodeURIComponent(location.hash.slice(1));
+            const entry = index.strategies.find(s => s.id === id);
+            if (!entry) return;
+            loadShard(entry)
+                .then(profile => {{ if (decodeURIComponent(location.hash.slice(1)) === id) renderProfile(profile); }})
+                .catch(err => {{
+                    document.getElementById('detail').innerHTML = `<p class="placeholder">⚠️ Fragment introuvable: ${{esc(err.message)}}</p>`;
+                }});
+        }}
+        
+        loadScript(`${{SHARDS}}/index.js?t=${{Date.now()}}`).then(() => {{
+            const generated = index.run_timestamp ? ` • ${{index.run_timestamp.slice(0, 16).replace('T', ' ')}}` : '';
+            document.getElementById('summary').textContent = `${{index.strategies.length}} stratégies${{generated}}`;
+            document.getElementById('search').addEventListener('input', renderList);
+            window.addEventListener('hashchange', openFromHash);
+            openFromHash();
+        }}).catch(() => {{
+            document.getElementById('detail').innerHTML = '<p class="placeholder">⚠️ Index des fragments introuvable</p>';
+        }});
+    </script>
+</body>
+</html>''')
+
+
+def _jsonable(value: Any) -> Any:
+    """Convertit un profil en valeurs JSON strictes (scalaires numpy, NaN → None)."""
+    if isinstance(value, dict):
+        return {str(k): _jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(v) for v in value]
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+def _write_if_changed(path: Path, text: str) -> bool:
+    """Écrit le fichier si son contenu diffère. Retourne True si écrit."""
+    if path.exists() and path.read_text(encoding='utf-8') == text:
+        return False
+    path.write_text(text, encoding='utf-8')
+    return True
+
+
+class CorrelationExplorerGenerator:
+    """
+    Génère l'explorateur de corrélation et ses fragments par stratégie.
+    
+    Utilisation:
+        analyzer = CorrelationAnalyzer(data)
+        analyzer.run()
+        
+        explorer = CorrelationExplorerGenerator(analyzer)
+        stats = explorer.generate(output_dir)
+    """
+    
+    def __init__(self, analyzer):
+        """
+        Initialise le générateur.
+        
+        Args:
+            analyzer: Instance de CorrelationAnalyzer (doit avoir exécuté run())
+        """
+        self.analyzer = analyzer
+        self.pages = CorrelationPagesGenerator(analyzer)
+    
+    def generate(
+        self,
+        output_dir: Path,
+        top_n: int = 15,
+        verbose: bool = True
+    ) -> Dict[str, int]:
+        """
+        Génère l'explorateur et met à jour les fragments modifiés.
+        
+        Args:
+            output_dir: Répertoire de sortie
+            top_n: Nombre de stratégies dans les listes top/bottom
+            verbose: Afficher la progression
+            
+        Returns:
+            Dict avec statistiques : {'written': int, 'unchanged': int, 'removed': int,
+            'errors': int, 'total': int}
+        """
+        output_dir = Path(output_dir)
+        shards_dir = output_dir / SHARDS_DIR
+        shards_dir.mkdir(parents=True, exist_ok=True)
+        
+        if verbose:
+            print("\n" + "=" * 70)
+            print("🧭 GÉNÉRATION DE L'EXPLORATEUR DE CORRÉLATION")
+            print("=" * 70)
+        
+        strategies = self.analyzer.scores['Strategy'].tolist()
+        
+        self.pages._ensure_rolling_correlations(verbose)
+        self.pages._build_index()
+        
+        if verbose:
+            print(f"\n📊 {len(strategies)} fragments à préparer...")
+        
+        stats = {'written': 0, 'unchanged': 0, 'removed': 0, 'errors': 0, 'total': len(strategies)}
+        entries = []
+        
+        for strategy in strategies:
+            try:
+                profile = self.pages._calculate_profile(strategy, top_n)
+            except Exception as e:
+                if verbose:
+                    print(f"   ⚠️  Erreur pour {strategy}: {e}")
+                stats['errors'] += 1
+                continue
+            
+            shard = self._shard(profile)
+            filename = f"{self.pages._sanitize_filename(strategy)}.js"
+            written = _write_if_changed(shards_dir / filename, shard)
+            stats['written' if written else 'unchanged'] += 1
+            entries.append(self._index_entry(profile, filename, shard))
+        
+        # Fragments des stratégies disparues
+        kept = {entry['file'] for entry in entries} | {'index.js'}
+        for path in shards_dir.glob('*.js'):
+            if path.name not in kept:
+                path.unlink()
+                stats['removed'] += 1
+        
+        _write_if_changed(shards_dir / 'index.js', self._index_script(entries))
+        _write_if_changed(output_dir / EXPLORER_FILE, self._explorer_html())
+        
+        if verbose:
+            print(f"\n✅ {stats['written']} fragments écrits, {stats['unchanged']} inchangés, "
+                  f"{stats['removed']} supprimés")
+            if stats['errors'] > 0:
+                print(f"⚠️  {stats['errors']} erreurs rencontrées")
+            print(f"📁 Emplacement: {output_dir / EXPLORER_FILE}")
+        
+        return stats
+    
+    @staticmethod
+    def _shard(profile: Dict[str, Any]) -> str:
+        """Fragment d'une stratégie (profil sans les paramètres communs, déplacés dans l'index)."""
+        data = _jsonable({k: v for k, v in profile.items() if k != 'config'})
+        return f"explorerShard({json.dumps(data, ensure_ascii=False, separators=(',', ':'))});\n"
+    
+    @staticmethod
+    def _index_entry(profile: Dict[str, Any], filename: str, shard: str) -> Dict[str, Any]:
+        """Ligne de l'index: résumé pour la liste et empreinte du fragment."""
+        return _jsonable({
+            'id': profile['strategy_id'],
+            'file': filename,
+            'version': hashlib.sha1(shard.encode('utf-8')).hexdigest()[:12],
+            'symbol': profile['symbol'],
+            'score_davey': profile['score_davey'],
+            'status': profile['status'],
+            'status_emoji': profile['status_emoji'],
+        })
+    
+    def _index_script(self, entries) -> str:
+        """Index des fragments (stratégies dans l'ordre des scores, paramètres de l'analyse)."""
+        run_timestamp = getattr(self.analyzer, 'run_timestamp', None)
+        index = _jsonable({
+            'run_timestamp': run_timestamp.isoformat() if run_timestamp else None,
+            'config': {
+                'threshold': self.analyzer.correlation_threshold,
+                'start_year': self.analyzer.start_year_longterm,
+                'recent_months': self.analyzer.recent_months
+            },
+            'strategies': entries,
+        })
+        return f"explorerIndex({json.dumps(index, ensure_ascii=False, separators=(',', ':'))});\n"
+    
+    @staticmethod
+    def _explorer_html() -> str:
+        """Application de l'explorateur (sans données: réécrite seulement si le code change)."""
+        return EXPLORER_TEMPLATE.render(page_style=Markup(PAGE_STYLE), shards_dir=SHARDS_DIR)
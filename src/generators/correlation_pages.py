@@ -7,18 +7,391 @@ une page HTML par stratégie avec :
 - Top N stratégies les plus corrélées
 - Top N stratégies les moins corrélées (opportunités de diversification)
 - Distribution des corrélations
+- Évolution de la corrélation glissante avec les plus corrélées
+- Cluster de la stratégie (classification hiérarchique LT)
 - Alertes et recommandations
 
 Architecture:
     CorrelationAnalyzer (calculs) -> CorrelationPagesGenerator (HTML)
+
+Les profils sont calculés dans le processus principal à partir d'index
+construits une seule fois (position de chaque stratégie dans les scores,
+symboles, lignes de matrices alignées), les tops par argpartition; le rendu
+et l'écriture des pages sont répartis par lots sur un pool de processus.
 """
 
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List
-import json
+from typing import Dict, Any, List, Optional, Tuple
+import os
 import numpy as np
+import pandas as pd
 from datetime import datetime
 
+from ..utils.templates import Markup, compile_template, json_script
+
+
+# Feuille de style des pages de corrélation (partagée avec l'explorateur)
+PAGE_STYLE = """        * { margin: 0; padding: 0; box-sizing: border-box; }
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
+            background: #0d1117;
+            color: #c9d1d9;
+            line-height: 1.6;
+            padding: 20px;
+        }
+        .container {
+            max-width: 1200px;
+            margin: 0 auto;
+            background: #161b22;
+            border-radius: 8px;
+            padding: 30px;
+            border: 1px solid #30363d;
+        }
+        .nav { margin-bottom: 20px; }
+        .nav a {
+            display: inline-block;
+            padding: 8px 16px;
+            background: #21262d;
+            color: #58a6ff;
+            text-decoration: none;
+            border-radius: 6px;
+            margin-right: 8px;
+        }
+        .nav a:hover { background: #30363d; }
+        h1 { color: #c9d1d9; font-size: 1.8em; margin-bottom: 8px; }
+        .subtitle { color: #8b949e; margin-bottom: 20px; }
+        .score-badge {
+            display: inline-flex;
+            align-items: center;
+            gap: 10px;
+            padding: 12px 20px;
+            border-radius: 8px;
+            font-size: 1.2em;
+            font-weight: bold;
+            margin: 15px 0;
+        }
+        .score-badge.diversifiant { background: rgba(46, 160, 67, 0.2); color: #3fb950; }
+        .score-badge.modere { background: rgba(187, 128, 9, 0.2); color: #d29922; }
+        .score-badge.correle { background: rgba(219, 109, 40, 0.2); color: #f0883e; }
+        .score-badge.tres-correle { background: rgba(248, 81, 73, 0.2); color: #f85149; }
+        h2 {
+            color: #58a6ff;
+            font-size: 1.3em;
+            margin: 24px 0 12px;
+            padding-left: 12px;
+            border-left: 3px solid #58a6ff;
+        }
+        .stats-grid {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(160px, 1fr));
+            gap: 12px;
+            margin: 16px 0;
+        }
+        .stat-card {
+            background: #0d1117;
+            border: 1px solid #30363d;
+            border-radius: 6px;
+            padding: 16px;
+            text-align: center;
+        }
+        .stat-value { font-size: 1.6em; font-weight: bold; color: #58a6ff; }
+        .stat-label { font-size: 0.85em; color: #8b949e; margin-top: 4px; }
+        table {
+            width: 100%;
+            border-collapse: collapse;
+            margin: 12px 0;
+            font-size: 0.9em;
+        }
+        th, td {
+            padding: 10px 12px;
+            text-align: left;
+            border-bottom: 1px solid #21262d;
+        }
+        th {
+            background: #0d1117;
+            color: #8b949e;
+            font-weight: 600;
+        }
+        tr:hover { background: #0d1117; }
+        .corr-high { color: #f85149; font-weight: bold; }
+        .corr-medium { color: #d29922; }
+        .corr-low { color: #3fb950; }
+        .delta-positive { color: #f85149; }
+        .delta-positive::before { content: '↗ '; }
+        .delta-negative { color: #3fb950; }
+        .delta-negative::before { content: '↘ '; }
+        .alert {
+            padding: 12px 16px;
+            border-radius: 6px;
+            margin: 10px 0;
+            border-left: 3px solid;
+        }
+        .alert.success { background: rgba(46, 160, 67, 0.1); border-color: #3fb950; color: #3fb950; }
+        .alert.warning { background: rgba(187, 128, 9, 0.1); border-color: #d29922; color: #d29922; }
+        .alert.danger { background: rgba(248, 81, 73, 0.1); border-color: #f85149; color: #f85149; }
+        .alert.info { background: rgba(88, 166, 255, 0.1); border-color: #58a6ff; color: #58a6ff; }
+        .dist-bar {
+            display: flex;
+            height: 24px;
+            border-radius: 4px;
+            overflow: hidden;
+            margin: 12px 0;
+        }
+        .dist-segment {
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            color: white;
+            font-size: 0.75em;
+            font-weight: bold;
+        }
+        .dist-very-neg { background: #58a6ff; }
+        .dist-neg { background: #79c0ff; }
+        .dist-neutral { background: #6e7681; }
+        .dist-pos { background: #d29922; }
+        .dist-very-pos { background: #f85149; }
+        .rolling-chart {
+            width: 100%;
+            height: 280px;
+            background: #0d1117;
+            border: 1px solid #30363d;
+            border-radius: 6px;
+        }
+        .rolling-legend { font-size: 0.85em; color: #8b949e; margin-top: 8px; }
+        .rolling-legend span { margin-right: 14px; white-space: nowrap; }
+        @media (max-width: 768px) {
+            .stats-grid { grid-template-columns: repeat(2, 1fr); }
+            h1 { font-size: 1.4em; }
+        }
+"""
+
+# Page inline (fallback si pas de template externe), compilée une fois
+INLINE_PAGE_TEMPLATE = compile_template('''<!DOCTYPE html>
+<html lang="fr">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{strategy_id} - Analyse de Corrélation</title>
+    <style>
+{page_style}    </style>
+</head>
+<body>
+    <div class="container">
+        <nav class="nav">
+            <a href="{strategy_name}.html">← Rapport Stratégie</a>
+            <a href="index.html">📊 Dashboard</a>
+        </nav>
+        
+        <h1>📊 {strategy_id}</h1>
+        <p class="subtitle">Analyse de Corrélation • Symbole: {symbol}</p>
+        
+        <div class="score-badge {status_class}">
+            <span>{status_emoji} {status}</span>
+            <span>Score: {score_davey}</span>
+        </div>
+        
+        <div id="alerts"></div>
+        
+        <h2>📈 Profil de Corrélation</h2>
+        <div class="stats-grid">
+            <div class="stat-card">
+                <div class="stat-value">{n_corr_lt}</div>
+                <div class="stat-label">Corrélées (LT)</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-value">{n_corr_ct}</div>
+                <div class="stat-label">Corrélées (CT)</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-value">{avg_corr_lt:.3f}</div>
+                <div class="stat-label">Moy. LT</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-value">{avg_corr_ct:.3f}</div>
+                <div class="stat-label">Moy. CT</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-value">{delta_avg_fmt}</div>
+                <div class="stat-label">Delta (CT-LT)</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-value">{max_corr_lt:.3f}</div>
+                <div class="stat-label">Max LT</div>
+            </div>
+        </div>
+        
+        <h2>📊 Distribution des Corrélations</h2>
+        <div id="distContainer"></div>
+        {cluster_section}
+        
+        <div id="rollingSection" style="display:none">
+            <h2>📉 Corrélation Glissante ({rolling_window_months} mois)</h2>
+            <canvas id="rollingChart" class="rolling-chart"></canvas>
+            <div id="rollingLegend" class="rolling-legend"></div>
+        </div>
+        
+        <h2>🔝 Top {n_most} Stratégies les Plus Corrélées</h2>
+        <table id="mostTable">
+            <thead><tr><th>Stratégie</th><th>Symbole</th><th>Corr. LT</th><th>Corr. CT</th><th>Delta</th></tr></thead>
+            <tbody></tbody>
+        </table>
+        
+        <h2>🔻 Top {n_least} Stratégies les Moins Corrélées</h2>
+        <table id="leastTable">
+            <thead><tr><th>Stratégie</th><th>Symbole</th><th>Corr. LT</th><th>Corr. CT</th><th>Diversification</th></tr></thead>
+            <tbody></tbody>
+        </table>
+        
+        <div style="margin-top:30px;padding-top:15px;border-top:1px solid #30363d;text-align:center;color:#6e7681;font-size:0.85em;">
+            Généré le {timestamp} • Méthode Kevin Davey
+        </div>
+    </div>
+    
+    <script>
+        const mostData = {most_json};
+        const leastData = {least_json};
+        const alerts = {alerts_json};
+        const dist = {dist_json};
+        const rolling = {rolling_json};
+        
+        // Alertes
+        const alertsCont = document.getElementById('alerts');
+        alerts.forEach(a => {{
+            const icons = {{'success': '✅', 'warning': '⚠️', 'danger': '🚨', 'info': '💡'}};
+            alertsCont.innerHTML += `<div class="alert ${{a.type}}"><span>${{icons[a.type] || '📌'}} ${{a.message}}</span></div>`;
+        }});
+        
+        // Distribution
+        const total = Object.values(dist).reduce((a,b) => a+b, 0);
+        if (total > 0) {{
+            const pcts = {{
+                vn: (dist.very_negative/total*100).toFixed(1),
+                n: (dist.negative/total*100).toFixed(1),
+                neu: (dist.neutral/total*100).toFixed(1),
+                p: (dist.positive/total*100).toFixed(1),
+                vp: (dist.very_positive/total*100).toFixed(1)
+            }};
+            document.getElementById('distContainer').innerHTML = `
+                <div class="dist-bar">
+                    <div class="dist-segment dist-very-neg" style="width:${{pcts.vn}}%">${{dist.very_negative}}</div>
+                    <div class="dist-segment dist-neg" style="width:${{pcts.n}}%">${{dist.negative}}</div>
+                    <div class="dist-segment dist-neutral" style="width:${{pcts.neu}}%">${{dist.neutral}}</div>
+                    <div class="dist-segment dist-pos" style="width:${{pcts.p}}%">${{dist.positive}}</div>
+                    <div class="dist-segment dist-very-pos" style="width:${{pcts.vp}}%">${{dist.very_positive}}</div>
+                </div>
+                <div style="font-size:0.85em;color:#8b949e;margin-top:8px;">
+                    🔵 r≤-0.7 (${{dist.very_negative}}) • 🔷 -0.7<r≤-0.3 (${{dist.negative}}) • ⚪ -0.3<r<0.3 (${{dist.neutral}}) • 🟠 0.3≤r<0.7 (${{dist.positive}}) • 🔴 r≥0.7 (${{dist.very_positive}})
+                </div>
+            `;
+        }}
+        
+        // Corrélation glissante
+        if (rolling.series.length > 0) {{
+            document.getElementById('rollingSection').style.display = 'block';
+            const canvas = document.getElementById('rollingChart');
+            const ctx = canvas.getContext('2d');
+            const w = canvas.width = canvas.clientWidth;
+            const h = canvas.height = canvas.clientHeight;
+            const pad = {{left: 40, right: 10, top: 10, bottom: 24}};
+            const n = rolling.dates.length;
+            const xAt = i => pad.left + (n > 1 ? i / (n - 1) : 0.5) * (w - pad.left - pad.right);
+            const yAt = v => pad.top + (1 - (v + 1) / 2) * (h - pad.top - pad.bottom);
+            const colors = ['#f85149', '#d29922', '#58a6ff', '#3fb950', '#bc8cff'];
+            
+            ctx.font = '11px sans-serif';
+            ctx.fillStyle = '#8b949e';
+            [-1, -0.5, 0, 0.5, 1].forEach(v => {{
+                ctx.strokeStyle = v === 0 ? '#30363d' : '#21262d';
+                ctx.beginPath(); ctx.moveTo(pad.left, yAt(v)); ctx.lineTo(w - pad.right, yAt(v)); ctx.stroke();
+                ctx.fillText(v.toFixed(1), 4, yAt(v) + 4);
+            }});
+            ctx.fillText(rolling.dates[0], pad.left, h - 6);
+            ctx.fillText(rolling.dates[n - 1], w - pad.right - 50, h - 6);
+            
+            const legend = document.getElementById('rollingLegend');
+            rolling.series.forEach((s, k) => {{
+                ctx.strokeStyle = colors[k % colors.length];
+                ctx.lineWidth = 1.5;
+                ctx.beginPath();
+                let drawing = false;
+                s.values.forEach((v, i) => {{
+                    if (v === null) {{ drawing = false; return; }}
+                    if (drawing) ctx.lineTo(xAt(i), yAt(v)); else ctx.moveTo(xAt(i), yAt(v));
+                    drawing = true;
+                }});
+                ctx.stroke();
+                legend.innerHTML += `<span style="color:${{colors[k % colors.length]}}">━ ${{s.strategy}}</span>`;
+            }});
+        }}
+        
+        // Tables
+        function getCorrClass(v) {{
+            if (!v) return '';
+            const a = Math.abs(v);
+            return a >= 0.7 ? 'corr-high' : a >= 0.5 ? 'corr-medium' : 'corr-low';
+        }}
+        
+        function fmtCorr(v) {{ return v !== null ? v.toFixed(3) : '-'; }}
+        
+        function fmtDelta(v) {{
+            if (!v) return '-';
+            const cls = v > 0.05 ? 'delta-positive' : v < -0.05 ? 'delta-negative' : '';
+            return `<span class="${{cls}}">${{v>=0?'+':''}}${{v.toFixed(3)}}</span>`;
+        }}
+        
+        const mostTb = document.querySelector('#mostTable tbody');
+        mostData.forEach(r => {{
+            mostTb.innerHTML += `<tr>
+                <td>${{r.strategy}}</td>
+                <td>${{r.symbol}}</td>
+                <td class="${{getCorrClass(r.corr_lt)}}">${{fmtCorr(r.corr_lt)}}</td>
+                <td class="${{getCorrClass(r.corr_ct)}}">${{fmtCorr(r.corr_ct)}}</td>
+                <td>${{fmtDelta(r.delta)}}</td>
+            </tr>`;
+        }});
+        
+        const leastTb = document.querySelector('#leastTable tbody');
+        leastData.forEach(r => {{
+            const stars = r.max_abs < 0.2 ? '⭐⭐⭐' : r.max_abs < 0.4 ? '⭐⭐' : '⭐';
+            leastTb.innerHTML += `<tr>
+                <td>${{r.strategy}}</td>
+                <td>${{r.symbol}}</td>
+                <td class="${{getCorrClass(r.corr_lt)}}">${{fmtCorr(r.corr_lt)}}</td>
+                <td class="${{getCorrClass(r.corr_ct)}}">${{fmtCorr(r.corr_ct)}}</td>
+                <td>${{stars}}</td>
+            </tr>`;
+        }});
+    </script>
+</body>
+</html>''')
+
+CLUSTER_SECTION_TEMPLATE = compile_template('''
+        <h2>🧩 Cluster #{id} ({size} stratégies, corr. moyenne {mean})</h2>
+        <p class="subtitle">{members}</p>
+        ''')
+
+def _write_pages(template: Optional[str], pages: List[Tuple[Dict[str, Any], str]]) -> List[Tuple[str, Optional[str]]]:
+    """
+    Rend et écrit un lot de pages (exécuté dans un processus du pool).
+    
+    Args:
+        template: Contenu du template HTML (None: template inline)
+        pages: Liste (profil, chemin du fichier HTML)
+        
+    Returns:
+        Liste (stratégie, message d'erreur ou None)
+    """
+    results = []
+    for profile, path in pages:
+        try:
+            html = CorrelationPagesGenerator._render_page(template, profile)
+            Path(path).write_text(html, encoding='utf-8')
+            results.append((profile['strategy_id'], None))
+        except Exception as e:
+            results.append((profile['strategy_id'], str(e)))
+    return results
+
 
 class CorrelationPagesGenerator:
     """
@@ -32,6 +405,12 @@ class CorrelationPagesGenerator:
         stats = generator.generate_all(output_dir)
     """
     
+    # Nombre max de courbes sur le graphique de corrélation glissante
+    ROLLING_CHART_SERIES = 5
+    
+    # Pages rendues par tâche du pool de processus
+    PAGES_PER_TASK = 25
+    
     def __init__(self, analyzer):
         """
         Initialise le générateur.
@@ -44,12 +423,14 @@ class CorrelationPagesGenerator:
         
         self.analyzer = analyzer
         self.template_path = Path(__file__).parent.parent / 'templates' / 'correlation_page.html'
+        self._index = None
     
     def generate_all(
         self,
         output_dir: Path,
         top_n: int = 15,
-        verbose: bool = True
+        verbose: bool = True,
+        n_jobs: Optional[int] = 1
     ) -> Dict[str, int]:
         """
         Génère toutes les pages individuelles.
@@ -58,6 +439,10 @@ class CorrelationPagesGenerator:
             output_dir: Répertoire de sortie pour les pages HTML
             top_n: Nombre de stratégies dans les listes top/bottom
             verbose: Afficher la progression
+            n_jobs: Processus de rendu (défaut: 1 = séquentiel, None = nombre de CPU).
+                Les profils restent calculés ici: le pool ne parallélise que
+                l'écriture des pages et, en démarrage spawn, son lancement
+                (ré-import des modules) coûte souvent plus que ce rendu
             
         Returns:
             Dict avec statistiques : {'generated': int, 'errors': int, 'total': int}
@@ -72,30 +457,57 @@ class CorrelationPagesGenerator:
         
         strategies = self.analyzer.scores['Strategy'].tolist()
         
+        self._ensure_rolling_correlations(verbose)
+        self._build_index()
+        template = self._load_template()
+        
+        n_jobs = n_jobs or os.cpu_count() or 1
+        parallel = n_jobs > 1 and len(strategies) > self.PAGES_PER_TASK
+        
         if verbose:
-            print(f"\n📊 {len(strategies)} pages à générer...")
+            mode = f"{n_jobs} processus" if parallel else "séquentiel"
+            print(f"\n📊 {len(strategies)} pages à générer ({mode})...")
         
         generated = 0
         errors = 0
         
-        for i, strategy in enumerate(strategies):
-            if verbose and (i + 1) % 50 == 0:
-                print(f"   → {i + 1}/{len(strategies)} pages générées...")
-            
-            try:
-                # Calculer le profil de corrélation
-                profile = self._calculate_profile(strategy, top_n)
-                
-                # Générer la page HTML
-                html_path = output_dir / f"{self._sanitize_filename(strategy)}_correlation.html"
-                self._generate_html(profile, html_path)
+        def collect(results):
+            nonlocal generated, errors
+            for strategy, error in results:
+                if error is None:
+                    generated += 1
+                    if verbose and generated % 50 == 0:
+                        print(f"   → {generated}/{len(strategies)} pages générées...")
+                else:
+                    if verbose:
+                        print(f"   ⚠️  Erreur pour {strategy}: {error}")
+                    errors += 1
+        
+        # Profils calculés ici (accès à l'analyzer), rendu par lots dans le pool
+        executor = ProcessPoolExecutor(max_workers=n_jobs) if parallel else None
+        futures = []
+        try:
+            for start in range(0, len(strategies), self.PAGES_PER_TASK):
+                pages = []
+                for strategy in strategies[start:start + self.PAGES_PER_TASK]:
+                    try:
+                        profile = self._calculate_profile(strategy, top_n)
+                    except Exception as e:
+                        collect([(strategy, str(e))])
+                        continue
+                    html_path = output_dir / f"{self._sanitize_filename(strategy)}_correlation.html"
+                    pages.append((profile, str(html_path)))
                 
-                generated += 1
-                
-            except Exception as e:
-                if verbose:
-                    print(f"   ⚠️  Erreur pour {strategy}: {e}")
-                errors += 1
+                if executor is None:
+                    collect(_write_pages(template, pages))
+                else:
+                    futures.append(executor.submit(_write_pages, template, pages))
+            
+            for future in futures:
+                collect(future.result())
+        finally:
+            if executor is not None:
+                executor.shutdown()
         
         if verbose:
             print(f"\n✅ {generated} pages générées avec succès")
@@ -103,12 +515,170 @@ class CorrelationPagesGenerator:
                 print(f"⚠️  {errors} erreurs rencontrées")
             print(f"📁 Emplacement: {output_dir}")
         
-        return {
-            'generated': generated,
-            'errors': errors,
-            'total': len(strategies)
+        return {
+            'generated': generated,
+            'errors': errors,
+            'total': len(strategies)
+        }
+    
+    def _ensure_rolling_correlations(self, verbose: bool):
+        """Calcule les corrélations glissantes si l'analyzer le permet et ne l'a pas fait."""
+        if getattr(self.analyzer, 'rolling_correlations', None) is not None:
+            return
+        if not hasattr(self.analyzer, 'compute_rolling_correlations'):
+            return
+        
+        try:
+            rolling = self.analyzer.compute_rolling_correlations()
+            if verbose:
+                print(f"\n📉 Corrélations glissantes: {len(rolling)} paires, "
+                      f"{len(rolling.window_ends)} fenêtres de {rolling.window_months} mois")
+        except Exception as e:
+            if verbose:
+                print(f"   ⚠️  Corrélations glissantes indisponibles: {e}")
+    
+    def _rolling_chart_data(self, strategy: str, most_correlated: List[Dict]) -> Dict[str, Any]:
+        """
+        Séries glissantes de la stratégie avec ses partenaires les plus corrélés.
+        
+        Args:
+            strategy: Stratégie de la page
+            most_correlated: Stratégies les plus corrélées (triées)
+            
+        Returns:
+            Dict pour le graphique (séries vides si non disponible)
+        """
+        rolling = getattr(self.analyzer, 'rolling_correlations', None)
+        if rolling is None:
+            return {'dates': [], 'window_months': None, 'series': []}
+        
+        partners = [c['strategy'] for c in most_correlated]
+        chart = rolling.chart_data(strategy, partners)
+        chart['series'] = chart['series'][:self.ROLLING_CHART_SERIES]
+        return chart
+    
+    def _cluster_data(self, strategy: str) -> Optional[Dict[str, Any]]:
+        """
+        Cluster d'une stratégie (classification hiérarchique de l'analyzer).
+        
+        Returns:
+            Dict id, size, mean_corr, members (autres stratégies, ordre des feuilles),
+            ou None si pas de classification
+        """
+        clusters = getattr(self.analyzer, 'clusters', None)
+        cluster_id = clusters.cluster_of(strategy) if clusters is not None else None
+        if cluster_id is None:
+            return None
+        row = clusters.summary[clusters.summary['Cluster'] == cluster_id].iloc[0]
+        return {
+            'id': cluster_id,
+            'size': int(row['Size']),
+            'mean_corr': None if pd.isna(row['Mean_Corr']) else round(float(row['Mean_Corr']), 3),
+            'members': [s for s in row['Strategies'] if s != strategy],
+        }
+    
+    def _horizon_rows(self, horizon: str):
+        """
+        Accès aux lignes de corrélations d'un horizon.
+        
+        Lignes lues dans la matrice empaquetée de l'analyzer (sans reconstruire
+        la matrice dense), sinon dans le DataFrame corr_matrix_*.
+        
+        Returns:
+            Tuple (libellés, fonction stratégie → ligne dans l'ordre des libellés)
+        """
+        packed_matrix = getattr(self.analyzer, 'packed_matrix', None)
+        packed = packed_matrix(f'corr_{horizon}') if packed_matrix else None
+        if packed is not None:
+            return list(packed.labels), packed.row
+        
+        frame = getattr(self.analyzer, f'corr_matrix_{horizon}')
+        values = frame.to_numpy(dtype=np.float64)
+        position = {s: k for k, s in enumerate(frame.index)}
+        return list(frame.columns), lambda strategy: values[position[strategy]]
+    
+    def _build_index(self):
+        """
+        Construit une fois les index utilisés par tous les profils.
+        
+        - position de chaque stratégie dans self.analyzer.scores
+        - libellés réunis LT ∪ CT et symbole de chacun
+        - pour chaque horizon: lecture des lignes et positions dans la réunion
+        """
+        scores = self.analyzer.scores
+        score_rows = {s: k for k, s in enumerate(scores['Strategy'])}
+        
+        horizons = {horizon: self._horizon_rows(horizon) for horizon in ('lt', 'ct')}
+        labels = list(horizons['lt'][0])
+        union = {s: k for k, s in enumerate(labels)}
+        for s in horizons['ct'][0]:
+            if s not in union:
+                union[s] = len(labels)
+                labels.append(s)
+        
+        # Symbole: colonne Symbol des scores, sinon suffixe du Strategy ID
+        symbols = np.array([s.rsplit('_', 1)[1] if '_' in s else 'Unknown' for s in labels], dtype=object)
+        if 'Symbol' in scores.columns:
+            for k, s in enumerate(labels):
+                row = score_rows.get(s)
+                if row is not None:
+                    symbols[k] = scores['Symbol'].iat[row]
+        
+        self._index = {
+            'score_rows': score_rows,
+            'labels': labels,
+            'position': union,
+            'symbols': symbols,
+            'rows': {
+                horizon: (read_row, np.array([union[s] for s in names], dtype=np.intp), set(names))
+                for horizon, (names, read_row) in horizons.items()
+            },
         }
     
+    def _correlation_vector(self, horizon: str, strategy: str) -> np.ndarray:
+        """
+        Corrélations d'une stratégie alignées sur les libellés réunis LT ∪ CT.
+        
+        Returns:
+            Vecteur float64 (NaN: stratégie elle-même, paire absente ou non calculée)
+        """
+        read_row, positions, names = self._index['rows'][horizon]
+        vector = np.full(len(self._index['labels']), np.nan)
+        if strategy in names:
+            vector[positions] = read_row(strategy)
+            vector[self._index['position'][strategy]] = np.nan
+        return vector
+    
+    @staticmethod
+    def _top_positions(keys: np.ndarray, k: int) -> np.ndarray:
+        """Positions des k plus petites clés, triées (égalités: ordre des positions)."""
+        if k <= 0 or len(keys) == 0:
+            return np.array([], dtype=np.intp)
+        if k < len(keys):
+            selected = np.argpartition(keys, k - 1)[:k]
+        else:
+            selected = np.arange(len(keys))
+        return selected[np.lexsort((selected, keys[selected]))]
+    
+    def _correlation_entries(self, positions: np.ndarray, lt: np.ndarray, ct: np.ndarray, max_abs: np.ndarray) -> List[Dict]:
+        """Lignes des tableaux top/bottom pour des positions de la réunion LT ∪ CT."""
+        labels, symbols = self._index['labels'], self._index['symbols']
+        
+        def rounded(value):
+            return None if np.isnan(value) else round(float(value), 3)
+        
+        return [
+            {
+                'strategy': labels[k],
+                'symbol': symbols[k],
+                'corr_lt': rounded(lt[k]),
+                'corr_ct': rounded(ct[k]),
+                'delta': rounded(ct[k] - lt[k]),
+                'max_abs': float(max_abs[k])
+            }
+            for k in positions.tolist()
+        ]
+    
     def _calculate_profile(self, strategy: str, top_n: int) -> Dict[str, Any]:
         """
         Calcule le profil de corrélation détaillé d'une stratégie.
@@ -120,10 +690,11 @@ class CorrelationPagesGenerator:
         Returns:
             Dict avec toutes les données nécessaires au template
         """
-        # Récupérer les données de base depuis self.analyzer.scores
-        strategy_row = self.analyzer.scores[
-            self.analyzer.scores['Strategy'] == strategy
-        ].iloc[0]
+        if self._index is None:
+            self._build_index()
+        
+        # Récupérer les données de base depuis self.analyzer.scores (position indexée)
+        strategy_row = self.analyzer.scores.iloc[self._index['score_rows'][strategy]]
         
         # Extraire nom et symbole (compatible avec différents formats de CSV)
         if 'Strategy_Name' in strategy_row and 'Symbol' in strategy_row:
@@ -137,72 +708,43 @@ class CorrelationPagesGenerator:
             else:
                 strategy_name, symbol = strategy, 'Unknown'
         
-        # Récupérer les corrélations LT et CT pour cette stratégie
-        lt_corrs = self.analyzer.corr_matrix_lt.loc[strategy].drop(strategy, errors='ignore').dropna()
-        ct_corrs = self.analyzer.corr_matrix_ct.loc[strategy].drop(strategy, errors='ignore').dropna()
+        # Corrélations LT et CT alignées sur toutes les stratégies (LT ∪ CT)
+        lt = self._correlation_vector('lt', strategy)
+        ct = self._correlation_vector('ct', strategy)
         
-        # Fusionner toutes les stratégies corrélées (LT + CT)
-        all_strats = set(lt_corrs.index) | set(ct_corrs.index)
-        correlations_detail = []
-        
-        for s in all_strats:
-            c_lt = lt_corrs.get(s, np.nan)
-            c_ct = ct_corrs.get(s, np.nan)
-            
-            # Calculer le delta (évolution CT - LT)
-            delta = c_ct - c_lt if not (np.isnan(c_lt) or np.isnan(c_ct)) else np.nan
-            
-            # Max absolu pour tri
-            max_abs = max(
-                abs(c_lt) if not np.isnan(c_lt) else 0,
-                abs(c_ct) if not np.isnan(c_ct) else 0
-            )
-            
-            # Extraire symbole de la stratégie corrélée
-            # Essayer de récupérer depuis le DataFrame d'abord
-            try:
-                s_row = self.analyzer.scores[self.analyzer.scores['Strategy'] == s].iloc[0]
-                s_symbol = s_row.get('Symbol', 'Unknown')
-            except:
-                # Fallback: parser
-                s_parts = s.rsplit('_', 1)
-                s_symbol = s_parts[1] if len(s_parts) == 2 else 'Unknown'
-            
-            correlations_detail.append({
-                'strategy': s,
-                'symbol': s_symbol,
-                'corr_lt': round(float(c_lt), 3) if not np.isnan(c_lt) else None,
-                'corr_ct': round(float(c_ct), 3) if not np.isnan(c_ct) else None,
-                'delta': round(float(delta), 3) if not np.isnan(delta) else None,
-                'max_abs': max_abs
-            })
-        
-        # Trier par corrélation max absolue (décroissant)
-        correlations_detail.sort(key=lambda x: x['max_abs'], reverse=True)
+        # Max absolu pour tri (0 si aucune corrélation)
+        with np.errstate(invalid='ignore'):
+            max_abs = np.nan_to_num(np.fmax(np.abs(lt), np.abs(ct)), nan=0.0)
+        candidates = np.flatnonzero(~np.isnan(lt) | ~np.isnan(ct))
         
         # Top corrélées (les plus fortes corrélations)
-        most_correlated = correlations_detail[:top_n]
+        top = candidates[self._top_positions(-max_abs[candidates], top_n)]
+        most_correlated = self._correlation_entries(top, lt, ct, max_abs)
         
         # Moins corrélées (opportunités de diversification)
-        least_correlated = sorted(
-            [c for c in correlations_detail if c['max_abs'] > 0],
-            key=lambda x: x['max_abs']
-        )[:top_n]
+        diversifying = candidates[max_abs[candidates] > 0]
+        bottom = diversifying[self._top_positions(max_abs[diversifying], top_n)]
+        least_correlated = self._correlation_entries(bottom, lt, ct, max_abs)
         
         # Distribution par bucket
-        all_corrs = list(lt_corrs) + list(ct_corrs)
-        all_corrs = [c for c in all_corrs if not np.isnan(c)]
+        all_corrs = np.concatenate([lt[~np.isnan(lt)], ct[~np.isnan(ct)]])
         distribution = {
-            'very_negative': sum(1 for c in all_corrs if c <= -0.7),
-            'negative': sum(1 for c in all_corrs if -0.7 < c <= -0.3),
-            'neutral': sum(1 for c in all_corrs if -0.3 < c < 0.3),
-            'positive': sum(1 for c in all_corrs if 0.3 <= c < 0.7),
-            'very_positive': sum(1 for c in all_corrs if c >= 0.7)
+            'very_negative': int(np.count_nonzero(all_corrs <= -0.7)),
+            'negative': int(np.count_nonzero((all_corrs > -0.7) & (all_corrs <= -0.3))),
+            'neutral': int(np.count_nonzero((all_corrs > -0.3) & (all_corrs < 0.3))),
+            'positive': int(np.count_nonzero((all_corrs >= 0.3) & (all_corrs < 0.7))),
+            'very_positive': int(np.count_nonzero(all_corrs >= 0.7))
         }
         
         # Générer les alertes
         alerts = self._generate_alerts(strategy_row, most_correlated)
         
+        # Corrélation glissante avec les plus corrélées
+        rolling = self._rolling_chart_data(strategy, most_correlated)
+        
+        # Cluster de la stratégie (classification LT)
+        cluster = self._cluster_data(strategy)
+        
         # Gérer les noms de colonnes variables (Delta_Corr vs Delta_Avg, etc.)
         delta_avg = strategy_row.get('Delta_Corr', strategy_row.get('Delta_Avg', 0))
         max_corr_lt_with = strategy_row.get('Max_Corr_LT_With', 'N/A')
@@ -235,6 +777,8 @@ class CorrelationPagesGenerator:
             'least_correlated': least_correlated,
             'distribution': distribution,
             'alerts': alerts,
+            'rolling': rolling,
+            'cluster': cluster,
             
             'config': {
                 'threshold': self.analyzer.correlation_threshold,
@@ -321,17 +865,24 @@ class CorrelationPagesGenerator:
             profile: Profil de corrélation de la stratégie
             output_path: Chemin du fichier HTML de sortie
         """
-        if self.template_path.exists():
-            # Utiliser le template externe
-            template = self.template_path.read_text(encoding='utf-8')
-            html = self._render_template(template, profile)
-        else:
-            # Fallback sur template inline
-            html = self._generate_inline_html(profile)
-        
+        html = self._render_page(self._load_template(), profile)
         output_path.write_text(html, encoding='utf-8')
     
-    def _render_template(self, template: str, profile: Dict[str, Any]) -> str:
+    def _load_template(self) -> Optional[str]:
+        """Contenu du template externe (lu une fois par génération), None s'il est absent."""
+        if self.template_path.exists():
+            return self.template_path.read_text(encoding='utf-8')
+        return None
+    
+    @classmethod
+    def _render_page(cls, template: Optional[str], profile: Dict[str, Any]) -> str:
+        """HTML d'une page: template externe, sinon fallback sur template inline."""
+        if template is not None:
+            return cls._render_template(template, profile)
+        return cls._generate_inline_html(profile)
+    
+    @staticmethod
+    def _render_template(template: str, profile: Dict[str, Any]) -> str:
         """
         Rend le template avec les données du profil.
         
@@ -344,15 +895,17 @@ class CorrelationPagesGenerator:
         """
         # Préparer les données JSON pour JavaScript
         data = {
-            'most_correlated': json.dumps(profile['most_correlated'], ensure_ascii=False),
-            'least_correlated': json.dumps(profile['least_correlated'], ensure_ascii=False),
-            'alerts': json.dumps(profile['alerts'], ensure_ascii=False),
-            'distribution': json.dumps(profile['distribution']),
+            'most_correlated': json_script(profile['most_correlated'], ensure_ascii=False),
+            'least_correlated': json_script(profile['least_correlated'], ensure_ascii=False),
+            'alerts': json_script(profile['alerts'], ensure_ascii=False),
+            'distribution': json_script(profile['distribution']),
+            'rolling': json_script(profile['rolling'], ensure_ascii=False),
+            'cluster': json_script(profile['cluster'], ensure_ascii=False),
             'timestamp': datetime.now().strftime('%d/%m/%Y à %H:%M')
         }
         
-        # Ajouter les données du profil
-        data.update(profile)
+        # Ajouter les données du profil (sans écraser les JSON déjà préparés)
+        data.update({k: v for k, v in profile.items() if k not in data})
         
         # Classe CSS du status
         data['status_class'] = profile['status'].lower().replace(' ', '-').replace('é', 'e')
@@ -360,15 +913,11 @@ class CorrelationPagesGenerator:
         # Formatter les nombres
         data['delta_avg_fmt'] = f"{'+'if profile['delta_avg']>=0 else ''}{profile['delta_avg']:.3f}"
         
-        # Remplacer les placeholders
-        html = template
-        for key, value in data.items():
-            placeholder = f"{{{{{key}}}}}"
-            html = html.replace(placeholder, str(value))
-        
-        return html
+        # Remplir les placeholders {{cle}} (template compilé une fois, placeholders inconnus conservés)
+        return compile_template(template, 'placeholder').render(data)
     
-    def _generate_inline_html(self, profile: Dict[str, Any]) -> str:
+    @classmethod
+    def _generate_inline_html(cls, profile: Dict[str, Any]) -> str:
         """
         Génère le HTML inline (fallback si pas de template).
         
@@ -380,289 +929,35 @@ class CorrelationPagesGenerator:
         """
         p = profile  # Raccourci
         
-        # Classe CSS du status
-        status_class = p['status'].lower().replace(' ', '-').replace('é', 'e')
-        
-        # Préparer les données JSON
-        most_json = json.dumps(p['most_correlated'], ensure_ascii=False)
-        least_json = json.dumps(p['least_correlated'], ensure_ascii=False)
-        alerts_json = json.dumps(p['alerts'], ensure_ascii=False)
-        dist_json = json.dumps(p['distribution'])
-        
-        return f'''<!DOCTYPE html>
-<html lang="fr">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{p['strategy_id']} - Analyse de Corrélation</title>
-    <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-            background: #0d1117;
-            color: #c9d1d9;
-            line-height: 1.6;
-            padding: 20px;
-        }}
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-            background: #161b22;
-            border-radius: 8px;
-            padding: 30px;
-            border: 1px solid #30363d;
-        }}
-        .nav {{ margin-bottom: 20px; }}
-        .nav a {{
-            display: inline-block;
-            padding: 8px 16px;
-            background: #21262d;
-            color: #58a6ff;
-            text-decoration: none;
-            border-radius: 6px;
-            margin-right: 8px;
-        }}
-        .nav a:hover {{ background: #30363d; }}
-        h1 {{ color: #c9d1d9; font-size: 1.8em; margin-bottom: 8px; }}
-        .subtitle {{ color: #8b949e; margin-bottom: 20px; }}
-        .score-badge {{
-            display: inline-flex;
-            align-items: center;
-            gap: 10px;
-            padding: 12px 20px;
-            border-radius: 8px;
-            font-size: 1.2em;
-            font-weight: bold;
-            margin: 15px 0;
-        }}
-        .score-badge.diversifiant {{ background: rgba(46, 160, 67, 0.2); color: #3fb950; }}
-        .score-badge.modere {{ background: rgba(187, 128, 9, 0.2); color: #d29922; }}
-        .score-badge.correle {{ background: rgba(219, 109, 40, 0.2); color: #f0883e; }}
-        .score-badge.tres-correle {{ background: rgba(248, 81, 73, 0.2); color: #f85149; }}
-        h2 {{
-            color: #58a6ff;
-            font-size: 1.3em;
-            margin: 24px 0 12px;
-            padding-left: 12px;
-            border-left: 3px solid #58a6ff;
-        }}
-        .stats-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(160px, 1fr));
-            gap: 12px;
-            margin: 16px 0;
-        }}
-        .stat-card {{
-            background: #0d1117;
-            border: 1px solid #30363d;
-            border-radius: 6px;
-            padding: 16px;
-            text-align: center;
-        }}
-        .stat-value {{ font-size: 1.6em; font-weight: bold; color: #58a6ff; }}
-        .stat-label {{ font-size: 0.85em; color: #8b949e; margin-top: 4px; }}
-        table {{
-            width: 100%;
-            border-collapse: collapse;
-            margin: 12px 0;
-            font-size: 0.9em;
-        }}
-        th, td {{
-            padding: 10px 12px;
-            text-align: left;
-            border-bottom: 1px solid #21262d;
-        }}
-        th {{
-            background: #0d1117;
-            color: #8b949e;
-            font-weight: 600;
-        }}
-        tr:hover {{ background: #0d1117; }}
-        .corr-high {{ color: #f85149; font-weight: bold; }}
-        .corr-medium {{ color: #d29922; }}
-        .corr-low {{ color: #3fb950; }}
-        .delta-positive {{ color: #f85149; }}
-        .delta-positive::before {{ content: '↗ '; }}
-        .delta-negative {{ color: #3fb950; }}
-        .delta-negative::before {{ content: '↘ '; }}
-        .alert {{
-            padding: 12px 16px;
-            border-radius: 6px;
-            margin: 10px 0;
-            border-left: 3px solid;
-        }}
-        .alert.success {{ background: rgba(46, 160, 67, 0.1); border-color: #3fb950; color: #3fb950; }}
-        .alert.warning {{ background: rgba(187, 128, 9, 0.1); border-color: #d29922; color: #d29922; }}
-        .alert.danger {{ background: rgba(248, 81, 73, 0.1); border-color: #f85149; color: #f85149; }}
-        .alert.info {{ background: rgba(88, 166, 255, 0.1); border-color: #58a6ff; color: #58a6ff; }}
-        .dist-bar {{
-            display: flex;
-            height: 24px;
-            border-radius: 4px;
-            overflow: hidden;
-            margin: 12px 0;
-        }}
-        .dist-segment {{
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            color: white;
-            font-size: 0.75em;
-            font-weight: bold;
-        }}
-        .dist-very-neg {{ background: #58a6ff; }}
-        .dist-neg {{ background: #79c0ff; }}
-        .dist-neutral {{ background: #6e7681; }}
-        .dist-pos {{ background: #d29922; }}
-        .dist-very-pos {{ background: #f85149; }}
-        @media (max-width: 768px) {{
-            .stats-grid {{ grid-template-columns: repeat(2, 1fr); }}
-            h1 {{ font-size: 1.4em; }}
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <nav class="nav">
-            <a href="{p['strategy_name']}.html">← Rapport Stratégie</a>
-            <a href="index.html">📊 Dashboard</a>
-        </nav>
-        
-        <h1>📊 {p['strategy_id']}</h1>
-        <p class="subtitle">Analyse de Corrélation • Symbole: {p['symbol']}</p>
-        
-        <div class="score-badge {status_class}">
-            <span>{p['status_emoji']} {p['status']}</span>
-            <span>Score: {p['score_davey']}</span>
-        </div>
-        
-        <div id="alerts"></div>
-        
-        <h2>📈 Profil de Corrélation</h2>
-        <div class="stats-grid">
-            <div class="stat-card">
-                <div class="stat-value">{p['n_corr_lt']}</div>
-                <div class="stat-label">Corrélées (LT)</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-value">{p['n_corr_ct']}</div>
-                <div class="stat-label">Corrélées (CT)</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-value">{p['avg_corr_lt']:.3f}</div>
-                <div class="stat-label">Moy. LT</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-value">{p['avg_corr_ct']:.3f}</div>
-                <div class="stat-label">Moy. CT</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-value">{'+'if p['delta_avg']>=0 else''}{p['delta_avg']:.3f}</div>
-                <div class="stat-label">Delta (CT-LT)</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-value">{p['max_corr_lt']:.3f}</div>
-                <div class="stat-label">Max LT</div>
-            </div>
-        </div>
-        
-        <h2>📊 Distribution des Corrélations</h2>
-        <div id="distContainer"></div>
-        
-        <h2>🔝 Top {len(p['most_correlated'])} Stratégies les Plus Corrélées</h2>
-        <table id="mostTable">
-            <thead><tr><th>Stratégie</th><th>Symbole</th><th>Corr. LT</th><th>Corr. CT</th><th>Delta</th></tr></thead>
-            <tbody></tbody>
-        </table>
-        
-        <h2>🔻 Top {len(p['least_correlated'])} Stratégies les Moins Corrélées</h2>
-        <table id="leastTable">
-            <thead><tr><th>Stratégie</th><th>Symbole</th><th>Corr. LT</th><th>Corr. CT</th><th>Diversification</th></tr></thead>
-            <tbody></tbody>
-        </table>
-        
-        <div style="margin-top:30px;padding-top:15px;border-top:1px solid #30363d;text-align:center;color:#6e7681;font-size:0.85em;">
-            Généré le {datetime.now().strftime('%d/%m/%Y à %H:%M')} • Méthode Kevin Davey
-        </div>
-    </div>
+        return INLINE_PAGE_TEMPLATE.render(
+            p,
+            page_style=Markup(PAGE_STYLE),
+            # Classe CSS du status
+            status_class=p['status'].lower().replace(' ', '-').replace('é', 'e'),
+            delta_avg_fmt=f"{'+'if p['delta_avg']>=0 else ''}{p['delta_avg']:.3f}",
+            cluster_section=cls._cluster_section(p['cluster']),
+            rolling_window_months=p['rolling']['window_months'],
+            n_most=len(p['most_correlated']),
+            n_least=len(p['least_correlated']),
+            timestamp=datetime.now().strftime('%d/%m/%Y à %H:%M'),
+            # Données JSON pour JavaScript
+            most_json=json_script(p['most_correlated'], ensure_ascii=False),
+            least_json=json_script(p['least_correlated'], ensure_ascii=False),
+            alerts_json=json_script(p['alerts'], ensure_ascii=False),
+            dist_json=json_script(p['distribution']),
+            rolling_json=json_script(p['rolling'], ensure_ascii=False),
+        )
     
-    <script>
-        const mostData = {most_json};
-        const leastData = {least_json};
-        const alerts = {alerts_json};
-        const dist = {dist_json};
-        
-        // Alertes
-        const alertsCont = document.getElementById('alerts');
-        alerts.forEach(a => {{
-            const icons = {{'success': '✅', 'warning': '⚠️', 'danger': '🚨', 'info': '💡'}};
-            alertsCont.innerHTML += `<div class="alert ${{a.type}}"><span>${{icons[a.type] || '📌'}} ${{a.message}}</span></div>`;
-        }});
-        
-        // Distribution
-        const total = Object.values(dist).reduce((a,b) => a+b, 0);
-        if (total > 0) {{
-            const pcts = {{
-                vn: (dist.very_negative/total*100).toFixed(1),
-                n: (dist.negative/total*100).toFixed(1),
-                neu: (dist.neutral/total*100).toFixed(1),
-                p: (dist.positive/total*100).toFixed(1),
-                vp: (dist.very_positive/total*100).toFixed(1)
-            }};
-            document.getElementById('distContainer').innerHTML = `
-                <div class="dist-bar">
-                    <div class="dist-segment dist-very-neg" style="width:${{pcts.vn}}%">${{dist.very_negative}}</div>
-                    <div class="dist-segment dist-neg" style="width:${{pcts.n}}%">${{dist.negative}}</div>
-                    <div class="dist-segment dist-neutral" style="width:${{pcts.neu}}%">${{dist.neutral}}</div>
-                    <div class="dist-segment dist-pos" style="width:${{pcts.p}}%">${{dist.positive}}</div>
-                    <div class="dist-segment dist-very-pos" style="width:${{pcts.vp}}%">${{dist.very_positive}}</div>
-                </div>
-                <div style="font-size:0.85em;color:#8b949e;margin-top:8px;">
-                    🔵 r≤-0.7 (${{dist.very_negative}}) • 🔷 -0.7<r≤-0.3 (${{dist.negative}}) • ⚪ -0.3<r<0.3 (${{dist.neutral}}) • 🟠 0.3≤r<0.7 (${{dist.positive}}) • 🔴 r≥0.7 (${{dist.very_positive}})
-                </div>
-            `;
-        }}
-        
-        // Tables
-        function getCorrClass(v) {{
-            if (!v) return '';
-            const a = Math.abs(v);
-            return a >= 0.7 ? 'corr-high' : a >= 0.5 ? 'corr-medium' : 'corr-low';
-        }}
-        
-        function fmtCorr(v) {{ return v !== null ? v.toFixed(3) : '-'; }}
-        
-        function fmtDelta(v) {{
-            if (!v) return '-';
-            const cls = v > 0.05 ? 'delta-positive' : v < -0.05 ? 'delta-negative' : '';
-            return `<span class="${{cls}}">${{v>=0?'+':''}}${{v.toFixed(3)}}</span>`;
-        }}
-        
-        const mostTb = document.querySelector('#mostTable tbody');
-        mostData.forEach(r => {{
-            mostTb.innerHTML += `<tr>
-                <td>${{r.strategy}}</td>
-                <td>${{r.symbol}}</td>
-                <td class="${{getCorrClass(r.corr_lt)}}">${{fmtCorr(r.corr_lt)}}</td>
-                <td class="${{getCorrClass(r.corr_ct)}}">${{fmtCorr(r.corr_ct)}}</td>
-                <td>${{fmtDelta(r.delta)}}</td>
-            </tr>`;
-        }});
-        
-        const leastTb = document.querySelector('#leastTable tbody');
-        leastData.forEach(r => {{
-            const stars = r.max_abs < 0.2 ? '⭐⭐⭐' : r.max_abs < 0.4 ? '⭐⭐' : '⭐';
-            leastTb.innerHTML += `<tr>
-                <td>${{r.strategy}}</td>
-                <td>${{r.symbol}}</td>
-                <td class="${{getCorrClass(r.corr_lt)}}">${{fmtCorr(r.corr_lt)}}</td>
-                <td class="${{getCorrClass(r.corr_ct)}}">${{fmtCorr(r.corr_ct)}}</td>
-                <td>${{stars}}</td>
-            </tr>`;
-        }});
-    </script>
-</body>
-</html>'''
+    @staticmethod
+    def _cluster_section(cluster: Optional[Dict[str, Any]]) -> str:
+        """Section HTML du cluster (vide si la stratégie est seule dans son cluster)."""
+        if not cluster or not cluster['members']:
+            return Markup('')
+        return CLUSTER_SECTION_TEMPLATE.render(
+            cluster,
+            mean='N/A' if cluster['mean_corr'] is None else f"{cluster['mean_corr']:.3f}",
+            members=', '.join(cluster['members']),
+        )
     
     @staticmethod
     def _sanitize_filename(name: str) -> str:
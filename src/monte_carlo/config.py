@@ -24,6 +24,22 @@ DEFAULT_CONFIG = {
     'random_seed': None,
 }
 
+# Isolation des simulations (un processus par stratégie dans le pipeline)
+WORKER_CONFIG = {
+    'timeout_seconds': 300,            # Durée max par stratégie (wall-clock)
+    'memory_limit_mb': 2048,           # Plafond mémoire virtuelle du worker (POSIX uniquement)
+    'slow_threshold_seconds': 60,      # Au-delà: stratégie signalée comme lente
+    'terminate_grace_seconds': 5,      # Délai d'arrêt propre avant kill
+}
+
+# Statuts d'exécution d'un worker
+WORKER_STATUS_OK = "ok"
+WORKER_STATUS_SKIPPED = "skipped"
+WORKER_STATUS_TIMEOUT = "timeout"
+WORKER_STATUS_MEMORY = "memory"
+WORKER_STATUS_CRASHED = "crashed"
+WORKER_STATUS_ERROR = "error"
+
 # Statuts de validation
 STATUS_OK = "OK"
 STATUS_WARNING = "WARNING"
@@ -18,7 +18,6 @@ Version: 2.1 - Ajout du dashboard interactif avec recalcul dynamique
 """
 
 import pandas as pd
-import json
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional
@@ -44,6 +43,9 @@ except ImportError:
     OUTPUT_ROOT = V2_ROOT / "outputs"
     HTML_MONTECARLO_DIR = OUTPUT_ROOT / "html_reports" / "montecarlo"
 
+# Templates précompilés partagés (analysés une fois, rendu par jointure)
+from src.utils.templates import Markup, compile_template, json_script
+
 # NOUVEAU: Importer la configuration du dashboard
 try:
     from src.monte_carlo.config import (
@@ -143,6 +145,38 @@ def load_individual_strategy_data(csv_file: Path) -> Dict:
     }
 
 
+# Fragments répétés (une ligne par niveau de capital / stratégie / symbole)
+RESULT_ROW_TEMPLATE = compile_template("""
+        <tr class="{row_class}">
+            <td>${Start_Equity:,.0f}</td>
+            <td>{Ruin_Pct:.2f}%</td>
+            <td>{Median_DD_Pct:.2f}%</td>
+            <td>${Median_Profit:,.0f}</td>
+            <td>{Median_Return_Pct:.2f}%</td>
+            <td>{return_dd_ratio:.2f}</td>
+            <td>{Prob_Positive_Pct:.1f}%</td>
+        </tr>
+        """)
+
+SUMMARY_ROW_TEMPLATE = compile_template("""
+        <tr data-strategy="{strategy_name}" data-symbol="{symbol}" data-status="{status}">
+            <td><a href="{individual_link}" class="strategy-link">{strategy_name}</a></td>
+            <td>{symbol}</td>
+            <td><span class="status-badge {status_class}">{status_text}</span></td>
+            <td>{capital_str}</td>
+            <td>{nb_trades:,}</td>
+            <td>${total_pnl:,.0f}</td>
+            <td>{win_rate:.1f}%</td>
+            <td>{profit_factor:.2f}</td>
+            <td>{ruin_pct:.1f}%</td>
+            <td>{return_dd_ratio:.2f}</td>
+            <td>{prob_positive:.1f}%</td>
+        </tr>
+        """)
+
+SYMBOL_OPTION_TEMPLATE = compile_template('<option value="{symbol}">{symbol}</option>')
+
+
 def generate_individual_html(
     strategy_name: str,
     symbol: str,
@@ -178,20 +212,14 @@ def generate_individual_html(
         rec_row = df.iloc[-1].to_dict()
     
     # Générer les lignes du tableau
-    results_rows = ""
-    for _, row in df.iterrows():
-        row_class = 'recommended' if row['Start_Equity'] == recommended_capital else ''
-        results_rows += f"""
-        <tr class="{row_class}">
-            <td>${row['Start_Equity']:,.0f}</td>
-            <td>{row['Ruin_Pct']:.2f}%</td>
-            <td>{row['Median_DD_Pct']:.2f}%</td>
-            <td>${row['Median_Profit']:,.0f}</td>
-            <td>{row['Median_Return_Pct']:.2f}%</td>
-            <td>{min(row['Return_DD_Ratio'], 99.99):.2f}</td>
-            <td>{row['Prob_Positive_Pct']:.1f}%</td>
-        </tr>
-        """
+    results_rows = RESULT_ROW_TEMPLATE.render_many(
+        dict(
+            row,
+            row_class='recommended' if row['Start_Equity'] == recommended_capital else '',
+            return_dd_ratio=min(row['Return_DD_Ratio'], 99.99),
+        )
+        for row in df.to_dict('records')
+    )
     
     # Déterminer le statut et la recommandation
     status = summary_row.get('status', 'UNKNOWN')
@@ -251,7 +279,7 @@ def generate_individual_html(
         """
     
     # Template HTML
-    html_content = HTML_INDIVIDUAL_TEMPLATE.format(
+    html_content = HTML_INDIVIDUAL_TEMPLATE.render(
         strategy_full_name=f"{symbol}_{strategy_name}",
         generation_date=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
         total_trades=f"{int(summary_row.get('nb_trades', 0)):,}",
@@ -268,14 +296,14 @@ def generate_individual_html(
         status_class=status_class,
         recommendation_title=recommendation_title,
         recommendation_text=recommendation_text,
-        criteria_html=criteria_html,
+        criteria_html=Markup(criteria_html),
         results_rows=results_rows,
-        capital_levels_json=json.dumps(capital_levels),
-        ruin_probs_json=json.dumps(ruin_probs),
-        return_dd_ratios_json=json.dumps([min(r, 20) for r in return_dd_ratios]),
-        median_profits_json=json.dumps(median_profits),
-        prob_positives_json=json.dumps(prob_positives),
-        recommended_capital_json=json.dumps(float(recommended_capital) if recommended_capital > 0 else 0),
+        capital_levels_json=json_script(capital_levels),
+        ruin_probs_json=json_script(ruin_probs),
+        return_dd_ratios_json=json_script([min(r, 20) for r in return_dd_ratios]),
+        median_profits_json=json_script(median_profits),
+        prob_positives_json=json_script(prob_positives),
+        recommended_capital_json=json_script(float(recommended_capital) if recommended_capital > 0 else 0),
     )
     
     # Écrire le fichier
@@ -309,7 +337,7 @@ def generate_summary_html(
         return row['strategy_name'].split('_')[0] if '_' in row['strategy_name'] else 'UNKNOWN'
     
     symbols = sorted(set(summary_df.apply(get_symbol, axis=1)))
-    symbol_options = '\n'.join(f'<option value="{s}">{s}</option>' for s in symbols)
+    symbol_options = SYMBOL_OPTION_TEMPLATE.render_many(({'symbol': s} for s in symbols), separator='\n')
     
     # Charger les données complètes de tous les niveaux pour chaque stratégie
     print("   📊 Chargement des données détaillées pour recalcul dynamique...")
@@ -355,7 +383,7 @@ def generate_summary_html(
     print(f"      ✓ {len(strategies_detailed_data)} stratégies chargées avec données détaillées")
     
     # Générer les lignes du tableau
-    table_rows = ""
+    table_rows = []
     for _, row in summary_df.iterrows():
         status_class = {
             STATUS_OK: 'status-ok',
@@ -377,24 +405,23 @@ def generate_summary_html(
         else:
             symbol = row['symbol']
         
-        # Lien vers le rapport individuel
-        individual_link = f"Individual/{symbol}_{row['strategy_name']}_MC.html"
-        
-        table_rows += f"""
-        <tr data-strategy="{row['strategy_name']}" data-symbol="{symbol}" data-status="{row['status']}">
-            <td><a href="{individual_link}" class="strategy-link">{row['strategy_name']}</a></td>
-            <td>{symbol}</td>
-            <td><span class="status-badge {status_class}">{status_text}</span></td>
-            <td>{capital_str}</td>
-            <td>{int(row['nb_trades']):,}</td>
-            <td>${row['total_pnl']:,.0f}</td>
-            <td>{row['win_rate']:.1f}%</td>
-            <td>{min(row['profit_factor'], 99.99):.2f}</td>
-            <td>{row['ruin_pct']:.1f}%</td>
-            <td>{min(row['return_dd_ratio'], 99.99):.2f}</td>
-            <td>{row['prob_positive']:.1f}%</td>
-        </tr>
-        """
+        table_rows.append({
+            'strategy_name': row['strategy_name'],
+            'symbol': symbol,
+            'status': row['status'],
+            # Lien vers le rapport individuel
+            'individual_link': f"Individual/{symbol}_{row['strategy_name']}_MC.html",
+            'status_class': status_class,
+            'status_text': status_text,
+            'capital_str': capital_str,
+            'nb_trades': int(row['nb_trades']),
+            'total_pnl': row['total_pnl'],
+            'win_rate': row['win_rate'],
+            'profit_factor': min(row['profit_factor'], 99.99),
+            'ruin_pct': row['ruin_pct'],
+            'return_dd_ratio': min(row['return_dd_ratio'], 99.99),
+            'prob_positive': row['prob_positive'],
+        })
     
     # Préparer les données JSON pour les graphiques ET le recalcul dynamique
     strategies_json_data = []
@@ -420,7 +447,7 @@ def generate_summary_html(
         })
     
     # JSON des données détaillées pour recalcul dynamique
-    strategies_detailed_json = json.dumps(strategies_detailed_data)
+    strategies_detailed_json = json_script(strategies_detailed_data)
     
     # Debug: afficher un échantillon
     if strategies_detailed_data:
@@ -433,13 +460,13 @@ def generate_summary_html(
     config_info = f"Run: {run_info['run_name']} | {run_info.get('nb_simulations', 'N/A')} simulations"
     
     # NOUVEAU: Préparer les données de configuration pour le template
-    presets_json = json.dumps(DASHBOARD_PRESETS) if DASHBOARD_PRESETS else '{}'
-    colors_json = json.dumps(DASHBOARD_COLORS) if DASHBOARD_COLORS else '{}'
-    slider_ranges_json = json.dumps(SLIDER_RANGES) if SLIDER_RANGES else '{}'
-    default_criteria_json = json.dumps(DASHBOARD_DEFAULT_CRITERIA) if DASHBOARD_DEFAULT_CRITERIA else '{}'
+    presets_json = json_script(DASHBOARD_PRESETS or {})
+    colors_json = json_script(DASHBOARD_COLORS or {})
+    slider_ranges_json = json_script(SLIDER_RANGES or {})
+    default_criteria_json = json_script(DASHBOARD_DEFAULT_CRITERIA or {})
     
     # Remplir le template
-    html_content = HTML_SUMMARY_TEMPLATE.format(
+    html_content = HTML_SUMMARY_TEMPLATE.render(
         generation_date=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
         total_strategies=total_strategies,
         ok_count=ok_count,
@@ -448,8 +475,8 @@ def generate_summary_html(
         total_trades=f"{total_trades:,}",
         total_pnl=f"{total_pnl:,.0f}",
         symbol_options=symbol_options,
-        table_rows=table_rows,
-        strategies_json=json.dumps(strategies_json_data),
+        table_rows=SUMMARY_ROW_TEMPLATE.render_many(table_rows),
+        strategies_json=json_script(strategies_json_data),
         strategies_detailed_json=strategies_detailed_json,
         config_info=config_info,
         # NOUVEAUX placeholders pour la configuration
@@ -584,8 +611,8 @@ except ImportError:
     INDIVIDUAL_TEMPLATE = html_templates.INDIVIDUAL_TEMPLATE
     SUMMARY_TEMPLATE = html_templates.SUMMARY_TEMPLATE
 
-HTML_INDIVIDUAL_TEMPLATE = INDIVIDUAL_TEMPLATE
-HTML_SUMMARY_TEMPLATE = SUMMARY_TEMPLATE
+HTML_INDIVIDUAL_TEMPLATE = compile_template(INDIVIDUAL_TEMPLATE)
+HTML_SUMMARY_TEMPLATE = compile_template(SUMMARY_TEMPLATE)
 
 
 if __name__ == "__main__":
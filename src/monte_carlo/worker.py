@@ -0,0 +1,247 @@
+"""
+Exécution isolée des simulations Monte Carlo.
+
+Chaque stratégie est simulée dans un processus dédié avec:
+- un timeout wall-clock (le worker est tué s'il le dépasse)
+- un plafond mémoire (RLIMIT_AS, POSIX uniquement)
+
+Un fichier d'equity aberrant (export tick, fichier corrompu, etc.) ne bloque
+donc plus l'étape Monte Carlo: il est signalé et l'étape continue.
+
+Coût: avec spawn (Windows), chaque processus ré-importe pandas et numpy
+(de l'ordre d'une seconde par stratégie). Un pool de workers avec
+maxtasksperchild=1 garderait l'isolation (un processus neuf par stratégie)
+tout en préparant le processus suivant pendant la simulation en cours;
+le timeout par stratégie y demande toutefois de tuer le worker concerné,
+ce que multiprocessing.Pool ne permet pas directement.
+
+Utilisation:
+    outcome = simulate_strategy_isolated(
+        equity_file, output_dir,
+        sim_params={'nb_simulations': 2000},
+        timeout_seconds=300,
+        memory_limit_mb=2048,
+    )
+    if outcome['status'] == 'ok':
+        summary = outcome['summary']
+"""
+
+import multiprocessing
+import time
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+from .config import (
+    WORKER_CONFIG,
+    WORKER_STATUS_OK,
+    WORKER_STATUS_SKIPPED,
+    WORKER_STATUS_TIMEOUT,
+    WORKER_STATUS_MEMORY,
+    WORKER_STATUS_CRASHED,
+    WORKER_STATUS_ERROR,
+)
+
+
+def _apply_memory_limit(memory_limit_mb: Optional[int]) -> bool:
+    """
+    Applique un plafond de mémoire virtuelle au processus courant.
+
+    Args:
+        memory_limit_mb: Plafond en Mo (None ou 0 = pas de limite)
+
+    Returns:
+        True si la limite a été appliquée
+    """
+    if not memory_limit_mb:
+        return False
+
+    try:
+        import resource
+    except ImportError:
+        # Windows: pas de RLIMIT, seul le timeout protège le pipeline
+        return False
+
+    limit_bytes = int(memory_limit_mb) * 1024 * 1024
+    try:
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        if hard != resource.RLIM_INFINITY:
+            limit_bytes = min(limit_bytes, hard)
+        resource.setrlimit(resource.RLIMIT_AS, (limit_bytes, hard))
+        return True
+    except (ValueError, OSError):
+        return False
+
+
+def _worker_main(
+    conn,
+    equity_file: str,
+    output_dir: str,
+    sim_params: Dict[str, Any],
+    memory_limit_mb: Optional[int],
+):
+    """
+    Point d'entrée du processus worker (doit rester au niveau module pour spawn).
+
+    Envoie un tuple (status, payload) sur la connexion.
+    """
+    try:
+        _apply_memory_limit(memory_limit_mb)
+
+        from .simulator import MonteCarloSimulator
+        from .data_loader import detect_file_format
+
+        if detect_file_format(equity_file) == "unknown":
+            conn.send((WORKER_STATUS_SKIPPED, {'error': "format inconnu"}))
+            return
+
+        mc = MonteCarloSimulator(strategy_file=equity_file, **sim_params)
+        mc.run(verbose=False)
+
+        csv_path = Path(output_dir) / f"{Path(equity_file).stem}_mc.csv"
+        mc.export_csv(str(csv_path), include_metadata=True)
+
+        conn.send((WORKER_STATUS_OK, {
+            'summary': mc.get_summary(),
+            'status': mc.status,
+            'recommended_capital': mc.recommended_capital,
+        }))
+    except MemoryError:
+        conn.send((WORKER_STATUS_MEMORY, {'error': "plafond mémoire atteint"}))
+    except Exception as e:
+        conn.send((WORKER_STATUS_ERROR, {'error': str(e)}))
+    finally:
+        conn.close()
+
+
+def count_trades_quick(equity_file: Path) -> Optional[int]:
+    """
+    Estime le nombre de trades d'un fichier sans le parser entièrement.
+
+    - Titan/MultiCharts: dernière valeur de la colonne CumulativeTrades
+    - CSV extrait: nombre de lignes (hors header)
+
+    Args:
+        equity_file: Chemin du fichier d'equity
+
+    Returns:
+        Nombre de trades, ou None si indéterminable
+    """
+    equity_file = Path(equity_file)
+    try:
+        with open(equity_file, 'rb') as f:
+            first_line = f.readline()
+
+            if b'Net_Profit' in first_line or b'Strategy_Name' in first_line:
+                nb_lines = sum(chunk.count(b'\n') for chunk in iter(lambda: f.read(1 << 20), b''))
+                return nb_lines
+
+            # Titan: lire uniquement la fin du fichier
+            f.seek(0, 2)
+            size = f.tell()
+            f.seek(max(0, size - 4096))
+            tail = f.read().strip().splitlines()
+
+        if not tail:
+            return None
+        parts = tail[-1].decode('utf-8', errors='ignore').split()
+        return int(float(parts[5])) if len(parts) >= 6 else None
+    except (OSError, ValueError):
+        return None
+
+
+def simulate_strategy_isolated(
+    equity_file: Path,
+    output_dir: Path,
+    sim_params: Dict[str, Any],
+    timeout_seconds: Optional[float] = None,
+    memory_limit_mb: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Simule une stratégie dans un processus isolé.
+
+    Args:
+        equity_file: Fichier d'equity curve (Titan ou CSV extrait)
+        output_dir: Répertoire de sortie du CSV Monte Carlo
+        sim_params: Paramètres passés à MonteCarloSimulator
+        timeout_seconds: Durée max (None = WORKER_CONFIG, 0 = illimité)
+        memory_limit_mb: Plafond mémoire (None = WORKER_CONFIG, 0 = illimité)
+
+    Returns:
+        Dict avec status, summary (si ok), error, duration_seconds,
+        file_size_mb et nb_trades (estimé pour les échecs)
+    """
+    equity_file = Path(equity_file)
+    if timeout_seconds is None:
+        timeout_seconds = WORKER_CONFIG['timeout_seconds']
+    if memory_limit_mb is None:
+        memory_limit_mb = WORKER_CONFIG['memory_limit_mb']
+
+    outcome = {
+        'strategy': equity_file.stem,
+        'file': str(equity_file),
+        'status': WORKER_STATUS_ERROR,
+        'summary': None,
+        'mc_status': None,
+        'recommended_capital': None,
+        'error': None,
+        'duration_seconds': 0.0,
+        'file_size_mb': round(equity_file.stat().st_size / (1024 * 1024), 2) if equity_file.exists() else 0.0,
+        'nb_trades': None,
+    }
+
+    ctx = multiprocessing.get_context()
+    parent_conn, child_conn = ctx.Pipe(duplex=False)
+    process = ctx.Process(
+        target=_worker_main,
+        args=(child_conn, str(equity_file), str(output_dir), sim_params, memory_limit_mb),
+        daemon=True,
+    )
+
+    start_time = time.time()
+    process.start()
+    child_conn.close()
+
+    message = None
+    timed_out = False
+    try:
+        # poll() rend la main dès que le worker répond ou meurt: seul un
+        # poll() expiré est un timeout (un worker mort mais pas encore
+        # récupéré par join() est encore vu vivant par is_alive())
+        if parent_conn.poll(timeout_seconds or None):
+            message = parent_conn.recv()
+        else:
+            timed_out = True
+    except EOFError:
+        # Worker mort sans réponse (kill OOM, segfault...)
+        message = None
+    finally:
+        parent_conn.close()
+
+    if timed_out:
+        process.terminate()
+        process.join(WORKER_CONFIG['terminate_grace_seconds'])
+        if process.is_alive():
+            process.kill()
+        outcome['status'] = WORKER_STATUS_TIMEOUT
+        outcome['error'] = f"timeout après {timeout_seconds}s"
+    else:
+        process.join(WORKER_CONFIG['terminate_grace_seconds'])
+        if message is None:
+            outcome['status'] = WORKER_STATUS_CRASHED
+            outcome['error'] = f"worker terminé sans résultat (exit code {process.exitcode})"
+        else:
+            status, payload = message
+            outcome['status'] = status
+            outcome['error'] = payload.get('error')
+            outcome['summary'] = payload.get('summary')
+            outcome['mc_status'] = payload.get('status')
+            outcome['recommended_capital'] = payload.get('recommended_capital')
+
+    outcome['duration_seconds'] = round(time.time() - start_time, 1)
+
+    if outcome['summary']:
+        outcome['nb_trades'] = outcome['summary'].get('nb_trades')
+    else:
+        outcome['nb_trades'] = count_trades_quick(equity_file)
+
+    return outcome
@@ -5,9 +5,11 @@ Trading Strategy Analysis Pipeline V2 - Utils Package
 from .file_utils import safe_read, extract_powerlanguage_code, clean_strategy_name
 from .matching import find_best_match, similarity_ratio, normalize_strategy_name
 from .constants import SYMBOL_MAPPING, STRATEGY_TYPES, KPI_DEFINITIONS
+from .templates import Template, Markup, compile_template, escape_html, json_script
 
 __all__ = [
     'safe_read', 'extract_powerlanguage_code', 'clean_strategy_name',
     'find_best_match', 'similarity_ratio', 'normalize_strategy_name',
     'SYMBOL_MAPPING', 'STRATEGY_TYPES', 'KPI_DEFINITIONS',
+    'Template', 'Markup', 'compile_template', 'escape_html', 'json_script',
 ]
@@ -0,0 +1,185 @@
+"""
+Templates HTML précompilés partagés par les générateurs de rapports.
+
+Un template est analysé une seule fois en segments littéraux et emplacements
+nommés; le rendu joint les segments et les valeurs, sans remplacement
+successif sur le texte complet ni reformatage du template à chaque page.
+
+Deux syntaxes:
+    'format'       syntaxe de str.format: {nom}, {nom:,.0f}, {nom!r},
+                   accolades doublées {{ }} pour le texte littéral
+                   (templates Monte Carlo, pages de corrélation, rapports IA)
+    'placeholder'  {{nom}}, accolades simples littérales (templates HTML
+                   externes); un emplacement sans valeur est laissé tel quel
+
+Les valeurs sont échappées pour le HTML, sauf les Markup: fragments déjà
+construits (lignes de tableaux rendues par render_many) et JSON des scripts
+(json_script).
+
+Utilisation:
+    ROW = compile_template('<tr><td>{name}</td><td>{profit:,.0f}</td></tr>')
+    PAGE = compile_template(PAGE_TEMPLATE)
+    html = PAGE.render(title=name, rows=ROW.render_many(rows), data=json_script(data))
+"""
+
+import html
+import json
+import re
+from functools import lru_cache
+from string import Formatter
+from typing import Any, Iterable, List, Mapping, Optional, Tuple
+
+
+class Markup(str):
+    """Chaîne HTML sûre, insérée telle quelle par les templates."""
+
+    __slots__ = ()
+
+
+def escape_html(value: Any) -> Markup:
+    """Échappe une valeur pour le HTML (les Markup sont conservés)."""
+    if isinstance(value, Markup):
+        return value
+    return Markup(html.escape(str(value), quote=True))
+
+
+def json_script(value: Any, **kwargs) -> Markup:
+    """
+    JSON à insérer dans un <script> (« </ » neutralisé).
+
+    Args:
+        value: Données sérialisables
+        **kwargs: Options de json.dumps (ensure_ascii, default, ...)
+    """
+    return Markup(json.dumps(value, **kwargs).replace('</', '<\\/'))
+
+
+_PLACEHOLDER = re.compile(r'\{\{\s*(\w+)\s*\}\}')
+
+# Emplacement: (nom, format, conversion, texte d'origine si valeur facultative)
+Slot = Tuple[str, str, Optional[str], Optional[str]]
+
+
+def _parse_format(text: str) -> Tuple[List[str], List[Slot]]:
+    """Segments d'un template str.format (noms simples uniquement)."""
+    literals, slots = [''], []
+    for literal, name, spec, conversion in Formatter().parse(text):
+        literals[-1] += literal
+        if name is None:
+            continue
+        if not name.isidentifier() or (spec and '{' in spec):
+            raise ValueError(f"Emplacement de template non supporté: {{{name}}}")
+        slots.append((name, spec or '', conversion, None))
+        literals.append('')
+    return literals, slots
+
+
+def _parse_placeholders(text: str) -> Tuple[List[str], List[Slot]]:
+    """Segments d'un template à emplacements {{nom}}."""
+    literals, slots = [], []
+    start = 0
+    for match in _PLACEHOLDER.finditer(text):
+        literals.append(text[start:match.start()])
+        slots.append((match.group(1), '', None, match.group(0)))
+        start = match.end()
+    literals.append(text[start:])
+    return literals, slots
+
+
+class Template:
+    """
+    Template compilé: len(slots) + 1 segments littéraux autour des emplacements.
+
+    Attributs:
+        literals: Segments littéraux
+        slots: Emplacements (nom, format, conversion, texte d'origine)
+        autoescape: Échapper les valeurs (hors Markup)
+    """
+
+    __slots__ = ('literals', 'slots', 'autoescape')
+
+    def __init__(self, text: str, syntax: str = 'format', autoescape: bool = True):
+        """
+        Analyse le template.
+
+        Args:
+            text: Texte du template
+            syntax: 'format' ou 'placeholder'
+            autoescape: Échapper les valeurs pour le HTML
+        """
+        if syntax == 'format':
+            literals, slots = _parse_format(text)
+        elif syntax == 'placeholder':
+            literals, slots = _parse_placeholders(text)
+        else:
+            raise ValueError(f"Syntaxe de template inconnue: {syntax}")
+        self.literals = tuple(literals)
+        self.slots = tuple(slots)
+        self.autoescape = autoescape
+
+    @property
+    def names(self) -> List[str]:
+        """Noms des emplacements (ordre d'apparition, sans doublons)."""
+        return list(dict.fromkeys(slot[0] for slot in self.slots))
+
+    def _value(self, value: Any, spec: str, conversion: Optional[str]) -> str:
+        """Valeur d'un emplacement: conversion, format puis échappement."""
+        if isinstance(value, Markup) and not spec and not conversion:
+            return value
+        if conversion == 'r':
+            value = repr(value)
+        elif conversion == 'a':
+            value = ascii(value)
+        elif conversion == 's':
+            value = str(value)
+        text = format(value, spec)
+        return html.escape(text, quote=True) if self.autoescape else text
+
+    def render(self, context: Optional[Mapping[str, Any]] = None, **values) -> Markup:
+        """
+        Rend le template.
+
+        Args:
+            context: Valeurs des emplacements (dict, ligne de données...)
+            **values: Valeurs complémentaires (prioritaires sur context)
+
+        Returns:
+            HTML (Markup)
+
+        Raises:
+            KeyError: Emplacement 'format' sans valeur
+        """
+        if context is not None:
+            values = {**context, **values} if values else context
+
+        literals = self.literals
+        parts = [literals[0]]
+        for k, (name, spec, conversion, original) in enumerate(self.slots):
+            if name in values:
+                parts.append(self._value(values[name], spec, conversion))
+            elif original is None:
+                raise KeyError(name)
+            else:
+                parts.append(original)
+            parts.append(literals[k + 1])
+        return Markup(''.join(parts))
+
+    def render_many(self, rows: Iterable[Mapping[str, Any]], separator: str = '') -> Markup:
+        """Rend le template pour chaque ligne et joint les résultats (lignes de tableau, options...)."""
+        return Markup(separator.join([self.render(row) for row in rows]))
+
+
+@lru_cache(maxsize=None)
+def compile_template(text: str, syntax: str = 'format', autoescape: bool = True) -> Template:
+    """
+    Template compilé, mis en cache par texte (analysé une seule fois par processus).
+
+    Args:
+        text: Texte du template
+        syntax: 'format' ou 'placeholder'
+        autoescape: Échapper les valeurs pour le HTML
+
+    Returns:
+        Template
+    """
+    return Template(text, syntax, autoescape)
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""
+Tests unitaires pour le module templates (templates HTML précompilés).
+"""
+
+import pytest
+from src.utils.templates import (
+    Markup,
+    Template,
+    compile_template,
+    escape_html,
+    json_script,
+)
+
+
+class TestFormatSyntax:
+    """Tests pour la syntaxe str.format."""
+    
+    def test_matches_str_format(self):
+        """Même rendu que str.format (formats, accolades doublées)."""
+        text = "<p>{name}: ${profit:,.0f} ({ratio:.2f})</p><script>const x = {{a: {count}}};</script>"
+        values = {'name': 'ES_Breakout', 'profit': 12345.6, 'ratio': 1.5, 'count': 3}
+        assert compile_template(text).render(values) == text.format(**values)
+    
+    def test_escapes_values(self):
+        """Valeurs échappées, Markup insérés tels quels."""
+        template = compile_template("<td>{name}</td>{rows}")
+        html = template.render(name='A <&> "B"', rows=Markup('<tr></tr>'))
+        assert html == '<td>A &lt;&amp;&gt; &quot;B&quot;</td><tr></tr>'
+        assert isinstance(html, Markup)
+    
+    def test_missing_value(self):
+        """Emplacement sans valeur: KeyError, comme str.format."""
+        with pytest.raises(KeyError):
+            compile_template("{a}{b}").render(a=1)
+    
+    def test_unsupported_field(self):
+        """Champs indexés ou positionnels refusés à la compilation."""
+        with pytest.raises(ValueError):
+            Template("{row[0]}")
+        with pytest.raises(ValueError):
+            Template("{}")
+    
+    def test_render_many(self):
+        """Une ligne rendue par élément, résultat non ré-échappé."""
+        row = compile_template("<li>{x}</li>")
+        page = compile_template("<ul>{items}</ul>")
+        items = row.render_many({'x': v} for v in ['a', '<b>'])
+        assert page.render(items=items) == '<ul><li>a</li><li>&lt;b&gt;</li></ul>'
+
+
+class TestPlaceholderSyntax:
+    """Tests pour la syntaxe {{nom}} des templates externes."""
+    
+    def test_placeholders(self):
+        """Emplacements remplis, accolades simples littérales, inconnus conservés."""
+        template = compile_template("body { color: red; } {{title}} {{ missing }} {{title}}", 'placeholder')
+        assert template.names == ['title', 'missing']
+        assert template.render(title='T&C') == "body { color: red; } T&amp;C {{ missing }} T&amp;C"
+
+
+class TestHelpers:
+    """Tests pour les fonctions utilitaires."""
+    
+    def test_json_script(self):
+        """JSON sans fermeture de balise script."""
+        assert json_script({'a': '</script>'}) == '{"a": "<\\/script>"}'
+    
+    def test_escape_html(self):
+        """Échappement HTML, Markup conservé."""
+        assert escape_html("<script>") == "&lt;script&gt;"
+        assert escape_html(Markup("<b>")) == "<b>"
+    
+    def test_compile_cache(self):
+        """Un même texte n'est analysé qu'une fois."""
+        assert compile_template("<p>{x}</p>") is compile_template("<p>{x}</p>")
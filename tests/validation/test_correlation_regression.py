@@ -3,12 +3,25 @@
 Tests pour le module de Corrélation V2.
 """
 
+import json
+import warnings
 import pytest
 import pandas as pd
 import numpy as np
 from pathlib import Path
 
 
+def _sparse_profit_matrix(seed: int = 0, n_days: int = 400, n_strategies: int = 8) -> pd.DataFrame:
+    """Matrice de profits avec activité partielle, une copie linéaire et une série constante."""
+    rng = np.random.default_rng(seed)
+    activity = rng.random((n_days, n_strategies)) < rng.uniform(0.1, 0.9, n_strategies)
+    values = rng.normal(50, 300, (n_days, n_strategies)) * activity
+    values[:, 1] = np.where(values[:, 0] != 0, values[:, 0] * 3 + 500, 0)
+    values[:, 2] = np.where(values[:, 2] != 0, 42.0, 0)
+    dates = pd.date_range('2020-01-01', periods=n_days, freq='B')
+    return pd.DataFrame(values, index=dates, columns=[f"S{i}" for i in range(n_strategies)])
+
+
 class TestCorrelationConfig:
     """Tests pour la configuration de corrélation."""
     
@@ -98,6 +111,147 @@ class TestCorrelationCalculator:
         except ImportError:
             pytest.skip("Module non disponible")
     
+    def test_profit_matrix_matches_pivot(self):
+        """La ProfitMatrix (bincount) = pivot_table somme, et les fenêtres sont des vues."""
+        try:
+            from src.consolidators import ProfitMatrix
+        except ImportError:
+            pytest.skip("Module non disponible")
+        
+        data = pd.DataFrame({
+            'Date': pd.to_datetime(['2024-01-03', '2024-01-02', '2024-01-02', '2024-01-04', '2024-01-03']),
+            'Strategy_ID': ['B', 'A', 'A', 'A', 'C'],
+            'DailyProfit': [10.0, 5.0, -5.0, 7.5, 2.0],
+        })
+        expected = data.pivot_table(
+            index='Date', columns='Strategy_ID', values='DailyProfit', aggfunc='sum', fill_value=0
+        )
+        
+        profits = ProfitMatrix.from_frame(data)
+        assert profits.strategies.tolist() == ['A', 'B', 'C']
+        assert np.array_equal(profits.values, expected.to_numpy(dtype=np.float32))
+        assert profits.active_days().tolist() == [1, 1, 1]
+        
+        window = profits.window(start='2024-01-03')
+        assert len(window) == 2
+        assert np.shares_memory(window.values, profits.values)
+        assert window.filter_active(1).strategies.tolist() == ['A', 'B', 'C']
+    
+    def test_consolidated_cache_roundtrip(self, tmp_path):
+        """Le compagnon colonnaire redonne les mêmes données et suit le fichier source."""
+        try:
+            from src.consolidators import CorrelationAnalyzer, load_consolidated
+            from src.consolidators.consolidated_cache import companion_path, is_cache_fresh
+        except ImportError:
+            pytest.skip("Module non disponible")
+        
+        source = tmp_path / "Consolidated_Strategies_20240105.txt"
+        source.write_text(
+            "Strategy_Name;Symbol;Date;DailyProfit\n"
+            "Alpha;ES;02/01/2024;10,5\n"
+            "Alpha;ES;03/01/2024;-4\n"
+            "Beta;NQ;02/01/2024;7,25\n"
+            "Beta;NQ;31/02/2024;1\n",
+            encoding='utf-8',
+        )
+        
+        first = load_consolidated(source, verbose=False)
+        cache = companion_path(source)
+        assert is_cache_fresh(source, cache)
+        
+        cached = load_consolidated(cache, verbose=False)
+        assert cached.columns.tolist() == first.columns.tolist()
+        assert cached['Strategy_ID'].astype(str).tolist() == ['Alpha_ES', 'Alpha_ES', 'Beta_NQ', 'Beta_NQ']
+        assert cached['Date'].isna().sum() == 1
+        assert np.array_equal(cached['DailyProfit'].to_numpy(), first['DailyProfit'].to_numpy())
+        
+        prepared_text = CorrelationAnalyzer(first).data
+        prepared_cache = CorrelationAnalyzer(cached).data
+        assert prepared_cache['Date'].tolist() == prepared_text['Date'].tolist()
+        assert prepared_cache['Strategy_ID'].astype(str).tolist() == prepared_text['Strategy_ID'].tolist()
+        
+        # Le source change: le compagnon n'est plus frais et il est réécrit
+        with open(source, 'a', encoding='utf-8') as f:
+            f.write("Beta;NQ;04/01/2024;3\n")
+        assert not is_cache_fresh(source, cache)
+        assert len(load_consolidated(cache, verbose=False)) == 5
+        assert is_cache_fresh(source, cache)
+    
+    def test_latest_consolidated_checks_cache_signature(self, tmp_path, monkeypatch):
+        """Un .txt remplacé en conservant ses dates (cp -p) n'utilise pas l'ancien compagnon."""
+        try:
+            import os
+            from config import settings
+            from src.consolidators import load_consolidated
+            from src.consolidators.consolidated_cache import companion_path
+        except ImportError:
+            pytest.skip("Module non disponible")
+        
+        monkeypatch.setattr(settings, 'CONSOLIDATED_DIR', tmp_path)
+        source = tmp_path / "Consolidated_Strategies_20240105.txt"
+        source.write_text("Strategy_Name;Symbol;Date;DailyProfit\nAlpha;ES;02/01/2024;10\n", encoding='utf-8')
+        load_consolidated(source, verbose=False)
+        cache = companion_path(source)
+        assert settings.get_latest_consolidated() == cache
+        
+        # Nouveau contenu, date de modification antérieure au compagnon
+        source.write_text("Strategy_Name;Symbol;Date;DailyProfit\nBeta;NQ;03/01/2024;-5\n", encoding='utf-8')
+        old_mtime = cache.stat().st_mtime - 60
+        os.utime(source, (old_mtime, old_mtime))
+        assert settings.get_latest_consolidated() == source
+        assert settings.get_latest_consolidated(prefer_cache=False) == source
+    
+    def test_streamed_profit_matrix_matches_full_load(self, tmp_path):
+        """La lecture par blocs donne la même matrice et les mêmes corrélations que le chargement complet."""
+        try:
+            from src.consolidators import CorrelationAnalyzer, ProfitMatrix, load_consolidated, stream_profit_matrix
+        except ImportError:
+            pytest.skip("Module non disponible")
+        
+        matrix = _sparse_profit_matrix(seed=11, n_days=300, n_strategies=6)
+        rows = matrix.stack().rename('DailyProfit').reset_index()
+        rows.columns = ['Date', 'Strategy_Name', 'DailyProfit']
+        rows = rows[rows['DailyProfit'] != 0].sample(frac=1.0, random_state=0)
+        rows['Symbol'] = 'ES'
+        rows['Date'] = rows['Date'].dt.strftime('%d/%m/%Y')
+        source = tmp_path / "Consolidated_Strategies_20210101.txt"
+        rows.to_csv(source, sep=';', decimal=',', index=False)
+        
+        streamed = stream_profit_matrix(source, chunk_rows=97, verbose=False)
+        full = load_consolidated(source, verbose=False)
+        expected = ProfitMatrix.from_frame(CorrelationAnalyzer(full).data)
+        assert streamed.strategies.tolist() == expected.strategies.tolist()
+        assert streamed.dates.equals(expected.dates)
+        assert np.array_equal(streamed.values, expected.values)
+        
+        # Le compagnon écrit par load_consolidated est relu par tranches
+        from src.consolidators.consolidated_cache import (
+            companion_path, iter_consolidated_cache, read_consolidated_cache,
+        )
+        columns = ['Date', 'Strategy_ID', 'DailyProfit']
+        chunks = list(iter_consolidated_cache(companion_path(source), columns, 97))
+        assert max(len(c) for c in chunks) == 97
+        pd.testing.assert_frame_equal(
+            pd.concat(chunks, ignore_index=True),
+            read_consolidated_cache(companion_path(source), columns=columns),
+        )
+        cached = stream_profit_matrix(source, chunk_rows=97, verbose=False)
+        assert np.array_equal(cached.values, expected.values)
+        
+        # Seconde passe: un bloc non relevé par scan() est refusé
+        from src.consolidators import ProfitMatrixAccumulator
+        accumulator = ProfitMatrixAccumulator()
+        accumulator.scan(chunks[0])
+        with pytest.raises(ValueError):
+            accumulator.add(pd.concat(chunks, ignore_index=True))
+        
+        from_stream = CorrelationAnalyzer(streamed, start_year_longterm=2020, recent_months=6)
+        from_frame = CorrelationAnalyzer(full, start_year_longterm=2020, recent_months=6)
+        from_stream.run(verbose=False)
+        from_frame.run(verbose=False)
+        pd.testing.assert_frame_equal(from_stream.corr_matrix_lt, from_frame.corr_matrix_lt)
+        pd.testing.assert_frame_equal(from_stream.scores, from_frame.scores)
+    
     def test_calculate_correlation_matrix(self):
         """La matrice de corrélation peut être calculée."""
         try:
@@ -122,6 +276,865 @@ class TestCorrelationCalculator:
         except ImportError:
             pytest.skip("Module non disponible")
     
+    def test_pearson_engine_matches_pairwise(self):
+        """Le moteur matriciel reproduit la corrélation paire par paire."""
+        try:
+            from src.consolidators import calculate_correlation_matrix
+        except ImportError:
+            pytest.skip("Module non disponible")
+        
+        matrix = _sparse_profit_matrix(seed=7)
+        corr, common_days = calculate_correlation_matrix(matrix, min_common_days=40)
+        
+        strategies = matrix.columns.tolist()
+        for i, a in enumerate(strategies):
+            for b in strategies[i + 1:]:
+                mask = (matrix[a] != 0) & (matrix[b] != 0)
+                assert common_days.loc[a, b] == mask.sum()
+                if mask.sum() >= 40:
+                    expected = matrix.loc[mask, a].corr(matrix.loc[mask, b])
+                else:
+                    expected = np.nan
+                if np.isnan(expected):
+                    assert np.isnan(corr.loc[a, b]), f"{a}/{b}"
+                else:
+                    assert abs(corr.loc[a, b] - expected) < 1e-9, f"{a}/{b}"
+    
+    def test_tiled_pearson_matches_direct(self):
+        """Le calcul par tuiles (multi-processus) reproduit le calcul direct."""
+        try:
+            from src.consolidators.correlation_engine import pearson_correlation_matrix
+            from src.consolidators.correlation_tiles import tiled_pearson_correlation_matrix
+        except ImportError:
+            pytest.skip("Module non disponible")
+        
+        values = _sparse_profit_matrix(seed=5, n_strategies=70).to_numpy()
+        expected, expected_common = pearson_correlation_matrix(values, 40)
+        
+        for n_workers in (1, 2):
+            corr, common = tiled_pearson_correlation_matrix(
+                values, 40, tile_size=32, n_workers=n_workers, memory_budget_mb=512
+            )
+            assert (common == expected_common).all()
+            assert (np.isnan(corr) == np.isnan(expected)).all()
+            assert np.nanmax(np.abs(corr - expected)) < 1e-12
+    
+    def test_incremental_state_matches_full_run(self, tmp_path):
+        """Les mises à jour jour par jour de l'état donnent les matrices d'un calcul complet."""
+        try:
+            from src.consolidators import CorrelationAnalyzer
+        except ImportError:
+            pytest.skip("Module non disponible")
+        
+        matrix = _sparse_profit_matrix(seed=9, n_days=600, n_strategies=6)
+        data = matrix.stack().rename('DailyProfit').reset_index()
+        data.columns = ['Date', 'Strategy_ID', 'DailyProfit']
+        data = data[data['DailyProfit'] != 0]
+        
+        state_path = tmp_path / "correlation_state.npz"
+        dates = matrix.index
+        for end in [dates[-40]] + list(dates[-5:]):
+            analyzer = CorrelationAnalyzer(data[data['Date'] <= end], start_year_longterm=2020, recent_months=6)
+            analyzer.run(verbose=False, state_path=state_path)
+        
+        full = CorrelationAnalyzer(data, start_year_longterm=2020, recent_months=6)
+        full.run(verbose=False)
+        
+        for incremental, expected in [
+            (analyzer.corr_matrix_lt, full.corr_matrix_lt),
+            (analyzer.corr_matrix_ct, full.corr_matrix_ct),
+        ]:
+            assert incremental.columns.tolist() == expected.columns.tolist()
+            assert (incremental.isna() == expected.isna()).all().all()
+            assert np.nanmax(np.abs(incremental.values - expected.values)) < 1e-9
+        assert (analyzer.common_days_ct.values == full.common_days_ct.values).all()
+    
+    def test_binary_export_roundtrip(self, tmp_path):
+        """L'export .npy + index JSON recharge les mêmes matrices (mappées) et les mêmes scores."""
+        try:
+            from src.consolidators import CorrelationAnalyzer, CorrelationStore
+        except ImportError:
+            pytest.skip("Module non disponible")
+        
+        matrix = _sparse_profit_matrix(seed=11, n_days=500, n_strategies=7)
+        data = matrix.stack().rename('DailyProfit').reset_index()
+        data.columns = ['Date', 'Strategy_ID', 'DailyProfit']
+        data = data[data['DailyProfit'] != 0]
+        
+        analyzer = CorrelationAnalyzer(data, start_year_longterm=2020, recent_months=6)
+        analyzer.run(verbose=False)
+        analyzer.build_similarity_index()
+        index_path = analyzer.export_binary(tmp_path)['index']
+        
+        reloaded = CorrelationAnalyzer.from_binary(index_path)
+        pd.testing.assert_frame_equal(reloaded.corr_matrix_lt, analyzer.corr_matrix_lt)
+        pd.testing.assert_frame_equal(reloaded.corr_matrix_ct, analyzer.corr_matrix_ct)
+        assert (reloaded.common_days_ct.values == analyzer.common_days_ct.values).all()
+        pd.testing.assert_frame_equal(reloaded.scores, analyzer.scores)
+        assert reloaded.recent_months == 6
+        assert reloaded.similarity.strategies == analyzer.similarity.strategies
+        
+        # Matrices rechargées empaquetées et mappées, sans copie dans l'analyseur
+        store = CorrelationStore.load(index_path)
+        packed = store.correlation['lt']
+        assert isinstance(packed.upper, np.memmap)
+        assert packed.upper.dtype == np.float32 and store.common_days['lt'].dtype == np.uint16
+        assert packed.nbytes == 4 * 7 * 8 // 2
+        assert isinstance(reloaded._packed['corr_lt'].upper, np.memmap)
+        row = store.row('lt', 'S3')
+        assert np.array_equal(row, analyzer.corr_matrix_lt.loc['S3'].to_numpy(), equal_nan=True)
+        assert store.row('lt', 'inconnue') is None
+    
+    def test_packed_result_frames(self):
+        """Les DataFrames publics (float64 / int64) sont construits une fois et conservés."""
+        try:
+            from src.consolidators import CorrelationAnalyzer
+        except ImportError:
+            pytest.skip("Module non disponible")
+        
+        matrix = _sparse_profit_matrix(seed=5, n_days=400, n_strategies=5)
+        data = matrix.stack().rename('DailyProfit').reset_index()
+        data.columns = ['Date', 'Strategy_ID', 'DailyProfit']
+        analyzer = CorrelationAnalyzer(data[data['DailyProfit'] != 0], start_year_longterm=2020, recent_months=6)
+        analyzer.run(verbose=False)
+        
+        corr = analyzer.corr_matrix_lt
+        assert (corr.dtypes == np.float64).all()
+        assert (analyzer.common_days_lt.dtypes == np.int64).all()
+        assert (analyzer.delta_matrix.dtypes == np.float64).all()
+        assert corr is analyzer.corr_matrix_lt
+        
+        # Écriture sur place: visible par l'attribut, pas par le stockage empaqueté
+        corr.loc['S0', 'S1'] = corr.loc['S1', 'S0'] = 0.5
+        assert analyzer.corr_matrix_lt.loc['S0', 'S1'] == 0.5
+        assert analyzer.packed_matrix('corr_lt').get('S0', 'S1') != 0.5
+        
+        # Réaffectation: reportée dans le stockage, DataFrame reconstruit
+        analyzer.corr_matrix_lt = corr
+        assert analyzer.packed_matrix('corr_lt').get('S0', 'S1') == 0.5
+        assert analyzer.corr_matrix_lt is not corr
+        assert analyzer.corr_matrix_lt.loc['S0', 'S1'] == 0.5
+    
+    def test_rolling_correlations_match_window_recompute(self):
+        """Les corrélations glissantes (sommes cumulées) = recalcul direct de chaque fenêtre."""
+        try:
+            from src.consolidators import rolling_pair_correlations
+        except ImportError:
+            pytest.skip("Module non disponible")
+        
+        matrix = _sparse_profit_matrix(seed=4, n_days=700, n_strategies=5)
+        pairs = [('S0', 'S1'), ('S3', 'S0'), ('S2', 'S4'), ('S3', 'S4')]
+        rolling = rolling_pair_correlations(matrix, pairs, window_months=6, step_months=2, min_common_days=20)
+        
+        assert len(rolling) == 4
+        for a, b in pairs:
+            series = rolling.series(b, a)
+            for k, end in enumerate(rolling.window_ends):
+                window = matrix[(matrix.index > end - pd.DateOffset(months=6)) & (matrix.index <= end)]
+                mask = (window[a] != 0) & (window[b] != 0)
+                expected = window.loc[mask, a].corr(window.loc[mask, b]) if mask.sum() >= 20 else np.nan
+                if np.isnan(expected) or window.loc[mask, a].std() == 0 or window.loc[mask, b].std() == 0:
+                    assert np.isnan(series[k]), f"{a}/{b} @ {end}"
+                else:
+                    assert abs(series[k] - expected) < 1e-5, f"{a}/{b} @ {end}"
+    
+    def test_multi_window_matches_single_runs(self):
+        """Les fenêtres 12M et LT du mode multi-fenêtres = matrices CT et LT de run()."""
+        try:
+            from src.consolidators import CorrelationAnalyzer
+        except ImportError:
+            pytest.skip("Module non disponible")
+        
+        matrix = _sparse_profit_matrix(seed=2, n_days=800, n_strategies=6)
+        data = matrix.stack().rename('DailyProfit').reset_index()
+        data.columns = ['Date', 'Strategy_ID', 'DailyProfit']
+        
+        analyzer = CorrelationAnalyzer(data, start_year_longterm=2020, recent_months=12)
+        analyzer.run(verbose=False)
+        scores = analyzer.run_multi_window(windows_months=[6, 12], verbose=False)
+        
+        # Les matrices de run() sont stockées en float32 (triangle empaqueté)
+        for label, expected in [('12M', analyzer.corr_matrix_ct), ('LT', analyzer.corr_matrix_lt)]:
+            corr = analyzer.multi_window_corr[label]
+            assert corr.columns.tolist() == expected.columns.tolist()
+            assert np.nanmax(np.abs(corr.values - expected.values)) < 1e-6
+        
+        assert {'N_Corr_6M', 'N_Corr_12M', 'N_Corr_LT', 'Score_Davey'} <= set(scores.columns)
+        assert scores['Score_Davey'].is_monotonic_decreasing
+        
+        # Fenêtres LT + CT seules: même score (et mêmes seuils) que run()
+        scores = analyzer.run_multi_window(windows_months=[12], verbose=False)
+        expected = analyzer.scores.set_index('Strategy')['Score_Davey']
+        actual = scores.set_index('Strategy')['Score_Davey'].reindex(expected.index)
+        assert np.allclose(actual.values, expected.values)
+    
+    def test_spearman_matches_ranked_pearson(self):
+        """Spearman = Pearson des rangs moyens sur les jours communs."""
+        try:
+            from src.consolidators import calculate_correlation_matrix
+        except ImportError:
+            pytest.skip("Module non disponible")
+        
+        matrix = _sparse_profit_matrix(seed=11).round(0)
+        corr, _ = calculate_correlation_matrix(matrix, min_common_days=40, method='spearman')
+        
+        strategies = matrix.columns.tolist()
+        for i, a in enumerate(strategies):
+            for b in strategies[i + 1:]:
+                mask = (matrix[a] != 0) & (matrix[b] != 0)
+                expected = np.nan
+                if mask.sum() >= 40:
+                    expected = matrix.loc[mask, a].rank().corr(matrix.loc[mask, b].rank())
+                if np.isnan(expected):
+                    assert np.isnan(corr.loc[a, b]), f"{a}/{b}"
+                else:
+                    assert abs(corr.loc[a, b] - expected) < 1e-9, f"{a}/{b}"
+    
+    def test_kendall_tau_b_matches_brute_force(self):
+        """Le tau-b en O(n log n) correspond au comptage O(n²) avec ex-aequo."""
+        try:
+            from src.consolidators.correlation_engine import kendall_tau_b
+        except ImportError:
+            pytest.skip("Module non disponible")
+        
+        rng = np.random.default_rng(3)
+        x = rng.integers(0, 6, 150).astype(float)
+        y = rng.integers(0, 4, 150).astype(float)
+        
+        concordant = discordant = ties_x = ties_y = 0
+        for i in range(len(x)):
+            for j in range(i + 1, len(x)):
+                sign = np.sign(x[i] - x[j]) * np.sign(y[i] - y[j])
+                if sign > 0:
+                    concordant += 1
+                elif sign < 0:
+                    discordant += 1
+                elif x[i] == x[j] and y[i] != y[j]:
+                    ties_x += 1
+                elif y[i] == y[j] and x[i] != x[j]:
+                    ties_y += 1
+        expected = (concordant - discordant) / np.sqrt(
+            (concordant + discordant + ties_x) * (concordant + discordant + ties_y)
+        )
+        
+        assert abs(kendall_tau_b(x, y) - expected) < 1e-12
+        assert np.isnan(kendall_tau_b(x, np.ones_like(x)))
+    
+    def test_davey_scores_match_per_strategy_reference(self):
+        """Les scores vectorisés = calcul stratégie par stratégie, pour plusieurs seuils."""
+        try:
+            from src.consolidators import calculate_davey_scores
+            from src.consolidators.correlation_calculator import calculate_davey_scores_for_thresholds
+        except ImportError:
+            pytest.skip("Module non disponible")
+        
+        rng = np.random.default_rng(5)
+        names = [f"S{i}" for i in range(12)]
+        values = rng.uniform(-1, 1, (12, 12))
+        values = (values + values.T) / 2
+        values[rng.random((12, 12)) < 0.2] = np.nan
+        np.fill_diagonal(values, 1.0)
+        corr_lt = pd.DataFrame(values, index=names, columns=names)
+        corr_ct = corr_lt.iloc[2:, 2:] * 0.9
+        
+        scores = calculate_davey_scores(corr_lt, corr_ct, 0.5, 0.5, 0.5).set_index('Strategy')
+        assert sorted(scores.index) == sorted(names[2:])
+        assert scores['Score_Davey'].is_monotonic_decreasing
+        for strat in names[2:]:
+            lt = corr_lt.loc[strat].drop(strat).dropna().abs()
+            ct = corr_ct.loc[strat].drop(strat).dropna().abs()
+            row = scores.loc[strat]
+            assert row['N_Corr_LT'] == (lt > 0.5).sum()
+            assert row['N_Corr_CT'] == (ct > 0.5).sum()
+            assert row['Score_Davey'] == round((lt > 0.5).sum() * 0.5 + (ct > 0.5).sum() * 0.5, 1)
+            assert row['Avg_Corr_LT'] == round(lt.mean(), 3)
+            assert row['Max_Corr_CT'] == round(ct.max(), 3)
+            assert row['Max_Corr_LT_With'] == lt.idxmax()
+        
+        by_threshold = calculate_davey_scores_for_thresholds(corr_lt, corr_ct, [0.7, 0.3, 0.5], 0.5, 0.5)
+        assert list(by_threshold) == [0.7, 0.3, 0.5]
+        pd.testing.assert_frame_equal(by_threshold[0.5].set_index('Strategy'), scores)
+        for threshold, df in by_threshold.items():
+            counts = df.set_index('Strategy')['N_Corr_CT']
+            for strat in names[2:]:
+                assert counts[strat] == (corr_ct.loc[strat].drop(strat).abs() > threshold).sum()
+    
+    def test_threshold_sweep_matches_single_threshold_scores(self):
+        """Le balayage des seuils = calculate_davey_scores seuil par seuil."""
+        try:
+            from src.consolidators import calculate_davey_scores
+            from src.consolidators.correlation_calculator import calculate_threshold_sweep
+        except ImportError:
+            pytest.skip("Module non disponible")
+        
+        rng = np.random.default_rng(6)
+        names = [f"S{i}" for i in range(15)]
+        values = rng.uniform(-1, 1, (15, 15))
+        values = (values + values.T) / 2
+        np.fill_diagonal(values, 1.0)
+        corr_lt = pd.DataFrame(values, index=names, columns=names)
+        corr_ct = corr_lt.iloc[1:, 1:] * 1.3
+        
+        thresholds = [0.2, 0.4, 0.6]
+        sweep = calculate_threshold_sweep(corr_lt, corr_ct, thresholds, 0.5, 0.5)
+        assert len(sweep) == 14 * len(thresholds)
+        
+        for threshold in thresholds:
+            expected = calculate_davey_scores(corr_lt, corr_ct, threshold, 0.5, 0.5).set_index('Strategy')
+            actual = sweep[sweep['Threshold'] == threshold].set_index('Strategy').loc[expected.index]
+            for column in ['N_Corr_LT', 'N_Corr_CT', 'Score_Davey', 'Status']:
+                assert actual[column].tolist() == expected[column].tolist()
+    
+    def test_extreme_pairs_match_pair_list(self):
+        """Les paires extrêmes (blocs + argpartition) = nlargest/nsmallest sur la liste des paires."""
+        try:
+            import src.consolidators.correlation_calculator as calculator
+        except ImportError:
+            pytest.skip("Module non disponible")
+        
+        rng = np.random.default_rng(8)
+        names = [f"S{i}" for i in range(30)]
+        values = np.round(rng.uniform(-1, 1, (30, 30)), 1)
+        values = np.triu(values, 1) + np.triu(values, 1).T
+        values[3, 7] = values[7, 3] = np.nan
+        np.fill_diagonal(values, 1.0)
+        matrix = pd.DataFrame(values, index=names, columns=names)
+        
+        pairs = pd.DataFrame([
+            {'Strategy_1': names[i], 'Strategy_2': names[j], 'Correlation': values[i, j]}
+            for i in range(30) for j in range(i + 1, 30) if not np.isnan(values[i, j])
+        ])
+        pairs['Abs'] = pairs['Correlation'].abs()
+        
+        # Petits blocs: plusieurs blocs et nombreux ex æquo à la frontière
+        original_block = calculator._PAIR_BLOCK_ELEMENTS
+        calculator._PAIR_BLOCK_ELEMENTS = 100
+        try:
+            most, least = calculator.find_extreme_pairs(matrix, top_n=15)
+            biggest = calculator.top_pairs(matrix, 15, 'abs')
+        finally:
+            calculator._PAIR_BLOCK_ELEMENTS = original_block
+        
+        columns = ['Strategy_1', 'Strategy_2', 'Correlation']
+        pd.testing.assert_frame_equal(most, pairs.nlargest(15, 'Correlation')[columns].reset_index(drop=True))
+        pd.testing.assert_frame_equal(least, pairs.nsmallest(15, 'Correlation')[columns].reset_index(drop=True))
+        pd.testing.assert_frame_equal(biggest, pairs.nlargest(15, 'Abs')[columns].reset_index(drop=True))
+    
+    
+    def test_packed_matrix_matches_dense(self):
+        """Matrice empaquetée: accès par paire, lignes, paires extrêmes et delta = matrice dense."""
+        try:
+            import src.consolidators.correlation_calculator as calculator
+            from src.consolidators.packed_matrix import PackedSymmetricMatrix, packed_delta
+        except ImportError:
+            pytest.skip("Module non disponible")
+        
+        rng = np.random.default_rng(12)
+        names = [f"S{i}" for i in range(25)]
+        values = np.round(rng.uniform(-1, 1, (25, 25)), 2)
+        values = np.triu(values, 1) + np.triu(values, 1).T
+        values[2, 9] = values[9, 2] = np.nan
+        np.fill_diagonal(values, 1.0)
+        matrix = pd.DataFrame(values, index=names, columns=names).astype(np.float32)
+        packed = PackedSymmetricMatrix.from_dense(matrix)
+        
+        assert packed.nbytes == (25 * 24 // 2 + 25) * 4
+        pd.testing.assert_frame_equal(packed.to_frame(), matrix)
+        np.testing.assert_array_equal(np.asarray(packed), matrix.to_numpy())
+        for a, b in [('S0', 'S24'), ('S24', 'S0'), ('S5', 'S5'), ('S2', 'S9')]:
+            np.testing.assert_array_equal(packed.get(a, b), matrix.loc[a, b])
+        for name in names:
+            pd.testing.assert_series_equal(packed.row_series(name), matrix.loc[name])
+        
+        original_block = calculator._PAIR_BLOCK_ELEMENTS
+        calculator._PAIR_BLOCK_ELEMENTS = 50
+        try:
+            for mode in ('largest', 'smallest', 'abs'):
+                pd.testing.assert_frame_equal(
+                    calculator.top_pairs(packed, 12, mode),
+                    calculator.top_pairs(matrix, 12, mode),
+                )
+        finally:
+            calculator._PAIR_BLOCK_ELEMENTS = original_block
+        
+        # Delta sur les stratégies communes (ordre LT), jours communs en uint16 saturés
+        ct = matrix.iloc[::-1, ::-1].drop(index='S3', columns='S3') * 0.5
+        delta = packed_delta(packed, PackedSymmetricMatrix.from_dense(ct))
+        common = [s for s in names if s != 'S3']
+        pd.testing.assert_frame_equal(delta.to_frame(), ct.loc[common, common] - matrix.loc[common, common])
+        
+        days = PackedSymmetricMatrix.from_dense(np.full((3, 3), 70000.0), dtype=np.uint16)
+        assert days.get(0, 2) == np.iinfo(np.uint16).max
+    
+    def test_portfolio_scores_match_restricted_davey_scores(self):
+        """Les scores incrémentaux du portefeuille = scores Davey sur les matrices restreintes aux membres."""
+        try:
+            from src.consolidators.correlation_calculator import calculate_davey_scores
+            from src.consolidators.portfolio_selection import PortfolioSelector
+        except ImportError:
+            pytest.skip("Module non disponible")
+        
+        profit_matrix = _sparse_profit_matrix(seed=9, n_days=300, n_strategies=14)
+        corr_lt = profit_matrix.corr(min_periods=20)
+        corr_ct = profit_matrix.iloc[-150:].corr(min_periods=20)
+        selector = PortfolioSelector(corr_lt, corr_ct, threshold=0.1)
+        
+        def reference(members):
+            sub_lt = corr_lt.loc[members, members]
+            sub_ct = corr_ct.loc[members, members]
+            return calculate_davey_scores(sub_lt, sub_ct, 0.1, 0.5, 0.5).set_index('Strategy')
+        
+        portfolio = selector.select(6, beam_width=3)
+        assert len(portfolio.members) == 6
+        assert selector.members == []
+        
+        # Ajouts / retraits successifs: les vecteurs restent cohérents
+        names = list(corr_lt.columns)
+        portfolio.remove(portfolio.member_names[0])
+        portfolio.add(next(s for s in names if s not in portfolio.member_names))
+        scores = portfolio.scores().set_index('Strategy')
+        expected = reference(portfolio.member_names)
+        for column in ['Score_Davey', 'N_Corr_LT', 'N_Corr_CT']:
+            assert (scores.loc[expected.index, column] == expected[column]).all()
+        
+        # What-if: scores du scénario sans modifier le portefeuille
+        before = portfolio.member_names
+        outsider = next(s for s in names if s not in before)
+        what_if = portfolio.what_if(add=outsider, remove=before[-1]).set_index('Strategy')
+        assert portfolio.member_names == before
+        expected = reference(before[:-1] + [outsider])
+        assert (what_if.loc[expected.index, 'Score_Davey'] == expected['Score_Davey']).all()
+        
+        # Le faisceau fait au moins aussi bien que la recherche gloutonne
+        assert selector.select(6, beam_width=4).total_score <= selector.select(6).total_score
+    
+    def test_bootstrap_intervals_match_resampled_rows(self):
+        """Les répliques pondérées = corrélations des lignes rééchantillonnées; comptes robustes cohérents."""
+        try:
+            from src.consolidators.correlation_bootstrap import (
+                bootstrap_correlation_intervals, bootstrap_weights, robust_correlated_counts,
+            )
+            from src.consolidators.correlation_engine import pearson_correlation_matrix
+        except ImportError:
+            pytest.skip("Module non disponible")
+        
+        profit_matrix = _sparse_profit_matrix(seed=10, n_days=200, n_strategies=8)
+        lower, upper = bootstrap_correlation_intervals(profit_matrix, 20, n_replicates=40, seed=5, n_workers=1)
+        
+        # Référence: matrice de profits rééchantillonnée ligne par ligne
+        values = profit_matrix.to_numpy()
+        replicates = []
+        for counts in bootstrap_weights(len(values), 40, seed=5):
+            rows = np.repeat(np.arange(len(values)), counts.astype(int))
+            replicates.append(pearson_correlation_matrix(values[rows], 20)[0])
+        replicates = np.array(replicates)
+        
+        # Moins de la moitié des répliques calculables → NaN (BOOTSTRAP_CONFIG['min_valid_share'])
+        replicates[:, (~np.isnan(replicates)).sum(axis=0) < 20] = np.nan
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            expected = np.nanquantile(replicates, [0.025, 0.975], axis=0)
+        
+        assert np.allclose(lower, expected[0], atol=1e-5, equal_nan=True)
+        assert np.allclose(upper, expected[1], atol=1e-5, equal_nan=True)
+        
+        # S1 est une copie linéaire de S0: intervalle dégénéré à 1, paire robuste
+        assert lower.loc['S0', 'S1'] == pytest.approx(1.0)
+        robust = robust_correlated_counts(lower, upper, 0.7)
+        assert robust['S0'] >= 1 and robust['S1'] >= 1
+        
+        # Le calcul parallèle par blocs donne les mêmes bornes
+        parallel = bootstrap_correlation_intervals(
+            profit_matrix, 20, n_replicates=40, seed=5, n_workers=2, memory_budget_mb=0.01
+        )
+        assert np.allclose(parallel[0], lower, equal_nan=True)
+        assert np.allclose(parallel[1], upper, equal_nan=True)
+    
+    
+    def test_similarity_index_matches_pearson_engine(self, tmp_path):
+        """Index de similarité: corrélations exactes du moteur, doublon retrouvé, ajout et sauvegarde."""
+        try:
+            from src.consolidators.correlation_engine import pearson_correlation_matrix
+            from src.consolidators.correlation_neighbors import SimilarityIndex, read_datasource_profits
+        except ImportError:
+            pytest.skip("Module non disponible")
+        
+        profit_matrix = _sparse_profit_matrix(seed=13, n_days=400, n_strategies=60)
+        corr, common = pearson_correlation_matrix(profit_matrix.to_numpy(), 20)
+        index = SimilarityIndex.build(profit_matrix, min_common_days=20, n_components=32)
+        
+        # Candidates = univers complet: résultat exact, stratégie interrogée exclue
+        result = index.query('S5', k=10, order='abs', n_candidates=60)
+        expected = pd.Series(corr[5], index=profit_matrix.columns).drop('S5').dropna()
+        assert 'S5' not in result['Strategy'].tolist()
+        assert np.allclose(result['Correlation'], expected.loc[result['Strategy']].to_numpy(), atol=1e-6)
+        assert np.allclose(np.abs(result['Correlation']), expected.abs().nlargest(10).to_numpy(), atol=1e-6)
+        assert (result['Common_Days'].to_numpy() == common[5, profit_matrix.columns.get_indexer(result['Strategy'])]).all()
+        
+        # Nouvelle courbe (fichier DataSource) dupliquant S7: trouvée par l'esquisse seule
+        duplicate = profit_matrix['S7'] * 2 + np.where(profit_matrix['S7'] != 0, 10.0, 0.0)
+        path = tmp_path / 'ES_NEW.txt'
+        path.write_text(''.join(f"{d:%d/%m/%Y} {v:.5f} 1 0 0 0\n" for d, v in duplicate.items()))
+        profits = read_datasource_profits(path)
+        assert profits.name == 'NEW_ES'
+        top = index.query(profits, k=3, n_candidates=3)
+        assert top['Strategy'].iloc[0] == 'S7'
+        assert top['Correlation'].iloc[0] == pytest.approx(1.0)
+        
+        # Ajout incrémental puis rechargement
+        index.add(profits.name, profits)
+        with pytest.raises(ValueError):
+            index.add('NEW_ES', profits)
+        reloaded = SimilarityIndex.load(index.save(tmp_path / 'similarity.npz'))
+        assert len(reloaded) == 61 and 'NEW_ES' in reloaded
+        pd.testing.assert_frame_equal(reloaded.query('S7', k=5), index.query('S7', k=5))
+        assert reloaded.query('S7', k=1)['Strategy'].iloc[0] == 'NEW_ES'
+    
+    
+    
+    def test_aggregated_correlations_match_resampled_pearson(self, tmp_path):
+        """Agrégation semaine / mois = groupby pandas; corrélations agrégées, scores et export cohérents."""
+        try:
+            from src.consolidators import CorrelationAnalyzer, ProfitMatrix, add_aggregated_score_columns
+            from src.consolidators.config import AGGREGATION_CONFIG
+            from src.consolidators.correlation_engine import pearson_correlation_matrix
+        except ImportError:
+            pytest.skip("Module non disponible")
+        
+        matrix = _sparse_profit_matrix(seed=17, n_days=600, n_strategies=9)
+        profits = ProfitMatrix(matrix.index, matrix.columns, matrix.to_numpy(np.float32), matrix.to_numpy() != 0)
+        for freq, period in [('W', 'W-SUN'), ('M', 'M')]:
+            aggregated = profits.aggregate(freq)
+            grouped = matrix.groupby(matrix.index.to_period(period))
+            expected = grouped.sum()
+            assert list(aggregated.dates) == list(expected.index.start_time)
+            np.testing.assert_allclose(aggregated.values, expected.to_numpy(), rtol=1e-5, atol=1e-2)
+            np.testing.assert_array_equal(aggregated.active, (grouped.apply(lambda g: (g != 0).any())).to_numpy())
+        
+        data = matrix.stack().rename('DailyProfit').reset_index()
+        data.columns = ['Date', 'Strategy_ID', 'DailyProfit']
+        data = data[data['DailyProfit'] != 0]
+        analyzer = CorrelationAnalyzer(data, start_year_longterm=2020, recent_months=6, min_common_days_longterm=30)
+        assert analyzer.aggregation_levels == []
+        analyzer.aggregation_levels = list(AGGREGATION_CONFIG['levels'])
+        analyzer.run(verbose=False)
+        assert set(analyzer.aggregated_corr) == set(AGGREGATION_CONFIG['levels'])
+        
+        weekly = analyzer.profits.window(start=pd.Timestamp('2020-01-01')).aggregate('W')
+        corr, common = pearson_correlation_matrix(
+            weekly.values.astype(np.float64), AGGREGATION_CONFIG['min_common_periods']['W'], weekly.active
+        )
+        np.testing.assert_allclose(analyzer.aggregated_corr['W'].to_dense(np.float64), corr, atol=1e-6)
+        np.testing.assert_array_equal(analyzer.aggregated_common['W'].to_dense(), common)
+        
+        # Colonnes de scores ajoutées en fin de schéma (Score_Davey inchangé) et rechargement binaire
+        columns = analyzer.scores.columns.tolist()
+        first = columns.index('N_Corr_W')
+        assert columns[first:first + 4] == ['N_Corr_W', 'Avg_Corr_W', 'N_Corr_M', 'Avg_Corr_M']
+        assert columns.index('Status_Emoji') < first
+        abs_corr = np.abs(corr)
+        np.fill_diagonal(abs_corr, np.nan)
+        with np.errstate(invalid='ignore'):
+            expected_n = pd.Series((abs_corr > analyzer.correlation_threshold).sum(axis=1), index=weekly.strategies)
+        scores = analyzer.scores.set_index('Strategy')
+        assert (scores['N_Corr_W'] == expected_n.loc[scores.index]).all()
+        columns = add_aggregated_score_columns(scores.reset_index(), pd.DataFrame(corr, index=weekly.strategies, columns=weekly.strategies), 'X', analyzer.correlation_threshold)
+        assert (columns['N_Corr_X'].to_numpy() == expected_n.loc[scores.index].to_numpy()).all()
+        
+        reloaded = CorrelationAnalyzer.from_binary(analyzer.export_binary(tmp_path)['index'])
+        pd.testing.assert_frame_equal(reloaded.scores, analyzer.scores)
+        html = reloaded.export_dashboard(tmp_path / 'dashboard.html').read_text(encoding='utf-8')
+        assert 'heatmapAggW' in html and 'heatmapAggM' in html
+    
+    
+    
+    
+    def test_average_linkage_matches_brute_force(self, tmp_path):
+        """Lien moyen = fusions des clusters à distance moyenne minimale; ordre, clusters et export."""
+        try:
+            from src.consolidators import CorrelationAnalyzer, CorrelationClusters, average_linkage
+            from src.consolidators.correlation_clustering import correlation_distance
+        except ImportError:
+            pytest.skip("Module non disponible")
+        
+        rng = np.random.default_rng(21)
+        factors = rng.normal(size=(3, 200))
+        values = np.repeat(factors, 6, axis=0) + rng.normal(scale=0.8, size=(18, 200))
+        names = [f"S{i}" for i in rng.permutation(18)]
+        corr = pd.DataFrame(np.corrcoef(values), index=names, columns=names)
+        corr.iloc[0, 1] = corr.iloc[1, 0] = np.nan
+        distance = correlation_distance(corr.to_numpy())
+        
+        # Référence: à chaque étape, fusion des deux clusters de distance moyenne minimale
+        members = {k: [k] for k in range(18)}
+        expected = []
+        while len(members) > 1:
+            keys = sorted(members)
+            d, a, b = min(
+                (distance[np.ix_(members[a], members[b])].mean(), a, b)
+                for i, a in enumerate(keys) for b in keys[i + 1:]
+            )
+            expected.append((a, b, d, len(members[a]) + len(members[b])))
+            members[18 + len(expected) - 1] = members.pop(a) + members.pop(b)
+        np.testing.assert_allclose(average_linkage(distance), np.array(expected))
+        
+        # Trois groupes de 6 stratégies, contigus dans l'ordre des feuilles
+        clusters = CorrelationClusters.build(corr, cut_distance=0.5)
+        assert sorted(clusters.summary['Size']) == [6, 6, 6]
+        assert clusters.summary['Cluster'].tolist() == [1, 2, 3]
+        ordered = clusters.ordered_strategies
+        assert sorted(ordered) == sorted(names)
+        for _, row in clusters.summary.iterrows():
+            block = corr.loc[row['Strategies'], row['Strategies']].to_numpy()
+            off = block[~np.eye(len(block), dtype=bool)]
+            assert row['Mean_Corr'] == pytest.approx(np.nanmean(off), abs=1e-4)
+            assert ordered.index(row['Strategies'][0]) + row['Size'] - 1 == ordered.index(row['Strategies'][-1])
+        assert clusters.members(names[5]) == clusters.summary.loc[clusters.summary['Cluster'] == clusters.cluster_of(names[5]), 'Strategies'].iloc[0]
+        
+        reloaded = CorrelationClusters.load(clusters.save(tmp_path / 'clusters.npz'))
+        pd.testing.assert_frame_equal(reloaded.summary, clusters.summary)
+        assert reloaded.ordered_strategies == ordered
+        
+        # Analyse: colonne Cluster, export binaire et heatmap dans l'ordre des clusters
+        matrix = _sparse_profit_matrix(seed=5, n_days=500, n_strategies=12)
+        data = matrix.stack().rename('DailyProfit').reset_index()
+        data.columns = ['Date', 'Strategy_ID', 'DailyProfit']
+        data = data[data['DailyProfit'] != 0]
+        analyzer = CorrelationAnalyzer(data, start_year_longterm=2020, recent_months=6, min_common_days_longterm=30)
+        analyzer.clustering_enabled = True
+        analyzer.run(verbose=False)
+        assert analyzer.clusters.strategies == analyzer.corr_matrix_lt.columns.tolist()
+        assert analyzer.scores['Cluster'].notna().all()
+        assert analyzer.scores.columns.get_loc('Cluster') > analyzer.scores.columns.get_loc('Status_Emoji')
+        assert analyzer.scores.set_index('Strategy').loc['S0', 'Cluster'] == analyzer.scores.set_index('Strategy').loc['S1', 'Cluster']
+        
+        reloaded = CorrelationAnalyzer.from_binary(analyzer.export_binary(tmp_path)['index'])
+        assert reloaded.clusters.ordered_strategies == analyzer.clusters.ordered_strategies
+        pd.testing.assert_frame_equal(reloaded.scores, analyzer.scores)
+        html = reloaded.export_dashboard(tmp_path / 'dashboard.html').read_text(encoding='utf-8')
+        assert 'const stratLT = ' + json.dumps(analyzer.clusters.ordered_strategies) in html
+    
+    
+    
+    def test_codrawdown_matches_pairwise_drawdown_days(self, tmp_path):
+        """Co-drawdown = Pearson sur les jours où les deux stratégies tradent en drawdown."""
+        try:
+            from src.consolidators import CorrelationAnalyzer
+            from src.consolidators.config import DRAWDOWN_CONFIG
+        except ImportError:
+            pytest.skip("Module non disponible")
+        
+        matrix = _sparse_profit_matrix(seed=23, n_days=600, n_strategies=10)
+        data = matrix.stack().rename('DailyProfit').reset_index()
+        data.columns = ['Date', 'Strategy_ID', 'DailyProfit']
+        data = data[data['DailyProfit'] != 0]
+        analyzer = CorrelationAnalyzer(data, start_year_longterm=2020, recent_months=6, min_common_days_longterm=30)
+        assert not analyzer.codrawdown_enabled
+        analyzer.codrawdown_enabled = True
+        analyzer.run(verbose=False)
+        assert analyzer.scores.columns[-2:].tolist() == ['N_Corr_DD', 'Avg_Corr_DD']
+        
+        # Référence pandas: équité cumulée sous son plus haut (départ à 0)
+        profits = matrix.loc[:, analyzer.corr_matrix_lt.columns]
+        equity = profits.cumsum()
+        in_drawdown = (equity < equity.clip(lower=0).cummax()) & (profits != 0)
+        corr = analyzer.codrawdown_corr.to_frame(np.float64)
+        for a in profits.columns:
+            for b in profits.columns:
+                if a == b:
+                    continue
+                days = in_drawdown[a] & in_drawdown[b]
+                expected = profits.loc[days, a].corr(profits.loc[days, b])
+                if days.sum() < DRAWDOWN_CONFIG['min_common_days'] or np.isnan(expected):
+                    assert np.isnan(corr.loc[a, b])
+                    continue
+                assert corr.loc[a, b] == pytest.approx(expected, abs=1e-6)
+                assert analyzer.codrawdown_common.get(a, b) == days.sum()
+        
+        # Même comptage Davey que LT / CT
+        threshold = analyzer.correlation_threshold
+        abs_corr = corr.abs().to_numpy(copy=True)
+        np.fill_diagonal(abs_corr, np.nan)
+        with np.errstate(invalid='ignore'):
+            expected_n = pd.Series((abs_corr > threshold).sum(axis=1), index=corr.index)
+        scores = analyzer.scores.set_index('Strategy')
+        assert (scores['N_Corr_DD'] == expected_n.loc[scores.index]).all()
+        
+        pairs = analyzer.codrawdown_pairs(5)
+        np.testing.assert_allclose(pairs['Delta'], pairs['Corr_DD'] - pairs['Corr_LT'], atol=1e-6)
+        assert pairs['Delta'].is_monotonic_decreasing
+        
+        reloaded = CorrelationAnalyzer.from_binary(analyzer.export_binary(tmp_path)['index'])
+        pd.testing.assert_frame_equal(reloaded.codrawdown_corr.to_frame(), analyzer.codrawdown_corr.to_frame())
+        # Scores de run() sur les corrélations float64, rechargés sur le float32 stocké:
+        # mêmes comptes, partenaire maximal départagé différemment (S0 = S1 ici)
+        partners = [c for c in analyzer.scores.columns if c.endswith('_With')]
+        pd.testing.assert_frame_equal(reloaded.scores.drop(columns=partners), analyzer.scores.drop(columns=partners))
+        html = analyzer.export_dashboard(tmp_path / 'dashboard.html').read_text(encoding='utf-8')
+        assert 'heatmapDD' in html
+    
+    def test_dashboard_heatmap_payload_decodes_to_matrix(self, tmp_path):
+        """Heatmap binaire (diagonale + triangle supérieur, base64): décodage fidèle et 10× plus compact."""
+        try:
+            import base64
+            from src.consolidators.packed_matrix import PackedSymmetricMatrix
+            from src.generators import CorrelationDashboardGenerator
+        except ImportError:
+            pytest.skip("Module non disponible")
+        
+        rng = np.random.default_rng(31)
+        n = 150
+        names = [f"S{i}" for i in range(n)]
+        corr = np.corrcoef(rng.normal(size=(n, 300)))
+        corr[3, 7] = corr[7, 3] = np.nan
+        packed = PackedSymmetricMatrix.from_dense(pd.DataFrame(corr, index=names, columns=names))
+        dense = packed.to_dense(np.float64)
+        upper = np.triu_indices(n, k=1)
+        
+        def decode(payload):
+            dtype = np.int8 if payload['encoding'] == 'int8' else np.dtype('<f4')
+            raw = np.frombuffer(base64.b64decode(payload['values']), dtype=dtype).astype(np.float64)
+            if payload['encoding'] == 'int8':
+                raw = np.where(raw == -128, np.nan, raw * payload['scale'])
+            matrix = np.empty((n, n))
+            matrix[np.diag_indices(n)] = raw[:n]
+            matrix[upper] = raw[n:]
+            matrix.T[upper] = raw[n:]
+            return matrix
+        
+        generator = CorrelationDashboardGenerator()
+        strategies, short_names, payload, bounds = generator._heatmap_data(packed)
+        assert strategies == names and bounds == []
+        decoded = decode(payload)
+        np.testing.assert_array_equal(np.isnan(decoded), np.isnan(dense))
+        np.testing.assert_allclose(decoded, dense, atol=payload['scale'] / 2 + 1e-9)
+        
+        # Indicateurs |v| > seuil exacts, même quand la valeur quantifiée est de l'autre côté
+        corr[0, 1] = corr[1, 0] = 0.6995
+        corr[0, 2] = corr[2, 0] = 0.7045
+        near = PackedSymmetricMatrix.from_dense(pd.DataFrame(corr, index=names, columns=names))
+        flagged = generator._heatmap_data(near, threshold=0.7)[2]
+        above = np.unpackbits(
+            np.frombuffer(base64.b64decode(flagged['above']), dtype=np.uint8), bitorder='little'
+        )[:n * (n + 1) // 2].astype(bool)
+        exact = near.to_dense(np.float64)
+        with np.errstate(invalid='ignore'):
+            np.testing.assert_array_equal(above[n:], np.abs(exact[upper]) > 0.7)
+        assert above[:n].all() and flagged['threshold'] == 0.7
+        assert not above[n + 0] and above[n + 1]
+        
+        generator.HEATMAP_ENCODING = 'float32'
+        np.testing.assert_allclose(decode(generator._heatmap_data(packed)[2]), dense, atol=1e-7)
+        
+        # Ancien format: un objet {x, y, v} par cellule non NaN
+        rows, cols = np.nonzero(~np.isnan(dense))
+        points = json.dumps([{'x': j, 'y': i, 'v': round(v, 4)} for i, j, v in zip(rows.tolist(), cols.tolist(), dense[rows, cols].tolist())])
+        assert len(json.dumps(payload)) * 10 < len(points)
+        
+        # Dashboard d'une analyse: matrice LT encodée dans l'ordre des clusters
+        from src.consolidators import CorrelationAnalyzer
+        matrix = _sparse_profit_matrix(seed=5, n_days=500, n_strategies=12)
+        data = matrix.stack().rename('DailyProfit').reset_index()
+        data.columns = ['Date', 'Strategy_ID', 'DailyProfit']
+        data = data[data['DailyProfit'] != 0]
+        analyzer = CorrelationAnalyzer(data, start_year_longterm=2020, recent_months=6, min_common_days_longterm=30)
+        analyzer.clustering_enabled = True
+        analyzer.run(verbose=False)
+        html = analyzer.export_dashboard(tmp_path / 'dashboard.html').read_text(encoding='utf-8')
+        payload = CorrelationDashboardGenerator()._heatmap_data(
+            analyzer._packed['corr_lt'], analyzer.clusters, analyzer.correlation_threshold
+        )[2]
+        assert 'const dataLT = ' + json.dumps(payload) in html
+        assert "{'x'" not in html and '"x":' not in html
+    
+    
+    def test_pages_profile_matches_dataframe_scan(self, tmp_path):
+        """Profil indexé (argpartition) = tri complet des paires LT ∪ CT; rendu parallèle = séquentiel."""
+        try:
+            from src.consolidators import CorrelationAnalyzer
+            from src.generators.correlation_pages import CorrelationPagesGenerator
+        except ImportError:
+            pytest.skip("Module non disponible")
+        
+        matrix = _sparse_profit_matrix(seed=13, n_days=500, n_strategies=40)
+        data = matrix.stack().rename('DailyProfit').reset_index()
+        data.columns = ['Date', 'Strategy_ID', 'DailyProfit']
+        data = data[data['DailyProfit'] != 0]
+        analyzer = CorrelationAnalyzer(data, start_year_longterm=2020, recent_months=6, min_common_days_longterm=30)
+        analyzer.run(verbose=False)
+        generator = CorrelationPagesGenerator(analyzer)
+        
+        for strategy in analyzer.scores['Strategy']:
+            lt = analyzer.corr_matrix_lt.loc[strategy].drop(strategy).dropna()
+            ct = analyzer.corr_matrix_ct.loc[strategy].drop(strategy).dropna() if strategy in analyzer.corr_matrix_ct else pd.Series(dtype=float)
+            max_abs = pd.concat([lt.abs(), ct.abs()], axis=1).max(axis=1).sort_values(ascending=False, kind='stable')
+            
+            profile = generator._calculate_profile(strategy, 8)
+            most = [c['max_abs'] for c in profile['most_correlated']]
+            least = [c['max_abs'] for c in profile['least_correlated']]
+            np.testing.assert_allclose(most, max_abs.to_numpy()[:8])
+            np.testing.assert_allclose(least, np.sort(max_abs[max_abs > 0].to_numpy())[:8])
+            for c in profile['most_correlated']:
+                assert c['corr_lt'] == (round(float(lt[c['strategy']]), 3) if c['strategy'] in lt else None)
+            
+            values = pd.concat([lt, ct])
+            assert profile['distribution']['very_positive'] == int((values >= 0.7).sum())
+            assert profile['distribution']['neutral'] == int(((values > -0.3) & (values < 0.3)).sum())
+            assert sum(profile['distribution'].values()) == len(values)
+        
+        sequential = generator.generate_all(tmp_path / 'seq', top_n=5, verbose=False, n_jobs=1)
+        generator.PAGES_PER_TASK = 7
+        parallel = generator.generate_all(tmp_path / 'par', top_n=5, verbose=False, n_jobs=2)
+        assert sequential == parallel == {'generated': 40, 'errors': 0, 'total': 40}
+        assert sorted(p.name for p in (tmp_path / 'seq').iterdir()) == sorted(p.name for p in (tmp_path / 'par').iterdir())
+    
+    def test_explorer_shards_rewrite_only_changes(self, tmp_path):
+        """Explorateur: un fragment par stratégie (profil des pages), réécrit seulement s'il change."""
+        try:
+            from src.consolidators import CorrelationAnalyzer
+            from src.generators.correlation_explorer import EXPLORER_FILE, SHARDS_DIR, CorrelationExplorerGenerator
+        except ImportError:
+            pytest.skip("Module non disponible")
+        
+        matrix = _sparse_profit_matrix(seed=17, n_days=500, n_strategies=15)
+        data = matrix.stack().rename('DailyProfit').reset_index()
+        data.columns = ['Date', 'Strategy_ID', 'DailyProfit']
+        data = data[data['DailyProfit'] != 0]
+        analyzer = CorrelationAnalyzer(data, start_year_longterm=2020, recent_months=6, min_common_days_longterm=30)
+        analyzer.run(verbose=False)
+        explorer = CorrelationExplorerGenerator(analyzer)
+        
+        stats = explorer.generate(tmp_path, top_n=5, verbose=False)
+        n = len(analyzer.scores)
+        assert stats == {'written': n, 'unchanged': 0, 'removed': 0, 'errors': 0, 'total': n}
+        
+        def payload(path, callback):
+            text = path.read_text(encoding='utf-8')
+            assert text.startswith(callback + '(') and text.endswith(');\n')
+            return json.loads(text[len(callback) + 1:-3])
+        
+        shards = tmp_path / SHARDS_DIR
+        index = payload(shards / 'index.js', 'explorerIndex')
+        assert [e['id'] for e in index['strategies']] == analyzer.scores['Strategy'].tolist()
+        strategy = index['strategies'][0]['id']
+        shard = payload(shards / index['strategies'][0]['file'], 'explorerShard')
+        profile = explorer.pages._calculate_profile(strategy, 5)
+        assert shard['strategy_id'] == strategy and 'config' not in shard
+        assert shard['most_correlated'] == json.loads(json.dumps(profile['most_correlated']))
+        assert shard['distribution'] == profile['distribution']
+        
+        # Nouvelle génération: rien n'est réécrit; stratégie disparue: fragment supprimé
+        mtimes = {p.name: p.stat().st_mtime_ns for p in tmp_path.rglob('*') if p.is_file()}
+        assert explorer.generate(tmp_path, top_n=5, verbose=False)['written'] == 0
+        assert mtimes == {p.name: p.stat().st_mtime_ns for p in tmp_path.rglob('*') if p.is_file()}
+        
+        (shards / 'OLD_ES.js').write_text('explorerShard({});\n', encoding='utf-8')
+        analyzer.scores = analyzer.scores.iloc[1:]
+        stats = explorer.generate(tmp_path, top_n=5, verbose=False)
+        assert stats['removed'] == 2 and not (shards / 'OLD_ES.js').exists()
+        assert len(list(shards.glob('*.js'))) == n
+        assert SHARDS_DIR in (tmp_path / EXPLORER_FILE).read_text(encoding='utf-8')
+    
     def test_get_correlation_status(self):
         """Le statut de corrélation est correct."""
         try:
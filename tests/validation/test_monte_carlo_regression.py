@@ -8,12 +8,20 @@ Note: Les simulations MC sont stochastiques, donc on utilise:
 - Des tolérances statistiques pour les métriques
 """
 
+import os
+import multiprocessing
+
 import pytest
 import pandas as pd
 import numpy as np
 from pathlib import Path
 
 
+def _crashing_worker(conn, *args):
+    """Worker qui meurt sans répondre (comme un kill OOM ou un segfault)."""
+    os._exit(3)
+
+
 class TestMonteCarloRegression:
     """
     Vérifie que les simulations MC V2 correspondent à V1.
@@ -183,3 +191,85 @@ class TestMonteCarloOutput:
         for status in v1_reference_mc["Status"].unique():
             if pd.notna(status):
                 assert status in valid_statuses, f"Statut invalide: {status}"
+
+
+class TestMonteCarloWorker:
+    """Tests pour l'exécution isolée des simulations."""
+    
+    EQUITY_FILE = Path(__file__).parent.parent / "data" / "samples" / "equity_curves" / "GC_EasterGold.txt"
+    
+    def test_count_trades_quick(self):
+        """Le comptage rapide lit la dernière valeur CumulativeTrades."""
+        try:
+            from src.monte_carlo.worker import count_trades_quick
+        except ImportError:
+            pytest.skip("Module worker non disponible")
+        
+        if not self.EQUITY_FILE.exists():
+            pytest.skip("Fichier equity de test manquant")
+        
+        nb_trades = count_trades_quick(self.EQUITY_FILE)
+        last_line = self.EQUITY_FILE.read_text().strip().splitlines()[-1]
+        assert nb_trades == int(float(last_line.split()[5]))
+    
+    @pytest.mark.slow
+    def test_isolated_simulation_ok(self, tmp_path):
+        """Une simulation isolée retourne le résumé et écrit le CSV."""
+        try:
+            from src.monte_carlo.worker import simulate_strategy_isolated
+        except ImportError:
+            pytest.skip("Module worker non disponible")
+        
+        if not self.EQUITY_FILE.exists():
+            pytest.skip("Fichier equity de test manquant")
+        
+        outcome = simulate_strategy_isolated(
+            self.EQUITY_FILE, tmp_path, {'nb_simulations': 100, 'random_seed': 42},
+            timeout_seconds=120, memory_limit_mb=0,
+        )
+        
+        assert outcome['status'] == "ok"
+        assert outcome['summary']['strategy_name'] == self.EQUITY_FILE.stem
+        assert (tmp_path / f"{self.EQUITY_FILE.stem}_mc.csv").exists()
+    
+    @pytest.mark.slow
+    def test_isolated_simulation_timeout(self, tmp_path):
+        """Un worker qui dépasse le timeout est tué et signalé."""
+        try:
+            from src.monte_carlo.worker import simulate_strategy_isolated
+        except ImportError:
+            pytest.skip("Module worker non disponible")
+        
+        if not self.EQUITY_FILE.exists():
+            pytest.skip("Fichier equity de test manquant")
+        
+        outcome = simulate_strategy_isolated(
+            self.EQUITY_FILE, tmp_path, {'nb_simulations': 1_000_000},
+            timeout_seconds=0.5, memory_limit_mb=0,
+        )
+        
+        assert outcome['status'] == "timeout"
+        assert outcome['file_size_mb'] > 0
+        assert outcome['nb_trades'] is not None
+    
+    def test_isolated_simulation_crash_is_not_timeout(self, tmp_path, monkeypatch):
+        """Un worker mort sans résultat est signalé 'crashed', pas 'timeout'."""
+        try:
+            from src.monte_carlo import worker
+        except ImportError:
+            pytest.skip("Module worker non disponible")
+        
+        if not self.EQUITY_FILE.exists():
+            pytest.skip("Fichier equity de test manquant")
+        if multiprocessing.get_start_method() != "fork":
+            pytest.skip("Remplacement du worker possible uniquement avec fork")
+        
+        monkeypatch.setattr(worker, "_worker_main", _crashing_worker)
+        for _ in range(10):
+            outcome = worker.simulate_strategy_isolated(
+                self.EQUITY_FILE, tmp_path, {},
+                timeout_seconds=30, memory_limit_mb=0,
+            )
+            assert outcome['status'] == "crashed"
+            assert "exit code 3" in outcome['error']
+            assert outcome['duration_seconds'] < 30